@@ -6,7 +6,6 @@ managing state, buffering, and display parameters.
 """
 
 import logging
-from collections import deque
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -15,7 +14,16 @@ from typing import Callable, Optional
 import numpy as np
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
-from py2flamingo.services.camera_service import CameraService, ImageHeader
+from py2flamingo.controllers.display_rate_governor import DisplayRateGovernor
+from py2flamingo.services.camera_service import (
+    CameraService,
+    FrameHistory,
+    ImageHeader,
+)
+
+# Frame history budget: ~300 full 2048x2048 uint16 frames (~6 s of Z-paint
+# motion at 50 FPS). A cropped AOI gets proportionally more frames.
+DEFAULT_HISTORY_BUDGET_BYTES = 300 * 2048 * 2048 * 2
 
 
 class CameraState(Enum):
@@ -50,13 +58,19 @@ class CameraController(QObject):
         np.ndarray, dict, int, int
     )  # (image, position, z_index, frame_num)
 
-    def __init__(self, camera_service: CameraService, laser_led_controller=None):
+    def __init__(
+        self,
+        camera_service: CameraService,
+        laser_led_controller=None,
+        history_budget_bytes: int = DEFAULT_HISTORY_BUDGET_BYTES,
+    ):
         """
         Initialize camera controller.
 
         Args:
             camera_service: CameraService instance for hardware communication
             laser_led_controller: Optional LaserLEDController for coordinating light sources
+            history_budget_bytes: Memory bound for the frame history
         """
         super().__init__()
 
@@ -68,12 +82,10 @@ class CameraController(QObject):
         self._state = CameraState.IDLE
 
         # Image buffering
-        # Buffer size for frame history - needs to hold all frames during Z-paint motion
-        # At 50 FPS camera, 10 seconds of motion = 500 frames
-        # Each frame is ~8MB (2048x2048 uint16), so 500 frames = ~4GB max
-        # Using 300 frames = ~2.4GB max (safer for memory, covers ~6s of motion)
-        self._max_buffer_frames = 300
-        self._frame_buffer = deque(maxlen=self._max_buffer_frames)
+        # Frame history - needs to hold all frames during Z-paint motion.
+        # Entries reference the service's read-only frames (no copy) and are
+        # bounded by bytes, so the budget holds whatever the AOI size.
+        self._frame_buffer = FrameHistory(history_budget_bytes)
 
         # Display parameters
         self._display_min = 0
@@ -110,11 +122,20 @@ class CameraController(QObject):
         self._tile_transition_pending = False
         self._tile_transition_flush_count = 0
 
+        # Off-GUI tile ingest (TileFrameIngest). When attached it receives
+        # every frame from the receiver thread and tile frames no longer pass
+        # through _pull_and_display_frame.
+        self._tile_ingest = None
+
+        # Adapts the display rate to how far behind the GUI event loop is;
+        # live views report their render cost to it and skip hidden frames.
+        self.display_governor = DisplayRateGovernor(max_fps=self._max_display_fps)
+
         # Timer-based frame pulling (ensures display always updates)
         # This timer pulls latest frame from buffer and discards accumulated frames
         self._display_timer = QTimer()
         self._display_timer.timeout.connect(self._pull_and_display_frame)
-        self._display_timer_interval_ms = int(1000 / self._max_display_fps)
+        self._display_timer_interval_ms = self.display_governor.interval_ms
 
         # Connect camera service callback (lightweight notification only)
         self.camera_service.set_image_callback(self._on_image_received)
@@ -250,8 +271,11 @@ class CameraController(QObject):
             f"CameraController: Activated tile mode for {position.get('filename', 'unknown')}"
         )
 
-        # Enlarge frame buffer so GUI-thread stalls don't cause frame loss
-        self.camera_service.set_tile_mode_buffer(True)
+        if self._tile_ingest is not None:
+            self._tile_ingest.begin_tile(position)
+        else:
+            # Enlarge frame buffer so GUI-thread stalls don't cause frame loss
+            self.camera_service.set_tile_mode_buffer(True)
 
         # Ensure display timer runs so _pull_and_display_frame routes frames
         if not self._display_timer.isActive():
@@ -270,6 +294,37 @@ class CameraController(QObject):
             self.logger.warning(f"Could not start data receiver for tile workflow: {e}")
             self._workflow_started_streaming = False
 
+    def attach_tile_ingest(self, ingest) -> None:
+        """Deliver tile-workflow frames to ``ingest`` from the receiver thread.
+
+        Args:
+            ingest: TileFrameIngest (already started)
+        """
+        self.detach_tile_ingest()
+        self._tile_ingest = ingest
+        self.camera_service.add_frame_listener(ingest.on_frame)
+        self.logger.info("Tile frame ingest attached to camera receiver")
+
+    def detach_tile_ingest(self) -> None:
+        """Stop feeding the attached tile ingest (no-op if none)."""
+        if self._tile_ingest is not None:
+            self.camera_service.remove_frame_listener(self._tile_ingest.on_frame)
+            self._tile_ingest = None
+
+    def begin_tile(self, position: dict) -> None:
+        """Mark the start of a tile workflow. Safe to call from any thread.
+
+        With an ingest attached the boundary is queued in order with the
+        frames; otherwise the GUI timer flushes stale frames and adopts the
+        position on its next tick.
+        """
+        ingest = self._tile_ingest
+        if ingest is not None:
+            ingest.begin_tile(position)
+            return
+        self._pending_tile_position = position
+        self._tile_transition_pending = True
+
     def clear_tile_mode(self):
         """Deactivate tile workflow mode."""
         if self._workflow_tile_mode:
@@ -364,6 +419,9 @@ class CameraController(QObject):
         """
         Set maximum display frame rate.
 
+        The display governor lowers the actual rate below this when the GUI
+        falls behind and recovers towards it as load decreases.
+
         Args:
             fps: Maximum frames per second for display updates
         """
@@ -374,7 +432,8 @@ class CameraController(QObject):
 
         self._max_display_fps = fps
         self._min_display_interval = 1.0 / fps
-        self._display_timer_interval_ms = int(1000 / fps)
+        self.display_governor.max_fps = fps
+        self._display_timer_interval_ms = self.display_governor.interval_ms
 
         # Update timer if running
         if self._display_timer.isActive():
@@ -411,14 +470,15 @@ class CameraController(QObject):
         # Increment local frame counter (hardware frame_number may be stuck at 0)
         self._local_frame_counter += 1
 
-        # ONLY handle snapshot capture (fast operation)
+        # Snapshot and history keep references: the service's frames are
+        # read-only and never reused, so a copy would only cost time and memory.
         if self._capture_next_frame:
-            self._captured_snapshot = (image.copy(), header)
+            self._captured_snapshot = (image, header)
             self._capture_next_frame = False
             self.logger.info("Snapshot captured from data stream")
 
         # Add to our own buffer for history with local frame counter
-        self._frame_buffer.append((image.copy(), header, self._local_frame_counter))
+        self._frame_buffer.append(image, header, self._local_frame_counter)
 
     def _pull_and_display_frame(self) -> None:
         """
@@ -437,12 +497,19 @@ class CameraController(QObject):
         - Frames are dropped intelligently (keep latest, drop old)
         - Processing time doesn't cause lag accumulation
         """
+        new_interval = self.display_governor.tick()
+        if new_interval is not None:
+            self._display_timer_interval_ms = new_interval
+            self._display_timer.setInterval(new_interval)
+
         try:
             # In tile workflow mode: process buffered frames in bounded batches
             # Processing ALL frames at once can block the GUI thread, causing
             # cascading delays. Limit to MAX_FRAMES_PER_TICK per timer tick.
-            if self._workflow_tile_mode and (
-                self._current_tile_position or self._tile_transition_pending
+            if (
+                self._workflow_tile_mode
+                and self._tile_ingest is None
+                and (self._current_tile_position or self._tile_transition_pending)
             ):
                 # Handle pending tile transition: flush stale frames from previous tile,
                 # reset z_plane_counter, and adopt the new tile position — all atomically
@@ -560,9 +627,7 @@ class CameraController(QObject):
             local_frame_number is a counter that increments with each new frame received,
             independent of hardware frame_number which may be stuck at 0.
         """
-        if len(self._frame_buffer) > 0:
-            return self._frame_buffer[-1]
-        return None
+        return self._frame_buffer.latest()
 
     def _generate_snapshot_filename(self, sample_name: str, save_directory: str) -> str:
         """
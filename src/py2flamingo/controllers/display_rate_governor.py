@@ -0,0 +1,222 @@
+"""
+Adaptive display frame rate for live camera views.
+
+CameraController's display timer used to fire at a fixed rate and every view
+rendered every frame it was handed. On slower acquisition PCs live view plus
+the 3D preview saturated the GUI event loop: timer ticks queued up behind
+renders and the whole UI stopped responding.
+
+DisplayRateGovernor closes the loop:
+
+- Views report how long each render took (``render()`` context manager) and
+  ask ``should_render()`` first, which says no while the view is hidden or
+  minimized, or when it already shows that frame.
+- The display timer calls ``tick()`` on every timeout. How late the tick
+  arrives measures how far behind the event loop is; together with the share
+  of wall time spent rendering it drives the rate: a multiplicative drop when
+  the loop falls behind, a gradual climb back to the configured maximum when
+  it keeps up.
+
+Everything runs on the GUI thread; no locking.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ViewStats:
+    widget: Any = None
+    last_frame: Any = None
+    rendered: int = 0
+    skipped: int = 0
+    mean_s: float = 0.0  # exponential moving average
+    max_s: float = 0.0
+    window_s: float = 0.0  # render time since the last rate decision
+
+
+class DisplayRateGovernor:
+    """Chooses the live display rate from measured render cost and loop lag.
+
+    Args:
+        max_fps: Upper bound (the configured maximum display rate)
+        min_fps: Lower bound when the GUI is overloaded
+        adjust_period_s: Minimum time between rate changes
+        clock: Monotonic time source (seconds)
+    """
+
+    # Event loop behind: ticks late by more than this share of the interval
+    LAG_HIGH = 0.5
+    LAG_LOW = 0.1
+    # Share of wall time spent rendering
+    LOAD_HIGH = 0.5
+    LOAD_LOW = 0.25
+    DECREASE_FACTOR = 0.7
+    EMA_ALPHA = 0.2
+    # Tick intervals measured at the current rate before it may change again
+    MIN_SAMPLES = 3
+
+    def __init__(
+        self,
+        max_fps: float = 30.0,
+        min_fps: float = 2.0,
+        adjust_period_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_fps = max_fps
+        self._min_fps = min(min_fps, max_fps)
+        self._rate_fps = max_fps
+        self._adjust_period_s = adjust_period_s
+        self._clock = clock
+
+        self._views: Dict[str, _ViewStats] = {}
+        self._last_tick: Optional[float] = None
+        self._last_adjust = clock()
+        self._lag_s = 0.0  # moving average of tick lateness
+        self._samples = 0
+
+    # ------------------------------------------------------------------
+    # Rate
+    # ------------------------------------------------------------------
+
+    @property
+    def rate_fps(self) -> float:
+        """Currently chosen display rate."""
+        return self._rate_fps
+
+    @property
+    def interval_ms(self) -> int:
+        """Display timer interval for the current rate."""
+        return int(1000 / self._rate_fps)
+
+    @property
+    def max_fps(self) -> float:
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, fps: float) -> None:
+        """Set the configured maximum; the rate restarts from it."""
+        self._max_fps = fps
+        self._min_fps = min(self._min_fps, fps)
+        self._rate_fps = fps
+        self._lag_s = 0.0
+        self._samples = 0
+
+    def tick(self) -> Optional[int]:
+        """Record a display timer tick.
+
+        Returns:
+            New timer interval in ms when the rate changed, else None
+        """
+        now = self._clock()
+        interval_s = 1.0 / self._rate_fps
+        if self._last_tick is not None:
+            late = max(0.0, (now - self._last_tick) - interval_s)
+            self._lag_s += self.EMA_ALPHA * (late - self._lag_s)
+            self._samples += 1
+        self._last_tick = now
+
+        elapsed = now - self._last_adjust
+        if elapsed < self._adjust_period_s or self._samples < self.MIN_SAMPLES:
+            return None
+
+        load = sum(v.window_s for v in self._views.values()) / elapsed
+        for view in self._views.values():
+            view.window_s = 0.0
+        self._last_adjust = now
+
+        lag = self._lag_s / interval_s
+        rate = self._rate_fps
+        if lag > self.LAG_HIGH or load > self.LOAD_HIGH:
+            rate = max(self._min_fps, rate * self.DECREASE_FACTOR)
+        elif lag < self.LAG_LOW and load < self.LOAD_LOW:
+            rate = min(self._max_fps, rate + max(1.0, rate * 0.1))
+        if rate == self._rate_fps:
+            return None
+
+        logger.info(
+            f"Display rate {self._rate_fps:.1f} -> {rate:.1f} FPS "
+            f"(tick lag {self._lag_s * 1000:.0f} ms, render load {load:.0%})"
+        )
+        self._rate_fps = rate
+        # The lag was measured against the old interval
+        self._lag_s = 0.0
+        self._samples = 0
+        self._last_tick = None
+        return self.interval_ms
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def register(self, name: str, widget=None) -> None:
+        """Track a consumer view; ``widget`` is checked for visibility."""
+        self._views.setdefault(name, _ViewStats()).widget = widget
+
+    def should_render(self, name: str, frame=None) -> bool:
+        """Whether ``name`` should render now.
+
+        Args:
+            name: Registered view name
+            frame: The frame about to be rendered; skipped if the view
+                already shows this exact array
+        """
+        view = self._views.setdefault(name, _ViewStats())
+        if not self._is_shown(view.widget) or (
+            frame is not None and frame is view.last_frame
+        ):
+            view.skipped += 1
+            return False
+        view.last_frame = frame
+        return True
+
+    @contextmanager
+    def render(self, name: str) -> Iterator[None]:
+        """Time one render of view ``name``."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record_render(name, self._clock() - start)
+
+    def record_render(self, name: str, seconds: float) -> None:
+        view = self._views.setdefault(name, _ViewStats())
+        view.rendered += 1
+        view.window_s += seconds
+        view.max_s = max(view.max_s, seconds)
+        if view.rendered == 1:
+            view.mean_s = seconds
+        else:
+            view.mean_s += self.EMA_ALPHA * (seconds - view.mean_s)
+
+    def stats(self) -> Dict[str, Any]:
+        """Chosen rate, event loop lag and per-view render statistics."""
+        return {
+            "rate_fps": self._rate_fps,
+            "max_fps": self._max_fps,
+            "tick_lag_ms": self._lag_s * 1000,
+            "views": {
+                name: {
+                    "rendered": v.rendered,
+                    "skipped": v.skipped,
+                    "mean_render_ms": v.mean_s * 1000,
+                    "max_render_ms": v.max_s * 1000,
+                }
+                for name, v in self._views.items()
+            },
+        }
+
+    @staticmethod
+    def _is_shown(widget) -> bool:
+        if widget is None:
+            return True
+        try:
+            return widget.isVisible() and not widget.window().isMinimized()
+        except RuntimeError:
+            # Underlying C++ widget already deleted
+            return False
@@ -555,15 +555,19 @@ class MovementController(QObject):
         """
         Background thread for workflow position polling.
 
-        Queries ACTUAL hardware position (not cached) and updates position tracking.
-        This runs at a slower rate to avoid interfering with workflow execution.
+        Reads the hardware position and updates position tracking. Axes observed
+        within the last polling interval (by any reader, or by a motion-stopped
+        callback) come from the shared position cache; only the rest are
+        queried. This runs at a slower rate to avoid interfering with workflow
+        execution.
         """
         self.logger.info("Workflow poll loop started")
 
         while self._workflow_polling_enabled:
             try:
-                # Query actual position from hardware (slower but accurate)
-                hardware_pos = self.stage_service.get_position()
+                hardware_pos = self.stage_service.get_position(
+                    max_age_s=self._workflow_polling_interval
+                )
 
                 if hardware_pos:
                     # Check if position changed significantly
@@ -183,9 +183,27 @@ class WorkflowController(QObject):
                 - (False, "File not found: ...") if file doesn't exist
                 - (False, error message) on validation errors
         """
+        success, msg, workflow_data = self.read_workflow(file_path)
+        if not success:
+            return (False, msg)
+        return self.load_workflow_data(Path(file_path), workflow_data)
+
+    def read_workflow(self, file_path: str) -> Tuple[bool, str, Optional[bytes]]:
+        """
+        Validate and read a workflow file without making it the current one.
+
+        Lets the workflow queue prepare the next item while the current
+        workflow is still running; pair with :meth:`load_workflow_data`.
+
+        Args:
+            file_path: Path to workflow file
+
+        Returns:
+            Tuple of (success, message, workflow bytes or None)
+        """
         # Validate file path
         if not file_path:
-            return (False, "Workflow file path cannot be empty")
+            return (False, "Workflow file path cannot be empty", None)
 
         path = Path(file_path)
 
@@ -193,36 +211,44 @@ class WorkflowController(QObject):
         valid, errors = self.validate_workflow_file(str(path))
         if not valid:
             error_msg = "; ".join(errors)
-            return (False, error_msg)
+            return (False, error_msg, None)
 
-        # Attempt to load workflow file
+        # Attempt to read workflow file
         try:
             if not path.exists():
                 raise FileNotFoundError(f"Workflow file not found: {path}")
 
-            # Read file contents
-            workflow_data = path.read_bytes()
-
-            # Cache workflow data and path
-            self._current_workflow_data = workflow_data
-            self._current_workflow_path = path
-
-            self._logger.info(
-                f"Loaded workflow: {path.name} ({len(workflow_data)} bytes)"
-            )
-            return (True, f"Workflow loaded successfully: {path.name}")
+            return (True, f"Workflow read: {path.name}", path.read_bytes())
 
         except FileNotFoundError:
             self._logger.error(f"Workflow file not found: {path}")
-            return (False, f"File not found: {path}")
+            return (False, f"File not found: {path}", None)
 
         except ValueError as e:
             self._logger.error(f"Invalid workflow file: {e}")
-            return (False, f"Invalid workflow file: {str(e)}")
+            return (False, f"Invalid workflow file: {str(e)}", None)
 
         except Exception as e:
             self._logger.exception("Error loading workflow")
-            return (False, f"Error loading workflow: {str(e)}")
+            return (False, f"Error loading workflow: {str(e)}", None)
+
+    def load_workflow_data(self, path: Path, workflow_data: bytes) -> Tuple[bool, str]:
+        """
+        Make already-read workflow bytes the current workflow.
+
+        Args:
+            path: Path the bytes were read from
+            workflow_data: Workflow file contents (from :meth:`read_workflow`)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        # Cache workflow data and path
+        self._current_workflow_data = workflow_data
+        self._current_workflow_path = path
+
+        self._logger.info(f"Loaded workflow: {path.name} ({len(workflow_data)} bytes)")
+        return (True, f"Workflow loaded successfully: {path.name}")
 
     def start_workflow(self) -> Tuple[bool, str]:
         """
@@ -23,9 +23,11 @@ import socket
 import struct
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set
 
 logger = logging.getLogger(__name__)
 
@@ -154,6 +156,11 @@ class MessageDispatcher:
         # The background reader puts responses in the queue
         self._pending_requests: Dict[int, queue.Queue] = {}
 
+        # Pending batch requests: command_code -> futures in send order.
+        # Unlike the single-slot queues above, several requests with the
+        # same code can be in flight; responses complete them FIFO.
+        self._pending_futures: Dict[int, Deque[Future]] = {}
+
         # Callback handlers: command_code -> list of handlers
         self._callback_handlers: Dict[int, List[Callable[[ParsedMessage], None]]] = {}
 
@@ -193,6 +200,66 @@ class MessageDispatcher:
         with self._lock:
             self._pending_requests.pop(command_code, None)
 
+    def register_pending_future(self, command_code: int) -> Future:
+        """
+        Register a pending request completed through a Future.
+
+        Requests for the same code are answered in the order they were
+        registered. A caller that stops waiting should ``cancel()`` the
+        future so the next response goes to the next request.
+
+        Args:
+            command_code: The command code we expect a response for
+
+        Returns:
+            Future resolved with the ParsedMessage response
+        """
+        future: Future = Future()
+        with self._lock:
+            self._pending_futures.setdefault(command_code, deque()).append(future)
+        return future
+
+    def fail_pending_futures(
+        self, error: Exception, futures: Optional[Sequence[Future]] = None
+    ):
+        """
+        Fail outstanding futures (socket closed, reader stopped, send failed).
+
+        Args:
+            error: Exception set on each future
+            futures: Futures to fail; None fails every pending future
+        """
+        with self._lock:
+            if futures is None:
+                failed = [f for q in self._pending_futures.values() for f in q]
+                self._pending_futures.clear()
+            else:
+                failed = []
+                for future in futures:
+                    for code, pending in list(self._pending_futures.items()):
+                        if future in pending:
+                            pending.remove(future)
+                            failed.append(future)
+                            if not pending:
+                                del self._pending_futures[code]
+                            break
+        # Removed under the lock, so nothing else can complete these now
+        for future in failed:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _take_pending_future(self, command_code: int) -> Optional[Future]:
+        """Oldest live future for ``command_code``. Caller holds the lock."""
+        futures = self._pending_futures.get(command_code)
+        while futures:
+            future = futures.popleft()
+            if future.set_running_or_notify_cancel():
+                if not futures:
+                    del self._pending_futures[command_code]
+                return future
+        self._pending_futures.pop(command_code, None)
+        return None
+
     def register_callback_handler(
         self, command_code: int, handler: Callable[[ParsedMessage], None]
     ):
@@ -269,10 +336,18 @@ class MessageDispatcher:
                 except queue.Full:
                     logger.error(f"Response queue full for 0x{command_code:04X}")
 
+            future = self._take_pending_future(command_code)
+
             # Check if this is an unsolicited callback with handlers
-            if command_code in self._callback_handlers:
+            if future is None and command_code in self._callback_handlers:
                 handlers = self._callback_handlers[command_code].copy()
 
+        # Resolve outside the lock: done-callbacks run synchronously
+        if future is not None:
+            self._stats["responses_dispatched"] += 1
+            future.set_result(message)
+            return
+
         # Call handlers outside the lock to prevent deadlocks
         if command_code in self._callback_handlers:
             for handler in handlers:
@@ -792,9 +867,16 @@ class CommandClient:
         """
         self._socket = command_socket
         self._dispatcher = MessageDispatcher()
-        self._reader = SocketReader(command_socket, self._dispatcher, on_closed)
+        self._on_closed = on_closed
+        self._reader = SocketReader(command_socket, self._dispatcher, self._closed)
         self._send_lock = threading.Lock()  # Serialize command sends
 
+    def _closed(self, reason: str):
+        """Reader saw the socket close: no pending batch response will come."""
+        self._dispatcher.fail_pending_futures(ConnectionError(reason))
+        if self._on_closed is not None:
+            self._on_closed(reason)
+
     def start(self):
         """Start the background reader."""
         self._reader.start()
@@ -802,6 +884,7 @@ class CommandClient:
     def stop(self):
         """Stop the background reader."""
         self._reader.stop()
+        self._dispatcher.fail_pending_futures(ConnectionError("Reader stopped"))
 
     def is_running(self) -> bool:
         """Check if client is running."""
@@ -857,6 +940,39 @@ class CommandClient:
             # Clean up pending request
             self._dispatcher.unregister_pending_request(expected_response_code)
 
+    def send_batch(
+        self, batch: bytes, expected_response_codes: Sequence[Optional[int]]
+    ) -> List[Optional[Future]]:
+        """
+        Send several encoded commands in one write and return their futures.
+
+        Futures are registered before anything is sent, so a fast response
+        cannot be missed. Commands that expect no response pass None.
+
+        Args:
+            batch: Concatenated 128-byte commands (ProtocolEncoder.encode_commands)
+            expected_response_codes: Response code per command, in batch order
+
+        Returns:
+            One Future (resolving to ParsedMessage) or None per command
+
+        Raises:
+            OSError: If the send fails (the futures are failed too)
+        """
+        futures = [
+            None if code is None else self._dispatcher.register_pending_future(code)
+            for code in expected_response_codes
+        ]
+        try:
+            with self._send_lock:
+                self._socket.sendall(batch)
+        except OSError as e:
+            self._dispatcher.fail_pending_futures(
+                e, [f for f in futures if f is not None]
+            )
+            raise
+        return futures
+
     def register_callback(
         self, command_code: int, handler: Callable[[ParsedMessage], None]
     ):
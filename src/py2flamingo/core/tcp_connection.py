@@ -15,9 +15,11 @@ import logging
 import socket
 import sys
 import threading
-from typing import TYPE_CHECKING, Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from .socket_reader import CommandClient, MessageDispatcher, ParsedMessage
 
 
@@ -643,6 +645,42 @@ class TCPConnection:
             command_bytes, expected_response_code, timeout
         )
 
+    def send_command_batch(
+        self, batch: bytes, expected_response_codes: Sequence[Optional[int]]
+    ) -> List[Optional["Future"]]:
+        """
+        Send several encoded commands in one write via the async reader.
+
+        Args:
+            batch: Concatenated 128-byte commands (ProtocolEncoder.encode_commands)
+            expected_response_codes: Response code per command (None if the
+                command is not acknowledged)
+
+        Returns:
+            Per command, a Future resolving to its ParsedMessage, or None.
+            Cancel futures you stop waiting on.
+
+        Raises:
+            RuntimeError: If async reader not active
+            ConnectionError: If not connected
+            ValueError: If batch size does not match the response codes
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to microscope")
+
+        if not self._command_client:
+            raise RuntimeError(
+                "Async reader not active - use send_bytes/receive_bytes instead"
+            )
+
+        if len(batch) != 128 * len(expected_response_codes):
+            raise ValueError(
+                f"Batch of {len(batch)} bytes does not hold "
+                f"{len(expected_response_codes)} commands"
+            )
+
+        return self._command_client.send_batch(batch, expected_response_codes)
+
     def register_callback(
         self, command_code: int, handler: Callable[["ParsedMessage"], None]
     ) -> None:
@@ -22,8 +22,9 @@ Protocol Structure (128 bytes total):
     - End marker: 0xFEDC4321 (4 bytes, uint32)
 """
 
+import logging
 import struct
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 # Import all command code classes for name lookup
 from py2flamingo.core.command_codes import (
@@ -36,6 +37,8 @@ from py2flamingo.core.command_codes import (
     SystemCommands,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CommandCode:
     """Command codes for microscope operations."""
@@ -167,6 +170,25 @@ class ProtocolEncoder:
     # Expected size of encoded command
     COMMAND_SIZE = 128
 
+    # Commands logged in detail on send (stage, camera, system, laser, LED)
+    _DEBUG_COMMANDS = frozenset(
+        [
+            24580,
+            24584,  # STAGE_POSITION_SET, STAGE_POSITION_GET
+            12327,
+            12343,  # CAMERA_IMAGE_SIZE_GET, CAMERA_PIXEL_FIELD_OF_VIEW_GET
+            40967,  # SYSTEM_STATE_GET
+            8193,
+            8196,
+            8199,  # LASER_LEVEL_SET, LASER_ENABLE_PREVIEW, LASER_DISABLE_ALL
+            16385,
+            16386,
+            16387,  # LED_SET, LED_PREVIEW_ENABLE, LED_PREVIEW_DISABLE
+            28676,
+            28678,  # ILLUMINATION_LEFT_ENABLE, ILLUMINATION_RIGHT_ENABLE
+        ]
+    )
+
     def encode_command(
         self,
         code: int,
@@ -200,6 +222,156 @@ class ProtocolEncoder:
             >>> len(cmd)
             128
         """
+        params, value, data = self._prepare_fields(code, status, params, value, data)
+        self._log_tx(code, status, params, value, data, additional_data_size)
+
+        # Pack command structure
+        # C++ SCommand struct field order (bytes 0-127):
+        # start, code, status, hardwareID, subsystemID, clientID,
+        # int32Data0, int32Data1, int32Data2, cmdDataBits0, value, addDataBytes, buffer, end
+        #
+        # Python params array maps DIRECTLY to C++ struct fields:
+        # params[0] → hardwareID (byte 12)
+        # params[1] → subsystemID (byte 16)
+        # params[2] → clientID (byte 20)
+        # params[3] → int32Data0 (byte 24) - AXIS/LASER INDEX GOES HERE!
+        # params[4] → int32Data1 (byte 28)
+        # params[5] → int32Data2 (byte 32)
+        # params[6] → cmdDataBits0 (byte 36)
+        try:
+            command_bytes = self.COMMAND_STRUCT.pack(
+                self.START_MARKER,  # Start marker
+                code,  # Command code
+                status,  # Status
+                params[0],  # hardwareID
+                params[1],  # subsystemID
+                params[2],  # clientID
+                params[3],  # int32Data0 (AXIS for stage, LASER INDEX for laser!)
+                params[4],  # int32Data1
+                params[5],  # int32Data2
+                params[6],  # cmdDataBits0
+                value,  # value (double)
+                additional_data_size,  # addDataBytes (size of additional file data)
+                data,  # data (72 bytes)
+                self.END_MARKER,  # End marker
+            )
+        except struct.error as e:
+            raise ValueError(f"Failed to pack command structure: {e}")
+
+        # Packed bytes verification — only at DEBUG level
+        if code in self._DEBUG_COMMANDS and code not in (24580, 24584):
+            logger.debug(f"[TX] --- Packed Bytes Verification ---")
+            logger.debug(
+                f"[TX] Bytes 0-3 (Start): 0x{struct.unpack('I', command_bytes[0:4])[0]:08X}"
+            )
+            logger.debug(
+                f"[TX] Bytes 4-7 (Code): {struct.unpack('I', command_bytes[4:8])[0]} (0x{struct.unpack('I', command_bytes[4:8])[0]:04X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 8-11 (Status): {struct.unpack('I', command_bytes[8:12])[0]}"
+            )
+            logger.debug(
+                f"[TX] Bytes 12-15 (hardwareID): {struct.unpack('I', command_bytes[12:16])[0]} (0x{struct.unpack('I', command_bytes[12:16])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 16-19 (subsystemID): {struct.unpack('I', command_bytes[16:20])[0]} (0x{struct.unpack('I', command_bytes[16:20])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 20-23 (clientID): {struct.unpack('I', command_bytes[20:24])[0]} (0x{struct.unpack('I', command_bytes[20:24])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 24-27 (int32Data0): {struct.unpack('I', command_bytes[24:28])[0]} (0x{struct.unpack('I', command_bytes[24:28])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 28-31 (int32Data1): {struct.unpack('I', command_bytes[28:32])[0]} (0x{struct.unpack('I', command_bytes[28:32])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 32-35 (int32Data2): {struct.unpack('I', command_bytes[32:36])[0]} (0x{struct.unpack('I', command_bytes[32:36])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 36-39 (cmdDataBits0): {struct.unpack('I', command_bytes[36:40])[0]} (0x{struct.unpack('I', command_bytes[36:40])[0]:08X})"
+            )
+            logger.debug(
+                f"[TX] Bytes 40-47 (Value): {struct.unpack('d', command_bytes[40:48])[0]}"
+            )
+            logger.debug(
+                f"[TX] Bytes 48-51 (addDataBytes): {struct.unpack('I', command_bytes[48:52])[0]}"
+            )
+            logger.debug(
+                f"[TX] Bytes 124-127 (End): 0x{struct.unpack('I', command_bytes[124:128])[0]:08X}"
+            )
+            logger.debug(f"[TX] ======================================")
+
+        # Verify size
+        if len(command_bytes) != self.COMMAND_SIZE:
+            raise ValueError(
+                f"Encoded command has wrong size: "
+                f"expected {self.COMMAND_SIZE}, got {len(command_bytes)}"
+            )
+
+        return command_bytes
+
+    def encode_commands(self, commands: Sequence[Mapping[str, Any]]) -> bytearray:
+        """
+        Encode several commands back-to-back into one buffer.
+
+        Each command is packed straight into its 128-byte slot of a single
+        preallocated buffer, so a burst (e.g. moving several stage axes) goes
+        out in one ``sendall`` instead of one send per command.
+
+        Args:
+            commands: One mapping per command with ``encode_command`` keyword
+                arguments (``code`` required)
+
+        Returns:
+            ``len(commands) * 128`` bytes
+
+        Raises:
+            ValueError: If any command is invalid (nothing is returned)
+
+        Example:
+            >>> batch = encoder.encode_commands([
+            ...     {"code": 0x6005, "params": [0, 0, 0, 1], "value": 7.5},
+            ...     {"code": 0x6005, "params": [0, 0, 0, 2], "value": 12.0},
+            ... ])
+            >>> len(batch)
+            256
+        """
+        buffer = bytearray(self.COMMAND_SIZE * len(commands))
+        for index, command in enumerate(commands):
+            code = command["code"]
+            status = command.get("status", 0)
+            additional_data_size = command.get("additional_data_size", 0)
+            params, value, data = self._prepare_fields(
+                code,
+                status,
+                command.get("params"),
+                command.get("value", 0.0),
+                command.get("data", b""),
+            )
+            self._log_tx(code, status, params, value, data, additional_data_size)
+            try:
+                self.COMMAND_STRUCT.pack_into(
+                    buffer,
+                    index * self.COMMAND_SIZE,
+                    self.START_MARKER,
+                    code,
+                    status,
+                    *params,
+                    value,
+                    additional_data_size,
+                    data,
+                    self.END_MARKER,
+                )
+            except struct.error as e:
+                raise ValueError(f"Failed to pack command structure: {e}")
+        return buffer
+
+    @staticmethod
+    def _prepare_fields(
+        code: int, status: int, params: Optional[List[int]], value: float, data
+    ):
+        """Validate and normalize fields: 7 params, float value, 72-byte data."""
         # Validate and prepare parameters
         if params is None:
             params = [0] * 7
@@ -235,29 +407,19 @@ class ProtocolEncoder:
         else:
             data = data.ljust(72, b"\x00")
 
-        # DEBUG: Log complete command details for debug commands
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        # List of commands to log in detail (stage, camera, system, laser, LED)
-        debug_commands = [
-            24580,
-            24584,  # STAGE_POSITION_SET, STAGE_POSITION_GET
-            12327,
-            12343,  # CAMERA_IMAGE_SIZE_GET, CAMERA_PIXEL_FIELD_OF_VIEW_GET
-            40967,  # SYSTEM_STATE_GET
-            8193,
-            8196,
-            8199,  # LASER_LEVEL_SET, LASER_ENABLE_PREVIEW, LASER_DISABLE_ALL
-            16385,
-            16386,
-            16387,  # LED_SET, LED_PREVIEW_ENABLE, LED_PREVIEW_DISABLE
-            28676,
-            28678,  # ILLUMINATION_LEFT_ENABLE, ILLUMINATION_RIGHT_ENABLE
-        ]
+        return params, value, data
 
-        if code in debug_commands:
+    def _log_tx(
+        self,
+        code: int,
+        status: int,
+        params: List[int],
+        value: float,
+        data: bytes,
+        additional_data_size: int,
+    ) -> None:
+        """Log outgoing commands of interest ([TX] lines)."""
+        if code in self._DEBUG_COMMANDS:
             cmd_name = get_command_name(code)
 
             # Compact logging for position commands (these work well, reduce verbosity)
@@ -310,92 +472,6 @@ class ProtocolEncoder:
                 logger.debug(f"[TX] Start Marker: 0x{self.START_MARKER:08X}")
                 logger.debug(f"[TX] End Marker: 0x{self.END_MARKER:08X}")
 
-        # Pack command structure
-        # C++ SCommand struct field order (bytes 0-127):
-        # start, code, status, hardwareID, subsystemID, clientID,
-        # int32Data0, int32Data1, int32Data2, cmdDataBits0, value, addDataBytes, buffer, end
-        #
-        # Python params array maps DIRECTLY to C++ struct fields:
-        # params[0] → hardwareID (byte 12)
-        # params[1] → subsystemID (byte 16)
-        # params[2] → clientID (byte 20)
-        # params[3] → int32Data0 (byte 24) - AXIS/LASER INDEX GOES HERE!
-        # params[4] → int32Data1 (byte 28)
-        # params[5] → int32Data2 (byte 32)
-        # params[6] → cmdDataBits0 (byte 36)
-        try:
-            command_bytes = self.COMMAND_STRUCT.pack(
-                self.START_MARKER,  # Start marker
-                code,  # Command code
-                status,  # Status
-                params[0],  # hardwareID
-                params[1],  # subsystemID
-                params[2],  # clientID
-                params[3],  # int32Data0 (AXIS for stage, LASER INDEX for laser!)
-                params[4],  # int32Data1
-                params[5],  # int32Data2
-                params[6],  # cmdDataBits0
-                value,  # value (double)
-                additional_data_size,  # addDataBytes (size of additional file data)
-                data,  # data (72 bytes)
-                self.END_MARKER,  # End marker
-            )
-        except struct.error as e:
-            raise ValueError(f"Failed to pack command structure: {e}")
-
-        # Packed bytes verification — only at DEBUG level
-        if code in debug_commands and code not in (24580, 24584):
-            logger.debug(f"[TX] --- Packed Bytes Verification ---")
-            logger.debug(
-                f"[TX] Bytes 0-3 (Start): 0x{struct.unpack('I', command_bytes[0:4])[0]:08X}"
-            )
-            logger.debug(
-                f"[TX] Bytes 4-7 (Code): {struct.unpack('I', command_bytes[4:8])[0]} (0x{struct.unpack('I', command_bytes[4:8])[0]:04X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 8-11 (Status): {struct.unpack('I', command_bytes[8:12])[0]}"
-            )
-            logger.debug(
-                f"[TX] Bytes 12-15 (hardwareID): {struct.unpack('I', command_bytes[12:16])[0]} (0x{struct.unpack('I', command_bytes[12:16])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 16-19 (subsystemID): {struct.unpack('I', command_bytes[16:20])[0]} (0x{struct.unpack('I', command_bytes[16:20])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 20-23 (clientID): {struct.unpack('I', command_bytes[20:24])[0]} (0x{struct.unpack('I', command_bytes[20:24])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 24-27 (int32Data0): {struct.unpack('I', command_bytes[24:28])[0]} (0x{struct.unpack('I', command_bytes[24:28])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 28-31 (int32Data1): {struct.unpack('I', command_bytes[28:32])[0]} (0x{struct.unpack('I', command_bytes[28:32])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 32-35 (int32Data2): {struct.unpack('I', command_bytes[32:36])[0]} (0x{struct.unpack('I', command_bytes[32:36])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 36-39 (cmdDataBits0): {struct.unpack('I', command_bytes[36:40])[0]} (0x{struct.unpack('I', command_bytes[36:40])[0]:08X})"
-            )
-            logger.debug(
-                f"[TX] Bytes 40-47 (Value): {struct.unpack('d', command_bytes[40:48])[0]}"
-            )
-            logger.debug(
-                f"[TX] Bytes 48-51 (addDataBytes): {struct.unpack('I', command_bytes[48:52])[0]}"
-            )
-            logger.debug(
-                f"[TX] Bytes 124-127 (End): 0x{struct.unpack('I', command_bytes[124:128])[0]:08X}"
-            )
-            logger.debug(f"[TX] ======================================")
-
-        # Verify size
-        if len(command_bytes) != self.COMMAND_SIZE:
-            raise ValueError(
-                f"Encoded command has wrong size: "
-                f"expected {self.COMMAND_SIZE}, got {len(command_bytes)}"
-            )
-
-        return command_bytes
-
 
 class ProtocolDecoder:
     """
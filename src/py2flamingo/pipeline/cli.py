@@ -138,6 +138,14 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override channel-axis index when it can't be inferred from --input",
     )
+    run_p.add_argument(
+        "--lazy",
+        action="store_true",
+        help=(
+            "Memory-map / lazily open --input; each channel is read only when "
+            "a node first uses it"
+        ),
+    )
     run_p.add_argument(
         "--skip-tag",
         type=str,
@@ -347,6 +355,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
                 args.input,
                 channel=args.volume_channel,
                 channel_axis=args.channel_axis,
+                lazy=args.lazy,
             )
         except (ValueError, FileNotFoundError, ImportError) as e:
             print(f"error: could not load --input: {e}", file=sys.stderr)
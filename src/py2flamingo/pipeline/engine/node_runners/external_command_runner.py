@@ -6,6 +6,13 @@ Config:
     input_format: str — 'tiff' or 'numpy' (how to serialize input data)
     output_format: str — 'csv', 'json', or 'numpy' (how to parse output)
     timeout_seconds: int — max execution time (default 300)
+    transport: str — 'file' (default), 'shm' or 'npy'. With 'shm', array
+        input is published as a shared-memory block and {input_file} is its
+        JSON descriptor (see shared_arrays); if that fails it falls back to a
+        .npy on tmpfs. With 'npy', array input always goes to a .npy on tmpfs,
+        for path-only tools that cannot read descriptors. Under either,
+        output descriptors (*.shm.json) are read back the same way, and .npy
+        outputs are memory-mapped instead of read.
 
 Inputs:
     input_data — ANY (data to serialize and pass to the command)
@@ -19,6 +26,7 @@ Outputs:
 
 import json
 import logging
+import os
 import subprocess
 import tempfile
 from pathlib import Path
@@ -27,6 +35,13 @@ import numpy as np
 
 from py2flamingo.pipeline.engine.context import ExecutionContext
 from py2flamingo.pipeline.engine.node_runners.base_runner import AbstractNodeRunner
+from py2flamingo.pipeline.engine.shared_arrays import (
+    DESCRIPTOR_SUFFIX,
+    publish_array,
+    ram_backed_tempdir,
+    read_array,
+    release_array,
+)
 from py2flamingo.pipeline.models.pipeline import Pipeline, PipelineNode
 from py2flamingo.pipeline.models.port_types import PortType
 
@@ -48,22 +63,33 @@ class ExternalCommandRunner(AbstractNodeRunner):
         input_format = config.get("input_format", "numpy")
         output_format = config.get("output_format", "json")
         timeout = config.get("timeout_seconds", 300)
+        transport = config.get("transport", "file")
+        use_shm = transport in ("shm", "npy")
 
         # Get input data
         input_data = self._get_input(node, pipeline, context, "input_data")
 
         # Create temp directory for I/O
-        with tempfile.TemporaryDirectory(prefix="pipeline_ext_") as tmpdir:
+        if use_shm:
+            tmp = ram_backed_tempdir(prefix="pipeline_ext_")
+        else:
+            tmp = tempfile.TemporaryDirectory(prefix="pipeline_ext_")
+        block = None
+        with tmp as tmpdir:
             tmpdir_path = Path(tmpdir)
             input_file = tmpdir_path / "input"
             output_dir = tmpdir_path / "output"
             output_dir.mkdir()
 
             # Serialize input
-            if input_data is not None:
-                self._serialize_input(input_data, input_file, input_format)
-            else:
+            if input_data is None:
                 input_file = Path("/dev/null")
+            elif transport == "npy" and isinstance(input_data, np.ndarray):
+                input_file = self._write_npy(input_data, input_file)
+            elif use_shm and isinstance(input_data, np.ndarray):
+                input_file, block = self._share_input(input_data, input_file)
+            else:
+                self._serialize_input(input_data, input_file, input_format)
 
             # Build command
             cmd = command_template.format(
@@ -73,31 +99,53 @@ class ExternalCommandRunner(AbstractNodeRunner):
 
             logger.info(f"External command '{node.name}': running: {cmd}")
 
-            # Execute
-            try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-            except subprocess.TimeoutExpired:
-                raise RuntimeError(
-                    f"External command timed out after {timeout}s: {cmd}"
+            env = None
+            if use_shm:
+                env = dict(
+                    os.environ,
+                    FLAMINGO_INPUT=str(input_file),
+                    FLAMINGO_OUTPUT_DIR=str(output_dir),
                 )
 
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
-                raise RuntimeError(
-                    f"External command failed (exit {result.returncode}): {stderr}"
+            try:
+                # Execute
+                try:
+                    result = subprocess.run(
+                        cmd,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=timeout,
+                        env=env,
+                    )
+                except subprocess.TimeoutExpired:
+                    raise RuntimeError(
+                        f"External command timed out after {timeout}s: {cmd}"
+                    )
+                finally:
+                    if block is not None:
+                        block.close()
+                        block.unlink()
+
+                if result.returncode != 0:
+                    stderr = result.stderr.strip()
+                    raise RuntimeError(
+                        f"External command failed (exit {result.returncode}): "
+                        f"{stderr}"
+                    )
+
+                if result.stdout.strip():
+                    logger.info(f"Command stdout: {result.stdout.strip()[:500]}")
+
+                # Parse output
+                output_data = self._parse_output(
+                    output_dir, output_format, mmap=use_shm
                 )
-
-            if result.stdout.strip():
-                logger.info(f"Command stdout: {result.stdout.strip()[:500]}")
-
-            # Parse output
-            output_data = self._parse_output(output_dir, output_format)
+            finally:
+                # Blocks a command hands back outlive it; release every one,
+                # including unread ones and those left by a failed run
+                for descriptor in output_dir.glob(f"*{DESCRIPTOR_SUFFIX}"):
+                    release_array(descriptor)
 
             # Set outputs
             self._set_output(node, context, "output_data", PortType.ANY, output_data)
@@ -108,6 +156,25 @@ class ExternalCommandRunner(AbstractNodeRunner):
 
         logger.info(f"External command '{node.name}': completed")
 
+    def _share_input(self, data: np.ndarray, path: Path):
+        """Publish array input in shared memory, or as a .npy on tmpfs.
+
+        Returns:
+            (path handed to the command, block to release or None)
+        """
+        descriptor = path.with_suffix(DESCRIPTOR_SUFFIX)
+        try:
+            return descriptor, publish_array(data, descriptor)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Shared memory unavailable ({e}); passing a .npy file")
+            return self._write_npy(data, path), None
+
+    def _write_npy(self, data: np.ndarray, path: Path) -> Path:
+        """Write array input as a .npy beside ``path`` and return its path."""
+        npy = path.with_suffix(".npy")
+        np.save(str(npy), data)
+        return npy
+
     def _serialize_input(self, data, path: Path, fmt: str) -> None:
         """Write input data to a file."""
         if fmt == "tiff":
@@ -137,13 +204,18 @@ class ExternalCommandRunner(AbstractNodeRunner):
                 else:
                     f.write(str(data).encode())
 
-    def _parse_output(self, output_dir: Path, fmt: str):
+    def _parse_output(self, output_dir: Path, fmt: str, mmap: bool = False):
         """Read output from the output directory."""
         files = sorted(output_dir.iterdir())
         if not files:
             logger.warning("External command produced no output files")
             return None
 
+        # An array handed back in shared memory wins over files
+        descriptors = [f for f in files if f.name.endswith(DESCRIPTOR_SUFFIX)]
+        if descriptors:
+            return read_array(descriptors[0])
+
         output_file = files[0]  # Take the first output file
 
         if fmt == "json":
@@ -157,7 +229,9 @@ class ExternalCommandRunner(AbstractNodeRunner):
                 reader = csv.DictReader(f)
                 return list(reader)
         elif fmt == "numpy":
-            return np.load(str(output_file), allow_pickle=False)
+            # A mapped file outlives its (tmpfs) directory on POSIX only
+            mmap_mode = "r" if mmap and os.name == "posix" else None
+            return np.load(str(output_file), allow_pickle=False, mmap_mode=mmap_mode)
         else:
             with open(output_file) as f:
                 return f.read()
@@ -7,6 +7,8 @@ Config:
     opening_enabled: bool — morphological opening
     opening_radius: int — opening structuring element radius
     min_object_size: int — minimum object size in voxels
+    otsu_channels: list — channels thresholded automatically (Otsu)
+    tiled: bool — process large volumes in overlapping blocks on a thread pool
 
 Inputs:
     volume — 3D numpy array (or uses current viewer data if unconnected)
@@ -73,6 +75,8 @@ class ThresholdRunner(AbstractNodeRunner):
             opening_enabled=config.get("opening_enabled", False),
             opening_radius=config.get("opening_radius", 1),
             min_object_size=config.get("min_object_size", 0),
+            otsu_channels=[int(c) for c in config.get("otsu_channels", []) or []],
+            tiled=bool(config.get("tiled", False)),
         )
 
         # Get input volume(s)
@@ -0,0 +1,170 @@
+"""
+Shared-memory array exchange between the pipeline and external commands.
+
+An array is published as a named shared-memory block plus a small JSON
+descriptor file (block name, shape, dtype, strides). Only the descriptor
+path crosses the process boundary; the child maps the same pages instead of
+reading a multi-GB file the parent just wrote.
+
+External tools written in Python can use this module directly:
+
+    volume, block = attach_array(sys.argv[1])
+    labels = segment(volume)
+    publish_array(labels, Path(out_dir) / "labels.shm.json", untrack=True)
+    block.close()
+
+A block published by a child must outlive the child, so it is created with
+``untrack=True`` and the parent unlinks it after reading (or with
+:func:`release_array` if it does not read it).
+"""
+
+import json
+import logging
+import os
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+if os.name == "posix":
+    import _posixshmem
+
+logger = logging.getLogger(__name__)
+
+# Output files with this suffix are descriptors, not data
+DESCRIPTOR_SUFFIX = ".shm.json"
+
+# tmpfs mount used for the path-based fallback, so a .npy never hits disk
+_RAM_DIR = Path("/dev/shm")
+
+
+def _untrack(block: shared_memory.SharedMemory) -> None:
+    """Stop this process's resource tracker from unlinking the block at exit.
+
+    Before Python 3.13 attaching to a block registers it too, so a child that
+    merely reads the parent's input would destroy it on exit.
+    """
+    try:
+        resource_tracker.unregister(block._name, "shared_memory")
+    except Exception:
+        pass
+
+
+def _unlink_untracked(block: shared_memory.SharedMemory) -> None:
+    """Unlink a block that is not registered with this process's tracker.
+
+    ``SharedMemory.unlink()`` unregisters the block as well, which for an
+    untracked block makes the resource tracker print a KeyError traceback.
+    """
+    if os.name == "posix":
+        _posixshmem.shm_unlink(block._name)
+    else:
+        # Windows frees the block with its last handle
+        block.unlink()
+
+
+def publish_array(
+    array: np.ndarray,
+    descriptor_path: Union[str, Path],
+    untrack: bool = False,
+) -> shared_memory.SharedMemory:
+    """Copy an array into a new shared-memory block and describe it.
+
+    Args:
+        array: Array to publish (made C-contiguous if it is not)
+        descriptor_path: Where to write the JSON descriptor
+        untrack: Leave the block alive when this process exits, for a child
+            handing a result back to its parent
+
+    Returns:
+        The block; the caller closes it and, if it owns it, unlinks it
+    """
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    if untrack:
+        _untrack(block)
+    try:
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        del view
+
+        descriptor = {
+            "name": block.name,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+            "strides": list(array.strides),
+            "order": "C",
+        }
+        Path(descriptor_path).write_text(json.dumps(descriptor))
+    except Exception:
+        block.close()
+        if untrack:
+            _unlink_untracked(block)
+        else:
+            block.unlink()
+        raise
+    return block
+
+
+def attach_array(
+    descriptor_path: Union[str, Path],
+) -> Tuple[np.ndarray, shared_memory.SharedMemory]:
+    """Map a published array without copying it.
+
+    Returns:
+        (array view, block). The view is only valid until the block is
+        closed, so drop it first.
+    """
+    descriptor = json.loads(Path(descriptor_path).read_text())
+    block = shared_memory.SharedMemory(name=descriptor["name"])
+    _untrack(block)
+    array = np.ndarray(
+        tuple(descriptor["shape"]),
+        dtype=np.dtype(descriptor["dtype"]),
+        buffer=block.buf,
+        strides=tuple(descriptor["strides"]),
+    )
+    return array, block
+
+
+def read_array(descriptor_path: Union[str, Path], unlink: bool = True) -> np.ndarray:
+    """Copy a published array out of shared memory and release the block."""
+    view, block = attach_array(descriptor_path)
+    try:
+        return view.copy()
+    finally:
+        del view
+        block.close()
+        if unlink:
+            _unlink_untracked(block)
+
+
+def release_array(descriptor_path: Union[str, Path]) -> None:
+    """Unlink a published block without reading it.
+
+    Blocks that were already released are skipped, so this is safe to call on
+    every descriptor a command left behind.
+    """
+    try:
+        view, block = attach_array(descriptor_path)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not release shared array {descriptor_path}: {e}")
+        return
+    del view
+    block.close()
+    _unlink_untracked(block)
+
+
+def ram_backed_tempdir(prefix: str) -> tempfile.TemporaryDirectory:
+    """A temporary directory on tmpfs when the platform has one.
+
+    Path-only tools still get a real ``.npy`` file, but it lives in RAM.
+    """
+    ram_dir: Optional[str] = None
+    if _RAM_DIR.is_dir() and os.access(_RAM_DIR, os.W_OK):
+        ram_dir = str(_RAM_DIR)
+    return tempfile.TemporaryDirectory(prefix=prefix, dir=ram_dir)
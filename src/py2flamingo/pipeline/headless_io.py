@@ -20,13 +20,19 @@ Supported inputs (dispatched on suffix):
 Every returned value is a 3-D ``(Z, Y, X)`` array; 2-D inputs gain a leading
 singleton Z so downstream runners (THRESHOLD, OVERVIEW_ANALYSIS) always see a
 volume.
+
+Sources are opened without reading pixels — ``.npy`` and uncompressed TIFF are
+memory-mapped, zarr is wrapped as a chunk-lazy dask array — and channel/axis
+splitting is done with views. Only the channels (and ``z_range``) that are
+returned get read; with ``lazy=True`` not even those are, and each channel is
+paged or computed in when a runner first touches it.
 """
 
 from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
@@ -47,6 +53,8 @@ def load_volumes(
     *,
     channel: Optional[int] = None,
     channel_axis: Optional[int] = None,
+    lazy: bool = False,
+    z_range: Optional[Tuple[int, int]] = None,
 ) -> Dict[int, np.ndarray]:
     """Load an image file into a ``{channel_id: (Z, Y, X) ndarray}`` dict.
 
@@ -57,9 +65,13 @@ def load_volumes(
             multi-channel source it selects which channel to return.
         channel_axis: Override channel-axis detection (0-based index into the
             raw array). Use when ``tifffile`` cannot infer the axis order.
+        lazy: Return ``np.memmap`` views (``.npy``, uncompressed TIFF) or dask
+            arrays (zarr) instead of in-memory arrays. Compressed TIFF cannot
+            be mapped and is always read.
+        z_range: ``(start, stop)`` Z slice applied to every returned channel.
 
     Returns:
-        Mapping of integer channel id → 3-D ``(Z, Y, X)`` numpy array.
+        Mapping of integer channel id → 3-D ``(Z, Y, X)`` array.
 
     Raises:
         FileNotFoundError: Path does not exist.
@@ -85,7 +97,19 @@ def load_volumes(
             "Supported: .npy, .tif/.tiff/.ome.tif, .zarr/.ome.zarr"
         )
 
-    return _select_channel(volumes, channel)
+    volumes = _select_channel(volumes, channel)
+    if z_range is not None:
+        volumes = {c: v[slice(*z_range)] for c, v in volumes.items()}
+    if lazy:
+        return volumes
+    return {c: _materialize(v) for c, v in volumes.items()}
+
+
+def _materialize(arr) -> np.ndarray:
+    """Read a mapped or lazy channel view into an in-memory ndarray."""
+    if isinstance(arr, np.memmap):
+        return np.array(arr)
+    return np.asarray(arr)
 
 
 # ---------------------------------------------------------------------------
@@ -94,7 +118,7 @@ def load_volumes(
 
 
 def _load_npy(p: Path, *, channel_axis: Optional[int]) -> Dict[int, np.ndarray]:
-    arr = np.load(str(p))
+    arr = np.load(str(p), mmap_mode="r")
     logger.info("Loaded .npy %s: shape=%s dtype=%s", p.name, arr.shape, arr.dtype)
     return _split_array(arr, axes=None, channel_axis=channel_axis)
 
@@ -109,12 +133,13 @@ def _load_tiff(p: Path, *, channel_axis: Optional[int]) -> Dict[int, np.ndarray]
 
     with tifffile.TiffFile(str(p)) as tif:
         series = tif.series[0] if tif.series else None
-        if series is not None:
-            arr = series.asarray()
-            axes = series.axes  # e.g. 'YX', 'ZYX', 'CYX', 'TZCYX'
-        else:
-            arr = tif.asarray()
-            axes = None
+        axes = series.axes if series is not None else None  # e.g. 'TZCYX'
+        try:
+            arr = tifffile.memmap(str(p), series=0, mode="r")
+        except ValueError:
+            # Compressed or scattered pages: no way around a full read
+            logger.debug("TIFF %s is not memory-mappable; reading it", p.name)
+            arr = series.asarray() if series is not None else tif.asarray()
     logger.info(
         "Loaded TIFF %s: shape=%s dtype=%s axes=%s", p.name, arr.shape, arr.dtype, axes
     )
@@ -136,10 +161,18 @@ def _load_zarr(p: Path, *, channel_axis: Optional[int]) -> Dict[int, np.ndarray]
             "zarr is required to load .zarr input. pip install zarr"
         ) from e
 
+    import dask.array as da
+
     store = _create_zarr_store(str(p))
     root = zarr.open_group(store=store, mode="r")
     node = _find_zarr_array(root, p)
-    arr = np.asarray(node[:])
+    # One task per shard (or chunk); nothing is read until a channel is used
+    arr = da.from_array(
+        node,
+        chunks=getattr(node, "shards", None) or node.chunks,
+        meta=np.empty((0,) * node.ndim, dtype=node.dtype),
+        name=False,
+    )
     logger.info("Loaded zarr %s: shape=%s dtype=%s", p.name, arr.shape, arr.dtype)
     # OME-Zarr from this app is typically (C,Z,Y,X) or (Z,Y,X); no T axis.
     axes = "CZYX" if arr.ndim == 4 else ("ZYX" if arr.ndim == 3 else None)
@@ -185,7 +218,7 @@ def _split_with_axes(arr: np.ndarray, axes: str) -> Dict[int, np.ndarray]:
         if not reducible:
             break
         i = reducible[0]
-        arr = np.take(arr, 0, axis=i)
+        arr = arr[(slice(None),) * i + (0,)]  # a view, unlike np.take
         axes = axes[:i] + axes[i + 1 :]
 
     if "C" in axes:
@@ -70,6 +70,9 @@ class InMemoryVoxelStorage:
     arrive with string channel keys (JSON spec) but ``ThresholdRunner``'s
     fallback at ``threshold_runner.py:88`` hard-codes int ``0``. Without
     normalization the lookup misses.
+
+    Values may be memory-mapped or lazy arrays from
+    ``load_volumes(..., lazy=True)``; lazy ones are materialized on first use.
     """
 
     def __init__(self, volumes_by_channel: Optional[Dict[Any, np.ndarray]] = None):
@@ -95,7 +98,12 @@ class InMemoryVoxelStorage:
         ch = self._coerce(channel)
         if ch is None:
             return None
-        return self._volumes.get(ch)
+        vol = self._volumes.get(ch)
+        if vol is not None and not isinstance(vol, np.ndarray):
+            # Lazy (dask) channel from load_volumes(lazy=True): read it the
+            # first time a runner asks, and only that channel.
+            vol = self._volumes[ch] = np.asarray(vol)
+        return vol
 
 
 # ---------------------------------------------------------------------------
@@ -7,14 +7,24 @@ can be used both by the interactive dialog and by pipeline ThresholdRunner nodes
 
 GPU-accelerated when CuPy is available (gaussian filter, morphological opening,
 connected component labeling).  Falls back transparently to CPU (scipy.ndimage).
+
+Volumes too large to smooth in one piece (native-resolution stitched data) can
+be processed in tiled mode: overlapping blocks are smoothed, thresholded and
+opened on a thread pool, and their connected components are stitched across
+block faces.  On the CPU the tiled result is identical to the monolithic one.
 """
 
+import itertools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from py2flamingo.pipeline.models.detected_object import DetectedObject
 from py2flamingo.visualization.gpu_transforms import (
@@ -37,6 +47,12 @@ class ThresholdSettings:
         opening_enabled: Whether to apply morphological opening
         opening_radius: Radius for opening structuring element
         min_object_size: Minimum connected-component size in voxels (0 = no filter)
+        otsu_channels: Channels thresholded at Otsu's value of the (smoothed)
+            volume instead of their channel_thresholds entry
+        otsu_bins: Histogram bins used for Otsu's method
+        tiled: Process the volume in overlapping blocks on a thread pool
+        tile_shape: Core block shape (z, y, x) for tiled mode
+        max_workers: Thread count for tiled mode (None = CPU count)
     """
 
     channel_thresholds: Dict[int, float] = field(default_factory=dict)
@@ -44,6 +60,11 @@ class ThresholdSettings:
     opening_enabled: bool = False
     opening_radius: int = 1
     min_object_size: int = 0
+    otsu_channels: List[int] = field(default_factory=list)
+    otsu_bins: int = 256
+    tiled: bool = False
+    tile_shape: Tuple[int, int, int] = (64, 512, 512)
+    max_workers: Optional[int] = None
 
 
 @dataclass
@@ -55,12 +76,14 @@ class ThresholdResult:
         labels: Integer 3D array with per-channel labels
         objects: List of detected connected components
         object_count: Number of detected objects
+        thresholds: Map of channel_id -> threshold actually applied
     """
 
     combined_mask: Optional[np.ndarray] = None
     labels: Optional[np.ndarray] = None
     objects: List[DetectedObject] = field(default_factory=list)
     object_count: int = 0
+    thresholds: Dict[int, float] = field(default_factory=dict)
 
 
 class ThresholdAnalysisService:
@@ -98,20 +121,22 @@ class ThresholdAnalysisService:
         Returns:
             ThresholdResult with mask, labels, and detected objects
         """
+        channels = self._active_channels(volumes, settings)
+        if settings.tiled:
+            return self._analyze_tiled(
+                channels, volumes, settings, voxel_size_um, voxel_to_stage_fn
+            )
+
         combined: Optional[np.ndarray] = None
         labels: Optional[np.ndarray] = None
+        thresholds: Dict[int, float] = {}
 
         # Keep original (pre-smoothing) volumes for intensity feature extraction
         original_volumes = volumes
 
         # --- Per-channel threshold ---
-        for ch_id, threshold in settings.channel_thresholds.items():
-            if threshold <= 0:
-                continue
-            vol = volumes.get(ch_id)
-            if vol is None:
-                logger.warning(f"No volume for channel {ch_id}, skipping")
-                continue
+        for ch_id, vol in channels:
+            raw = vol
 
             # Gaussian smoothing (GPU-accelerated)
             if settings.gauss_sigma > 0:
@@ -119,17 +144,19 @@ class ThresholdAnalysisService:
                     vol.astype(np.float32), sigma=settings.gauss_sigma
                 )
 
-            ch_mask = vol >= threshold
+            if ch_id in settings.otsu_channels:
+                value_range = (float(np.min(raw)), float(np.max(raw)))
+                hist, edges = _histogram(vol, value_range, settings.otsu_bins)
+                thresholds[ch_id] = _otsu_from_histogram(hist, edges)
+            else:
+                thresholds[ch_id] = settings.channel_thresholds[ch_id]
+
+            ch_mask = vol >= thresholds[ch_id]
 
             if combined is None:
                 combined = ch_mask
                 labels = np.zeros(ch_mask.shape, dtype=np.int32)
             else:
-                if combined.shape != ch_mask.shape:
-                    logger.warning(
-                        f"Shape mismatch ch {ch_id}: {ch_mask.shape} vs {combined.shape}"
-                    )
-                    continue
                 combined = combined | ch_mask
 
             # Per-channel label (ch_id + 1); later channels overwrite in overlap
@@ -137,7 +164,7 @@ class ThresholdAnalysisService:
 
         # --- Post-union processing ---
         if combined is None or not combined.any():
-            return ThresholdResult()
+            return ThresholdResult(thresholds=thresholds)
 
         # Morphological opening (GPU-accelerated)
         if settings.opening_enabled:
@@ -170,6 +197,224 @@ class ThresholdAnalysisService:
             labels=labels,
             objects=objects,
             object_count=len(objects),
+            thresholds=thresholds,
+        )
+
+    @staticmethod
+    def _active_channels(
+        volumes: Dict[int, Any], settings: ThresholdSettings
+    ) -> List[Tuple[int, Any]]:
+        """Channels to threshold, in label-overwrite order, with their volumes.
+
+        A channel takes part if it has a positive threshold or is listed in
+        otsu_channels.  Channels without a volume, or whose shape differs from
+        the first usable channel, are skipped with a warning.
+        """
+        otsu = set(settings.otsu_channels)
+        candidates = [
+            ch_id
+            for ch_id, threshold in settings.channel_thresholds.items()
+            if threshold > 0 or ch_id in otsu
+        ]
+        candidates += [ch for ch in settings.otsu_channels if ch not in candidates]
+
+        channels: List[Tuple[int, Any]] = []
+        for ch_id in candidates:
+            vol = volumes.get(ch_id)
+            if vol is None:
+                logger.warning(f"No volume for channel {ch_id}, skipping")
+                continue
+            if channels and vol.shape != channels[0][1].shape:
+                logger.warning(
+                    f"Shape mismatch ch {ch_id}: {vol.shape} vs {channels[0][1].shape}"
+                )
+                continue
+            channels.append((ch_id, vol))
+        return channels
+
+    def _analyze_tiled(
+        self,
+        channels: List[Tuple[int, Any]],
+        volumes: Dict[int, Any],
+        settings: ThresholdSettings,
+        voxel_size_um: Tuple[float, float, float],
+        voxel_to_stage_fn: Optional[Callable],
+    ) -> ThresholdResult:
+        """Blockwise version of analyze() with the same result.
+
+        Each block is read with a halo wide enough that its core sees exactly
+        the neighbourhood the full-volume filters would: the Gaussian radius,
+        plus twice the opening radius (erosion then dilation).  Otsu thresholds
+        come from a histogram summed over block cores.  Blocks are labelled
+        independently and components touching across a block face are merged,
+        then renumbered in raster order of their first voxel so label ids
+        match ndimage.label on the whole mask.  Only the boolean mask and two
+        int32 label volumes are held at full size; volumes may be memory maps.
+        """
+        if not channels:
+            return ThresholdResult()
+
+        shape = tuple(channels[0][1].shape)
+        blocks = _block_grid(shape, settings.tile_shape)
+        sigma = settings.gauss_sigma
+        smooth_halo = _gaussian_radius(sigma) if sigma > 0 else 0
+        halo = smooth_halo
+        struct = None
+        if settings.opening_enabled:
+            struct = ndimage.iterate_structure(
+                ndimage.generate_binary_structure(3, 1), settings.opening_radius
+            )
+            halo += 2 * settings.opening_radius
+
+        def smoothed(vol, core, block_halo):
+            padded, inner = _padded_block(core, block_halo, shape)
+            data = np.asarray(vol[padded])
+            if sigma > 0:
+                data = gaussian_filter_auto(
+                    data.astype(np.float32), sigma=sigma, force_cpu=True
+                )
+            return data, inner
+
+        workers = settings.max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="threshold-tile"
+        ) as pool:
+            # --- Thresholds (Otsu from a global histogram over block cores) ---
+            thresholds: Dict[int, float] = {}
+            for ch_id, vol in channels:
+                if ch_id not in settings.otsu_channels:
+                    thresholds[ch_id] = settings.channel_thresholds[ch_id]
+                    continue
+                ranges = list(
+                    pool.map(
+                        lambda b, v=vol: (
+                            float(np.min(v[b.core])),
+                            float(np.max(v[b.core])),
+                        ),
+                        blocks,
+                    )
+                )
+                value_range = (min(r[0] for r in ranges), max(r[1] for r in ranges))
+
+                def block_histogram(b, v=vol, value_range=value_range):
+                    data, inner = smoothed(v, b.core, smooth_halo)
+                    return _histogram(data[inner], value_range, settings.otsu_bins)
+
+                hist = None
+                for block_hist, edges in pool.map(block_histogram, blocks):
+                    hist = block_hist if hist is None else hist + block_hist
+                thresholds[ch_id] = _otsu_from_histogram(hist, edges)
+
+            # --- Threshold, union, opening and per-block labelling ---
+            combined = np.zeros(shape, dtype=bool)
+            labels = np.zeros(shape, dtype=np.int32)
+            components = np.zeros(shape, dtype=np.int32)
+
+            def threshold_block(b):
+                block_mask = block_labels = None
+                for ch_id, vol in channels:
+                    data, inner = smoothed(vol, b.core, halo)
+                    ch_mask = data >= thresholds[ch_id]
+                    if block_mask is None:
+                        block_mask = ch_mask
+                        block_labels = np.zeros(ch_mask.shape, dtype=np.int32)
+                    else:
+                        block_mask = block_mask | ch_mask
+                    block_labels[ch_mask] = ch_id + 1
+
+                any_before_opening = bool(block_mask[inner].any())
+                if struct is not None:
+                    block_mask = ndimage.binary_opening(block_mask, structure=struct)
+                core_mask = block_mask[inner]
+                core_labels = block_labels[inner]
+                core_labels[~core_mask] = 0
+                combined[b.core] = core_mask
+                labels[b.core] = core_labels
+
+                local, n = ndimage.label(core_mask)
+                components[b.core] = local
+                return any_before_opening, n, *_component_stats(local, n, b, shape)
+
+            stats = list(pool.map(threshold_block, blocks))
+            if not any(s[0] for s in stats):
+                return ThresholdResult(thresholds=thresholds)
+
+            # --- Stitch components across block faces ---
+            counts = np.array([s[1] for s in stats], dtype=np.int64)
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            num_local = int(counts.sum())
+            sizes = np.concatenate([s[2] for s in stats])
+            firsts = np.concatenate([s[3] for s in stats])
+
+            pairs = [np.empty((0, 2), dtype=np.int64)]
+            for i, b in enumerate(blocks):
+                for axis, j in b.neighbours.items():
+                    a_face = list(b.core)
+                    a_face[axis] = slice(b.core[axis].stop - 1, b.core[axis].stop)
+                    b_face = list(a_face)
+                    b_face[axis] = slice(b.core[axis].stop, b.core[axis].stop + 1)
+                    left = components[tuple(a_face)].ravel()
+                    right = components[tuple(b_face)].ravel()
+                    touching = (left > 0) & (right > 0)
+                    if touching.any():
+                        pairs.append(
+                            np.unique(
+                                np.stack(
+                                    [
+                                        left[touching] + offsets[i],
+                                        right[touching] + offsets[j],
+                                    ],
+                                    axis=1,
+                                ),
+                                axis=0,
+                            )
+                        )
+            pairs = np.concatenate(pairs) - 1
+            graph = coo_matrix(
+                (np.ones(len(pairs), dtype=np.int8), (pairs[:, 0], pairs[:, 1])),
+                shape=(num_local, num_local),
+            )
+            num_merged, merged = connected_components(graph, directed=False)
+
+            merged_sizes = np.bincount(merged, weights=sizes, minlength=num_merged)
+            merged_first = np.full(num_merged, np.iinfo(np.int64).max)
+            np.minimum.at(merged_first, merged, firsts)
+            keep = merged_sizes >= max(settings.min_object_size, 1)
+            order = np.argsort(merged_first, kind="stable")
+            order = order[keep[order]]
+            final_ids = np.zeros(num_merged, dtype=np.int32)
+            final_ids[order] = np.arange(1, len(order) + 1, dtype=np.int32)
+            lut = np.zeros(num_local + 1, dtype=np.int32)
+            lut[1:] = final_ids[merged]
+            num_features = len(order)
+
+            def relabel_block(i):
+                b = blocks[i]
+                block = components[b.core]
+                nonzero = block > 0
+                block[nonzero] = lut[block[nonzero] + offsets[i]]
+                if settings.min_object_size > 0:
+                    mask_view = combined[b.core]
+                    mask_view &= block > 0
+                    labels[b.core][~mask_view] = 0
+
+            list(pool.map(relabel_block, range(len(blocks))))
+
+        objects = self._extract_objects(
+            combined,
+            labels,
+            voxel_size_um,
+            voxel_to_stage_fn,
+            volumes,
+            labeled=(components, num_features),
+        )
+
+        return ThresholdResult(
+            combined_mask=combined,
+            labels=labels,
+            objects=objects,
+            object_count=len(objects),
+            thresholds=thresholds,
         )
 
     def _extract_objects(
@@ -179,15 +424,19 @@ class ThresholdAnalysisService:
         voxel_size_um: Tuple[float, float, float],
         voxel_to_stage_fn: Optional[Callable],
         volumes: Optional[Dict[int, np.ndarray]] = None,
+        labeled: Optional[Tuple[np.ndarray, int]] = None,
     ) -> List[DetectedObject]:
         """Extract per-component DetectedObject instances from the mask.
 
-        Uses GPU-accelerated labeling where beneficial, then extracts per-object
-        features including intensity statistics, surface area, sphericity, and
-        elongation via principal axis analysis.
+        Uses GPU-accelerated labeling where beneficial (unless the caller
+        passes an existing ``(labeled_arr, num_features)``), then extracts
+        per-object features including intensity statistics, surface area,
+        sphericity, and elongation via principal axis analysis.
         """
         # GPU-accelerated connected component labeling
-        labeled_arr, num_features = label_auto(mask)
+        if labeled is None:
+            labeled = label_auto(mask)
+        labeled_arr, num_features = labeled
         if num_features == 0:
             return []
 
@@ -286,6 +535,112 @@ class ThresholdAnalysisService:
         return objects
 
 
+class _Block(NamedTuple):
+    """One tile of the tiled pipeline: its core region and face neighbours."""
+
+    core: Tuple[slice, slice, slice]
+    neighbours: Dict[int, int]  # axis -> index of the next block along it
+
+
+def _block_grid(
+    shape: Tuple[int, ...], tile_shape: Tuple[int, int, int]
+) -> List[_Block]:
+    """Split a volume into a regular grid of non-overlapping core blocks."""
+    starts = [range(0, n, max(int(t), 1)) for n, t in zip(shape, tile_shape)]
+    grid = tuple(len(r) for r in starts)
+    blocks = []
+    for index in itertools.product(*(range(g) for g in grid)):
+        core = tuple(
+            slice(r[i], min(r[i] + max(int(t), 1), n))
+            for r, i, t, n in zip(starts, index, tile_shape, shape)
+        )
+        neighbours = {}
+        for axis in range(len(shape)):
+            if index[axis] + 1 < grid[axis]:
+                nxt = list(index)
+                nxt[axis] += 1
+                neighbours[axis] = int(np.ravel_multi_index(nxt, grid))
+        blocks.append(_Block(core, neighbours))
+    return blocks
+
+
+def _padded_block(
+    core: Tuple[slice, ...], halo: int, shape: Tuple[int, ...]
+) -> Tuple[Tuple[slice, ...], Tuple[slice, ...]]:
+    """Grow a core block by ``halo`` (clipped to the volume).
+
+    Returns:
+        (padded slices into the volume, core slices into the padded block)
+    """
+    padded = tuple(
+        slice(max(s.start - halo, 0), min(s.stop + halo, n))
+        for s, n in zip(core, shape)
+    )
+    inner = tuple(
+        slice(s.start - p.start, s.stop - p.start) for s, p in zip(core, padded)
+    )
+    return padded, inner
+
+
+def _gaussian_radius(sigma: float) -> int:
+    """Kernel radius of scipy's gaussian_filter at its default truncate=4."""
+    return int(4.0 * float(sigma) + 0.5)
+
+
+def _histogram(
+    values: np.ndarray, value_range: Tuple[float, float], bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fixed-range histogram; smoothed values are clipped into the raw range.
+
+    Using the raw volume's range keeps bin edges identical whether the
+    histogram is built in one piece or summed over blocks.
+    """
+    lo, hi = value_range
+    return np.histogram(np.clip(values, lo, hi), bins=bins, range=(lo, hi))
+
+
+def _otsu_from_histogram(hist: np.ndarray, edges: np.ndarray) -> float:
+    """Otsu's threshold (bin centre maximising between-class variance)."""
+    centers = (edges[:-1] + edges[1:]) / 2
+    hist = hist.astype(np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    sum_bg = np.cumsum(centers * hist)
+    valid = (weight_bg > 0) & (weight_fg > 0)
+    if not valid.any():
+        return float(centers[0])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_bg[-1] - sum_bg) / weight_fg
+    var_between = np.where(
+        valid, weight_bg * weight_fg * (mean_bg - mean_fg) ** 2, -1.0
+    )
+    return float(centers[int(np.argmax(var_between))])
+
+
+def _component_stats(
+    local: np.ndarray, num: int, block: _Block, shape: Tuple[int, ...]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Voxel count and global raster index of the first voxel per local label.
+
+    ndimage.label numbers components in raster order, so each label's first
+    voxel is where the running maximum of the foreground labels reaches it.
+    Raster order within a block agrees with raster order of the full volume.
+    """
+    flat = np.flatnonzero(local)
+    values = local.ravel()[flat]
+    sizes = np.bincount(values, minlength=num + 1)[1:].astype(np.int64)
+    is_first = np.ones(values.shape, dtype=bool)
+    if values.size > 1:
+        is_first[1:] = values[1:] > np.maximum.accumulate(values)[:-1]
+    coords = np.unravel_index(flat[is_first], local.shape)
+    firsts = np.ravel_multi_index(
+        tuple(c + s.start for c, s in zip(coords, block.core)), shape
+    ).astype(np.int64)
+    return sizes, firsts
+
+
 def _compute_surface_sphericity(
     region_mask: np.ndarray, volume_voxels: int
 ) -> Tuple[int, float]:
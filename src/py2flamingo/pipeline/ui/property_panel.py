@@ -45,6 +45,7 @@ LEGACY_KEYS: Dict[NodeType, set] = {
     NodeType.THRESHOLD: {
         "channel_thresholds",  # managed by per-channel threshold widgets
         "enabled_channels",  # managed by per-channel threshold widgets
+        "otsu_channels",  # set alongside channel_thresholds (scripts / JSON)
         "voxel_size_um",  # auto-derived from coordinate_config
     },
     NodeType.WORKFLOW: {
@@ -74,6 +75,7 @@ _CONFIG_SCHEMAS: Dict[NodeType, list] = {
         ("opening_radius", "Opening Radius", "int", 1),
         ("min_object_size", "Min Object Size (voxels)", "int", 0),
         ("default_threshold", "Default Threshold", "int", 100),
+        ("tiled", "Tiled (large volumes)", "bool", False),
     ],
     NodeType.FOR_EACH: [],
     NodeType.CONDITIONAL: [
@@ -91,6 +93,7 @@ _CONFIG_SCHEMAS: Dict[NodeType, list] = {
         ("input_format", "Input Format", "combo", "numpy", ["numpy", "tiff", "json"]),
         ("output_format", "Output Format", "combo", "json", ["json", "csv", "numpy"]),
         ("timeout_seconds", "Timeout (s)", "int", 300),
+        ("transport", "Transport", "combo", "file", ["file", "shm", "npy"]),
     ],
     NodeType.SAMPLE_VIEW_DATA: [
         ("channel_0", "Channel 1 (405nm) L", "bool", True),
@@ -8,6 +8,7 @@ Public API::
 
     from py2flamingo.psf_analysis import (
         PSFAnalysisService, PSFSettings, PSFResult, PSFBead, AxisFit, load_volume,
+        PSFResultCache,
     )
 
 Credit: the analysis reimplements the approach of mesoSPIM-PSFanalysis
@@ -15,6 +16,7 @@ Credit: the analysis reimplements the approach of mesoSPIM-PSFanalysis
 Sofroniew's ``psf`` (https://github.com/sofroniewn/psf, MIT). See ``NOTICE``.
 """
 
+from py2flamingo.psf_analysis.cache import PSFResultCache
 from py2flamingo.psf_analysis.io import load_volume
 from py2flamingo.psf_analysis.models import AxisFit, PSFBead, PSFResult
 from py2flamingo.psf_analysis.service import PSFAnalysisService, PSFSettings
@@ -26,4 +28,5 @@ __all__ = [
     "PSFBead",
     "AxisFit",
     "load_volume",
+    "PSFResultCache",
 ]
@@ -14,6 +14,11 @@ import logging
 import sys
 from pathlib import Path
 
+from py2flamingo.psf_analysis.cache import (
+    DEFAULT_CACHE_DIR,
+    PSFResultCache,
+    file_fingerprint,
+)
 from py2flamingo.psf_analysis.io import load_volume
 from py2flamingo.psf_analysis.service import PSFAnalysisService, PSFSettings
 
@@ -37,6 +42,14 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Z step in µm (overrides file metadata)",
     )
     p.add_argument("--channel", type=int, default=None, help="Channel to analyze")
+    p.add_argument(
+        "--z-range",
+        type=int,
+        nargs=2,
+        metavar=("START", "STOP"),
+        default=None,
+        help="Only analyze Z planes START..STOP-1 (e.g. the bead layer)",
+    )
     p.add_argument(
         "--csv", type=Path, default=None, help="Write per-bead CSV to this path"
     )
@@ -61,6 +74,15 @@ def _build_parser() -> argparse.ArgumentParser:
         default=10.0,
         help="Reject beads with a neighbor closer than this (µm)",
     )
+    p.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Reuse detections and bead fits from earlier runs stored here",
+    )
+    p.add_argument(
+        "--no-cache", action="store_true", help="Always detect and fit from scratch"
+    )
     p.add_argument("-v", "--verbose", action="store_true", help="Debug logging")
     return p
 
@@ -72,7 +94,10 @@ def main(argv=None) -> int:
         format="%(levelname)s %(name)s: %(message)s",
     )
 
-    volume, (z_file, y_file, x_file) = load_volume(args.input, channel=args.channel)
+    z_range = tuple(args.z_range) if args.z_range else None
+    volume, (z_file, y_file, x_file) = load_volume(
+        args.input, channel=args.channel, z_range=z_range
+    )
 
     x_um = args.xy_um if args.xy_um is not None else x_file
     y_um = args.xy_um if args.xy_um is not None else (y_file or x_file)
@@ -91,8 +116,13 @@ def main(argv=None) -> int:
         window_um=args.window_um,
         min_separation_um=args.min_separation_um,
     )
+    cache = None if args.no_cache else PSFResultCache(args.cache_dir)
     result = PSFAnalysisService().analyze(
-        volume, voxel_size_um=(float(z_um), float(y_um), float(x_um)), settings=settings
+        volume,
+        voxel_size_um=(float(z_um), float(y_um), float(x_um)),
+        settings=settings,
+        cache=cache,
+        fingerprint=file_fingerprint(args.input, channel=args.channel, z_range=z_range),
     )
 
     summary = result.summary()
@@ -0,0 +1,178 @@
+"""On-disk cache of bead detections and per-bead PSF fits.
+
+Part of the self-contained ``psf_analysis`` package (numpy only, no other
+py2flamingo imports).
+
+Re-running :meth:`PSFAnalysisService.analyze` with a tweaked setting usually
+only changes a cheap downstream step (crowding distance, R² gate), yet used to
+repeat peak detection and every Gaussian fit. The cache splits the work by what
+each stage actually depends on:
+
+* detections — volume fingerprint + detection parameters (smoothing,
+  thresholds, peak distance, bead cap);
+* fits — volume fingerprint + voxel size + crop window, stored per bead center,
+  so a run that accepts beads not fitted before only fits those.
+
+Edge/crowding rejection and the R² quality gate are cheap and always re-run.
+
+Layout: ``<root>/<fingerprint>/detect-<key>.npy`` and ``fit-<key>.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".flamingo" / "psf_cache"
+
+# Planes hashed per update when fingerprinting, so memory maps stream
+_HASH_PLANES = 16
+
+
+def _digest(payload: Any) -> str:
+    """Short stable hash of a JSON-serializable value."""
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def volume_fingerprint(volume: np.ndarray) -> str:
+    """Content hash of a volume (shape, dtype and every voxel).
+
+    Reads the array a few planes at a time, so memory-mapped volumes are
+    hashed without being loaded whole.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((tuple(volume.shape), np.dtype(volume.dtype).str)).encode())
+    for start in range(0, volume.shape[0], _HASH_PLANES):
+        block = np.ascontiguousarray(volume[start : start + _HASH_PLANES])
+        h.update(memoryview(block).cast("B"))
+    return h.hexdigest()
+
+
+def file_fingerprint(
+    path: Union[str, Path],
+    channel: Optional[int] = None,
+    z_range: Optional[Tuple[int, int]] = None,
+) -> Optional[str]:
+    """Cheap fingerprint for a volume loaded from a single file.
+
+    Uses the resolved path, size and modification time instead of the data.
+    Returns None for directory stores (e.g. ``.zarr``), whose mtime does not
+    track chunk edits; callers then fall back to :func:`volume_fingerprint`.
+    """
+    path = Path(path).resolve()
+    if not path.is_file():
+        return None
+    st = path.stat()
+    return _digest([str(path), st.st_size, st.st_mtime_ns, channel, z_range])
+
+
+def _axis_fit_to_json(fit) -> Dict[str, Any]:
+    entry = fit.to_dict()
+    entry["profile"] = fit.profile.tolist() if fit.profile is not None else None
+    return entry
+
+
+class PSFResultCache:
+    """Detections and fits for previously analyzed volumes, kept on disk.
+
+    Args:
+        root: Cache directory (created on first write)
+    """
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_CACHE_DIR):
+        self.root = Path(root)
+
+    # ---------------------------------------------------------------- keys
+    @staticmethod
+    def detection_key(settings) -> str:
+        return _digest(
+            [
+                settings.smooth_sigma_px,
+                settings.threshold_rel,
+                settings.threshold_abs,
+                settings.min_distance_px,
+                settings.max_beads,
+            ]
+        )
+
+    @staticmethod
+    def fit_key(voxel_size_um: Sequence[float], window_um: float) -> str:
+        return _digest([[float(v) for v in voxel_size_um], float(window_um)])
+
+    # ---------------------------------------------------------- detections
+    def load_detections(self, fingerprint: str, settings) -> Optional[np.ndarray]:
+        """Cached (N, 3) bead centers, or None on a miss."""
+        path = self.root / fingerprint / f"detect-{self.detection_key(settings)}.npy"
+        try:
+            return np.load(path)
+        except (OSError, ValueError):
+            return None
+
+    def store_detections(self, fingerprint: str, settings, centers: np.ndarray) -> None:
+        path = self.root / fingerprint / f"detect-{self.detection_key(settings)}.npy"
+        self._write(path, lambda fh: np.save(fh, np.asarray(centers)))
+
+    # ---------------------------------------------------------------- fits
+    def load_fits(
+        self, fingerprint: str, voxel_size_um: Sequence[float], window_um: float
+    ) -> Dict[Tuple[int, int, int], Dict[str, Dict[str, Any]]]:
+        """Cached per-bead fits keyed by the bead's (z, y, x) voxel center.
+
+        Each value maps axis name to the serialized fit; an empty dict means
+        the bead was fitted and no axis converged.
+        """
+        path = self._fit_path(fingerprint, voxel_size_um, window_um)
+        try:
+            raw = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {
+            tuple(int(c) for c in key.split(",")): fits for key, fits in raw.items()
+        }
+
+    def store_fits(
+        self,
+        fingerprint: str,
+        voxel_size_um: Sequence[float],
+        window_um: float,
+        beads: Dict[Tuple[int, int, int], Dict[str, Any]],
+    ) -> None:
+        """Merge newly fitted beads (center -> {axis: AxisFit}) into the cache."""
+        if not beads:
+            return
+        cached = self.load_fits(fingerprint, voxel_size_um, window_um)
+        for center, fits in beads.items():
+            cached[center] = {
+                axis: _axis_fit_to_json(fit) for axis, fit in fits.items()
+            }
+        payload = {",".join(str(c) for c in key): v for key, v in cached.items()}
+        path = self._fit_path(fingerprint, voxel_size_um, window_um)
+        self._write(path, lambda fh: fh.write(json.dumps(payload).encode()))
+
+    def _fit_path(
+        self, fingerprint: str, voxel_size_um: Sequence[float], window_um: float
+    ) -> Path:
+        key = self.fit_key(voxel_size_um, window_um)
+        return self.root / fingerprint / f"fit-{key}.json"
+
+    @staticmethod
+    def _write(path: Path, writer) -> None:
+        """Write via a temp file + rename so readers never see partial data."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with tmp.open("wb") as fh:
+                writer(fh)
+            os.replace(tmp, path)
+        except OSError as exc:
+            # A read-only or full cache only costs a recompute next time
+            logger.warning("Could not write PSF cache %s: %s", path, exc)
@@ -5,6 +5,9 @@ any other app module) so the ``psf_analysis`` package has no seam binding it to
 py2flamingo and can be extracted to a standalone repo. The dispatch mirrors
 ``headless_io.load_volumes`` but returns a single 3-D channel plus the voxel size
 parsed from the file (OME-TIFF ``PhysicalSize*`` metadata when available).
+
+``.npy`` and uncompressed TIFF are opened as memory maps, so only the requested
+channel and Z range are read from them.
 """
 
 from __future__ import annotations
@@ -24,6 +27,7 @@ def load_volume(
     path,
     *,
     channel: Optional[int] = None,
+    z_range: Optional[Tuple[int, int]] = None,
 ) -> Tuple[np.ndarray, VoxelSize]:
     """Load one 3-D channel volume and its voxel size from a file.
 
@@ -31,6 +35,8 @@ def load_volume(
         path: ``.npy``, ``.tif``/``.tiff``/``.ome.tif(f)``, or ``.zarr`` directory.
         channel: For multi-channel sources, which channel to return (default: the
             first / lowest-id channel).
+        z_range: ``(start, stop)`` Z slice to keep, e.g. the planes around the
+            bead layer of a deep stack.
 
     Returns:
         ``(volume, (z_um, y_um, x_um))``. Any voxel-size entry the file does not
@@ -60,6 +66,10 @@ def load_volume(
         )
 
     vol = _select_channel(volumes, channel)
+    if z_range is not None:
+        vol = vol[slice(*z_range)]
+    # Read the selected view out of the memory map
+    vol = np.array(vol) if isinstance(vol, np.memmap) else np.asarray(vol)
     return vol, voxel
 
 
@@ -69,7 +79,7 @@ def load_volume(
 
 
 def _load_npy(p: Path) -> Tuple[Dict[int, np.ndarray], VoxelSize]:
-    arr = np.load(str(p))
+    arr = np.load(str(p), mmap_mode="r")
     logger.info("Loaded .npy %s: shape=%s dtype=%s", p.name, arr.shape, arr.dtype)
     return _split_array(arr, axes=None), (None, None, None)
 
@@ -79,12 +89,12 @@ def _load_tiff(p: Path) -> Tuple[Dict[int, np.ndarray], VoxelSize]:
 
     with tifffile.TiffFile(str(p)) as tif:
         series = tif.series[0] if tif.series else None
-        if series is not None:
-            arr = series.asarray()
-            axes = series.axes
-        else:
-            arr = tif.asarray()
-            axes = None
+        axes = series.axes if series is not None else None
+        try:
+            arr = tifffile.memmap(str(p), series=0, mode="r")
+        except ValueError:
+            # Compressed or scattered pages must be decoded in full
+            arr = series.asarray() if series is not None else tif.asarray()
         voxel = _voxel_from_tiff(tif)
     logger.info(
         "Loaded TIFF %s: shape=%s dtype=%s axes=%s voxel=%s",
@@ -196,7 +206,7 @@ def _split_with_axes(arr: np.ndarray, axes: str) -> Dict[int, np.ndarray]:
         if not reducible:
             break
         i = reducible[0]
-        arr = np.take(arr, 0, axis=i)
+        arr = arr[(slice(None),) * i + (0,)]
         axes = axes[:i] + axes[i + 1 :]
     if "C" in axes:
         ci = axes.index("C")
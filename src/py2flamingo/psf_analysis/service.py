@@ -27,12 +27,13 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy import ndimage
 from scipy.optimize import curve_fit
 
+from py2flamingo.psf_analysis.cache import PSFResultCache, volume_fingerprint
 from py2flamingo.psf_analysis.models import (
     FWHM_PER_SIGMA,
     AxisFit,
@@ -88,6 +89,8 @@ class PSFAnalysisService:
         volume: np.ndarray,
         voxel_size_um: Tuple[float, float, float],
         settings: Optional[PSFSettings] = None,
+        cache: Optional[PSFResultCache] = None,
+        fingerprint: Optional[str] = None,
     ) -> PSFResult:
         """Detect beads in ``volume`` and fit a PSF to each.
 
@@ -97,6 +100,10 @@ class PSFAnalysisService:
             voxel_size_um: ``(z, y, x)`` voxel size in micrometers. The Z entry is
                 the acquisition Z-step; X/Y are the image-plane pixel size.
             settings: :class:`PSFSettings`; defaults used when None.
+            cache: Reuse detections and per-bead fits from earlier runs on the
+                same data (see :mod:`py2flamingo.psf_analysis.cache`).
+            fingerprint: Identity of ``volume`` for the cache; hashed from the
+                data when None.
 
         Returns:
             :class:`PSFResult` with one :class:`PSFBead` per detected bead.
@@ -109,7 +116,18 @@ class PSFAnalysisService:
         vz, vy, vx = (float(v) for v in voxel_size_um)
         volume_f = volume.astype(np.float32, copy=False)
 
-        centers = self._detect_beads(volume_f, voxel_size_um, settings)
+        centers = None
+        cached_fits: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+        new_fits: Dict[Tuple[int, int, int], Dict[str, AxisFit]] = {}
+        reused = 0
+        if cache is not None:
+            fingerprint = fingerprint or volume_fingerprint(volume)
+            centers = cache.load_detections(fingerprint, settings)
+            cached_fits = cache.load_fits(fingerprint, (vz, vy, vx), settings.window_um)
+        if centers is None:
+            centers = self._detect_beads(volume_f, voxel_size_um, settings)
+            if cache is not None:
+                cache.store_detections(fingerprint, settings, centers)
         n_detected = len(centers)
         logger.info("Detected %d candidate beads", n_detected)
 
@@ -137,11 +155,33 @@ class PSFAnalysisService:
                 )
                 continue
 
-            bead = self._fit_bead(
-                volume_f, bead_id, center, half_win, (vz, vy, vx), settings
-            )
+            key = tuple(int(c) for c in center)
+            if key in cached_fits:
+                bead = PSFBead(
+                    bead_id=bead_id,
+                    centroid_voxel=tuple(float(c) for c in key),
+                    fits={
+                        axis: self._cached_fit(entry)
+                        for axis, entry in cached_fits[key].items()
+                    },
+                )
+                self._apply_quality_gate(bead, settings)
+                reused += 1
+            else:
+                bead = self._fit_bead(
+                    volume_f, bead_id, center, half_win, (vz, vy, vx), settings
+                )
+                new_fits[key] = bead.fits
             beads.append(bead)
 
+        if cache is not None:
+            logger.info(
+                "Reused %d cached bead fits, fitted %d",
+                reused,
+                len(new_fits),
+            )
+            cache.store_fits(fingerprint, (vz, vy, vx), settings.window_um, new_fits)
+
         return PSFResult(beads=beads, voxel_size_um=(vz, vy, vx), n_detected=n_detected)
 
     # ------------------------------------------------------------------ detect
@@ -346,6 +386,24 @@ class PSFAnalysisService:
             fit_curve=fit_curve,
         )
 
+    @staticmethod
+    def _cached_fit(entry: Dict[str, Any]) -> AxisFit:
+        """Rebuild an :class:`AxisFit` (plot arrays included) from the cache."""
+        profile = np.asarray(entry["profile"], dtype=np.float64)
+        x = np.arange(profile.size, dtype=np.float64)
+        params = [entry[k] for k in ("amplitude", "mu_px", "sigma_px", "offset")]
+        return AxisFit(
+            amplitude=entry["amplitude"],
+            mu_px=entry["mu_px"],
+            sigma_px=entry["sigma_px"],
+            offset=entry["offset"],
+            fwhm_um=entry["fwhm_um"],
+            r_squared=entry["r_squared"],
+            coords_px=x,
+            profile=profile,
+            fit_curve=_gaussian(x, *params),
+        )
+
     @staticmethod
     def _apply_quality_gate(bead: PSFBead, settings: PSFSettings) -> None:
         """Mark a bead rejected when its lateral fits are missing or poor."""
@@ -34,6 +34,7 @@ from .tiff_size_validator import (
     TIFF_4GB_LIMIT,
     TiffSizeEstimate,
     calculate_tiff_size,
+    estimate_workflow_text,
     get_recommended_planes,
     parse_workflow_file,
     validate_workflow_params,
@@ -89,6 +90,7 @@ __all__ = [
     "calculate_tiff_size",
     "validate_workflow_params",
     "parse_workflow_file",
+    "estimate_workflow_text",
     "get_recommended_planes",
     "TiffSizeEstimate",
     "TIFF_4GB_LIMIT",
@@ -101,6 +101,61 @@ class CameraCommandCode:
     ROI_TOP_GET = 12306  # 0x3012
 
 
+class FrameHistory:
+    """
+    Recent frames bounded by total bytes rather than frame count.
+
+    Frames delivered by CameraService are read-only arrays over the received
+    socket buffer, so every consumer (display buffer, frame listeners, this
+    history, snapshot capture) holds a reference to the same pixels instead of
+    a copy. A frame's memory is released when the last of them lets go.
+
+    Entries are (image, header, local_frame_number). The newest entry is
+    always kept, even if it alone exceeds the budget.
+
+    Thread-safe: appended from the receiver thread, read from any thread.
+    """
+
+    def __init__(self, budget_bytes: int):
+        """
+        Args:
+            budget_bytes: Maximum total image bytes to retain
+        """
+        self._lock = threading.Lock()
+        self._entries: deque = deque()
+        self._nbytes = 0
+        self._budget_bytes = int(budget_bytes)
+
+    @property
+    def nbytes(self) -> int:
+        """Image bytes currently retained."""
+        return self._nbytes
+
+    def append(self, image: np.ndarray, header: "ImageHeader", number: int) -> None:
+        with self._lock:
+            self._entries.append((image, header, number))
+            self._nbytes += image.nbytes
+            self._evict()
+
+    def latest(self) -> Optional[tuple]:
+        """Newest (image, header, local_frame_number), or None if empty."""
+        with self._lock:
+            return self._entries[-1] if self._entries else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._nbytes > self._budget_bytes and len(self._entries) > 1:
+            image, _, _ = self._entries.popleft()
+            self._nbytes -= image.nbytes
+
+
 class CameraService(MicroscopeCommandService):
     """
     Service for camera operations on Flamingo microscope.
@@ -142,6 +197,13 @@ class CameraService(MicroscopeCommandService):
         # Image callback
         self._image_callback: Optional[Callable] = None
 
+        # Frame listeners: called on the receiver thread for every frame, for
+        # consumers that must see each frame (tile ingest) rather than pull
+        # the latest from the display buffer. Replaced, never mutated, so the
+        # receiver can iterate without a lock.
+        self._frame_listeners: Tuple[Callable, ...] = ()
+        self._listeners_lock = threading.Lock()
+
         # Frame rate calculation
         self._last_frame_time: float = 0
         self._frame_times: list = []
@@ -519,6 +581,30 @@ class CameraService(MicroscopeCommandService):
         """
         self._image_callback = callback
 
+    def add_frame_listener(
+        self, listener: Callable[[np.ndarray, ImageHeader], None]
+    ) -> None:
+        """Receive every frame on the receiver thread.
+
+        Unlike the display buffer, listeners never miss a frame however busy
+        the GUI is. They must return quickly (hand the frame to a queue).
+
+        Args:
+            listener: Function called with (image_array, header)
+        """
+        with self._listeners_lock:
+            if listener not in self._frame_listeners:
+                self._frame_listeners = self._frame_listeners + (listener,)
+
+    def remove_frame_listener(
+        self, listener: Callable[[np.ndarray, ImageHeader], None]
+    ) -> None:
+        """Stop delivering frames to a listener added with add_frame_listener()."""
+        with self._listeners_lock:
+            self._frame_listeners = tuple(
+                fn for fn in self._frame_listeners if fn != listener
+            )
+
     def start_live_view_streaming(self, data_port: int = 53718) -> None:
         """
         Start live view with image data streaming.
@@ -936,11 +1022,15 @@ class CameraService(MicroscopeCommandService):
                     self.logger.warning("Connection closed while reading image data")
                     break
 
-                # Convert to numpy array (16-bit unsigned)
+                # Convert to numpy array (16-bit unsigned). This array is the
+                # one and only copy of the frame: the display buffer, frame
+                # listeners and the controller's history all share it, so it
+                # is made read-only.
                 image_array = np.frombuffer(image_data_bytes, dtype=np.uint16)
                 image_array = image_array.reshape(
                     (header.image_height, header.image_width)
                 )
+                image_array.flags.writeable = False
 
                 # Update frame rate tracking
                 current_time = time.time()
@@ -981,6 +1071,12 @@ class CameraService(MicroscopeCommandService):
                             )
                     self._frame_buffer.append((image_array, header))
 
+                for listener in self._frame_listeners:
+                    try:
+                        listener(image_array, header)
+                    except Exception as e:
+                        self.logger.error(f"Error in frame listener: {e}")
+
                 # Optional: Trigger callback for notification (but don't do work in it!)
                 # Callback should just signal that data is available, not process it
                 if self._image_callback:
@@ -1026,10 +1122,16 @@ class CameraService(MicroscopeCommandService):
             f"Data receiver thread stopped (received {frames_received} frames)"
         )
 
-    def _receive_exact(self, sock: socket.socket, num_bytes: int) -> Optional[bytes]:
+    def _receive_exact(
+        self, sock: socket.socket, num_bytes: int
+    ) -> Optional[bytearray]:
         """
         Receive exactly num_bytes from socket.
 
+        Reads straight into one preallocated buffer, so an image frame is
+        copied once (kernel to buffer) rather than once per chunk plus a final
+        join.
+
         Args:
             sock: Socket to read from
             num_bytes: Number of bytes to receive
@@ -1040,14 +1142,16 @@ class CameraService(MicroscopeCommandService):
         Raises:
             socket.timeout: If receive times out
         """
-        data = bytearray()
-        while len(data) < num_bytes:
+        data = bytearray(num_bytes)
+        view = memoryview(data)
+        received = 0
+        while received < num_bytes:
             try:
-                chunk = sock.recv(num_bytes - len(data))
-                if not chunk:
+                n = sock.recv_into(view[received:], num_bytes - received)
+                if n == 0:
                     return None  # Connection closed
-                data.extend(chunk)
+                received += n
             except socket.timeout:
                 raise  # Let caller handle timeout
 
-        return bytes(data)
+        return data
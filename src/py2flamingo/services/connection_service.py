@@ -472,6 +472,7 @@ class MVCConnectionService:
         encoder: Protocol encoder for command formatting
         model: Observable connection model for state tracking
         queue_manager: Queue manager for data flow
+        position_cache: Shared last-known stage position (PositionCache)
         logger: Logger instance
     """
 
@@ -496,6 +497,7 @@ class MVCConnectionService:
         from py2flamingo.services.microscope_command_service import (
             MicroscopeCommandService,
         )
+        from py2flamingo.services.position_cache import PositionCache
 
         self.tcp_connection = tcp_connection
         self.encoder = encoder
@@ -516,6 +518,10 @@ class MVCConnectionService:
         # Note: We pass 'self' as the connection to provide access to encoder and sockets
         self._command_service = MicroscopeCommandService(self)
 
+        # Last known stage position, shared by every StageService on this
+        # connection and kept current by the async reader's callbacks
+        self.position_cache = PositionCache()
+
         # Reactive connection-loss support —
         # We remember the last-used config so reconnect_last() can restore
         # the connection without the caller having to supply it again, and
@@ -570,6 +576,11 @@ class MVCConnectionService:
             )
             self._live_socket = None  # Connected lazily via connect_live()
 
+            # Positions from a previous session are not trusted
+            self.position_cache.clear()
+            if self.has_async_reader:
+                self.position_cache.attach(self)
+
             # Update model to CONNECTED
             self.model.status = ConnectionStatus(
                 state=ConnectionState.CONNECTED,
@@ -627,6 +638,7 @@ class MVCConnectionService:
 
             self._command_socket = None
             self._live_socket = None
+            self.position_cache.clear()
 
             # Update model to DISCONNECTED
             self.model.status = ConnectionStatus(
@@ -1047,6 +1059,10 @@ class MVCConnectionService:
             )
         return None
 
+    def send_command_batch(self, batch: bytes, expected_response_codes):
+        """Send several commands in one write (delegates to tcp_connection)."""
+        return self.tcp_connection.send_command_batch(batch, expected_response_codes)
+
     def send_command(self, cmd: "Command", timeout: float = 5.0) -> bytes:
         """
         Send encoded command and get response.
@@ -16,6 +16,8 @@ preventing socket buffer buildup and ensuring callbacks are never missed.
 import logging
 import socket
 import struct
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from py2flamingo.core.tcp_protocol import CommandDataBits, get_command_name
@@ -778,29 +780,115 @@ class MicroscopeCommandService:
                 return {"success": False, "error": "timeout"}
 
             self.logger.debug(f"Received {command_name} response (async)")
+            return self._async_result(response, command_name)
 
-            # Convert ParsedMessage to legacy dict format
-            parsed = self._convert_parsed_message(response)
+        except Exception as e:
+            self.logger.error(f"Error in async {command_name}: {e}", exc_info=True)
+            return {"success": False, "error": str(e)}
 
-            # Include additional data if present (follows 128-byte message for some commands)
-            # Concatenate it to raw_response so callers get the full response
-            raw_response = response.raw_data
-            if response.additional_data:
-                raw_response = raw_response + response.additional_data
-                self.logger.debug(
-                    f"{command_name} has {len(response.additional_data)} bytes additional data"
-                )
+    def _async_result(self, response: "ParsedMessage", command_name: str) -> Dict:
+        """Build the _send_command result dict from an async-reader response."""
+        # Convert ParsedMessage to legacy dict format
+        parsed = self._convert_parsed_message(response)
 
-            return {
-                "success": True,
-                "parsed": parsed,
-                "raw_response": raw_response,
-                "additional_data": response.additional_data,
-            }
+        # Include additional data if present (follows 128-byte message for some commands)
+        # Concatenate it to raw_response so callers get the full response
+        raw_response = response.raw_data
+        if response.additional_data:
+            raw_response = raw_response + response.additional_data
+            self.logger.debug(
+                f"{command_name} has {len(response.additional_data)} bytes additional data"
+            )
+
+        return {
+            "success": True,
+            "parsed": parsed,
+            "raw_response": raw_response,
+            "additional_data": response.additional_data,
+        }
+
+    def _send_command_batch(
+        self, commands: List[Dict[str, Any]], timeout: float = 3.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several action commands as one burst.
 
+        With the async reader active, all commands are encoded into one buffer,
+        written with a single send, and their responses are awaited together
+        against one shared deadline. Responses with the same command code are
+        matched in send order. Without the async reader (or on a connection
+        that does not support batches) each command goes through
+        _send_command in turn.
+
+        Args:
+            commands: One dict per command with 'command_code', 'command_name'
+                and optional 'params' and 'value'
+            timeout: Seconds to wait for the whole batch
+
+        Returns:
+            One _send_command-style result dict per command, in order
+        """
+        if not commands:
+            return []
+
+        connection = self.connection
+        if not (
+            getattr(connection, "has_async_reader", False)
+            and hasattr(connection, "send_command_batch")
+            and hasattr(connection.encoder, "encode_commands")
+        ):
+            return [
+                self._send_command(
+                    c["command_code"],
+                    c["command_name"],
+                    params=c.get("params"),
+                    value=c.get("value", 0.0),
+                )
+                for c in commands
+            ]
+
+        if not self._ensure_connected_for_command(commands[0]["command_name"]):
+            error = "Not connected to microscope"
+            return [{"success": False, "error": error} for _ in commands]
+
+        encoded = []
+        for c in commands:
+            params = (list(c.get("params") or []) + [0] * 7)[:7]
+            params[6] = CommandDataBits.TRIGGER_CALL_BACK
+            encoded.append(
+                {
+                    "code": c["command_code"],
+                    "params": params,
+                    "value": c.get("value", 0.0),
+                }
+            )
+
+        try:
+            batch = connection.encoder.encode_commands(encoded)
+            futures = connection.send_command_batch(
+                batch, [c["command_code"] for c in commands]
+            )
         except Exception as e:
-            self.logger.error(f"Error in async {command_name}: {e}", exc_info=True)
-            return {"success": False, "error": str(e)}
+            self.logger.error(f"Error sending command batch: {e}", exc_info=True)
+            return [{"success": False, "error": str(e)} for _ in commands]
+
+        deadline = time.monotonic() + timeout
+        results = []
+        for command, future in zip(commands, futures):
+            name = command["command_name"]
+            try:
+                response = future.result(max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                future.cancel()
+                self.logger.error(f"Timeout waiting for {name} response (batch)")
+                results.append({"success": False, "error": "timeout"})
+                continue
+            except Exception as e:
+                self.logger.error(f"Error in batched {name}: {e}")
+                results.append({"success": False, "error": str(e)})
+                continue
+            results.append(self._async_result(response, name))
+        return results
 
     def _convert_parsed_message(self, msg: "ParsedMessage") -> Dict[str, Any]:
         """
@@ -0,0 +1,245 @@
+"""
+Shared stage position cache.
+
+Stage position used to be read by polling the instrument from every route
+that needed it: StageService queries, the workflow position poller, the
+post-move confirmation in PositionController and the connect-time query.
+During tile scans those redundant POSITION_GET round trips flood the command
+socket and compete with the commands that matter.
+
+PositionCache is the one position model for a connection (the
+MVCConnectionService owns it, so every StageService built on that connection
+shares it). Each axis has its own lock and holds the last observed value with
+a monotonic timestamp. It is fed by:
+
+- every successful StageService position query,
+- late POSITION_GET responses that arrive after their caller timed out,
+- move commands, which invalidate the axis until it is observed again,
+- STAGE_MOTION_STOPPED callbacks, which publish the commanded target of the
+  axis that stopped.
+
+Readers state how old a value they accept. ``fetch`` returns the cached value
+without a round trip when it is recent enough, and otherwise runs the query,
+with at most one query per axis in flight; concurrent readers of the same axis
+wait for that query instead of sending their own.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from py2flamingo.core.socket_reader import ParsedMessage
+
+logger = logging.getLogger(__name__)
+
+STAGE_POSITION_GET = 0x6008
+STAGE_MOTION_STOPPED = 0x6010
+
+# Axis codes (AxisCode in stage_service): X, Y, Z, R
+AXES = (1, 2, 3, 4)
+
+
+@dataclass(frozen=True)
+class AxisReading:
+    """One observed axis value.
+
+    Attributes:
+        value: Position in mm (degrees for R)
+        timestamp: time.monotonic() when it was observed; for a query, when
+            the query was sent, so a reply to a query sent before a move
+            command is never taken as the post-move position
+        source: "query", "callback" or "motion_stopped"
+    """
+
+    value: float
+    timestamp: float
+    source: str = "query"
+
+
+class _AxisSlot:
+    """Per-axis state, guarded by its own condition (one lock per axis)."""
+
+    __slots__ = ("cond", "reading", "moved_at", "target", "fetching", "generation")
+
+    def __init__(self):
+        self.cond = threading.Condition(threading.Lock())
+        self.reading: Optional[AxisReading] = None
+        # Readings older than the last move command are not current
+        self.moved_at = float("-inf")
+        self.target: Optional[float] = None
+        self.fetching = False
+        self.generation = 0
+
+
+class PositionCache:
+    """Last known stage position per axis, shared by every reader.
+
+    Example:
+        >>> cache = connection_service.position_cache
+        >>> # Accept anything observed in the last 0.5 s, else query once
+        >>> x = cache.fetch(AxisCode.X_AXIS, 0.5, lambda: stage.get_axis_position(1))
+    """
+
+    def __init__(self):
+        self._slots: Dict[int, _AxisSlot] = {axis: _AxisSlot() for axis in AXES}
+
+    # ------------------------------------------------------------------
+    # Writers
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        axis: int,
+        value: float,
+        source: str = "query",
+        observed_at: Optional[float] = None,
+    ) -> None:
+        """Record an observed axis value.
+
+        Args:
+            axis: Axis code (1=X, 2=Y, 3=Z, 4=R)
+            value: Observed position
+            source: Where it came from (see AxisReading)
+            observed_at: time.monotonic() when the query that produced it was
+                sent; defaults to now. Older than a newer reading: ignored.
+        """
+        slot = self._slots.get(axis)
+        if slot is None:
+            return
+        if observed_at is None:
+            observed_at = time.monotonic()
+        with slot.cond:
+            if slot.reading is None or slot.reading.timestamp <= observed_at:
+                slot.reading = AxisReading(float(value), observed_at, source)
+            slot.cond.notify_all()
+
+    def begin_move(self, axis: int, target: float) -> None:
+        """A move was commanded: the cached value is no longer current."""
+        slot = self._slots.get(axis)
+        if slot is None:
+            return
+        with slot.cond:
+            slot.moved_at = time.monotonic()
+            slot.target = float(target)
+
+    def clear(self) -> None:
+        """Forget everything (e.g. on disconnect)."""
+        for slot in self._slots.values():
+            with slot.cond:
+                slot.reading = None
+                slot.moved_at = float("-inf")
+                slot.target = None
+
+    # ------------------------------------------------------------------
+    # Readers
+    # ------------------------------------------------------------------
+
+    def get(self, axis: int, max_age_s: float) -> Optional[float]:
+        """Cached value if observed within ``max_age_s`` and since the last
+        move command, else None. Never blocks on the instrument."""
+        slot = self._slots.get(axis)
+        if slot is None:
+            return None
+        with slot.cond:
+            return self._fresh(slot, max_age_s)
+
+    def fetch(
+        self,
+        axis: int,
+        max_age_s: float,
+        query: Callable[[], Optional[float]],
+    ) -> Optional[float]:
+        """Cached value if fresh enough, else the result of ``query()``.
+
+        Only one query per axis runs at a time. A reader that finds one in
+        flight waits for it and takes its result rather than querying again.
+
+        Args:
+            axis: Axis code (1=X, 2=Y, 3=Z, 4=R)
+            max_age_s: Oldest acceptable value in seconds
+            query: Round trip to the instrument; returns None on failure
+
+        Returns:
+            Axis value, or None if the query failed
+        """
+        slot = self._slots.get(axis)
+        if slot is None:
+            return query()
+
+        with slot.cond:
+            value = self._fresh(slot, max_age_s)
+            if value is not None:
+                return value
+            if slot.fetching:
+                generation = slot.generation
+                while slot.fetching and slot.generation == generation:
+                    slot.cond.wait()
+                # The concurrent query's result, whether or not it succeeded
+                return self._fresh(slot, float("inf"))
+            slot.fetching = True
+
+        value = None
+        # Stamp with the send time: a move commanded while the query is in
+        # flight makes its (pre-move) answer stale
+        started = time.monotonic()
+        try:
+            value = query()
+        finally:
+            with slot.cond:
+                current = slot.reading
+                if value is not None and (
+                    current is None or current.timestamp <= started
+                ):
+                    slot.reading = AxisReading(float(value), started)
+                slot.fetching = False
+                slot.generation += 1
+                slot.cond.notify_all()
+        return value
+
+    @staticmethod
+    def _fresh(slot: _AxisSlot, max_age_s: float) -> Optional[float]:
+        reading = slot.reading
+        if reading is None or reading.timestamp < slot.moved_at:
+            return None
+        if time.monotonic() - reading.timestamp > max_age_s:
+            return None
+        return reading.value
+
+    # ------------------------------------------------------------------
+    # Async reader callbacks (run on the reader thread)
+    # ------------------------------------------------------------------
+
+    def attach(self, connection) -> None:
+        """Register the callback handlers on a connection's async reader."""
+        connection.register_callback(STAGE_POSITION_GET, self.on_position_message)
+        connection.register_callback(STAGE_MOTION_STOPPED, self.on_motion_stopped)
+
+    def on_position_message(self, message: "ParsedMessage") -> None:
+        """A POSITION_GET response nobody was waiting for (late response)."""
+        axis = message.int32_data0
+        # X/Y/Z report exactly 0.0 while moving (see get_axis_position)
+        if message.value == 0.0 and axis != 4:
+            return
+        self.update(axis, message.value, source="callback")
+
+    def on_motion_stopped(self, message: "ParsedMessage") -> None:
+        """Publish the commanded target of the axis named in int32Data0.
+
+        Stops for axes without an outstanding move (duplicates, or an axis
+        the cache does not track) are ignored; other axes may still be moving.
+        """
+        if message.status_code != 1:
+            return
+        slot = self._slots.get(message.int32_data0)
+        if slot is None:
+            return
+        with slot.cond:
+            if slot.target is None:
+                return
+            slot.reading = AxisReading(slot.target, time.monotonic(), "motion_stopped")
+            slot.target = None
+            slot.cond.notify_all()
+        logger.debug(f"Motion stopped (axis {message.int32_data0}): position cached")
@@ -5,10 +5,12 @@ Handles all stage-related commands including position queries,
 movement control, and motion monitoring.
 """
 
+import time
 from typing import Any, Dict, Optional
 
 from py2flamingo.models.microscope import Position
 from py2flamingo.services.microscope_command_service import MicroscopeCommandService
+from py2flamingo.services.position_cache import PositionCache
 
 
 class StageCommandCode:
@@ -55,6 +57,12 @@ class StageService(MicroscopeCommandService):
         >>> position = stage.get_position()
     """
 
+    @property
+    def position_cache(self) -> Optional[PositionCache]:
+        """The connection's shared position cache (None on bare connections)."""
+        cache = getattr(self.connection, "position_cache", None)
+        return cache if isinstance(cache, PositionCache) else None
+
     def get_axis_position(self, axis: int) -> Optional[float]:
         """
         Query position of a single axis from hardware.
@@ -65,6 +73,8 @@ class StageService(MicroscopeCommandService):
         - params[3] = 3 for Z-axis
         - params[3] = 4 for R-axis (rotation)
 
+        Every value read is recorded in the connection's position cache.
+
         Args:
             axis: Axis code (AxisCode.X_AXIS, Y_AXIS, Z_AXIS, or ROTATION)
 
@@ -79,6 +89,15 @@ class StageService(MicroscopeCommandService):
             >>> if x_pos is not None:
             >>>     print(f"X position: {x_pos}")
         """
+        sent_at = time.monotonic()
+        position = self._query_axis_position(axis)
+        cache = self.position_cache
+        if position is not None and cache is not None:
+            cache.update(axis, position, observed_at=sent_at)
+        return position
+
+    def _query_axis_position(self, axis: int) -> Optional[float]:
+        """POSITION_GET round trip behind get_axis_position."""
         axis_names = {1: "X", 2: "Y", 3: "Z", 4: "R"}
         axis_name = axis_names.get(axis, f"Unknown({axis})")
 
@@ -306,12 +325,22 @@ class StageService(MicroscopeCommandService):
             )
             return None
 
-    def get_position(self) -> Optional[Position]:
+    def get_position(self, max_age_s: Optional[float] = None) -> Optional[Position]:
         """
-        Query current stage position from hardware for all axes.
+        Get current stage position for all axes.
 
         Queries each axis individually (X, Y, Z, R) as querying all at once (0xFF) doesn't work.
 
+        With ``max_age_s``, an axis whose cached value was observed within that
+        many seconds (and since its last move command) is served from the
+        connection's position cache without a round trip. Axes that need a
+        fresh value are queried, one query per axis at a time across all
+        readers. Without it every axis is queried.
+
+        Args:
+            max_age_s: Oldest acceptable cached value in seconds, or None to
+                always query the hardware
+
         Returns:
             Position object with x, y, z, r coordinates in millimeters, or None if any axis query times out
 
@@ -322,28 +351,33 @@ class StageService(MicroscopeCommandService):
             >>> pos = stage_service.get_position()
             >>> if pos:
             >>>     print(f"Stage at X={pos.x}, Y={pos.y}, Z={pos.z}, R={pos.r}")
+            >>> # During a scan: accept anything from the last half second
+            >>> pos = stage_service.get_position(max_age_s=0.5)
         """
-        self.logger.debug("Querying all axis positions from hardware...")
-
-        # Query each axis individually (0xFF doesn't work, must query one at a time)
-        x_pos = self.get_axis_position(AxisCode.X_AXIS)
-        if x_pos is None:
-            return None
-
-        y_pos = self.get_axis_position(AxisCode.Y_AXIS)
-        if y_pos is None:
-            return None
-
-        z_pos = self.get_axis_position(AxisCode.Z_AXIS)
-        if z_pos is None:
-            return None
-
-        r_pos = self.get_axis_position(AxisCode.ROTATION)
-        if r_pos is None:
-            return None
+        cache = self.position_cache
+        if max_age_s is None or cache is None:
+            self.logger.debug("Querying all axis positions from hardware...")
+            cache = None
+
+        values = {}
+        for name, axis in (
+            ("x", AxisCode.X_AXIS),
+            ("y", AxisCode.Y_AXIS),
+            ("z", AxisCode.Z_AXIS),
+            ("r", AxisCode.ROTATION),
+        ):
+            if cache is None:
+                value = self.get_axis_position(axis)
+            else:
+                value = cache.fetch(
+                    axis, max_age_s, lambda a=axis: self.get_axis_position(a)
+                )
+            if value is None:
+                return None
+            values[name] = value
 
         # Create Position object with all axes
-        position = Position(x=x_pos, y=y_pos, z=z_pos, r=r_pos)
+        position = Position(**values)
         self.logger.debug(f"Complete stage position: {position}")
 
         return position
@@ -369,6 +403,10 @@ class StageService(MicroscopeCommandService):
         """
         self.logger.debug(f"Moving axis {axis} to {position_mm} mm...")
 
+        # Before sending: a short move's motion-stopped callback can beat the ack
+        if self.position_cache is not None:
+            self.position_cache.begin_move(axis, position_mm)
+
         result = self._send_movement_command(
             StageCommandCode.POSITION_SET_SLIDER,  # Use slider variant from logs
             "STAGE_POSITION_SET",
@@ -388,6 +426,51 @@ class StageService(MicroscopeCommandService):
             "Motion is asynchronous - use motion monitoring to detect completion"
         )
 
+    def move_to_positions(self, targets: Dict[int, float]) -> None:
+        """
+        Move several axes to absolute positions with one command burst.
+
+        All position commands are sent in a single write and their
+        acknowledgements awaited together, instead of one round trip per
+        axis. Commands go out in ``targets`` order. Like move_to_position,
+        this returns once the commands are acknowledged, not when motion ends.
+
+        Args:
+            targets: Axis code -> target position in millimeters
+
+        Raises:
+            RuntimeError: If any command fails or microscope not connected
+
+        Example:
+            >>> stage_service.move_to_positions(
+            ...     {AxisCode.X_AXIS: 12.1, AxisCode.Y_AXIS: 7.6, AxisCode.Z_AXIS: 3.2}
+            ... )
+        """
+        self.logger.debug(f"Moving axes {targets} (burst)...")
+
+        if self.position_cache is not None:
+            for axis, position_mm in targets.items():
+                self.position_cache.begin_move(axis, position_mm)
+
+        results = self._send_command_batch(
+            [
+                {
+                    "command_code": StageCommandCode.POSITION_SET_SLIDER,
+                    "command_name": "STAGE_POSITION_SET",
+                    "params": [0, 0, 0, axis, 0, 0, 0],
+                    "value": position_mm,
+                }
+                for axis, position_mm in targets.items()
+            ]
+        )
+
+        for axis, result in zip(targets, results):
+            if not result["success"]:
+                raise RuntimeError(
+                    f"Failed to move stage axis {axis}: "
+                    f"{result.get('error', 'Unknown error')}"
+                )
+
     def is_motion_stopped(self) -> Optional[bool]:
         """
         Query if stage motion has stopped.
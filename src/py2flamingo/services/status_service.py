@@ -142,6 +142,11 @@ class StatusService:
         if cached is not None:
             return cached
 
+        # Stage position shared with every StageService on this connection
+        shared = self._shared_position()
+        if shared is not None:
+            return shared
+
         if not self.connection_service.is_connected():
             raise RuntimeError("Not connected to microscope")
 
@@ -173,6 +178,18 @@ class StatusService:
             self.logger.error(f"Failed to get position: {e}")
             raise
 
+    def _shared_position(self) -> Optional[Tuple[float, float, float]]:
+        """XYZ from the connection's position cache if all are within the TTL."""
+        from py2flamingo.services.position_cache import PositionCache
+
+        cache = getattr(self.connection_service, "position_cache", None)
+        if not isinstance(cache, PositionCache):
+            return None
+        values = tuple(cache.get(axis, self._cache_ttl) for axis in (1, 2, 3))
+        if any(v is None for v in values):
+            return None
+        return values
+
     def clear_cache(self) -> None:
         """Clear all cached status data."""
         self._cache.clear()
@@ -8,11 +8,15 @@ the standard TIFF 4GB file size limit.
 """
 
 import logging
-import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple, Optional, Tuple
 
+from py2flamingo.utils.workflow_parser import (
+    parse_workflow_fields,
+    read_workflow_fields,
+)
+
 # Standard TIFF has 32-bit offsets, limiting file size to 4GB
 TIFF_4GB_LIMIT = 4 * 1024 * 1024 * 1024  # 4,294,967,296 bytes
 
@@ -143,40 +147,50 @@ def validate_workflow_params(
     )
 
 
-def parse_workflow_file(workflow_path: Path) -> Optional[TiffSizeEstimate]:
+def estimate_workflow_text(content: str) -> TiffSizeEstimate:
     """
-    Parse a workflow file and validate its TIFF size.
+    Estimate the TIFF size of a workflow from its text.
 
     Args:
-        workflow_path: Path to workflow file
+        content: Workflow file content
 
     Returns:
-        TiffSizeEstimate if parseable, None otherwise
+        TiffSizeEstimate for the workflow
     """
-    try:
-        content = workflow_path.read_text()
+    fields = parse_workflow_fields(content)
+    return _estimate_workflow(fields.num_planes, fields.aoi_width, fields.aoi_height)
+
 
-        # Parse number of planes
-        num_planes_match = re.search(r"Number of planes\s*=\s*(\d+)", content)
-        num_planes = int(num_planes_match.group(1)) if num_planes_match else 1
+def _estimate_workflow(
+    num_planes: Optional[int],
+    image_width: Optional[int],
+    image_height: Optional[int],
+) -> TiffSizeEstimate:
+    """TIFF estimate from parsed workflow values; missing ones take defaults."""
+    # Assume 16-bit (2 bytes per pixel)
+    return calculate_tiff_size(
+        num_planes=num_planes if num_planes is not None else 1,
+        image_width=image_width if image_width is not None else 2048,
+        image_height=image_height if image_height is not None else 2048,
+        bytes_per_pixel=2,
+    )
 
-        # Parse AOI dimensions
-        aoi_width_match = re.search(r"AOI width\s*=\s*(\d+)", content)
-        aoi_height_match = re.search(r"AOI height\s*=\s*(\d+)", content)
 
-        image_width = int(aoi_width_match.group(1)) if aoi_width_match else 2048
-        image_height = int(aoi_height_match.group(1)) if aoi_height_match else 2048
+def parse_workflow_file(workflow_path: Path) -> Optional[TiffSizeEstimate]:
+    """
+    Parse a workflow file and validate its TIFF size.
 
-        # Assume 16-bit (2 bytes per pixel)
-        bytes_per_pixel = 2
+    Args:
+        workflow_path: Path to workflow file
 
-        return calculate_tiff_size(
-            num_planes=num_planes,
-            image_width=image_width,
-            image_height=image_height,
-            bytes_per_pixel=bytes_per_pixel,
+    Returns:
+        TiffSizeEstimate if parseable, None otherwise
+    """
+    try:
+        fields = read_workflow_fields(workflow_path)
+        return _estimate_workflow(
+            fields.num_planes, fields.aoi_width, fields.aoi_height
         )
-
     except Exception as e:
         logger.error(f"Failed to parse workflow file {workflow_path}: {e}")
         return None
@@ -7,10 +7,14 @@ This service manages a queue of workflow files and executes them sequentially,
 waiting for each workflow to complete before starting the next. This is critical
 for tile collection where multiple Z-stack workflows must run one after another.
 
-Workflow completion is detected by:
-1. Listening for CAMERA_STACK_COMPLETE (0x3011) callback from server
-2. Fallback: Polling system state (SYSTEM_STATE_GET) if no callback received
-3. Optional timeout based on estimated workflow duration
+Workflow start/completion is event-driven:
+1. UI_SET_GAUGE_VALUE (0x9004) / CAMERA_STACK_COMPLETE (0x3011) confirm start
+2. SYSTEM_STATE_IDLE (0xA002) signals completion
+3. Watchdog: SYSTEM_STATE_GET is polled only after the callbacks have been
+   silent for a full poll interval, plus a hard timeout
+
+While a workflow runs, the next queued file is read and validated so it can
+be sent as soon as the instrument reports idle.
 
 Progress tracking via:
 - UI_SET_GAUGE_VALUE (0x9004) callbacks for image acquisition progress
@@ -64,6 +68,10 @@ class WorkflowQueueItem:
     error: Optional[str] = None
     images_acquired: int = 0
     images_expected: int = 0
+    # Read + validated ahead of time while the previous workflow ran;
+    # staged_stat is (mtime_ns, size) so a file edited since is re-read.
+    staged_data: Optional[bytes] = None
+    staged_stat: Optional[tuple] = None
 
 
 class WorkflowQueueService(QObject):
@@ -108,12 +116,18 @@ class WorkflowQueueService(QObject):
     # Maximum time to wait for a workflow (seconds) - 30 minutes default
     MAX_WORKFLOW_TIMEOUT = 1800
 
-    # Minimum wait between workflows (seconds) - ensures system settles
-    # Increased from 1.0 to give server time to fully complete cleanup
+    # Minimum wait between workflows (seconds) - ensures system settles.
+    # Only applied when completion came from the polling watchdog, where we
+    # don't know how long ago the system actually went idle.
     MIN_INTER_WORKFLOW_DELAY = 3.0
 
-    # Delay after sending workflow before polling for start (seconds)
-    # Gives server time to receive and begin processing the workflow
+    # Settle time after a SYSTEM_STATE_IDLE broadcast (seconds). The
+    # broadcast is the firmware's own idle transition, so only a short
+    # turnaround is needed before sending the next workflow.
+    CALLBACK_IDLE_SETTLE_DELAY = 0.25
+
+    # Time to wait for a start-confirming callback before the first
+    # SYSTEM_STATE poll (seconds). Returns early as soon as one arrives.
     POST_WORKFLOW_SEND_DELAY = 2.0
 
     def __init__(
@@ -146,6 +160,14 @@ class WorkflowQueueService(QObject):
         self._completion_event = threading.Event()
         self._completion_data: Optional[Dict] = None
         self._workflow_running = False  # Set True when we confirm workflow is executing
+        # Set alongside _workflow_running so start-waits wake immediately
+        self._start_event = threading.Event()
+        # monotonic time of the last workflow callback; the polling watchdog
+        # only queries SYSTEM_STATE when callbacks have gone quiet
+        self._last_callback_time = 0.0
+        # True if the last completion came from the 0xA002 broadcast rather
+        # than the polling watchdog (decides the inter-workflow settle delay)
+        self._completed_via_callback = False
         # When True, the UI_SET_GAUGE_VALUE progress callback is registered
         # persistently (across connects) so the UI updates for ANY running
         # workflow, including a single direct run from the Workflow tab — not
@@ -260,7 +282,8 @@ class WorkflowQueueService(QObject):
         logger.info("Queue cancellation requested")
         self._cancel_requested = True
 
-        # Signal completion event to unblock waiting
+        # Signal start/completion events to unblock waiting
+        self._start_event.set()
         self._completion_event.set()
 
         # Also stop the currently running workflow
@@ -336,11 +359,16 @@ class WorkflowQueueService(QObject):
         self.progress_updated.emit(total, total, "Returning to start position...")
 
         try:
-            # move_to_position is asynchronous; commands are accepted in order.
-            stage_service.move_to_position(AxisCode.ROTATION, r)
-            stage_service.move_to_position(AxisCode.X_AXIS, x)
-            stage_service.move_to_position(AxisCode.Y_AXIS, y)
-            stage_service.move_to_position(AxisCode.Z_AXIS, z)
+            # Moves are asynchronous; commands are accepted in order, so the
+            # four go out as one burst.
+            stage_service.move_to_positions(
+                {
+                    AxisCode.ROTATION: r,
+                    AxisCode.X_AXIS: x,
+                    AxisCode.Y_AXIS: y,
+                    AxisCode.Z_AXIS: z,
+                }
+            )
             # Block (best-effort) until the linear axes physically arrive so the
             # batch is reported complete only once the stage is actually home.
             self._wait_for_stage_settle(
@@ -422,7 +450,10 @@ class WorkflowQueueService(QObject):
         Args:
             message: ParsedMessage (may not contain useful data)
         """
-        # Ignore idle signals if workflow hasn't started running yet
+        self._last_callback_time = time.monotonic()
+
+        # Ignore idle signals if workflow hasn't started running yet: they may
+        # be left over from the previous workflow or precede a slow start
         if not self._workflow_running:
             logger.warning(
                 f"[QUEUE] Ignoring SYSTEM_STATE_IDLE callback - "
@@ -433,6 +464,7 @@ class WorkflowQueueService(QObject):
         logger.info(f"[QUEUE] Received SYSTEM_STATE_IDLE callback - workflow complete!")
 
         # Signal completion - this is the definitive completion signal
+        self._completed_via_callback = True
         self._completion_event.set()
 
     def _on_stack_complete(self, message) -> None:
@@ -457,9 +489,10 @@ class WorkflowQueueService(QObject):
         )
 
         # Stack complete confirms workflow ran
+        self._last_callback_time = time.monotonic()
         if not self._workflow_running:
             logger.info(f"[QUEUE] Stack complete received - workflow confirmed running")
-            self._workflow_running = True
+            self._confirm_running()
 
         # Store completion data for reporting (but don't signal completion yet)
         self._completion_data = {
@@ -489,11 +522,12 @@ class WorkflowQueueService(QObject):
         expected = message.int32_data1
 
         # Progress update confirms workflow is actually running
+        self._last_callback_time = time.monotonic()
         if not self._workflow_running:
             logger.info(
                 f"[QUEUE] Progress update received - workflow confirmed running"
             )
-            self._workflow_running = True
+            self._confirm_running()
 
         logger.debug(f"Progress update: {acquired}/{expected} images")
 
@@ -513,6 +547,11 @@ class WorkflowQueueService(QObject):
             f"Acquiring... {acquired}/{expected} images",
         )
 
+    def _confirm_running(self) -> None:
+        """Mark the current workflow as running and wake any start-wait."""
+        self._workflow_running = True
+        self._start_event.set()
+
     def register_progress_monitoring(self) -> None:
         """Persistently listen for acquisition-progress callbacks.
 
@@ -823,12 +862,17 @@ class WorkflowQueueService(QObject):
                 )
                 self.workflow_completed.emit(i, total, str(item.file_path))
 
-                # Brief delay between workflows
+                # Brief delay between workflows. After the firmware's own idle
+                # broadcast only a short turnaround is needed; after a
+                # watchdog-detected completion keep the conservative settle.
                 if i < total - 1 and not self._cancel_requested:
-                    logger.info(
-                        f"Waiting {self.MIN_INTER_WORKFLOW_DELAY}s before next workflow..."
+                    delay = (
+                        self.CALLBACK_IDLE_SETTLE_DELAY
+                        if self._completed_via_callback
+                        else self.MIN_INTER_WORKFLOW_DELAY
                     )
-                    time.sleep(self.MIN_INTER_WORKFLOW_DELAY)
+                    logger.info(f"Waiting {delay}s before next workflow...")
+                    time.sleep(delay)
 
             # Queue finished
             logger.info(
@@ -863,8 +907,16 @@ class WorkflowQueueService(QObject):
         file_path = item.file_path
         logger.info(f"[QUEUE] Loading workflow: {file_path.name}")
 
-        # Load the workflow
-        success, msg = self._workflow_controller.load_workflow(str(file_path))
+        # Load the workflow (already read and validated if it was staged)
+        if item.staged_data is not None and item.staged_stat == self._file_stat(
+            file_path
+        ):
+            success, msg = self._workflow_controller.load_workflow_data(
+                file_path, item.staged_data
+            )
+        else:
+            success, msg = self._workflow_controller.load_workflow(str(file_path))
+        item.staged_data = None
         if not success:
             logger.error(f"[QUEUE] Load failed: {msg}")
             return (False, f"Load failed: {msg}")
@@ -873,10 +925,12 @@ class WorkflowQueueService(QObject):
         # Clear completion state BEFORE starting
         logger.info(f"[QUEUE] Clearing completion state...")
         self._completion_event.clear()
+        self._start_event.clear()
         self._completion_data = None
         self._workflow_running = (
             False  # Will be set True when we see progress/stack_complete
         )
+        self._completed_via_callback = False
 
         # Start the workflow
         logger.info(f"[QUEUE] Starting workflow execution...")
@@ -886,13 +940,11 @@ class WorkflowQueueService(QObject):
             return (False, f"Start failed: {msg}")
 
         logger.info(f"[QUEUE] Started workflow: {file_path.name}")
+        self._last_callback_time = time.monotonic()
 
-        # Give server time to receive and begin processing the workflow
-        # before we start polling. This reduces server load.
-        logger.info(
-            f"[QUEUE] Waiting {self.POST_WORKFLOW_SEND_DELAY}s for server to begin processing..."
-        )
-        time.sleep(self.POST_WORKFLOW_SEND_DELAY)
+        # Prepare the next item while this one runs, so the gap between
+        # workflows is only the instrument's own turnaround.
+        self._stage_next_workflow()
 
         # Wait for system to become NOT idle (confirms workflow actually started)
         logger.info(f"[QUEUE] Waiting for system to become busy (workflow to start)...")
@@ -914,6 +966,37 @@ class WorkflowQueueService(QObject):
 
         return (success, error)
 
+    @staticmethod
+    def _file_stat(file_path: Path) -> Optional[tuple]:
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _stage_next_workflow(self) -> None:
+        """Read and validate the next queued workflow ahead of time.
+
+        Best-effort: on any problem the item is simply loaded normally when
+        its turn comes, which reports the error through the usual path.
+        """
+        next_index = self._current_index + 1
+        if next_index >= len(self._queue):
+            return
+        item = self._queue[next_index]
+        stat = self._file_stat(item.file_path)
+        try:
+            success, _msg, data = self._workflow_controller.read_workflow(
+                str(item.file_path)
+            )
+        except Exception as e:  # noqa: BLE001 - staging is an optimization only
+            logger.debug(f"[QUEUE] Could not stage {item.file_path.name}: {e}")
+            return
+        if success and data is not None:
+            item.staged_data = data
+            item.staged_stat = stat
+            logger.debug(f"[QUEUE] Staged next workflow: {item.file_path.name}")
+
     def _wait_for_completion(self, item: WorkflowQueueItem) -> tuple:
         """
         Wait for workflow to complete via SYSTEM_STATE_IDLE callback.
@@ -981,9 +1064,19 @@ class WorkflowQueueService(QObject):
 
                 return (True, None)
 
-            # Fallback: Poll system state if no callback received
+            # Watchdog: only poll when the callbacks have gone quiet for a
+            # whole interval; progress updates prove the stream is alive.
+            silent_for = time.monotonic() - self._last_callback_time
+            if silent_for < self.STATE_POLL_INTERVAL:
+                self.progress_updated.emit(
+                    self._current_index + 1,
+                    len(self._queue),
+                    f"Workflow running... ({elapsed:.0f}s)",
+                )
+                continue
+
             logger.debug(
-                f"[QUEUE] No SYSTEM_STATE_IDLE callback after {self.STATE_POLL_INTERVAL}s, "
+                f"[QUEUE] No workflow callbacks for {silent_for:.0f}s, "
                 f"polling system state (workflow_running={self._workflow_running})..."
             )
 
@@ -1025,40 +1118,41 @@ class WorkflowQueueService(QObject):
 
     def _wait_for_workflow_start(self) -> bool:
         """
-        Wait for the system to become NOT idle after starting a workflow.
+        Wait for confirmation that the workflow actually started executing.
 
-        This confirms the workflow actually started executing before we begin
-        listening for the idle state that signals completion. This prevents
-        catching stale idle states from before the workflow started.
-
-        The method polls the system state waiting for it to become busy.
-        Once the system is busy (not idle), we know the workflow is running
-        and can safely wait for the SYSTEM_STATE_IDLE callback to signal
-        completion.
+        Confirmation normally comes from the first progress/stack-complete
+        callback, which wakes this wait immediately. If none arrives within
+        POST_WORKFLOW_SEND_DELAY, SYSTEM_STATE is polled as a watchdog every
+        WORKFLOW_START_POLL_INTERVAL. This prevents catching stale idle states
+        from before the workflow started.
 
         Returns:
-            True if workflow confirmed started (system became busy)
+            True if workflow confirmed started (callback, or system became busy)
             False if cancelled, timeout, or system remained idle
 
         Escape mechanisms:
             - Cancellation: User can cancel via self._cancel_requested
             - Timeout: MAX_WORKFLOW_START_TIMEOUT seconds (default 30s)
-            - Progress callback: If _workflow_running set True by callback, return success
         """
         start_time = time.time()
         logger.info(
             f"[QUEUE] Waiting for system to become busy (max {self.MAX_WORKFLOW_START_TIMEOUT}s)..."
         )
 
+        # Give the server time to begin processing before the first poll,
+        # but return as soon as a callback confirms the start.
+        wait_s = self.POST_WORKFLOW_SEND_DELAY
+
         while True:
+            started = self._start_event.wait(timeout=wait_s)
+            wait_s = self.WORKFLOW_START_POLL_INTERVAL
+
             # Check for cancellation (escape mechanism #1)
             if self._cancel_requested:
                 logger.info("[QUEUE] Workflow start wait cancelled by user")
                 return False
 
-            # Check if progress/stack callbacks already confirmed workflow running
-            # (escape mechanism via callback confirmation)
-            if self._workflow_running:
+            if started:
                 logger.info("[QUEUE] Workflow confirmed running via callback")
                 return True
 
@@ -1071,25 +1165,20 @@ class WorkflowQueueService(QObject):
                 )
                 return False
 
-            # Poll system state
+            # Poll system state (watchdog)
             if not self._is_system_idle():
                 # System is busy - workflow has started!
                 logger.info(
                     f"[QUEUE] System became busy after {elapsed:.1f}s - "
                     f"workflow confirmed started"
                 )
-                self._workflow_running = True
+                self._confirm_running()
                 return True
 
-            # Brief sleep before next poll
-            time.sleep(self.WORKFLOW_START_POLL_INTERVAL)
-
-            # Log progress periodically (every 5 seconds)
-            if int(elapsed) % 5 == 0 and elapsed > 0:
-                logger.debug(
-                    f"[QUEUE] Still waiting for workflow to start... "
-                    f"({elapsed:.1f}s elapsed)"
-                )
+            logger.debug(
+                f"[QUEUE] Still waiting for workflow to start... "
+                f"({elapsed:.1f}s elapsed)"
+            )
 
     # Number of consecutive poll failures before attempting reconnect
     MAX_CONSECUTIVE_POLL_FAILURES = 3
@@ -4,6 +4,7 @@ Provides workflow parsing, text formatting, image processing, and other utilitie
 """
 
 from .workflow_parser import (
+    WorkflowFields,
     WorkflowParser,
     WorkflowTextFormatter,
     dict_to_workflow_text,
@@ -11,6 +12,7 @@ from .workflow_parser import (
     get_workflow_summary,
     parse_workflow_file,
     read_workflow_as_bytes,
+    read_workflow_fields,
     validate_workflow,
 )
 
@@ -18,6 +20,8 @@ __all__ = [
     "WorkflowParser",
     "WorkflowTextFormatter",
     "parse_workflow_file",
+    "read_workflow_fields",
+    "WorkflowFields",
     "validate_workflow",
     "get_workflow_preview",
     "read_workflow_as_bytes",
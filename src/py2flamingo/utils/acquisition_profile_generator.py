@@ -109,6 +109,88 @@ def mask_z_profile_at_xy(
     return (int(z_indices[0]), int(z_indices[-1]))
 
 
+class MaskOccupancyIndex:
+    """Column summary of a 3D mask for repeated tile-window Z queries.
+
+    Every tile needs the Z extent of the mask inside its XY footprint. Slicing
+    the full (Z, Y, X) window and reducing it per tile costs a pass over the
+    mask column for every tile and every angle. The index reduces the mask
+    once to per-(y, x) first/last occupied Z and a summed-area table of
+    occupied columns, so a window query is an O(1) emptiness check plus a
+    min/max over a 2D patch.
+
+    Attributes:
+        shape: Shape of the indexed mask (Z, Y, X)
+        z_first: First occupied Z per column, ``nz`` where the column is empty
+        z_last: Last occupied Z per column, -1 where the column is empty
+    """
+
+    def __init__(self, mask: np.ndarray):
+        if mask.ndim != 3:
+            raise ValueError(f"Mask must be 3D, got {mask.ndim}D")
+
+        mask = mask.astype(bool, copy=False)
+        self.shape = mask.shape
+        nz = mask.shape[0]
+
+        occupied = mask.any(axis=0)
+        self.z_first = np.where(occupied, mask.argmax(axis=0), nz).astype(np.int32)
+        self.z_last = np.where(occupied, nz - 1 - mask[::-1].argmax(axis=0), -1).astype(
+            np.int32
+        )
+
+        # Summed-area table with a zero row/column in front
+        self._sat = np.zeros(
+            (occupied.shape[0] + 1, occupied.shape[1] + 1), dtype=np.int64
+        )
+        np.cumsum(occupied, axis=0, out=self._sat[1:, 1:])
+        np.cumsum(self._sat[1:, 1:], axis=1, out=self._sat[1:, 1:])
+
+    @property
+    def is_empty(self) -> bool:
+        return self._sat[-1, -1] == 0
+
+    def bounding_box(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Voxel bounding box of the mask as (min_zyx, max_zyx), or None."""
+        if self.is_empty:
+            return None
+        ys, xs = np.nonzero(self.z_last >= 0)
+        lo = np.array([self.z_first.min(), ys.min(), xs.min()])
+        hi = np.array([self.z_last.max(), ys.max(), xs.max()])
+        return lo, hi
+
+    def window_count(self, y_lo: int, y_hi: int, x_lo: int, x_hi: int) -> int:
+        """Number of occupied columns in the half-open window."""
+        sat = self._sat
+        return int(
+            sat[y_hi, x_hi] - sat[y_lo, x_hi] - sat[y_hi, x_lo] + sat[y_lo, x_lo]
+        )
+
+    def z_extent(
+        self,
+        y_center_voxel: int,
+        x_center_voxel: int,
+        fov_half_y_voxels: int,
+        fov_half_x_voxels: int,
+    ) -> Optional[Tuple[int, int]]:
+        """Same result as :func:`mask_z_profile_at_xy` on the indexed mask."""
+        _, ny, nx = self.shape
+
+        y_lo = max(0, y_center_voxel - fov_half_y_voxels)
+        y_hi = min(ny, y_center_voxel + fov_half_y_voxels + 1)
+        x_lo = max(0, x_center_voxel - fov_half_x_voxels)
+        x_hi = min(nx, x_center_voxel + fov_half_x_voxels + 1)
+
+        if y_lo >= y_hi or x_lo >= x_hi:
+            return None
+        if self.window_count(y_lo, y_hi, x_lo, x_hi) == 0:
+            return None
+
+        z_min = self.z_first[y_lo:y_hi, x_lo:x_hi].min()
+        z_max = self.z_last[y_lo:y_hi, x_lo:x_hi].max()
+        return (int(z_min), int(z_max))
+
+
 def rotate_point(
     x: float,
     z: float,
@@ -182,16 +264,18 @@ def generate_tile_profile(
     if mask.ndim != 3:
         raise ValueError(f"Mask must be 3D, got {mask.ndim}D")
 
-    nonzero = np.argwhere(mask)
-    if len(nonzero) == 0:
+    # One pass over the mask; every tile at every angle queries this index
+    index = MaskOccupancyIndex(mask)
+    bbox = index.bounding_box()
+    if bbox is None:
         logger.warning("Empty mask - no tiles to generate")
         return []
 
     nz, ny, nx = mask.shape
 
     # Bounding box in voxels
-    z_min_v, y_min_v, x_min_v = nonzero.min(axis=0)
-    z_max_v, y_max_v, x_max_v = nonzero.max(axis=0)
+    z_min_v, y_min_v, x_min_v = (int(v) for v in bbox[0])
+    z_max_v, y_max_v, x_max_v = (int(v) for v in bbox[1])
 
     # Convert bbox corners to stage coordinates
     x_min_mm, y_min_mm, z_min_mm = voxel_to_stage_fn(z_min_v, y_min_v, x_min_v)
@@ -219,7 +303,7 @@ def generate_tile_profile(
         if abs(angle) > 0.01 and tip_position is None:
             # Single angle — tile directly, angle is metadata only
             profiles = _generate_tiles_for_angle(
-                mask=mask,
+                index=index,
                 x_min_mm=x_min_mm - buffer_mm,
                 x_max_mm=x_max_mm + buffer_mm,
                 y_min_mm=y_min_mm - buffer_mm,
@@ -241,7 +325,7 @@ def generate_tile_profile(
         if abs(angle) < 0.01:
             # No rotation - tile directly
             profiles = _generate_tiles_for_angle(
-                mask=mask,
+                index=index,
                 x_min_mm=x_min_mm - buffer_mm,
                 x_max_mm=x_max_mm + buffer_mm,
                 y_min_mm=y_min_mm - buffer_mm,
@@ -280,7 +364,7 @@ def generate_tile_profile(
             # For rotated view: tile_x uses rotated X range, Z uses rotated Z range
             # Y is unchanged by X-Z rotation
             profiles = _generate_tiles_for_rotated_angle(
-                mask=mask,
+                index=index,
                 tile_x_min=rot_x_min,
                 tile_x_max=rot_x_max,
                 y_min_mm=y_min_mm - buffer_mm,
@@ -351,7 +435,7 @@ def _stage_to_voxel_approx(
 
 
 def _generate_tiles_for_angle(
-    mask: np.ndarray,
+    index: MaskOccupancyIndex,
     x_min_mm: float,
     x_max_mm: float,
     y_min_mm: float,
@@ -385,8 +469,8 @@ def _generate_tiles_for_angle(
                 x_pos, y_pos, voxel_to_stage_fn, voxel_size_mm, mask_shape
             )
 
-            z_extent = mask_z_profile_at_xy(
-                mask, y_voxel, x_voxel, fov_half_voxels, fov_half_voxels
+            z_extent = index.z_extent(
+                y_voxel, x_voxel, fov_half_voxels, fov_half_voxels
             )
 
             if z_extent is None:
@@ -424,7 +508,7 @@ def _generate_tiles_for_angle(
 
 
 def _generate_tiles_for_rotated_angle(
-    mask: np.ndarray,
+    index: MaskOccupancyIndex,
     tile_x_min: float,
     tile_x_max: float,
     y_min_mm: float,
@@ -445,7 +529,8 @@ def _generate_tiles_for_rotated_angle(
 
     For rotated views, the tile grid is laid out in the rotated coordinate frame.
     Each tile's Z range is determined by inverse-rotating the tile position back
-    to the mask coordinate frame and checking the mask Z extent there.
+    to the mask coordinate frame and querying the shared mask index there, so
+    no angle needs its own rotated copy of the mask.
     """
     step = tile_step_mm(fov_mm, overlap_percent)
     tip_x, tip_z = tip_position
@@ -475,8 +560,8 @@ def _generate_tiles_for_rotated_angle(
                 orig_x, y_pos, voxel_to_stage_fn, voxel_size_mm, mask_shape
             )
 
-            z_extent = mask_z_profile_at_xy(
-                mask, y_voxel, x_voxel, fov_half_voxels, fov_half_voxels
+            z_extent = index.z_extent(
+                y_voxel, x_voxel, fov_half_voxels, fov_half_voxels
             )
 
             if z_extent is None:
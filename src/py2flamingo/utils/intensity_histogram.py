@@ -0,0 +1,120 @@
+"""Intensity histogram for contrast queries.
+
+Auto-contrast used to scan the full image or volume with ``np.percentile``,
+``np.partition`` and ``np.max`` every time it ran. One integer-bin histogram
+answers all of those queries from 65536 bin counts instead, so a histogram
+kept alongside a stored volume or overview image makes switching channels or
+toggling auto-contrast a lookup rather than a rescan.
+
+Results are exact for uint8/uint16 data (one bin per count). Other data is
+rounded and clipped to 0-65535 first; :meth:`IntensityHistogram.supports`
+tells callers which case they are in.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Elements per bincount call: bounds the intp temporary to ~32 MB
+_CHUNK = 1 << 22
+
+
+class IntensityHistogram:
+    """Pixel counts per integer intensity 0-65535.
+
+    Example:
+        >>> hist = IntensityHistogram.from_array(frame)
+        >>> lo, hi = hist.percentile(5, ignore_zero=True), hist.percentile(99.9)
+    """
+
+    BINS = 65536
+
+    def __init__(self, counts: Optional[np.ndarray] = None):
+        self.counts = (
+            np.zeros(self.BINS, dtype=np.int64)
+            if counts is None
+            else np.asarray(counts, dtype=np.int64)
+        )
+
+    @staticmethod
+    def supports(values: np.ndarray) -> bool:
+        """True if the histogram of ``values`` is exact (bool/uint8/uint16)."""
+        return values.dtype in (np.bool_, np.uint8, np.uint16)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "IntensityHistogram":
+        """Histogram of every element of ``values``."""
+        values = np.asarray(values)
+        if not cls.supports(values):
+            values = np.clip(np.rint(values), 0, cls.BINS - 1).astype(np.uint16)
+        flat = values.reshape(-1)
+        counts = np.zeros(cls.BINS, dtype=np.int64)
+        for start in range(0, flat.size, _CHUNK):
+            chunk = np.bincount(flat[start : start + _CHUNK], minlength=cls.BINS)
+            counts += chunk
+        return cls(counts)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def min(self, ignore_zero: bool = False) -> int:
+        """Smallest value present (0 if empty)."""
+        present = np.flatnonzero(self.counts[1:] if ignore_zero else self.counts)
+        if present.size == 0:
+            return 0
+        return int(present[0]) + (1 if ignore_zero else 0)
+
+    def max(self) -> int:
+        """Largest value present (0 if empty)."""
+        present = np.flatnonzero(self.counts)
+        return int(present[-1]) if present.size else 0
+
+    def percentile(self, q: float, ignore_zero: bool = False) -> float:
+        """Same result as ``np.percentile(values, q)`` (linear interpolation).
+
+        Args:
+            q: Percentile, 0-100
+            ignore_zero: Leave zero-valued elements out (``values[values > 0]``)
+
+        Returns:
+            The percentile, or 0.0 if there are no (non-zero) elements
+        """
+        counts = self.counts
+        if ignore_zero:
+            counts = counts.copy()
+            counts[0] = 0
+        cum = np.cumsum(counts)
+        n = int(cum[-1])
+        if n == 0:
+            return 0.0
+        rank = q / 100.0 * (n - 1)
+        lo = int(np.floor(rank))
+        hi = min(lo + 1, n - 1)
+        v_lo, v_hi = np.searchsorted(cum, [lo, hi], side="right")
+        return float(v_lo + (rank - lo) * (v_hi - v_lo))
+
+    def count_at_least(self, level: float) -> int:
+        """Number of elements ``>= level``."""
+        return self._count_from(int(np.ceil(level)))
+
+    def count_above(self, level: float) -> int:
+        """Number of elements ``> level``."""
+        return self._count_from(int(np.floor(level)) + 1)
+
+    def _count_from(self, start: int) -> int:
+        start = min(max(start, 0), self.BINS)
+        return int(self.counts[start:].sum())
+
+    def mean_of_top(self, n: int) -> float:
+        """Mean of the ``n`` largest elements (all of them if fewer)."""
+        n = min(n, self.total)
+        if n <= 0:
+            return 0.0
+        counts = self.counts[::-1]
+        values = np.arange(self.BINS - 1, -1, -1, dtype=np.float64)
+        cum = np.cumsum(counts)
+        k = int(np.searchsorted(cum, n))  # first bin that completes n
+        taken = int(cum[k - 1]) if k else 0
+        total = float(counts[:k] @ values[:k]) + (n - taken) * values[k]
+        return total / n
@@ -5,11 +5,14 @@ sector* of a volume to collect, so the instrument only images the optically-best
 region instead of the whole cuboid from every configuration. Reduces redundant
 light-sheet exposure, acquisition time, and disk usage.
 
-This module is intentionally free of Qt, hardware, and numpy dependencies — it is
-plain geometry over stage coordinates (mm) and angles (degrees), so it is fully
-unit-testable without a rig. The acquisition dialog wires these decisions into the
-generated ``Workflow.txt`` (``<Illumination Path>`` and Start/End ``Angle``); the
-stitcher reassembles the resulting partial / asymmetric data.
+This module is intentionally free of Qt and hardware dependencies — it is plain
+geometry over stage coordinates (mm) and angles (degrees), so it is fully
+unit-testable without a rig. Sector assignment and per-angle rotation run on
+numpy arrays (all tiles x all angles at once) because the dialog re-plans on
+every angle-count / overlap change and tile sets reach several thousand. The
+acquisition dialog wires these decisions into the generated ``Workflow.txt``
+(``<Illumination Path>`` and Start/End ``Angle``); the stitcher reassembles the
+resulting partial / asymmetric data.
 
 Coordinate frame (current TSPIM scope, see coordinate_system_reference.md):
     * stage X = illumination axis (two opposing light-sheet arms along +/-X)
@@ -33,6 +36,8 @@ import math
 from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+
 __all__ = [
     "ArmSelection",
     "SectorPlan",
@@ -42,6 +47,8 @@ __all__ = [
     "angle_schedule_deg",
     "plan_multiview_sectors",
     "assign_tiles_to_angles",
+    "sector_membership",
+    "rotate_xz_array",
     "plan_halfrotate_split",
     "plan_multiview_acquisition",
 ]
@@ -230,24 +237,56 @@ def assign_tiles_to_angles(
         present (possibly empty). A tile with a degenerate position exactly on the
         rotation center is assigned to all angles.
     """
+    member = sector_membership(
+        np.asarray(tiles_xz_mm, dtype=float).reshape(-1, 2),
+        n_angles,
+        rotation_center_xz_mm,
+        good_direction_deg,
+        start_deg,
+        overlap_deg,
+        rotation_sign,
+    )
+    return {k: np.flatnonzero(member[:, k]).tolist() for k in range(n_angles)}
+
+
+def sector_membership(
+    tiles_mm: np.ndarray,
+    n_angles: int,
+    rotation_center_xz_mm: Tuple[float, float],
+    good_direction_deg: float = 45.0,
+    start_deg: float = 0.0,
+    overlap_deg: float = 0.0,
+    rotation_sign: float = 1.0,
+) -> np.ndarray:
+    """Array form of :func:`assign_tiles_to_angles`.
+
+    Args:
+        tiles_mm: Tile centers, shape ``(N, 2)`` as (x, z) or ``(N, 3)`` as
+            (x, y, z), in the un-rotated sample frame.
+        n_angles, rotation_center_xz_mm, good_direction_deg, start_deg,
+            overlap_deg, rotation_sign: see :func:`assign_tiles_to_angles`.
+
+    Returns:
+        Boolean array of shape ``(N, n_angles)``; ``[i, k]`` is True when tile
+        ``i`` is collected at angle ``k``. Same decisions as the per-tile rule,
+        including the all-angles case for a tile on the rotation center.
+    """
     plans = plan_multiview_sectors(
         n_angles, good_direction_deg, start_deg, overlap_deg, rotation_sign
     )
+    x, z = _xz_columns(tiles_mm)
     cx, cz = rotation_center_xz_mm
-    result: Dict[int, List[int]] = {k: [] for k in range(n_angles)}
-
-    for t_idx, (x, z) in enumerate(tiles_xz_mm):
-        dx, dz = x - cx, z - cz
-        if abs(dx) < 1e-9 and abs(dz) < 1e-9:
-            for k in range(n_angles):
-                result[k].append(t_idx)
-            continue
-        phi = math.degrees(math.atan2(dz, dx))
-        limit = plans[0].sector_half_width_deg + overlap_deg
-        for k, plan in enumerate(plans):
-            if _angular_distance_deg(phi, plan.sector_center_deg) <= limit + 1e-9:
-                result[k].append(t_idx)
-    return result
+    dx, dz = x - cx, z - cz
+
+    phi = np.degrees(np.arctan2(dz, dx))
+    centers = np.array([p.sector_center_deg for p in plans])
+    limit = plans[0].sector_half_width_deg + overlap_deg
+    distance = np.abs(_wrap_deg_array(phi[:, None] - centers[None, :]))
+    member = distance <= limit + 1e-9
+
+    on_center = (np.abs(dx) < 1e-9) & (np.abs(dz) < 1e-9)
+    member[on_center] = True
+    return member
 
 
 @dataclass(frozen=True)
@@ -300,10 +339,10 @@ def plan_multiview_acquisition(
     Returns:
         Flat list of :class:`MultiviewTile`, grouped implicitly by angle.
     """
-    tiles_xz = [(x, z) for (x, _y, z, _zmin, _zmax) in tiles_xyz_zrange]
+    tiles = np.asarray(tiles_xyz_zrange, dtype=float).reshape(-1, 5)
     angles = angle_schedule_deg(n_angles, start_deg)
-    assignment = assign_tiles_to_angles(
-        tiles_xz,
+    member = sector_membership(
+        tiles[:, :3],
         n_angles,
         rotation_center_xz_mm,
         good_direction_deg,
@@ -312,24 +351,34 @@ def plan_multiview_acquisition(
         rotation_sign,
     )
     tip_x, tip_z = rotation_center_xz_mm
+    xr, zr = rotate_xz_array(
+        tiles[:, 0], tiles[:, 2], tip_x, tip_z, [rotation_sign * a for a in angles]
+    )
+    half_span = (tiles[:, 4] - tiles[:, 3]) / 2.0
+
+    # Angle-major, source order within an angle (transpose before nonzero)
+    ks, idxs = np.nonzero(member.T)
     out: List[MultiviewTile] = []
-    for k, angle in enumerate(angles):
-        for idx in assignment[k]:
-            x, y, z, z_min, z_max = tiles_xyz_zrange[idx]
-            xr, zr = _rotate_xz(x, z, tip_x, tip_z, rotation_sign * angle)
-            span = z_max - z_min
-            out.append(
-                MultiviewTile(
-                    x=xr,
-                    y=y,
-                    z=zr,
-                    z_min=zr - span / 2.0,
-                    z_max=zr + span / 2.0,
-                    angle_deg=angle,
-                    angle_index=k,
-                    source_index=idx,
-                )
+    for k, idx, x, y, z, h in zip(
+        ks.tolist(),
+        idxs.tolist(),
+        xr[idxs, ks].tolist(),
+        tiles[idxs, 1].tolist(),
+        zr[idxs, ks].tolist(),
+        half_span[idxs].tolist(),
+    ):
+        out.append(
+            MultiviewTile(
+                x=x,
+                y=y,
+                z=z,
+                z_min=z - h,
+                z_max=z + h,
+                angle_deg=angles[k],
+                angle_index=k,
+                source_index=idx,
             )
+        )
     return out
 
 
@@ -367,21 +416,42 @@ def _wrap_deg(a: float) -> float:
     return a
 
 
-def _angular_distance_deg(a: float, b: float) -> float:
-    """Smallest absolute difference between two angles, in [0, 180]."""
-    return abs(_wrap_deg(a - b))
+def _wrap_deg_array(a: np.ndarray) -> np.ndarray:
+    """Element-wise :func:`_wrap_deg`."""
+    a = np.fmod(a, 360.0)
+    a = np.where(a <= -180.0, a + 360.0, a)
+    return np.where(a > 180.0, a - 360.0, a)
 
 
-def _rotate_xz(
-    x: float, z: float, tip_x: float, tip_z: float, angle_deg: float
-) -> Tuple[float, float]:
-    """Rotate a point in the X-Z plane about (tip_x, tip_z) by ``angle_deg``.
+def _xz_columns(tiles_mm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """X and Z columns of an ``(N, 2)`` (x, z) or ``(N, 3)`` (x, y, z) array."""
+    tiles_mm = np.asarray(tiles_mm, dtype=float)
+    if tiles_mm.ndim != 2 or tiles_mm.shape[1] not in (2, 3):
+        raise ValueError(
+            f"tiles must have shape (N, 2) or (N, 3), got {tiles_mm.shape}"
+        )
+    return tiles_mm[:, 0], tiles_mm[:, -1]
+
+
+def rotate_xz_array(
+    x: np.ndarray,
+    z: np.ndarray,
+    tip_x: float,
+    tip_z: float,
+    angles_deg: Sequence[float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rotate N points in the X-Z plane by each of K angles about (tip_x, tip_z).
 
     Matches the convention of ``acquisition_profile_generator.rotate_point``
     (positive = physical clockwise): x' = x_tip + dx·cos + dz·sin,
     z' = z_tip − dx·sin + dz·cos.
+
+    Returns:
+        ``(x', z')``, each of shape ``(N, K)``; column ``k`` holds every point
+        rotated by ``angles_deg[k]``.
     """
-    a = math.radians(angle_deg)
-    ca, sa = math.cos(a), math.sin(a)
-    dx, dz = x - tip_x, z - tip_z
-    return (tip_x + dx * ca + dz * sa, tip_z - dx * sa + dz * ca)
+    a = np.radians(np.asarray(angles_deg, dtype=float))
+    ca, sa = np.cos(a)[None, :], np.sin(a)[None, :]
+    dx = (np.asarray(x, dtype=float) - tip_x)[:, None]
+    dz = (np.asarray(z, dtype=float) - tip_z)[:, None]
+    return tip_x + dx * ca + dz * sa, tip_z - dx * sa + dz * ca
@@ -20,9 +20,14 @@ reorganization looks exactly like a successful run until the user goes
 looking for the data.
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -31,6 +36,16 @@ logger = logging.getLogger(__name__)
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+# Written into the drive root while a reorganization is in flight. If it is
+# still there at the next run, the previous pass was interrupted.
+JOURNAL_NAME = ".flamingo_reorganize_journal.jsonl"
+
+# Cross-device copies are disk/network bound; a few in flight hides latency
+# without thrashing the storage server.
+DEFAULT_COPY_WORKERS = 4
+
+_CHECKSUM_CHUNK = 8 * 1024 * 1024
+
 
 @dataclass
 class ReorganizeResult:
@@ -153,11 +168,417 @@ def infer_local_drive_root(
     return root
 
 
+@dataclass
+class PlannedMove:
+    """One top-level item of a server folder and where it will end up.
+
+    Attributes:
+        src: Item inside the timestamped server folder.
+        dest: Target path inside the nested layout.
+        folder: Name of the server folder the item belongs to.
+    """
+
+    src: Path
+    dest: Path
+    folder: str
+
+
+@dataclass
+class ReorganizePlan:
+    """Every move a reorganization will make, computed before touching disk.
+
+    Attributes:
+        root: Local drive root the server folders live in.
+        moves: Item moves, grouped by server folder in plan order.
+        folders: Server folder name -> (source folder, destination folder).
+        unmatched: Flattened names that had no matching folder on disk.
+    """
+
+    root: Path
+    moves: List[PlannedMove] = field(default_factory=list)
+    folders: Dict[str, Tuple[Path, Path]] = field(default_factory=dict)
+    unmatched: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """One-line description of what executing the plan would do."""
+        text = f"{len(self.moves)} item(s) from {len(self.folders)} folder(s)"
+        if self.unmatched:
+            text += f"; {len(self.unmatched)} not found on disk"
+        return text
+
+    def to_json(self) -> dict:
+        return {
+            "root": str(self.root),
+            "moves": [[str(m.src), str(m.dest), m.folder] for m in self.moves],
+            "folders": {
+                name: [str(src), str(dest)]
+                for name, (src, dest) in self.folders.items()
+            },
+            "unmatched": list(self.unmatched),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ReorganizePlan":
+        return cls(
+            root=Path(data["root"]),
+            moves=[PlannedMove(Path(s), Path(d), f) for s, d, f in data["moves"]],
+            folders={
+                name: (Path(src), Path(dest))
+                for name, (src, dest) in data["folders"].items()
+            },
+            unmatched=list(data.get("unmatched", [])),
+        )
+
+
+def plan_tile_reorganization(
+    local_path: str,
+    base_save_directory: str,
+    tile_folder_mapping: Dict[str, Tuple[str, str]],
+) -> ReorganizePlan:
+    """Work out every move needed to reach the nested layout, without moving.
+
+    The drive root is listed once and matched against all flattened names,
+    rather than globbing it once per tile.
+
+    Args:
+        local_path: Local drive path (e.g. 'G:\\CTLSM1')
+        base_save_directory: Base save directory name
+        tile_folder_mapping: Maps flattened_name -> (date_folder, tile_folder)
+
+    Returns:
+        A :class:`ReorganizePlan`; executing it is a separate step, so the plan
+        doubles as a dry run.
+    """
+    local_base = Path(local_path)
+    plan = ReorganizePlan(root=local_base)
+
+    # Server folders are named like: 20260127_123617_Test_2026-01-27_X11.09_Y14.46
+    candidates = [p for p in local_base.iterdir() if p.is_dir()]
+
+    for flattened_name, (date_folder, tile_folder) in tile_folder_mapping.items():
+        suffix = f"_{flattened_name}"
+        matching_folders = [p for p in candidates if p.name.endswith(suffix)]
+
+        if not matching_folders:
+            logger.warning(f"Could not find folder matching pattern: *{suffix}")
+            plan.unmatched.append(flattened_name)
+            continue
+
+        # Target nested structure: base/date/tile/
+        dest_folder = local_base / base_save_directory / date_folder / tile_folder
+        for src_folder in matching_folders:
+            plan.folders[src_folder.name] = (src_folder, dest_folder)
+            # Move contents (not the folder itself)
+            for item in sorted(src_folder.iterdir()):
+                plan.moves.append(
+                    PlannedMove(item, dest_folder / item.name, src_folder.name)
+                )
+
+    return plan
+
+
+def _file_checksum(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHECKSUM_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_file_verified(src: Path, dest: Path) -> None:
+    """Copy a file across devices, verify it, then remove the source.
+
+    The copy is written beside the target and only renamed into place once its
+    checksum matches what was read from the source, so an interrupted or
+    corrupted copy never masquerades as the real file.
+    """
+    partial = dest.with_name(dest.name + ".partial")
+    digest = hashlib.blake2b()
+    with open(src, "rb") as fin, open(partial, "wb") as fout:
+        while chunk := fin.read(_CHECKSUM_CHUNK):
+            digest.update(chunk)
+            fout.write(chunk)
+    shutil.copystat(src, partial)
+
+    if _file_checksum(partial) != digest.hexdigest():
+        partial.unlink()
+        raise OSError(f"Checksum mismatch copying {src} -> {dest}")
+
+    os.replace(partial, dest)
+    src.unlink()
+
+
+def _copy_tree_verified(src: Path, dest: Path) -> None:
+    dest.mkdir(parents=True, exist_ok=True)
+    for item in src.iterdir():
+        if item.is_dir():
+            _copy_tree_verified(item, dest / item.name)
+        else:
+            _copy_file_verified(item, dest / item.name)
+    src.rmdir()
+
+
+def _same_device(a: Path, b: Path) -> bool:
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+
+def _move_item(src: Path, dest: Path) -> bool:
+    """Move one item, overwriting an existing target.
+
+    Returns:
+        True if it was renamed in place, False if source and target are on
+        different devices and it still needs :func:`_copy_item`.
+    """
+    # Handle existing files by overwriting
+    if dest.exists():
+        if dest.is_dir():
+            shutil.rmtree(str(dest))
+        else:
+            dest.unlink()
+
+    if _same_device(src, dest.parent):
+        os.rename(src, dest)
+        return True
+    return False
+
+
+def _copy_item(src: Path, dest: Path) -> None:
+    if src.is_dir():
+        _copy_tree_verified(src, dest)
+    else:
+        _copy_file_verified(src, dest)
+
+
+class _Journal:
+    """Append-only record of a reorganization, for resume and rollback.
+
+    The first line holds the whole plan; each completed move then appends a
+    line. Lines are flushed and fsynced so a crash loses at most the move that
+    was in flight, and that move is safe to repeat.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def begin(self, plan: ReorganizePlan, resume: bool = False) -> None:
+        """Open the journal: append to it on resume, otherwise create it.
+
+        A new plan never shares a journal with an unfinished one; creating
+        over an existing journal raises FileExistsError.
+        """
+        self._file = open(self.path, "a" if resume else "x", encoding="utf-8")
+        if not resume:
+            self._append({"op": "plan", "plan": plan.to_json()})
+
+    def record_done(self, move: PlannedMove) -> None:
+        self._append({"op": "done", "src": str(move.src)})
+
+    def close(self, finished: bool) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if finished:
+            self.path.unlink(missing_ok=True)
+
+    def _append(self, entry: dict) -> None:
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @staticmethod
+    def read(path: Path) -> Tuple[Optional[ReorganizePlan], List[str]]:
+        """Return the journaled plan and the sources already moved, in order."""
+        plan = None
+        done: List[str] = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write
+                    continue
+                if entry.get("op") == "plan":
+                    plan = ReorganizePlan.from_json(entry["plan"])
+                elif entry.get("op") == "done":
+                    done.append(entry["src"])
+        return plan, done
+
+
+def execute_reorganization_plan(
+    plan: ReorganizePlan,
+    journal_path: Optional[Path] = None,
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    _already_done: Optional[set] = None,
+) -> ReorganizeResult:
+    """Carry out a plan: renames in place, verified copies in parallel.
+
+    Items on the same filesystem as their target are moved with an atomic
+    ``os.rename``. Only items that must cross a device boundary are copied,
+    on a bounded thread pool, with checksum verification before the source is
+    removed.
+
+    Args:
+        plan: Plan from :func:`plan_tile_reorganization`.
+        journal_path: Where to journal progress. The journal is removed when
+            every move succeeded and kept otherwise, for
+            :func:`resume_reorganization` or :func:`rollback_reorganization`.
+            It must not exist yet unless this is a resume.
+        max_workers: Concurrent cross-device copies.
+
+    Returns:
+        A :class:`ReorganizeResult` counting fully moved folders.
+    """
+    result = ReorganizeResult(unmatched=list(plan.unmatched))
+    done = _already_done or set()
+    failed_folders: Dict[str, str] = {}
+
+    journal = _Journal(journal_path) if journal_path is not None else None
+    if journal is not None:
+        journal.begin(plan, resume=_already_done is not None)
+
+    def record(move: PlannedMove) -> None:
+        if journal is not None:
+            journal.record_done(move)
+
+    def copy_and_record(move: PlannedMove) -> None:
+        try:
+            _copy_item(move.src, move.dest)
+            record(move)
+            logger.debug(f"Copied: {move.src.name} -> {move.dest}")
+        except Exception as e:
+            logger.error(f"Failed to copy {move.src}: {e}")
+            failed_folders.setdefault(move.folder, str(e))
+
+    cross_device: List[PlannedMove] = []
+    for _, dest_folder in plan.folders.values():
+        try:
+            dest_folder.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to create {dest_folder}: {e}")
+
+    for move in plan.moves:
+        if str(move.src) in done or move.folder in failed_folders:
+            continue
+        try:
+            if _move_item(move.src, move.dest):
+                record(move)
+                logger.debug(f"Moved: {move.src.name} -> {move.dest}")
+            else:
+                cross_device.append(move)
+        except Exception as e:
+            logger.error(f"Failed to move {move.src}: {e}")
+            failed_folders.setdefault(move.folder, str(e))
+
+    if cross_device:
+        logger.info(
+            f"Copying {len(cross_device)} item(s) across devices "
+            f"with {max_workers} worker(s)"
+        )
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            list(pool.map(copy_and_record, cross_device))
+
+    for name, (src_folder, dest_folder) in plan.folders.items():
+        if name in failed_folders:
+            logger.error(f"Failed to reorganize {src_folder}: {failed_folders[name]}")
+            result.failed.append(name)
+            continue
+
+        # Remove now-empty source folder
+        try:
+            src_folder.rmdir()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Folder not empty (might have hidden files)
+            logger.warning(f"Could not remove source folder (not empty): {src_folder}")
+
+        logger.info(f"Reorganized: {name} -> {dest_folder.relative_to(plan.root)}/")
+        result.moved += 1
+
+    if journal is not None:
+        journal.close(finished=not result.failed)
+
+    return result
+
+
+def resume_reorganization(
+    journal_path: Path, max_workers: int = DEFAULT_COPY_WORKERS
+) -> ReorganizeResult:
+    """Finish an interrupted reorganization from its journal.
+
+    Moves already journaled are skipped; the one that was in flight is simply
+    repeated (a rename either happened or did not, and a copy only replaces
+    its target after verification).
+    """
+    plan, journaled = _Journal.read(journal_path)
+    if plan is None:
+        journal_path.unlink(missing_ok=True)
+        return ReorganizeResult(skip_reason="the reorganization journal was empty")
+
+    done = set(journaled)
+    # A move whose source is gone but whose target exists completed after its
+    # journal line could be written.
+    done |= {str(m.src) for m in plan.moves if not m.src.exists() and m.dest.exists()}
+    logger.info(
+        f"Resuming reorganization: {len(done)} of {len(plan.moves)} item(s) done"
+    )
+    return execute_reorganization_plan(
+        plan, journal_path, max_workers, _already_done=done
+    )
+
+
+def rollback_reorganization(journal_path: Path) -> int:
+    """Undo an interrupted reorganization, putting items back where they were.
+
+    Journaled moves are reversed newest first, and only where the item is at
+    its target and its source slot is free; anything else was never moved or
+    has already been put back. Files overwritten at the target by the forward
+    pass cannot be restored.
+
+    Returns:
+        Number of items moved back.
+    """
+    plan, journaled = _Journal.read(journal_path)
+    restored = 0
+    if plan is not None:
+        moves = {str(m.src): m for m in plan.moves}
+        seen = set()
+        for src in reversed(journaled):
+            move = moves.get(src)
+            if move is None or src in seen:
+                continue
+            seen.add(src)
+            if not move.dest.exists() or move.src.exists():
+                continue
+            move.src.parent.mkdir(parents=True, exist_ok=True)
+            if not _move_item(move.dest, move.src):
+                _copy_item(move.dest, move.src)
+            restored += 1
+
+        # Drop nested folders the forward pass created and left empty
+        for _, dest_folder in plan.folders.values():
+            try:
+                dest_folder.rmdir()
+            except OSError:
+                pass
+
+    journal_path.unlink(missing_ok=True)
+    logger.info(f"Rolled back reorganization: {restored} item(s) restored")
+    return restored
+
+
 def reorganize_tile_folders(
     local_path: str,
     base_save_directory: str,
     tile_folder_mapping: Dict[str, Tuple[str, str]],
     local_access_enabled: bool = False,
+    max_workers: int = DEFAULT_COPY_WORKERS,
 ) -> ReorganizeResult:
     """Reorganize flattened folders into nested structure for MIP Overview compatibility.
 
@@ -167,11 +588,17 @@ def reorganize_tile_folders(
     This function should be called AFTER queue_completed signal, which guarantees all
     workflows have finished and all files are written.
 
+    The full move plan is computed first and journaled in the drive root, so
+    an interrupted pass is picked up again by the next call. If it cannot be
+    finished, this call moves nothing and the journal is left in place, to be
+    resumed later or undone with :func:`rollback_reorganization`.
+
     Args:
         local_path: Local drive path (e.g. 'G:\\CTLSM1')
         base_save_directory: Base save directory name
         tile_folder_mapping: Maps flattened_name -> (date_folder, tile_folder)
         local_access_enabled: Whether local access was enabled in save settings
+        max_workers: Concurrent copies for items that cannot be renamed in place
 
     Returns:
         A :class:`ReorganizeResult`. It is falsey when nothing moved, so the
@@ -188,64 +615,27 @@ def reorganize_tile_folders(
         return ReorganizeResult(skip_reason=skip_reason)
 
     local_base = Path(local_path)
+    journal_path = local_base / JOURNAL_NAME
+
+    if journal_path.exists():
+        logger.warning(f"Found an interrupted reorganization journal: {journal_path}")
+        resumed = resume_reorganization(journal_path, max_workers)
+        if journal_path.exists():
+            # Starting a new plan now would bury the unfinished moves
+            skip_reason = (
+                f"an earlier interrupted reorganization could not be finished "
+                f"(journal kept at {journal_path})"
+            )
+            logger.error(f"Skipping folder reorganization: {skip_reason}")
+            return ReorganizeResult(skip_reason=skip_reason, failed=resumed.failed)
 
     logger.info(f"Starting folder reorganization: {local_base}")
-    result = ReorganizeResult()
-
-    # Find the timestamped folders created by server
-    # They'll be named like: 20260127_123617_Test_2026-01-27_X11.09_Y14.46
-    for flattened_name, (date_folder, tile_folder) in tile_folder_mapping.items():
-        # Search for matching folder (with any timestamp prefix)
-        # Pattern: *_{flattened_name} where flattened_name is like "Test_2026-01-27_X11.09_Y14.46"
-        pattern = f"*_{flattened_name}"
-        matching_folders = list(local_base.glob(pattern))
-
-        if not matching_folders:
-            logger.warning(f"Could not find folder matching pattern: {pattern}")
-            result.unmatched.append(flattened_name)
-            continue
-
-        for src_folder in matching_folders:
-            if not src_folder.is_dir():
-                continue
-
-            # Target nested structure: base/date/tile/
-            dest_folder = local_base / base_save_directory / date_folder / tile_folder
-
-            try:
-                dest_folder.mkdir(parents=True, exist_ok=True)
-
-                # Move contents (not the folder itself)
-                items_moved = 0
-                for item in src_folder.iterdir():
-                    dest_path = dest_folder / item.name
-                    # Handle existing files by overwriting
-                    if dest_path.exists():
-                        if dest_path.is_dir():
-                            shutil.rmtree(str(dest_path))
-                        else:
-                            dest_path.unlink()
-                    shutil.move(str(item), str(dest_path))
-                    items_moved += 1
-                    logger.debug(f"Moved: {item.name} -> {dest_path}")
-
-                # Remove now-empty source folder
-                try:
-                    src_folder.rmdir()
-                except OSError:
-                    # Folder not empty (might have hidden files)
-                    logger.warning(
-                        f"Could not remove source folder (not empty): {src_folder}"
-                    )
-
-                logger.info(
-                    f"Reorganized: {src_folder.name} -> {base_save_directory}/{date_folder}/{tile_folder}/ ({items_moved} items)"
-                )
-                result.moved += 1
+    plan = plan_tile_reorganization(
+        local_path, base_save_directory, tile_folder_mapping
+    )
+    logger.info(f"Reorganization plan: {plan.summary()}")
 
-            except Exception as e:
-                logger.error(f"Failed to reorganize {src_folder}: {e}")
-                result.failed.append(src_folder.name)
+    result = execute_reorganization_plan(plan, journal_path, max_workers)
 
     if result.moved > 0:
         logger.info(
@@ -219,6 +219,98 @@ def inherit_z_range(
     return (lo, hi, n)
 
 
+class OverviewTileIndex:
+    """Overview tile footprints bucketed on a grid, for batch planning queries.
+
+    :func:`overlapping_overview_tiles` and :func:`inherit_z_range` each scan
+    every overview tile, so planning a whole acquisition grid that way is
+    O(acquisition x overview) -- and it reruns on every spin-box change. The
+    index buckets tile centres into cells one overview field wide; a query only
+    checks the cells an acquisition footprint can reach, with the same
+    :func:`_footprints_overlap` test, so the answers are identical.
+    """
+
+    def __init__(
+        self,
+        overview_tiles: Sequence,
+        overview_fov_x_mm: float,
+        overview_fov_y_mm: float,
+    ):
+        self.overview_fov_x_mm = float(overview_fov_x_mm)
+        self.overview_fov_y_mm = float(overview_fov_y_mm)
+        # A degenerate field still needs a finite cell to bucket into
+        self._cell_x = self.overview_fov_x_mm if self.overview_fov_x_mm > 0 else 1.0
+        self._cell_y = self.overview_fov_y_mm if self.overview_fov_y_mm > 0 else 1.0
+
+        self._xy: List[Tuple[float, float]] = []
+        self._z: List[Optional[Tuple[float, float]]] = []
+        self._buckets: dict = {}
+        for i, tile in enumerate(overview_tiles):
+            ox, oy = _tile_xy(tile)
+            self._xy.append((ox, oy))
+            self._z.append(_tile_z(tile))
+            self._buckets.setdefault(self._cell(ox, oy), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._xy)
+
+    def _cell(self, x_mm: float, y_mm: float) -> Tuple[int, int]:
+        return (math.floor(x_mm / self._cell_x), math.floor(y_mm / self._cell_y))
+
+    def _candidates(self, x_mm: float, y_mm: float, half_x: float, half_y: float):
+        ix0, iy0 = self._cell(x_mm - half_x, y_mm - half_y)
+        ix1, iy1 = self._cell(x_mm + half_x, y_mm + half_y)
+        n_cells = (ix1 - ix0 + 1) * (iy1 - iy0 + 1)
+        if n_cells >= len(self._buckets):
+            # Footprint spans more cells than are occupied: walk the occupied
+            for (ix, iy), members in self._buckets.items():
+                if ix0 <= ix <= ix1 and iy0 <= iy <= iy1:
+                    yield from members
+            return
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                yield from self._buckets.get((ix, iy), ())
+
+    def query(
+        self,
+        x_mm: float,
+        y_mm: float,
+        acq_fov_x_mm: float,
+        acq_fov_y_mm: float,
+    ) -> Tuple[int, Optional[float], Optional[float], int]:
+        """Coverage and inherited Z for one acquisition tile, in one pass.
+
+        Returns:
+            ``(covers, z_min, z_max, n_sources)`` -- the results of
+            :func:`overlapping_overview_tiles` and :func:`inherit_z_range`.
+        """
+        half_x = (float(acq_fov_x_mm) + self.overview_fov_x_mm) / 2.0
+        half_y = (float(acq_fov_y_mm) + self.overview_fov_y_mm) / 2.0
+        covers = n = 0
+        lo = hi = None
+        for i in self._candidates(x_mm, y_mm, half_x, half_y):
+            ox, oy = self._xy[i]
+            if not _footprints_overlap(x_mm, y_mm, ox, oy, half_x, half_y):
+                continue
+            covers += 1
+            span = self._z[i]
+            if span is None:
+                continue
+            n += 1
+            lo = span[0] if lo is None else min(lo, span[0])
+            hi = span[1] if hi is None else max(hi, span[1])
+        return (covers, lo, hi, n)
+
+    def query_many(
+        self,
+        positions: Sequence[Tuple[float, float]],
+        acq_fov_x_mm: float,
+        acq_fov_y_mm: float,
+    ) -> List[Tuple[int, Optional[float], Optional[float], int]]:
+        """:meth:`query` for a whole acquisition grid."""
+        return [self.query(x, y, acq_fov_x_mm, acq_fov_y_mm) for x, y in positions]
+
+
 @dataclass
 class AcquisitionPlan:
     """An acquisition grid derived from an overview, and how it was derived.
@@ -422,28 +514,12 @@ def plan_acquisition_from_overview(
     # per-tile depths — which is the entire product of Collect Tiles, and what
     # the laser acquisition sweeps.
     fallback = (float(z_min_mm), float(z_max_mm))
+    index = OverviewTileIndex(overview_centres, overview_fov_x_mm, overview_fov_y_mm)
+    queries = index.query_many(geometry.positions, geometry.fov_x_mm, geometry.fov_y_mm)
     planned = []
-    for x, y in geometry.positions:
-        covers = overlapping_overview_tiles(
-            x,
-            y,
-            geometry.fov_x_mm,
-            geometry.fov_y_mm,
-            overview_centres,
-            overview_fov_x_mm,
-            overview_fov_y_mm,
-        )
+    for (x, y), (covers, lo, hi, n) in zip(geometry.positions, queries):
         if drop_uncovered and covers == 0:
             continue
-        lo, hi, n = inherit_z_range(
-            x,
-            y,
-            geometry.fov_x_mm,
-            geometry.fov_y_mm,
-            overview_centres,
-            overview_fov_x_mm,
-            overview_fov_y_mm,
-        )
         if lo is None:
             lo, hi = fallback
         planned.append(
@@ -1,7 +1,9 @@
 """Tile workflow file parsing utilities.
 
 Pure file-parsing functions for extracting metadata from workflow files,
-extracted from tile_collection_dialog.py.
+extracted from tile_collection_dialog.py. The ``read_*_from_workflow``
+helpers are lookups into one cached parse per file
+(:func:`~py2flamingo.utils.workflow_parser.read_workflow_fields`).
 """
 
 import logging
@@ -9,6 +11,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from py2flamingo.utils.workflow_parser import read_workflow_fields
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,16 +60,9 @@ def read_xy_position_from_workflow(
         (x_mm, y_mm), or None if the block/fields are absent.
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-        x_match = re.search(
-            r"<Start Position>.*?X \(mm\) = ([-\d.]+)", content, re.DOTALL
-        )
-        y_match = re.search(
-            r"<Start Position>.*?Y \(mm\) = ([-\d.]+)", content, re.DOTALL
-        )
-        if x_match and y_match:
-            return float(x_match.group(1)), float(y_match.group(1))
+        fields = read_workflow_fields(workflow_file)
+        if fields.start_x is not None and fields.start_y is not None:
+            return fields.start_x, fields.start_y
     except Exception as e:
         logger.error(f"Failed to read XY position from {workflow_file.name}: {e}")
     return None
@@ -81,25 +78,9 @@ def read_z_range_from_workflow(workflow_file: Path) -> Tuple[float, float]:
         Tuple of (z_min, z_max) in mm
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-
-        # Parse Start Position Z
-        z_min = 0.0
-        z_max = 0.0
-
-        start_match = re.search(
-            r"<Start Position>.*?Z \(mm\) = ([-\d.]+)", content, re.DOTALL
-        )
-        if start_match:
-            z_min = float(start_match.group(1))
-
-        end_match = re.search(
-            r"<End Position>.*?Z \(mm\) = ([-\d.]+)", content, re.DOTALL
-        )
-        if end_match:
-            z_max = float(end_match.group(1))
-
+        fields = read_workflow_fields(workflow_file)
+        z_min = fields.start_z if fields.start_z is not None else 0.0
+        z_max = fields.end_z if fields.end_z is not None else 0.0
         return (z_min, z_max)
 
     except Exception as e:
@@ -128,31 +109,12 @@ def read_laser_channels_from_workflow(workflow_file: Path) -> List[int]:
         Falls back to [0] if parsing fails.
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-
-        # Extract Illumination Source block
-        illum_match = re.search(
-            r"<Illumination Source>(.*?)</Illumination Source>", content, re.DOTALL
-        )
-        if not illum_match:
+        channels = read_workflow_fields(workflow_file).laser_channels
+        if channels is None:
             logger.warning(f"No Illumination Source block in {workflow_file.name}")
             return [0]
 
-        illum_block = illum_match.group(1)
-        channels = []
-
-        # Match lines like: "Laser 2 2: 488 nm MLE = 10.00 1"
-        # The last number (1 or 0) indicates enabled/disabled
-        for match in re.finditer(
-            r"Laser\s+(\d+)\s+\d+:\s+\d+\s+nm\s+MLE\s*=\s*[\d.]+\s+(\d+)", illum_block
-        ):
-            laser_num = int(match.group(1))
-            enabled = int(match.group(2))
-            if enabled == 1:
-                # Laser number to channel: Laser 1 -> ch 0, Laser 2 -> ch 1, etc.
-                channels.append(laser_num - 1)
-
+        channels = list(channels)
         if not channels:
             logger.warning(
                 f"No enabled lasers found in {workflow_file.name}, defaulting to channel 0"
@@ -180,11 +142,8 @@ def read_num_planes_from_workflow(workflow_file: Path) -> Optional[int]:
         Number of planes per channel, or None if not found
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-        match = re.search(r"Number of planes\s*=\s*(\d+)", content)
-        if match:
-            num_planes = int(match.group(1))
+        num_planes = read_workflow_fields(workflow_file).num_planes
+        if num_planes is not None:
             logger.debug(f"Parsed num_planes from {workflow_file.name}: {num_planes}")
             return num_planes
     except Exception as e:
@@ -206,21 +165,8 @@ def read_save_directory_from_workflow(workflow_file: Path) -> Tuple[str, str]:
         e.g. ("G:\\", "CTLSM1\\Test_2026-03-06_X4.88_Y17.63")
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-
-        save_drive = ""
-        save_dir = ""
-
-        drive_match = re.search(r"Save image drive\s*=\s*(.+)", content)
-        if drive_match:
-            save_drive = drive_match.group(1).strip()
-
-        dir_match = re.search(r"Save image directory\s*=\s*(.+)", content)
-        if dir_match:
-            save_dir = dir_match.group(1).strip()
-
-        return (save_drive, save_dir)
+        fields = read_workflow_fields(workflow_file)
+        return (fields.save_drive or "", fields.save_directory or "")
 
     except Exception as e:
         logger.error(f"Failed to read save directory from {workflow_file.name}: {e}")
@@ -239,31 +185,14 @@ def read_illumination_path_from_workflow(workflow_file: Path) -> Tuple[bool, boo
         Tuple of (left_enabled, right_enabled). Defaults to (True, False).
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-
-        illum_match = re.search(
-            r"<Illumination Path>(.*?)</Illumination Path>", content, re.DOTALL
-        )
-        if not illum_match:
+        illumination_path = read_workflow_fields(workflow_file).illumination_path
+        if illumination_path is None:
             logger.info(
                 f"No Illumination Path block in {workflow_file.name}, defaulting to left"
             )
             return (True, False)
 
-        block = illum_match.group(1)
-
-        left_enabled = False
-        right_enabled = False
-
-        left_match = re.search(r"Left path\s*=\s*\w+\s+(\d+)", block)
-        if left_match:
-            left_enabled = int(left_match.group(1)) == 1
-
-        right_match = re.search(r"Right path\s*=\s*\w+\s+(\d+)", block)
-        if right_match:
-            right_enabled = int(right_match.group(1)) == 1
-
+        left_enabled, right_enabled = illumination_path
         logger.info(
             f"Illumination path from {workflow_file.name}: "
             f"left={left_enabled}, right={right_enabled}"
@@ -285,11 +214,8 @@ def read_z_velocity_from_workflow(workflow_file: Path) -> float:
         Z velocity in mm/s (default 1.0)
     """
     try:
-        with open(workflow_file, "r") as f:
-            content = f.read()
-        match = re.search(r"Z stage velocity \(mm/s\)\s*=\s*([\d.]+)", content)
-        if match:
-            velocity = float(match.group(1))
+        velocity = read_workflow_fields(workflow_file).z_velocity
+        if velocity is not None:
             logger.debug(
                 f"Parsed Z velocity from {workflow_file.name}: {velocity} mm/s"
             )
@@ -5,9 +5,10 @@ extracted from tile_collection_dialog.py.
 """
 
 import logging
-import math
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Two Z values closer than this (mm) are treated as the same value -- 0.1 µm,
@@ -77,30 +78,26 @@ def calculate_tile_z_ranges(
 
     # For each primary tile, find secondary tiles at matching Y positions
     # and map their X range to primary Z range
+    rows = _SecondaryRows(secondary_tiles)
     tile_z_ranges = {}
     fallback_count = 0
+    log_debug = logger.isEnabledFor(logging.DEBUG)
 
-    for p_tile in primary_tiles:
-        # Find secondary tiles with matching Y (within FOV tolerance)
-        matched_secondary_x = []
-        for s_tile in secondary_tiles:
-            y_distance = abs(p_tile.y - s_tile.y)
-            if y_distance < fov_mm:
-                matched_secondary_x.append(s_tile.x)
-
-        if matched_secondary_x:
+    for p_tile, (x_min, x_max, n_matched) in zip(
+        primary_tiles, rows.x_ranges([t.y for t in primary_tiles], fov_mm)
+    ):
+        if n_matched:
             # Map secondary X range to primary Z range
-            x_min = min(matched_secondary_x)
-            x_max = max(matched_secondary_x)
             # z_primary = x_secondary + offset, with FOV/2 margin for tile extent
             z_min = x_min + offset - fov_mm / 2
             z_max = x_max + offset + fov_mm / 2
-            logger.debug(
-                f"Tile ({p_tile.tile_x_idx},{p_tile.tile_y_idx}) at Y={p_tile.y:.3f}: "
-                f"{len(matched_secondary_x)} matched secondary tiles, "
-                f"secondary X=[{x_min:.3f}, {x_max:.3f}], "
-                f"mapped Z=[{z_min:.3f}, {z_max:.3f}] mm"
-            )
+            if log_debug:
+                logger.debug(
+                    f"Tile ({p_tile.tile_x_idx},{p_tile.tile_y_idx}) at Y={p_tile.y:.3f}: "
+                    f"{n_matched} matched secondary tiles, "
+                    f"secondary X=[{x_min:.3f}, {x_max:.3f}], "
+                    f"mapped Z=[{z_min:.3f}, {z_max:.3f}] mm"
+                )
         else:
             # No Y-matched secondary tiles - use fallback
             z_min = fallback_z_min
@@ -136,6 +133,51 @@ def calculate_tile_z_ranges(
     return tile_z_ranges
 
 
+class _SecondaryRows:
+    """Secondary tiles bucketed by Y row, sorted by Y, with each row's X extent.
+
+    Built once per calculation so each primary tile's lookup is a binary search
+    over rows instead of a scan over every secondary tile.
+    """
+
+    def __init__(self, secondary_tiles: List):
+        ys = np.array([t.y for t in secondary_tiles], dtype=float)
+        xs = np.array([t.x for t in secondary_tiles], dtype=float)
+        self.y, row = np.unique(ys, return_inverse=True)
+        self.x_min = np.full(len(self.y), np.inf)
+        self.x_max = np.full(len(self.y), -np.inf)
+        np.minimum.at(self.x_min, row, xs)
+        np.maximum.at(self.x_max, row, xs)
+        self.count = np.bincount(row, minlength=len(self.y))
+
+    def x_ranges(
+        self, primary_y: List[float], fov_mm: float
+    ) -> List[Tuple[float, float, int]]:
+        """``(x_min, x_max, n_matched)`` over secondary tiles within ``fov_mm``
+        in Y of each primary Y; ``n_matched`` is 0 when none are."""
+        py = np.asarray(primary_y, dtype=float)
+        # Widen the search by a hair either side, then apply the
+        # exact |dy| < fov test so edge tiles match exactly as a scan would
+        pad = 1e-9 * max(1.0, fov_mm)
+        lo = np.searchsorted(self.y, py - fov_mm - pad, side="left")
+        hi = np.searchsorted(self.y, py + fov_mm + pad, side="right")
+
+        out = []
+        for y, a, b in zip(py.tolist(), lo.tolist(), hi.tolist()):
+            rows = np.arange(a, b)[np.abs(y - self.y[a:b]) < fov_mm]
+            if len(rows) == 0:
+                out.append((0.0, 0.0, 0))
+                continue
+            out.append(
+                (
+                    float(self.x_min[rows].min()),
+                    float(self.x_max[rows].max()),
+                    int(self.count[rows].sum()),
+                )
+            )
+        return out
+
+
 def _estimate_rotation_offset(primary_tiles: List, secondary_tiles: List) -> float:
     """Estimate the rotation offset from tile data when tip position is unavailable.
 
@@ -250,17 +292,20 @@ def min_distance_in_tile_set(tiles: List) -> float:
     if len(tiles) < 2:
         return float("inf")
 
-    min_distance = float("inf")
-
-    for i, tile1 in enumerate(tiles):
-        for tile2 in tiles[i + 1 :]:
-            # Calculate Euclidean distance in XY plane
-            dx = tile1.x - tile2.x
-            dy = tile1.y - tile2.y
-            distance = math.sqrt(dx * dx + dy * dy)
+    from scipy.spatial import cKDTree
 
-            # Skip zero distances (same tile) and update minimum
-            if distance > 1e-6 and distance < min_distance:
-                min_distance = distance
+    # Exact duplicates are zero distances: drop them before the tree query
+    points = np.unique(np.array([(t.x, t.y) for t in tiles], dtype=float), axis=0)
+    if len(points) < 2:
+        return float("inf")
 
-    return min_distance
+    # Nearest neighbour in the XY plane, skipping sub-micron (same tile)
+    # neighbours; widen k only when near-duplicates hide the real neighbour
+    tree = cKDTree(points)
+    k = 2
+    while True:
+        distances, _ = tree.query(points, k=min(k, len(points)))
+        valid = distances[distances > 1e-6]
+        if k >= len(points) or (distances[:, -1] > 1e-6).all():
+            return float(valid.min()) if len(valid) else float("inf")
+        k *= 2
@@ -6,11 +6,49 @@ It leverages existing file_handlers utilities and adds additional validation and
 error handling for robust workflow processing.
 """
 
+import copy
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .file_handlers import workflow_to_dict
 
+# Parsed workflows, one entry per (kind, file). An entry is reused while the
+# file's mtime and size are unchanged; queue preflight and tile collection read
+# the same files many times over.
+_PARSE_CACHE_SIZE = 4096
+_parse_cache: "OrderedDict[Tuple[str, str], Tuple[int, int, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _cached_parse(path: Path, kind: str, parse: Callable[[Path], Any]) -> Any:
+    """Return ``parse(path)``, reusing the last result while the file is unchanged.
+
+    "Unchanged" means same mtime and size; a same-size rewrite within the
+    filesystem's timestamp resolution is not noticed.
+
+    Raises whatever ``os.stat`` or ``parse`` raises; failures are not cached.
+    """
+    st = os.stat(path)
+    key = (kind, os.path.abspath(path))
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            _parse_cache.move_to_end(key)
+            return entry[2]
+
+    value = parse(path)
+    with _parse_cache_lock:
+        _parse_cache[key] = (st.st_mtime_ns, st.st_size, value)
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return value
+
 
 def parse_workflow_file(path: Union[str, Path]) -> Dict[str, Any]:
     """Parse a workflow .txt file into a structured dictionary.
@@ -43,8 +81,9 @@ def parse_workflow_file(path: Union[str, Path]) -> Dict[str, Any]:
 
     # Use existing workflow_to_dict with enhanced error handling
     try:
-        # Read with error handling for encoding issues
-        workflow_dict = workflow_to_dict(path)
+        # Read with error handling for encoding issues. Callers may edit the
+        # dict, so hand out a copy of the cached parse.
+        workflow_dict = copy.deepcopy(_cached_parse(path, "dict", workflow_to_dict))
     except UnicodeDecodeError as e:
         raise ValueError(f"Encoding error in workflow file: {e}")
     except Exception as e:
@@ -56,6 +95,128 @@ def parse_workflow_file(path: Union[str, Path]) -> Dict[str, Any]:
     return workflow_dict
 
 
+_START_X_RE = re.compile(r"<Start Position>.*?X \(mm\) = ([-\d.]+)", re.DOTALL)
+_START_Y_RE = re.compile(r"<Start Position>.*?Y \(mm\) = ([-\d.]+)", re.DOTALL)
+_START_Z_RE = re.compile(r"<Start Position>.*?Z \(mm\) = ([-\d.]+)", re.DOTALL)
+_END_Z_RE = re.compile(r"<End Position>.*?Z \(mm\) = ([-\d.]+)", re.DOTALL)
+_ILLUM_SOURCE_RE = re.compile(
+    r"<Illumination Source>(.*?)</Illumination Source>", re.DOTALL
+)
+# "Laser 2 2: 488 nm MLE = 10.00 1" -- the last number is enabled (1) / off (0)
+_LASER_RE = re.compile(r"Laser\s+(\d+)\s+\d+:\s+\d+\s+nm\s+MLE\s*=\s*[\d.]+\s+(\d+)")
+_ILLUM_PATH_RE = re.compile(r"<Illumination Path>(.*?)</Illumination Path>", re.DOTALL)
+_LEFT_PATH_RE = re.compile(r"Left path\s*=\s*\w+\s+(\d+)")
+_RIGHT_PATH_RE = re.compile(r"Right path\s*=\s*\w+\s+(\d+)")
+_NUM_PLANES_RE = re.compile(r"Number of planes\s*=\s*(\d+)")
+_Z_VELOCITY_RE = re.compile(r"Z stage velocity \(mm/s\)\s*=\s*([\d.]+)")
+_SAVE_DRIVE_RE = re.compile(r"Save image drive\s*=\s*(.+)")
+_SAVE_DIR_RE = re.compile(r"Save image directory\s*=\s*(.+)")
+_AOI_WIDTH_RE = re.compile(r"AOI width\s*=\s*(\d+)")
+_AOI_HEIGHT_RE = re.compile(r"AOI height\s*=\s*(\d+)")
+
+
+@dataclass(frozen=True)
+class WorkflowFields:
+    """Fields commonly read from a workflow file, parsed in one go.
+
+    Each field is None when the file does not contain it; the readers in
+    ``tile_workflow_parser`` and ``tiff_size_validator`` apply their own
+    defaults.
+
+    Attributes:
+        start_x, start_y, start_z: ``<Start Position>`` X/Y/Z (mm)
+        end_z: ``<End Position>`` Z (mm)
+        laser_channels: Enabled lasers as channel IDs (Laser N -> N-1); empty
+            if none is enabled, None if there is no ``<Illumination Source>``
+        illumination_path: (left_on, right_on), None if there is no
+            ``<Illumination Path>`` block
+        num_planes: ``Number of planes``
+        z_velocity: ``Z stage velocity (mm/s)``
+        save_drive, save_directory: ``Save image drive`` / ``directory``
+        aoi_width, aoi_height: Camera AOI in pixels
+    """
+
+    start_x: Optional[float] = None
+    start_y: Optional[float] = None
+    start_z: Optional[float] = None
+    end_z: Optional[float] = None
+    laser_channels: Optional[Tuple[int, ...]] = None
+    illumination_path: Optional[Tuple[bool, bool]] = None
+    num_planes: Optional[int] = None
+    z_velocity: Optional[float] = None
+    save_drive: Optional[str] = None
+    save_directory: Optional[str] = None
+    aoi_width: Optional[int] = None
+    aoi_height: Optional[int] = None
+
+
+def parse_workflow_fields(content: str) -> WorkflowFields:
+    """Extract :class:`WorkflowFields` from workflow file text."""
+
+    def first(pattern: "re.Pattern", convert: Callable[[str], Any]) -> Any:
+        # A malformed value (e.g. "X (mm) = -") only loses that field
+        match = pattern.search(content)
+        if not match:
+            return None
+        try:
+            return convert(match.group(1))
+        except ValueError:
+            return None
+
+    laser_channels = None
+    illum = _ILLUM_SOURCE_RE.search(content)
+    if illum:
+        laser_channels = tuple(
+            int(m.group(1)) - 1
+            for m in _LASER_RE.finditer(illum.group(1))
+            if int(m.group(2)) == 1
+        )
+
+    illumination_path = None
+    path_block = _ILLUM_PATH_RE.search(content)
+    if path_block:
+        block = path_block.group(1)
+        left = _LEFT_PATH_RE.search(block)
+        right = _RIGHT_PATH_RE.search(block)
+        illumination_path = (
+            bool(left) and int(left.group(1)) == 1,
+            bool(right) and int(right.group(1)) == 1,
+        )
+
+    return WorkflowFields(
+        start_x=first(_START_X_RE, float),
+        start_y=first(_START_Y_RE, float),
+        start_z=first(_START_Z_RE, float),
+        end_z=first(_END_Z_RE, float),
+        laser_channels=laser_channels,
+        illumination_path=illumination_path,
+        num_planes=first(_NUM_PLANES_RE, int),
+        z_velocity=first(_Z_VELOCITY_RE, float),
+        save_drive=first(_SAVE_DRIVE_RE, str.strip),
+        save_directory=first(_SAVE_DIR_RE, str.strip),
+        aoi_width=first(_AOI_WIDTH_RE, int),
+        aoi_height=first(_AOI_HEIGHT_RE, int),
+    )
+
+
+def read_workflow_fields(path: Union[str, Path]) -> WorkflowFields:
+    """Read and parse a workflow file's common fields, cached per file.
+
+    The file is read and parsed again only when its modification time or size
+    changes.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid text
+    """
+
+    def parse(p: Path) -> WorkflowFields:
+        with open(p, "r") as f:
+            return parse_workflow_fields(f.read())
+
+    return _cached_parse(Path(path), "fields", parse)
+
+
 def infer_workflow_type(workflow_dict: Dict[str, Any]) -> str:
     """Infer the workflow-type string from a parsed workflow dict.
 
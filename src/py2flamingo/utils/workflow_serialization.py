@@ -18,9 +18,10 @@ cannot get it wrong — tile counts stay client-side (estimate / tile_geometry).
 """
 
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models.data.workflow import WorkflowType
+from .workflow_parser import dict_to_workflow_text
 
 # Camera laser slots in the exact order/format the server file lists them.
 _LASER_SLOTS = [
@@ -283,6 +284,90 @@ def build_tile_collection_section_dict(
     )
 
 
+class TileCollectionTemplate:
+    """The inputs every workflow of one tile-collection run shares.
+
+    Building a run of tiles used to re-read every panel and rebuild the
+    illumination source for each tile. The template captures the shared inputs
+    once; :meth:`render` then supplies only the per-tile fields (name,
+    position, Z range, save directory, Left/Right path) to
+    :func:`build_tile_collection_section_dict` and ``dict_to_workflow_text``.
+    It deliberately stays on that serializer rather than splicing values into
+    pre-rendered text, so a run can never differ from a single tile.
+    """
+
+    def __init__(
+        self,
+        *,
+        camera: Dict[str, Any],
+        illumination_list: List[Any],
+        left_on: bool,
+        right_on: bool,
+        multi_laser: bool,
+        save_settings: Dict[str, Any],
+        is_zstack: bool,
+        z_step_um: float,
+        z_velocity_mm_s: float,
+    ):
+        self.camera = dict(camera)
+        self.illumination_list = list(illumination_list)
+        self.left_on = left_on
+        self.right_on = right_on
+        self.multi_laser = multi_laser
+        self.save_settings = dict(save_settings)
+        self.is_zstack = is_zstack
+        self.z_step_um = z_step_um
+        self.z_velocity_mm_s = z_velocity_mm_s
+        self._sources: Dict[Tuple[bool, bool], Dict[str, str]] = {}
+
+    def illumination_source(self, left_on: bool, right_on: bool) -> Dict[str, str]:
+        """Illumination Source dict for a path combination, built once."""
+        key = (bool(left_on), bool(right_on))
+        source = self._sources.get(key)
+        if source is None:
+            source = build_tile_illumination_source(
+                self.illumination_list, left_on=key[0], right_on=key[1]
+            )
+            self._sources[key] = source
+        return source
+
+    def render(
+        self,
+        *,
+        name: str,
+        position: Any,
+        save_directory: str,
+        z_min: float,
+        z_max: float,
+        left_on: Optional[bool] = None,
+        right_on: Optional[bool] = None,
+    ) -> str:
+        """Workflow text for one tile.
+
+        ``left_on``/``right_on`` override the run's path flags when not None
+        (smart limited acquisition).
+        """
+        source = self.illumination_source(
+            self.left_on if left_on is None else left_on,
+            self.right_on if right_on is None else right_on,
+        )
+        save_settings = dict(self.save_settings, save_directory=save_directory)
+        section_dict = build_tile_collection_section_dict(
+            name=name,
+            position=position,
+            camera=self.camera,
+            illumination_source=source,
+            multi_laser=self.multi_laser,
+            save_settings=save_settings,
+            z_min=z_min,
+            z_max=z_max,
+            is_zstack=self.is_zstack,
+            z_step_um=self.z_step_um,
+            z_velocity_mm_s=self.z_velocity_mm_s,
+        )
+        return dict_to_workflow_text(section_dict)
+
+
 def _end_position(
     workflow_type: WorkflowType, position_a: Any, position_b: Any
 ) -> Dict[str, Any]:
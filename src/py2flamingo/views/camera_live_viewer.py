@@ -314,6 +314,9 @@ class CameraLiveViewer(QWidget):
         """Connect controller signals to UI slots."""
         self.camera_controller.new_image.connect(self._on_new_image)
         self.camera_controller.state_changed.connect(self._on_state_changed)
+        self.camera_controller.display_governor.register(
+            "camera_live_viewer", self.image_label
+        )
         self.camera_controller.error_occurred.connect(self._on_error)
         self.camera_controller.frame_rate_updated.connect(self._on_frame_rate_updated)
 
@@ -373,8 +376,11 @@ class CameraLiveViewer(QWidget):
                 header.image_scale_min, header.image_scale_max
             )
 
-        # Convert and display image
-        self._display_image(image, header)
+        # Convert and display image (not while hidden or minimized)
+        governor = self.camera_controller.display_governor
+        if governor.should_render("camera_live_viewer", image):
+            with governor.render("camera_live_viewer"):
+                self._display_image(image, header)
 
     @pyqtSlot(object)
     def _on_state_changed(self, state: CameraState) -> None:
@@ -5,8 +5,9 @@ images at different rotation angles with coordinate overlays.
 """
 
 import logging
+import weakref
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from PyQt5.QtCore import QPoint, QSize, Qt, QTimer, pyqtSignal
@@ -34,6 +35,7 @@ from PyQt5.QtWidgets import (
 )
 
 from py2flamingo.services.window_geometry_manager import PersistentWidget
+from py2flamingo.utils.intensity_histogram import IntensityHistogram
 from py2flamingo.utils.saved_data_version import LED_2D_SESSION
 
 logger = logging.getLogger(__name__)
@@ -41,10 +43,10 @@ logger = logging.getLogger(__name__)
 from py2flamingo.views.widgets.zoomable_image_label import ZoomableImageLabel
 from py2flamingo.visualization.zarr_2d_session import (
     ZARR_AVAILABLE,
+    Zarr2DSessionWriter,
     detect_session_format,
     load_2d_zarr_session,
     load_2d_zarr_session_lazy,
-    save_2d_zarr_session,
 )
 
 
@@ -100,6 +102,9 @@ class ImagePanel(QWidget):
         # Actual image intensity range (set when image is loaded)
         self._image_min = 0.0
         self._image_max_pct = 255.0  # 99.5th percentile
+        # Intensity histogram per source image (keyed by id, checked through a
+        # weak reference) so switching back to an image skips the rescan
+        self._histograms: Dict[int, Tuple[weakref.ref, IntensityHistogram]] = {}
 
         self._setup_ui()
 
@@ -216,6 +221,23 @@ class ImagePanel(QWidget):
         zoom_pct = int(self.image_label.zoom_level * 100)
         self.zoom_label.setText(f"{zoom_pct}%")
 
+    def _image_histogram(
+        self, image: np.ndarray, display_values: np.ndarray
+    ) -> IntensityHistogram:
+        """Histogram of ``display_values``, remembered for source ``image``."""
+        cached = self._histograms.get(id(image))
+        if cached is not None and cached[0]() is image:
+            return cached[1]
+        histogram = IntensityHistogram.from_array(display_values)
+        # Drop entries whose image is gone before adding this one
+        self._histograms = {
+            key: entry
+            for key, entry in self._histograms.items()
+            if entry[0]() is not None
+        }
+        self._histograms[id(image)] = (weakref.ref(image), histogram)
+        return histogram
+
     def _on_contrast_changed(self):
         """Handle contrast slider change - redraw image with new contrast."""
         self._contrast_min_slider = self._min_slider.value()
@@ -340,8 +362,13 @@ class ImagePanel(QWidget):
                     else display.ravel()
                 )
 
-            self._image_min = float(np.min(flat))
-            self._image_max_pct = float(np.percentile(flat, 99.5))
+            if IntensityHistogram.supports(flat):
+                histogram = self._image_histogram(image, flat)
+                self._image_min = float(histogram.min())
+                self._image_max_pct = histogram.percentile(99.5)
+            else:
+                self._image_min = float(np.min(flat))
+                self._image_max_pct = float(np.percentile(flat, 99.5))
 
             # Ensure min < max
             if self._image_max_pct <= self._image_min:
@@ -2379,18 +2406,19 @@ class LED2DOverviewResultWindow(PersistentWidget):
         if ZARR_AVAILABLE:
             save_path = Path(folder) / f"led_2d_overview_{timestamp}.zarr"
             try:
-                # Build hierarchical images dict
-                images = {}
+                # Each rotation's images compress on the writer's pool; the
+                # window stays responsive and the metadata lands last.
+                writer = Zarr2DSessionWriter(save_path, "led_2d_overview")
                 for i, rotation in enumerate(self._results):
                     for vis_type, image in rotation.stitched_images.items():
-                        if image is not None:
-                            images[f"rotation_{i}/stitched_{vis_type}"] = image
-
-                save_2d_zarr_session(save_path, metadata, images, "led_2d_overview")
+                        writer.add(f"rotation_{i}/stitched_{vis_type}", image)
+                future = writer.finish_async(metadata)
             except Exception as e:
                 logger.error(f"Error saving zarr session: {e}", exc_info=True)
                 QMessageBox.critical(self, "Error", f"Failed to save session:\n{e}")
                 return
+            self._watch_session_save(writer, future)
+            return
         else:
             save_path = Path(folder) / f"led_2d_overview_{timestamp}"
             try:
@@ -2400,6 +2428,34 @@ class LED2DOverviewResultWindow(PersistentWidget):
                 QMessageBox.critical(self, "Error", f"Failed to save session:\n{e}")
                 return
 
+        self._on_session_saved(save_path)
+
+    def _watch_session_save(self, writer, future):
+        """Poll a background zarr save and report when it has landed."""
+        self.save_session_action.setEnabled(False)
+        timer = QTimer(self)
+
+        def poll():
+            if not future.done():
+                done, total = writer.progress
+                self.save_session_action.setText(f"Saving Session... {done}/{total}")
+                return
+            timer.stop()
+            timer.deleteLater()
+            self.save_session_action.setText("Whole Session")
+            self.save_session_action.setEnabled(True)
+            try:
+                save_path = future.result()
+            except Exception as e:
+                logger.error(f"Error saving zarr session: {e}", exc_info=True)
+                QMessageBox.critical(self, "Error", f"Failed to save session:\n{e}")
+                return
+            self._on_session_saved(save_path)
+
+        timer.timeout.connect(poll)
+        timer.start(100)
+
+    def _on_session_saved(self, save_path):
         logger.info(f"Saved LED 2D Overview session to {save_path}")
         QMessageBox.information(
             self,
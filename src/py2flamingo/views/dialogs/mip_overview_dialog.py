@@ -23,7 +23,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import tifffile
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QCheckBox,
@@ -66,10 +66,10 @@ from py2flamingo.utils.saved_data_version import MIP_SESSION
 from py2flamingo.utils.tile_folder_organizer import infer_local_drive_root
 from py2flamingo.visualization.zarr_2d_session import (
     ZARR_AVAILABLE,
+    Zarr2DSessionWriter,
     detect_session_format,
     load_2d_zarr_session,
     load_2d_zarr_session_lazy,
-    save_2d_zarr_session,
 )
 
 # Import ImagePanel from LED 2D Overview (reuse UI components)
@@ -1288,19 +1288,48 @@ class MIPOverviewDialog(PersistentDialog):
         if ZARR_AVAILABLE:
             save_path = Path(folder) / f"mip_overview_{timestamp}.zarr"
             try:
-                images = {}
-                if self._stitched_image is not None:
-                    images["stitched_overview"] = self._stitched_image
-                save_2d_zarr_session(save_path, metadata, images, "mip_overview")
+                writer = Zarr2DSessionWriter(save_path, "mip_overview")
+                writer.add("stitched_overview", self._stitched_image)
+                future = writer.finish_async(metadata)
             except Exception as e:
                 QMessageBox.critical(
                     self, "Error", f"Failed to save zarr session:\n{e}"
                 )
                 return
+            self._watch_session_save(future)
+            return
         else:
             save_path = Path(folder) / f"mip_overview_{timestamp}"
             self._save_session_tiff(save_path, metadata)
 
+        self._on_session_saved(save_path)
+
+    def _watch_session_save(self, future):
+        """Poll a background zarr save; the dialog stays usable meanwhile."""
+        self._save_btn.setEnabled(False)
+        self._save_btn.setText("Saving...")
+        timer = QTimer(self)
+
+        def poll():
+            if not future.done():
+                return
+            timer.stop()
+            timer.deleteLater()
+            self._save_btn.setText("Save Session")
+            self._save_btn.setEnabled(True)
+            try:
+                save_path = future.result()
+            except Exception as e:
+                QMessageBox.critical(
+                    self, "Error", f"Failed to save zarr session:\n{e}"
+                )
+                return
+            self._on_session_saved(save_path)
+
+        timer.timeout.connect(poll)
+        timer.start(100)
+
+    def _on_session_saved(self, save_path):
         QMessageBox.information(
             self, "Session Saved", f"Session saved to:\n{save_path}"
         )
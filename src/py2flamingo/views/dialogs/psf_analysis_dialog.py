@@ -39,7 +39,13 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from py2flamingo.psf_analysis import PSFAnalysisService, PSFSettings, load_volume
+from py2flamingo.psf_analysis import (
+    PSFAnalysisService,
+    PSFResultCache,
+    PSFSettings,
+    load_volume,
+)
+from py2flamingo.psf_analysis.cache import file_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -52,16 +58,24 @@ class _AnalysisWorker(QThread):
     finished_result = pyqtSignal(object)
     failed = pyqtSignal(str)
 
-    def __init__(self, volume, voxel_size_um, settings, parent=None):
+    def __init__(
+        self, volume, voxel_size_um, settings, cache=None, fingerprint=None, parent=None
+    ):
         super().__init__(parent)
         self._volume = volume
         self._voxel_size_um = voxel_size_um
         self._settings = settings
+        self._cache = cache
+        self._fingerprint = fingerprint
 
     def run(self):
         try:
             result = PSFAnalysisService().analyze(
-                self._volume, voxel_size_um=self._voxel_size_um, settings=self._settings
+                self._volume,
+                voxel_size_um=self._voxel_size_um,
+                settings=self._settings,
+                cache=self._cache,
+                fingerprint=self._fingerprint,
             )
             self.finished_result.emit(result)
         except Exception as exc:  # surfaced to the user via failed()
@@ -79,6 +93,9 @@ class PSFAnalysisDialog(QDialog):
         self.resize(1000, 640)
 
         self._volume: Optional[np.ndarray] = None
+        self._fingerprint: Optional[str] = None
+        # Re-runs that only change crowding / R² reuse detections and fits
+        self._cache = PSFResultCache()
         self._result = None
         self._worker: Optional[_AnalysisWorker] = None
         self._last_dir = str(Path.home())
@@ -208,6 +225,7 @@ class PSFAnalysisDialog(QDialog):
             return
 
         self._volume = volume
+        self._fingerprint = file_fingerprint(path)
         self._path_label.setText(f"{Path(path).name}   shape={volume.shape}")
         self._path_label.setStyleSheet("")
         # Prefill voxel size from file metadata when present (keep config/user
@@ -235,7 +253,14 @@ class PSFAnalysisDialog(QDialog):
         )
         self._run_btn.setEnabled(False)
         self._summary_label.setText("Running…")
-        self._worker = _AnalysisWorker(self._volume, voxel, settings, parent=self)
+        self._worker = _AnalysisWorker(
+            self._volume,
+            voxel,
+            settings,
+            cache=self._cache,
+            fingerprint=self._fingerprint,
+            parent=self,
+        )
         self._worker.finished_result.connect(self._on_analysis_done)
         self._worker.failed.connect(self._on_analysis_failed)
         self._worker.start()
@@ -5,11 +5,12 @@ from the LED 2D Overview result window.
 """
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QButtonGroup,
@@ -42,8 +43,8 @@ from py2flamingo.services.progress_estimator import (
 from py2flamingo.services.tiff_size_validator import (
     TIFF_4GB_LIMIT,
     TiffSizeEstimate,
+    estimate_workflow_text,
     get_recommended_planes,
-    parse_workflow_file,
     validate_workflow_params,
 )
 from py2flamingo.services.window_geometry_manager import PersistentDialog
@@ -70,11 +71,7 @@ from py2flamingo.utils.tile_z_range import (
     estimate_fov_from_tiles,
     summarize_acquired_z,
 )
-from py2flamingo.utils.workflow_parser import dict_to_workflow_text
-from py2flamingo.utils.workflow_serialization import (
-    build_tile_collection_section_dict,
-    build_tile_illumination_source,
-)
+from py2flamingo.utils.workflow_serialization import TileCollectionTemplate
 from py2flamingo.views.workflow_panels import (
     CameraPanel,
     IlluminationPanel,
@@ -151,6 +148,52 @@ def _queue_eta_seconds(
     return cur_secs + future_secs
 
 
+class _ReorganizeWorker(QThread):
+    """Runs the post-collection folder reorganization off the UI thread.
+
+    Cross-device verified copies of a multi-TB run take long enough that doing
+    them in a Qt slot froze the dialog. Failures are contained and reported as
+    a skipped result, never raised.
+    """
+
+    finished_result = pyqtSignal(object)  # ReorganizeResult
+
+    # One pass at a time: a second would try to resume the journal the first
+    # is still writing.
+    _pass_lock = threading.Lock()
+
+    def __init__(
+        self,
+        local_path: Optional[str],
+        base_save_directory: str,
+        tile_folder_mapping: Dict[str, Tuple[str, str]],
+        local_access_enabled: bool,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._local_path = local_path
+        self._base_save_directory = base_save_directory
+        self._tile_folder_mapping = dict(tile_folder_mapping or {})
+        self._local_access_enabled = local_access_enabled
+
+    def run(self) -> None:
+        with self._pass_lock:
+            try:
+                result = reorganize_tile_folders(
+                    self._local_path,
+                    self._base_save_directory,
+                    self._tile_folder_mapping,
+                    self._local_access_enabled,
+                )
+            except Exception as e:
+                logger.error(f"Folder reorganization failed: {e}", exc_info=True)
+                result = ReorganizeResult(
+                    skip_reason=f"reorganization raised an error: {e}"
+                )
+        logger.info(f"Folder reorganization: {result.summary()}")
+        self.finished_result.emit(result)
+
+
 class TileCollectionDialog(PersistentDialog):
     """Dialog for creating workflows for selected tiles.
 
@@ -240,6 +283,9 @@ class TileCollectionDialog(PersistentDialog):
         self._app = app
         self._local_base_folder_hint = local_base_folder
         self._targeting_source = targeting_source
+        # Reorganization passes still running; held so Qt does not destroy a
+        # running thread once the dialog's slots return
+        self._reorganize_workers: List[_ReorganizeWorker] = []
         self._workflow_type = (
             WorkflowType.ZSTACK
         )  # Default to Z-Stack (user preference)
@@ -1935,13 +1981,16 @@ class TileCollectionDialog(PersistentDialog):
             f"enabled={self._local_access_enabled})"
         )
 
-        created_files = []
+        # Render every workflow in memory from one template of the shared
+        # panel state; nothing touches disk until the set has been validated.
+        template = self._tile_workflow_template(illumination_list, save_settings)
+        rendered: List[Tuple[str, str]] = []
         for i, (tile, rotation, z_min, z_max) in enumerate(tiles_to_process):
-            if progress.wasCanceled():
-                break
-
-            progress.setValue(i)
-            progress.setLabelText(f"Creating workflow {i+1}/{total}...")
+            if i % 50 == 0:
+                if progress.wasCanceled():
+                    break
+                progress.setValue(i)
+                progress.setLabelText(f"Creating workflow {i+1}/{total}...")
 
             # Create workflow name
             workflow_name = f"{name_prefix}_R{rotation:.0f}_X{tile.x:.2f}_Y{tile.y:.2f}"
@@ -1955,46 +2004,30 @@ class TileCollectionDialog(PersistentDialog):
             # Track for post-collection reorganization
             self._tile_folder_mapping[tile_save_directory] = (date_folder, tile_folder)
 
-            # Create a copy of save_settings with the tile-specific directory
-            tile_save_settings = save_settings.copy()
-            tile_save_settings["save_directory"] = tile_save_directory
-
             # Create position
             position = Position(x=tile.x, y=tile.y, z=tile.z, r=rotation)
 
             # Smart limited acquisition: pick near arm for peripheral tiles.
             arm_sel = self._arm_selection_for_tile(tile)
-            left_override = arm_sel.left_on if arm_sel else None
-            right_override = arm_sel.right_on if arm_sel else None
-
-            # Build workflow text with per-tile Z range and per-tile save directory
-            workflow_text = self._build_workflow_text(
-                workflow_name,
-                position,
-                illumination_list,
-                tile_save_settings,
-                z_min,
-                z_max,
-                left_on_override=left_override,
-                right_on_override=right_override,
-            )
 
-            # Save to file
-            workflow_file = workflow_folder / f"{workflow_name}.txt"
-            try:
-                with open(workflow_file, "w") as f:
-                    f.write(workflow_text)
-                created_files.append(workflow_file)
-                logger.info(f"Created workflow: {workflow_file.name}")
-            except Exception as e:
-                logger.error(f"Failed to save workflow {workflow_name}: {e}")
+            # Per-tile Z range and per-tile save directory
+            workflow_text = template.render(
+                name=workflow_name,
+                position=position,
+                save_directory=tile_save_directory,
+                z_min=z_min,
+                z_max=z_max,
+                left_on=arm_sel.left_on if arm_sel else None,
+                right_on=arm_sel.right_on if arm_sel else None,
+            )
+            rendered.append((workflow_name, workflow_text))
 
         progress.setValue(total)
 
-        # Report results
-        if created_files:
+        created_files: List[Path] = []
+        if rendered:
             # Validate TIFF size before execution
-            tiff_warning = self._validate_tiff_size(created_files)
+            tiff_warning = self._validate_tiff_size([text for _, text in rendered])
 
             if tiff_warning:
                 # Show warning with detailed information
@@ -2036,10 +2069,14 @@ class TileCollectionDialog(PersistentDialog):
                     logger.info(
                         "User cancelled workflow execution due to TIFF size warning - returning to dialog"
                     )
-                    # Don't close the dialog - let user adjust settings and try again
-                    # The workflow files were created but we return to let user modify parameters
+                    # Don't close the dialog - let user adjust settings and try again.
+                    # Nothing was written yet, so there are no stale files to clean up.
                     return
 
+            created_files = self._write_workflow_files(workflow_folder, rendered)
+
+        # Report results
+        if created_files:
             msg = f"Created {len(created_files)} workflow files in:\n{workflow_folder}\n\n"
             msg += f"Images will be saved to:\n{save_settings['save_drive']}/{base_save_directory}_{date_folder}_X_Y/\n"
             msg += "(Flattened structure for server compatibility)\n\n"
@@ -2077,22 +2114,24 @@ class TileCollectionDialog(PersistentDialog):
 
         self.accept()
 
-    def _validate_tiff_size(self, workflow_files: List[Path]) -> Optional[str]:
-        """Validate TIFF file size for workflow files.
+    def _validate_tiff_size(self, workflow_texts: List[str]) -> Optional[str]:
+        """Validate TIFF file size for a set of rendered workflows.
 
         Checks if the workflow parameters would produce TIFF files
-        that exceed the 4GB standard TIFF limit.
+        that exceed the 4GB standard TIFF limit. Every workflow is estimated
+        from its in-memory text and the largest one is reported, since per-tile
+        Z ranges give each tile its own plane count.
 
         Only applies to standard TIFF format. BigTIFF and Raw formats
         don't have this limitation.
 
         Args:
-            workflow_files: List of workflow file paths to validate
+            workflow_texts: Workflow file contents to validate
 
         Returns:
             Warning message if size exceeds limit, None if OK
         """
-        if not workflow_files:
+        if not workflow_texts:
             return None
 
         # Check save format - only standard TIFF has 4GB limit
@@ -2103,8 +2142,14 @@ class TileCollectionDialog(PersistentDialog):
             logger.debug(f"Skipping TIFF size validation - format is {save_format}")
             return None
 
-        # Parse the first workflow file to get parameters
-        estimate = parse_workflow_file(workflow_files[0])
+        try:
+            estimate = max(
+                (estimate_workflow_text(text) for text in workflow_texts),
+                key=lambda e: e.estimated_bytes,
+            )
+        except Exception as e:
+            logger.error(f"Failed to parse rendered workflows: {e}")
+            estimate = None
         if estimate is None:
             # Couldn't parse - fall back to current panel settings
             camera_settings = self._camera_panel.get_settings()
@@ -2154,69 +2199,59 @@ class TileCollectionDialog(PersistentDialog):
 
         return None
 
-    def _build_workflow_text(
-        self,
-        name: str,
-        position: Position,
-        illumination_list: List,
-        save_settings: dict,
-        z_min: float,
-        z_max: float,
-        left_on_override: Optional[bool] = None,
-        right_on_override: Optional[bool] = None,
-    ) -> str:
-        """Build workflow file text content.
+    def _tile_workflow_template(
+        self, illumination_list: List, save_settings: dict
+    ) -> TileCollectionTemplate:
+        """Capture the panel state every tile workflow of this run shares.
 
         Args:
-            name: Workflow name
-            position: Start position
             illumination_list: List of IlluminationSettings for enabled sources
-            save_settings: Save settings dict
-            z_min: Minimum Z for Z-stack
-            z_max: Maximum Z for Z-stack
-            left_on_override: If not None, overrides the panel's Left path flag
-                for this tile (smart limited acquisition).
-            right_on_override: If not None, overrides the panel's Right path flag.
+            save_settings: Save settings dict (the per-tile save directory is
+                supplied at render time)
 
         Returns:
-            Workflow file content as string
+            A TileCollectionTemplate that renders one tile's workflow text
         """
         # Serialization goes through the SAME path as the Workflow tab
         # (utils.workflow_serialization + dict_to_workflow_text) so the two can
         # never drift. Per-tile specifics (Sample name, Z range, and the smart-
-        # limited-acquisition Left/Right path overrides) are passed as inputs.
-        camera_settings = self._camera_panel.get_settings()
+        # limited-acquisition Left/Right path overrides) are render inputs.
         is_zstack = self._workflow_type == WorkflowType.ZSTACK
         stack = self._zstack_panel.get_settings() if is_zstack else None
-        z_step_um = stack.z_step_um if stack else 1.0
-        z_velocity_mm_s = stack.z_velocity_mm_s if stack else 0.1
-
-        # Illumination path: panel global, with a per-tile override winning.
         illum_ui_state = self._illumination_panel.get_ui_state()
-        left_on = illum_ui_state.get("left_path", True)
-        right_on = illum_ui_state.get("right_path", False)
-        if left_on_override is not None:
-            left_on = left_on_override
-        if right_on_override is not None:
-            right_on = right_on_override
-
-        illumination_source = build_tile_illumination_source(
-            illumination_list, left_on=left_on, right_on=right_on
-        )
-        section_dict = build_tile_collection_section_dict(
-            name=name,
-            position=position,
-            camera=camera_settings,
-            illumination_source=illumination_source,
+        return TileCollectionTemplate(
+            camera=self._camera_panel.get_settings(),
+            illumination_list=illumination_list,
+            left_on=illum_ui_state.get("left_path", True),
+            right_on=illum_ui_state.get("right_path", False),
             multi_laser=illum_ui_state.get("multi_laser_mode", False),
             save_settings=save_settings,
-            z_min=z_min,
-            z_max=z_max,
             is_zstack=is_zstack,
-            z_step_um=z_step_um,
-            z_velocity_mm_s=z_velocity_mm_s,
+            z_step_um=stack.z_step_um if stack else 1.0,
+            z_velocity_mm_s=stack.z_velocity_mm_s if stack else 0.1,
         )
-        return dict_to_workflow_text(section_dict)
+
+    @staticmethod
+    def _write_workflow_files(
+        workflow_folder: Path, rendered: List[Tuple[str, str]]
+    ) -> List[Path]:
+        """Write rendered workflows to disk in one pass.
+
+        Returns:
+            Paths of the files that were written
+        """
+        created_files = []
+        for workflow_name, workflow_text in rendered:
+            workflow_file = workflow_folder / f"{workflow_name}.txt"
+            try:
+                workflow_file.write_text(workflow_text)
+                created_files.append(workflow_file)
+            except Exception as e:
+                logger.error(f"Failed to save workflow {workflow_name}: {e}")
+        logger.info(
+            f"Created {len(created_files)} workflow file(s) in {workflow_folder}"
+        )
+        return created_files
 
     def _get_sample_view_instance(self):
         """Get Sample View instance from application.
@@ -2263,30 +2298,37 @@ class TileCollectionDialog(PersistentDialog):
                 "Sample View does not have prepare_for_tile_workflows method"
             )
 
-    def _reorganize_after_collection(self) -> ReorganizeResult:
+    def _reorganize_after_collection(
+        self, on_done: Callable[[ReorganizeResult], None]
+    ) -> _ReorganizeWorker:
         """Move the server's flat tile folders into the nested layout.
 
         Every execution path calls this once the run is over (completed,
         cancelled, or fallback-timed), because the flat layout the server is
         forced to produce is not what MIP Overview or the stitcher read.
 
-        Failures are contained: this is invoked from Qt slots, where an
-        exception would otherwise unwind into the signal dispatcher and be
-        lost, leaving the data flat with nothing in the log to say why.
+        The pass runs on a :class:`_ReorganizeWorker`; ``on_done`` receives
+        its :class:`ReorganizeResult` on the GUI thread. Failures are
+        contained in the worker, so ``on_done`` always runs.
         """
-        try:
-            result = reorganize_tile_folders(
-                getattr(self, "_local_path", None),
-                getattr(self, "_base_save_directory", ""),
-                getattr(self, "_tile_folder_mapping", {}),
-                getattr(self, "_local_access_enabled", False),
-            )
-        except Exception as e:
-            logger.error(f"Folder reorganization failed: {e}", exc_info=True)
-            return ReorganizeResult(skip_reason=f"reorganization raised an error: {e}")
+        worker = _ReorganizeWorker(
+            getattr(self, "_local_path", None),
+            getattr(self, "_base_save_directory", ""),
+            getattr(self, "_tile_folder_mapping", {}),
+            getattr(self, "_local_access_enabled", False),
+        )
+        self._reorganize_workers.append(worker)
+        worker.finished_result.connect(on_done)
+        worker.finished.connect(lambda w=worker: self._forget_reorganize_worker(w))
+        worker.start()
+        return worker
 
-        logger.info(f"Folder reorganization: {result.summary()}")
-        return result
+    def _forget_reorganize_worker(self, worker: _ReorganizeWorker) -> None:
+        try:
+            self._reorganize_workers.remove(worker)
+        except ValueError:
+            pass
+        worker.deleteLater()
 
     def _write_acquisition_manifest(self, reorg) -> None:
         """Record what was collected, in the folder the data landed in.
@@ -2707,18 +2749,16 @@ class TileCollectionDialog(PersistentDialog):
             camera_controller = getattr(wc, "_camera_controller", None)
 
             def on_workflow_start(file_path: Path, metadata: Dict):
-                """Signal a pending tile transition from the background thread.
+                """Signal a tile transition from the background thread.
 
-                Sets a flag that the GUI thread (_pull_and_display_frame) checks
-                to atomically flush stale frames and adopt the new tile position.
-                This avoids the race condition where resetting z_plane_counter
-                from the background thread causes stale frames to be mis-routed.
+                With the Sample View's tile ingest attached, the boundary is
+                queued in order with the incoming frames. Otherwise a flag is
+                set that the GUI thread (_pull_and_display_frame) checks to
+                atomically flush stale frames and adopt the new tile position,
+                so z_plane_counter is never reset from this thread.
                 """
                 if camera_controller and metadata:
-                    camera_controller._pending_tile_position = metadata
-                    camera_controller._tile_transition_pending = True
-                    # Do NOT touch _z_plane_counter or _current_tile_position here;
-                    # the GUI thread handles both atomically after flushing stale frames.
+                    camera_controller.begin_tile(metadata)
 
             queue_service.set_workflow_start_callback(on_workflow_start)
 
@@ -2958,16 +2998,43 @@ class TileCollectionDialog(PersistentDialog):
                 if sample_view and hasattr(sample_view, "load_completed_tile"):
                     sample_view.load_completed_tile(path)
 
+        def on_completed_reorganized(reorg):
+            self._write_acquisition_manifest(reorg)
+
+            # Report the reorganization outcome. Staying silent when it was
+            # skipped is what made this hard to notice: the run "succeeded"
+            # while the data was left where no downstream tool looks for it.
+            msg = f"Successfully executed {len(workflow_files)} workflows.\n\n"
+            if reorg.moved:
+                msg += (
+                    f"{reorg.moved} folder(s) reorganized into "
+                    f"{self._base_save_directory}/<date>/X_Y for MIP Overview "
+                    "and stitching."
+                )
+                if reorg.unmatched or reorg.failed:
+                    msg += (
+                        f"\n\n{len(reorg.unmatched)} folder(s) were not found on "
+                        f"disk and {len(reorg.failed)} could not be moved."
+                    )
+            else:
+                msg += (
+                    f"Data was left in the server's flat layout "
+                    f"({self._base_save_directory}_<date>_X_Y):\n{reorg.summary()}"
+                )
+
+            # Use None as parent since tile collection dialog is closed
+            QMessageBox.information(None, "Execution Complete", msg)
+
         def on_queue_completed():
             self._queue_completed = True
 
             # Reorganize FIRST. queue_completed only fires after every
             # SYSTEM_STATE_IDLE callback, so all files are on disk by now, and
-            # doing it before the progress/notification/Sample-View bookkeeping
-            # means a hiccup in any of that cosmetic work can no longer leave
-            # the acquisition stranded in the server's flat layout.
-            reorg = self._reorganize_after_collection()
-            self._write_acquisition_manifest(reorg)
+            # starting it before the progress/notification/Sample-View
+            # bookkeeping means a hiccup in any of that cosmetic work can no
+            # longer leave the acquisition stranded in the server's flat
+            # layout. It runs on a worker; on_completed_reorganized reports it.
+            self._reorganize_after_collection(on_completed_reorganized)
 
             progress._overall_bar.setValue(100)
             progress._overall_label.setText(
@@ -3028,30 +3095,17 @@ class TileCollectionDialog(PersistentDialog):
                 if sample_view and hasattr(sample_view, "finish_tile_workflows"):
                     sample_view.finish_tile_workflows()
 
-            # Report the reorganization outcome from the top of this handler.
-            # Staying silent when it was skipped is what made this hard to
-            # notice: the run "succeeded" while the data was left where no
-            # downstream tool looks for it.
-            msg = f"Successfully executed {len(workflow_files)} workflows.\n\n"
-            if reorg.moved:
-                msg += (
-                    f"{reorg.moved} folder(s) reorganized into "
-                    f"{self._base_save_directory}/<date>/X_Y for MIP Overview "
-                    "and stitching."
-                )
-                if reorg.unmatched or reorg.failed:
-                    msg += (
-                        f"\n\n{len(reorg.unmatched)} folder(s) were not found on "
-                        f"disk and {len(reorg.failed)} could not be moved."
-                    )
-            else:
-                msg += (
-                    f"Data was left in the server's flat layout "
-                    f"({self._base_save_directory}_<date>_X_Y):\n{reorg.summary()}"
-                )
+        def on_cancelled_reorganized(reorg):
+            self._write_acquisition_manifest(reorg)
 
             # Use None as parent since tile collection dialog is closed
-            QMessageBox.information(None, "Execution Complete", msg)
+            cancel_msg = "Workflow queue was cancelled."
+            if reorg.moved:
+                cancel_msg += (
+                    f"\n\n{reorg.moved} completed folder(s) were still "
+                    "reorganized into the nested layout."
+                )
+            QMessageBox.warning(None, "Execution Cancelled", cancel_msg)
 
         def on_queue_cancelled():
             self._queue_completed = True
@@ -3059,8 +3113,7 @@ class TileCollectionDialog(PersistentDialog):
             # Tiles that finished before the cancel are real data -- organize
             # them too. The glob simply finds nothing for the tiles that never
             # ran, so a partial run lands in the same layout as a full one.
-            reorg = self._reorganize_after_collection()
-            self._write_acquisition_manifest(reorg)
+            self._reorganize_after_collection(on_cancelled_reorganized)
 
             update_sample_view("Not Running", 0)
 
@@ -3080,14 +3133,6 @@ class TileCollectionDialog(PersistentDialog):
                     sample_view.finish_tile_workflows()
 
             progress.close()  # Close the progress dialog
-            # Use None as parent since tile collection dialog is closed
-            cancel_msg = "Workflow queue was cancelled."
-            if reorg.moved:
-                cancel_msg += (
-                    f"\n\n{reorg.moved} completed folder(s) were still "
-                    "reorganized into the nested layout."
-                )
-            QMessageBox.warning(None, "Execution Cancelled", cancel_msg)
 
         def on_error(message):
             self._queue_error = message
@@ -3126,8 +3171,10 @@ class TileCollectionDialog(PersistentDialog):
                     camera_controller._display_timer.start(
                         camera_controller._display_timer_interval_ms
                     )
-                # Enlarge frame buffer so GUI-thread stalls don't cause frame loss
-                camera_controller.camera_service.set_tile_mode_buffer(True)
+                # Enlarge frame buffer so GUI-thread stalls don't cause frame
+                # loss (not needed when the tile ingest takes every frame)
+                if getattr(camera_controller, "_tile_ingest", None) is None:
+                    camera_controller.camera_service.set_tile_mode_buffer(True)
                 # Start data receiver (listen-only, no LIVE_VIEW_START)
                 try:
                     camera_controller.camera_service.ensure_data_receiver_running()
@@ -3274,24 +3321,26 @@ class TileCollectionDialog(PersistentDialog):
 
         progress.setValue(len(workflow_files))
 
+        def on_reorganized(reorg):
+            self._write_acquisition_manifest(reorg)
+
+            fallback_msg = (
+                f"Executed {len(workflow_files)} workflows.\n\n"
+                "Note: Used fallback timing. For better reliability, "
+                "ensure WorkflowQueueService is configured."
+            )
+            if reorg.moved:
+                fallback_msg += (
+                    f"\n\n{reorg.moved} folder(s) reorganized into the nested layout."
+                )
+            elif reorg.skip_reason:
+                fallback_msg += f"\n\nFolders left in flat layout: {reorg.skip_reason}"
+            QMessageBox.information(self, "Execution Complete", fallback_msg)
+
         # The queue-service path reorganizes on queue_completed; this path had
         # no equivalent, so a run that fell back to timing-based execution
         # silently left every folder flat.
-        reorg = self._reorganize_after_collection()
-        self._write_acquisition_manifest(reorg)
-
-        fallback_msg = (
-            f"Executed {len(workflow_files)} workflows.\n\n"
-            "Note: Used fallback timing. For better reliability, "
-            "ensure WorkflowQueueService is configured."
-        )
-        if reorg.moved:
-            fallback_msg += (
-                f"\n\n{reorg.moved} folder(s) reorganized into the nested layout."
-            )
-        elif reorg.skip_reason:
-            fallback_msg += f"\n\nFolders left in flat layout: {reorg.skip_reason}"
-        QMessageBox.information(self, "Execution Complete", fallback_msg)
+        self._reorganize_after_collection(on_reorganized)
 
     def _get_config_service(self):
         """Get ConfigurationService from application."""
@@ -51,6 +51,8 @@ from PyQt5.QtWidgets import (
 
 from py2flamingo.resources import get_app_icon
 from py2flamingo.services.window_geometry_manager import PersistentDialog
+from py2flamingo.utils.intensity_histogram import IntensityHistogram
+from py2flamingo.visualization.tile_frame_ingest import TileFrameIngest
 from py2flamingo.visualization.tile_processing_worker import (
     TileFrameBuffer,
     TileProcessingWorker,
@@ -63,6 +65,7 @@ from superqt import QRangeSlider
 
 # Import camera state for live view control
 from py2flamingo.controllers.camera_controller import CameraState
+from py2flamingo.controllers.display_rate_governor import DisplayRateGovernor
 from py2flamingo.services.position_preset_service import PositionPresetService
 from py2flamingo.views.chamber_visualization_manager import ChamberVisualizationManager
 from py2flamingo.views.colors import ERROR_COLOR, SUCCESS_COLOR, WARNING_BG
@@ -430,6 +433,9 @@ class SampleView(QWidget):
         # Background visualization update machinery
         self._viz_update_in_progress = False  # Guard against concurrent bg updates
         self._viz_results_ready.connect(self._apply_visualization_results)
+        # ch_id -> (array last assigned to the layer, transform key it shows);
+        # lets unchanged regions skip the copy and full texture reassignment.
+        self._pushed_layer_data: Dict[int, tuple] = {}
 
         # Throttled timer for stage position → 3D visualization updates (20 FPS max)
         self._stage_update_timer = QTimer(self)
@@ -1709,6 +1715,9 @@ class SampleView(QWidget):
         if self.camera_controller:
             self.camera_controller.new_image.connect(self._on_frame_received)
             self.camera_controller.state_changed.connect(self._on_camera_state_changed)
+            governor = self._display_governor()
+            if governor is not None:
+                governor.register("sample_view", self.live_image_label)
 
             # Connect tile Z-stack frame signal for Sample View integration
             if hasattr(self.camera_controller, "tile_zstack_frame"):
@@ -1897,9 +1906,23 @@ class SampleView(QWidget):
 
     @pyqtSlot(object, object)
     def _on_frame_received(self, image: np.ndarray, header) -> None:
-        """Handle received camera frame."""
+        """Handle received camera frame.
+
+        Rendering is skipped while the live panel is hidden or minimized; the
+        frame is still kept so the display is current once it is shown.
+        """
         self._current_image = image
-        self._update_live_display()
+        governor = self._display_governor()
+        if governor is None:
+            self._update_live_display()
+        elif governor.should_render("sample_view", image):
+            with governor.render("sample_view"):
+                self._update_live_display()
+
+    def _display_governor(self) -> Optional[DisplayRateGovernor]:
+        """The camera controller's display rate governor, if it has one."""
+        governor = getattr(self.camera_controller, "display_governor", None)
+        return governor if isinstance(governor, DisplayRateGovernor) else None
 
     def _update_live_display(self) -> None:
         """Update the live image display.
@@ -2016,19 +2039,20 @@ class SampleView(QWidget):
         if time_since_last < self._auto_contrast_interval:
             return self._auto_contrast_max
 
-        # Calculate pixel statistics
+        # Calculate pixel statistics: one pass to count, then lookups
+        histogram = IntensityHistogram.from_array(image)
         total_pixels = image.size
         current_max = self._auto_contrast_max
 
         # Quick check: if image is very dark compared to current_max, jump directly
         # This handles the case where we start at 65535 but sample is dim
-        image_actual_max = int(np.max(image))
+        image_actual_max = histogram.max()
         if (
             image_actual_max < current_max * 0.1
         ):  # Actual max is less than 10% of display max
             # Image is very dark - set max based on actual data
             # Use 99th percentile for robustness against hot pixels
-            p99 = np.percentile(image, 99)
+            p99 = histogram.percentile(99)
             new_max = int(p99 / 0.85)  # Set so 99th percentile is at 85% brightness
             new_max = max(100, min(65535, new_max))  # Clamp to reasonable range
 
@@ -2043,18 +2067,14 @@ class SampleView(QWidget):
 
         # Count saturated pixels (>= 95% of current max)
         saturation_level = current_max * self._saturation_percentile
-        saturated_count = np.sum(image >= saturation_level)
+        saturated_count = histogram.count_at_least(saturation_level)
         saturated_ratio = saturated_count / total_pixels
 
         if saturated_ratio > self._saturation_threshold:
             # Too many saturated pixels - raise max to 95% of top 5% mean
             # This allows large jumps when transitioning to heavily stained areas
             top_5_percent_count = max(1, int(total_pixels * 0.05))
-            # Use partition for efficiency (faster than full sort)
-            top_values = np.partition(image.ravel(), -top_5_percent_count)[
-                -top_5_percent_count:
-            ]
-            top_5_mean = np.mean(top_values)
+            top_5_mean = histogram.mean_of_top(top_5_percent_count)
             new_max = int(top_5_mean / 0.95)  # Set so top 5% mean is at 95%
             new_max = min(65535, max(1000, new_max))  # Clamp to reasonable range
 
@@ -2068,7 +2088,7 @@ class SampleView(QWidget):
         else:
             # Check if we should lower the max (image is too dark)
             brightness_level = current_max * self._brightness_reference
-            bright_count = np.sum(image > brightness_level)
+            bright_count = histogram.count_above(brightness_level)
             bright_ratio = bright_count / total_pixels
 
             if bright_ratio < self._low_brightness_threshold:
@@ -3016,32 +3036,17 @@ class SampleView(QWidget):
             return
 
         for ch_id, layer in self.channel_layers.items():
-            volume = np.asarray(layer.data)
-            if volume is None or volume.size == 0:
-                continue
-
-            # Subsample large volumes to avoid locking up on stitched data
-            # (~6 GB per channel). Sample ~1M voxels max.
-            max_sample = 1_000_000
-            if volume.size > max_sample:
-                step = max(1, int((volume.size / max_sample) ** (1.0 / volume.ndim)))
-                sample = volume[
-                    tuple(slice(None, None, step) for _ in range(volume.ndim))
-                ]
-            else:
-                sample = volume
-
+            histogram = self._channel_histogram(ch_id, layer)
             # Calculate percentile-based contrast (5th to 99.9th percentile)
-            non_zero = sample[sample > 0]
-            if len(non_zero) == 0:
+            if histogram is None or histogram.max() == 0:
                 continue
 
             # Percentiles come from layer data, which is in DISPLAY units;
             # convert back to raw counts so the sliders below (and everything
             # else in this class) keep speaking one unit.
             scale = self._display_scale(ch_id)
-            min_val = int(np.percentile(non_zero, 5) * scale)
-            max_val = int(np.percentile(non_zero, 99.9) * scale)
+            min_val = int(histogram.percentile(5, ignore_zero=True) * scale)
+            max_val = int(histogram.percentile(99.9, ignore_zero=True) * scale)
 
             # Ensure min < max
             if max_val <= min_val:
@@ -3076,6 +3081,28 @@ class SampleView(QWidget):
 
             self.logger.info(f"Auto-contrast channel {ch_id}: [{min_val}, {max_val}]")
 
+    def _channel_histogram(self, ch_id: int, layer) -> Optional[IntensityHistogram]:
+        """Intensity histogram of a channel's volume, in display units.
+
+        Channels held in voxel storage use its histogram, which is kept
+        current as data is merged or loaded; anything else is counted from a
+        subsample of the layer data.
+        """
+        if self.voxel_storage and self.voxel_storage.has_data(ch_id):
+            return self.voxel_storage.intensity_histogram(ch_id)
+
+        volume = np.asarray(layer.data)
+        if volume is None or volume.size == 0:
+            return None
+
+        # Subsample large volumes to avoid locking up on stitched data
+        # (~6 GB per channel). Sample ~1M voxels max.
+        max_sample = 1_000_000
+        if volume.size > max_sample:
+            step = max(1, int((volume.size / max_sample) ** (1.0 / volume.ndim)))
+            volume = volume[tuple(slice(None, None, step) for _ in range(volume.ndim))]
+        return IntensityHistogram.from_array(volume)
+
     def _enable_channel_controls(self, ch_id: int, enabled: bool) -> None:
         """Enable or disable the UI controls for a single channel."""
         checkbox = self.channel_checkboxes.get(ch_id)
@@ -3568,7 +3595,13 @@ class SampleView(QWidget):
                         progress.show()
                         QApplication.processEvents()
 
-            result = load_stitched_volume(output_dir, store_override=store_override)
+            # The viewer resamples to its display grid anyway, so only the
+            # pyramid level that meets that resolution is read from disk.
+            result = load_stitched_volume(
+                output_dir,
+                voxel_storage=self.voxel_storage,
+                store_override=store_override,
+            )
             channels = result["channels"]
 
             if not channels:
@@ -3588,7 +3621,7 @@ class SampleView(QWidget):
             )
             QApplication.processEvents()
 
-            # Remove any legacy stitched napari layers from earlier versions
+            # Remove the stitched pyramid layers of a previous load
             self._remove_stitched_layers()
 
             # Load stitched volumes into voxel_storage so they flow through the
@@ -3742,7 +3775,8 @@ class SampleView(QWidget):
 
         for ch_info in channels:
             ch_id = _stitched_channel_slot(ch_info["ch_id"])
-            volume = np.asarray(ch_info["volume"])
+            # May be lazy (OME-Zarr): the resampler reads only what it samples
+            volume = ch_info["volume"]
             voxel_um = np.asarray(ch_info["voxel_size_um"], dtype=float)
 
             if volume.size == 0:
@@ -3852,6 +3886,15 @@ class SampleView(QWidget):
                 f"placed at display voxel corner {dst_start.tolist()}"
             )
 
+            if ch_info.get("multiscale"):
+                self._add_stitched_pyramid_layer(
+                    ch_id,
+                    ch_info["multiscale"],
+                    np.asarray(volume.shape) * voxel_um,
+                    corner,
+                    (sc_x, sc_y, sc_z),
+                )
+
         # Record overall data bounds
         if ch_ids_loaded and np.all(np.isfinite(world_bbox_min)):
             self.voxel_storage.data_bounds["min"] = world_bbox_min
@@ -3888,6 +3931,61 @@ class SampleView(QWidget):
         )
         return ch_ids_loaded
 
+    def _add_stitched_pyramid_layer(
+        self, ch_id: int, levels: list, extent_um, corner, sc_xyz
+    ) -> None:
+        """Add a stitched channel's full pyramid as a hidden multiscale layer.
+
+        The voxel-storage layer shows the display-resolution copy; this one
+        lets napari fetch finer levels chunk by chunk for the visible region
+        when the user turns it on and zooms in. It overlays the stitched data
+        at its load position and does not follow later stage moves.
+
+        Args:
+            ch_id: Viewer channel slot the data was loaded into
+            levels: Lazy (Z, Y, X) pyramid levels, finest first
+            extent_um: Physical (Z, Y, X) extent of the volume
+            corner: Display-voxel index of the placed volume's first voxel
+            sc_xyz: Sample region centre (X, Y, Z) µm used for the placement
+        """
+        if not self.viewer:
+            return
+
+        orientation = self.voxel_storage.config.axis_orientation()
+        display_voxel_um = np.array(self.voxel_storage.config.display_voxel_size)
+        oriented = [
+            orient_stitched_volume(
+                level, level.shape, extent_um / level.shape, sc_xyz, orientation
+            )[0]
+            for level in levels
+        ]
+        # Finest voxel size in display order, in display-voxel units
+        stage_axis = {"z": 0, "y": 1, "x": 2}
+        fine_voxel_um = np.asarray(extent_um, dtype=float) / levels[0].shape
+        scale = np.array(
+            [fine_voxel_um[stage_axis[orientation.stage_axis_for(i)]] for i in range(3)]
+        ) / np.asarray(display_voxel_um, dtype=float)
+        # Pixel centres: the display voxel at ``corner`` spans corner +- 0.5
+        translate = np.asarray(corner, dtype=float) - 0.5 + scale / 2
+
+        channel_layer = self.channel_layers.get(ch_id)
+        name = channel_layer.name if channel_layer is not None else f"Channel {ch_id}"
+        # Same napari 0.7 async-slice workaround as setup_data_layers
+        ndisplay = self.viewer.dims.ndisplay
+        self.viewer.dims.ndisplay = 2
+        self.viewer.add_image(
+            oriented,
+            multiscale=True,
+            name=f"{name} (stitched, full resolution)",
+            scale=scale,
+            translate=translate,
+            colormap=channel_layer.colormap if channel_layer is not None else "gray",
+            blending="additive",
+            visible=False,
+            metadata={"stitched": True, "ch_id": ch_id},
+        )
+        self.viewer.dims.ndisplay = ndisplay
+
     def _remove_stitched_layers(self) -> None:
         """Remove any previously loaded stitched layers from the viewer."""
         if not self.viewer:
@@ -4771,6 +4869,7 @@ class SampleView(QWidget):
 
                 try:
                     # Use transformed volume if stage has moved from origin
+                    transform_key = None
                     if self.last_stage_position and any(
                         v != 0 for v in self.last_stage_position.values()
                     ):
@@ -4784,17 +4883,19 @@ class SampleView(QWidget):
                         volume = self.voxel_storage.get_display_volume_transformed(
                             ch_id, self.last_stage_position, holder_pos
                         )
+                        transform_key = self._transform_key(
+                            self.last_stage_position, holder_pos
+                        )
                     else:
                         volume = self.voxel_storage.get_display_volume(ch_id)
+                    region = self.voxel_storage.take_display_changes(ch_id)
 
                     self.logger.info(
                         f"Channel {ch_id}: volume shape={volume.shape}, "
-                        f"non-zero={np.count_nonzero(volume)}, "
-                        f"max={volume.max()}"
+                        f"changed region={region}"
                     )
 
-                    # Force new array reference so napari detects the change
-                    self.channel_layers[ch_id].data = np.array(volume)
+                    self._push_channel_volume(ch_id, volume, region, transform_key)
 
                     # Auto-contrast if this is first data for channel
                     layer = self.channel_layers[ch_id]
@@ -4836,6 +4937,54 @@ class SampleView(QWidget):
             # Clear the flag even on error to avoid permanently blocking stage transforms
             self._viz_initial_pending = False
 
+    @staticmethod
+    def _transform_key(stage_pos: dict, holder_pos: np.ndarray) -> tuple:
+        """Identity of a stage transform, for comparing pushed layer data."""
+        return tuple(sorted(stage_pos.items())) + tuple(np.asarray(holder_pos).tolist())
+
+    def _push_channel_volume(self, ch_id, volume, region, transform_key=None) -> bool:
+        """Hand a display volume to its napari layer, copying as little as possible.
+
+        ``region`` is what the storage reported as changed since the previous
+        push (``take_display_changes``). If the layer still holds the array we
+        last gave it, shows the same transform and matches in shape and dtype,
+        an unchanged volume is skipped and an untransformed one only has the
+        changed region written in place. Anything else — a moved stage, a
+        layer reassigned elsewhere, a resized or re-typed cache — gets a full
+        copy as before.
+
+        Returns:
+            True if the layer was updated.
+        """
+        layer = self.channel_layers[ch_id]
+        buffer = layer.data
+        pushed = self._pushed_layer_data.get(ch_id)
+        reusable = (
+            pushed is not None
+            and pushed[0] is buffer
+            and pushed[1] == transform_key
+            and buffer.shape == volume.shape
+            and buffer.dtype == volume.dtype
+        )
+        if reusable and region is None:
+            return False
+        if reusable and transform_key is None:
+            try:
+                buffer[region] = volume[region]
+                layer.refresh(extent=False)
+                return True
+            except Exception:
+                self.logger.debug(
+                    f"Partial update of channel {ch_id} failed; reassigning",
+                    exc_info=True,
+                )
+
+        # New array reference so napari detects the change
+        buffer = np.array(volume)
+        layer.data = buffer
+        self._pushed_layer_data[ch_id] = (buffer, transform_key)
+        return True
+
     def _update_visualization_async(self):
         """Run visualization transforms in a background thread during tile workflows.
 
@@ -4883,13 +5032,16 @@ class SampleView(QWidget):
             try:
                 results = {}
                 for ch_id in channels_with_data:
+                    transform_key = None
                     if stage_pos and any(v != 0 for v in stage_pos.values()):
                         vol = self.voxel_storage.get_display_volume_transformed(
                             ch_id, stage_pos, holder_pos
                         )
+                        transform_key = self._transform_key(stage_pos, holder_pos)
                     else:
                         vol = self.voxel_storage.get_display_volume(ch_id)
-                    results[ch_id] = vol
+                    region = self.voxel_storage.take_display_changes(ch_id)
+                    results[ch_id] = (vol, region, transform_key)
                 self._viz_results_ready.emit(results)
             except Exception as e:
                 self.logger.error(f"Background viz update error: {e}", exc_info=True)
@@ -4901,14 +5053,13 @@ class SampleView(QWidget):
     def _apply_visualization_results(self, results: dict):
         """Apply pre-computed visualization volumes to napari layers (GUI thread)."""
         try:
-            for ch_id, volume in results.items():
+            for ch_id, (volume, region, transform_key) in results.items():
                 if ch_id in self.channel_layers:
                     self.logger.info(
                         f"Channel {ch_id}: volume shape={volume.shape}, "
-                        f"non-zero={np.count_nonzero(volume)}, max={volume.max()}"
+                        f"changed region={region}"
                     )
-                    # Force new array reference so napari detects the change
-                    self.channel_layers[ch_id].data = np.array(volume)
+                    self._push_channel_volume(ch_id, volume, region, transform_key)
 
                     layer = self.channel_layers[ch_id]
                     if not getattr(layer, "_auto_contrast_applied", False):
@@ -5853,6 +6004,10 @@ class SampleView(QWidget):
         # Start background tile processing worker
         self._start_tile_worker()
 
+        # Live frames go receiver -> ingest thread -> worker, bypassing the GUI
+        if not local_path:
+            self._start_tile_ingest()
+
         self.logger.info(
             f"Sample View: Prepared to receive {len(tile_info)} tile workflows"
         )
@@ -6008,6 +6163,9 @@ class SampleView(QWidget):
         # freezing the UI.
         self._viz_initial_pending = True
 
+        # Submit the last live tile before waiting for the worker
+        self._stop_tile_ingest()
+
         # Wait for background worker to finish processing all tiles
         if hasattr(self, "_tile_worker") and self._tile_worker:
             self.logger.info("Waiting for tile processing worker to finish...")
@@ -6078,7 +6236,8 @@ class SampleView(QWidget):
     ):
         """Handle incoming Z-stack frame from tile workflow.
 
-        Buffers downsampled frames on the GUI thread (~0.5ms per frame).
+        Fallback for controllers without a TileFrameIngest attached (see
+        _start_tile_ingest): buffers downsampled frames on the GUI thread.
         When a new tile starts, the previous tile's complete buffer is
         submitted to the background TileProcessingWorker for processing.
 
@@ -6128,20 +6287,7 @@ class SampleView(QWidget):
                 # lost.  Visualization updates are deferred to
                 # finish_tile_workflows() after all tiles are collected.
 
-            # CRITICAL: Force position update at start of each new tile
-            if self.movement_controller:
-                try:
-                    pos = self.movement_controller.get_position()
-                    if pos:
-                        self.logger.info(
-                            f"New tile starting - forcing position update: "
-                            f"X={pos.x:.3f}, Y={pos.y:.3f}, Z={pos.z:.3f}"
-                        )
-                        self._on_position_changed(pos.x, pos.y, pos.z, pos.r)
-                except Exception as e:
-                    self.logger.warning(
-                        f"Could not force position update for new tile: {e}"
-                    )
+            self._on_tile_started(position)
 
             # Set reference on first tile
             if not self._tile_reference_set and self.voxel_storage:
@@ -6164,15 +6310,6 @@ class SampleView(QWidget):
                     f"X={ref_x:.3f}, Y={ref_y:.3f}, Z={ref_z:.3f}, R={ref_r:.1f}°"
                 )
 
-            # Update last_stage_position for display transform (once per tile)
-            z_mid_tile = (z_min + z_max) / 2
-            self.last_stage_position = {
-                "x": position["x"],
-                "y": position["y"],
-                "z": z_mid_tile,
-                "r": position.get("r", self.last_stage_position.get("r", 0)),
-            }
-
             # Create new buffer for this tile
             num_planes = position.get("num_planes")
             self._current_tile_buffer = TileFrameBuffer(
@@ -6215,15 +6352,61 @@ class SampleView(QWidget):
 
         # Update progress bar (approximate, every 5th frame)
         if frame_count % 5 == 0:
-            estimated_total = self._estimate_frames_per_tile(position, num_channels)
-            total_tiles = max(1, len(self._expected_tiles))
-            tile_idx = len(self._tile_buffers_submitted) + 1
-            tile_pct = min(1.0, frame_count / max(1, estimated_total))
-            overall_pct = min(100, int(((tile_idx - 1 + tile_pct) / total_tiles) * 100))
-            status = f"Tile {tile_idx}/{total_tiles}: {frame_count} frames"
-            # ETA is driven by the tile-collection dialog's per-image
-            # estimator; pass None so we don't clobber its label.
-            self.update_workflow_progress(status, overall_pct, None)
+            self._on_tile_ingest_progress(
+                {
+                    "tile_index": len(self._tile_buffers_submitted) + 1,
+                    "frame_count": frame_count,
+                    "position": position,
+                }
+            )
+        else:
+            # Kick channel availability timer (fires after processing catches up)
+            self._channel_availability_timer.start()
+
+    def _on_tile_started(self, position: dict):
+        """GUI-side bookkeeping when a tile's first frame arrives."""
+        # CRITICAL: Force position update at start of each new tile
+        if self.movement_controller:
+            try:
+                pos = self.movement_controller.get_position()
+                if pos:
+                    self.logger.info(
+                        f"New tile starting - forcing position update: "
+                        f"X={pos.x:.3f}, Y={pos.y:.3f}, Z={pos.z:.3f}"
+                    )
+                    self._on_position_changed(pos.x, pos.y, pos.z, pos.r)
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not force position update for new tile: {e}"
+                )
+
+        ingest = getattr(self, "_tile_ingest", None)
+        if ingest is not None and ingest.reference_position is not None:
+            self._tile_reference_position = ingest.reference_position
+            self._tile_reference_set = True
+
+        # Update last_stage_position for display transform (once per tile)
+        self.last_stage_position = {
+            "x": position["x"],
+            "y": position["y"],
+            "z": (position["z_min"] + position["z_max"]) / 2,
+            "r": position.get("r", self.last_stage_position.get("r", 0)),
+        }
+
+    def _on_tile_ingest_progress(self, info: dict):
+        """Update the workflow progress bar from a (throttled) frame count."""
+        position = info["position"]
+        frame_count = info["frame_count"]
+        tile_idx = info["tile_index"]
+        num_channels = len(position.get("channels", [0]))
+        estimated_total = self._estimate_frames_per_tile(position, num_channels)
+        total_tiles = max(1, len(self._expected_tiles))
+        tile_pct = min(1.0, frame_count / max(1, estimated_total))
+        overall_pct = min(100, int(((tile_idx - 1 + tile_pct) / total_tiles) * 100))
+        status = f"Tile {tile_idx}/{total_tiles}: {frame_count} frames"
+        # ETA is driven by the tile-collection dialog's per-image
+        # estimator; pass None so we don't clobber its label.
+        self.update_workflow_progress(status, overall_pct, None)
 
         # Kick channel availability timer (will fire after processing catches up)
         self._channel_availability_timer.start()
@@ -6307,6 +6490,39 @@ class SampleView(QWidget):
         self._tile_worker_thread.start()
         self.logger.info("Tile processing worker thread started")
 
+    def _start_tile_ingest(self):
+        """Feed live tile frames to the worker from the camera receiver thread."""
+        self._stop_tile_ingest()
+        controller = self.camera_controller
+        if not hasattr(controller, "attach_tile_ingest") or not self._tile_worker:
+            self._tile_ingest = None
+            return
+
+        self._tile_ingest = TileFrameIngest(
+            tile_worker=self._tile_worker,
+            downsample=self._downsample_for_storage,
+            voxel_storage=self.voxel_storage,
+            default_r=self.last_stage_position.get("r", 0),
+        )
+        self._tile_ingest.tile_started.connect(self._on_tile_started)
+        self._tile_ingest.progress.connect(self._on_tile_ingest_progress)
+        self._tile_ingest.start()
+        controller.attach_tile_ingest(self._tile_ingest)
+
+    def _stop_tile_ingest(self):
+        """Drain the ingest queue, submit the last tile and detach."""
+        ingest = getattr(self, "_tile_ingest", None)
+        if ingest is None:
+            return
+        if hasattr(self.camera_controller, "detach_tile_ingest"):
+            self.camera_controller.detach_tile_ingest()
+        ingest.finish()
+        self._tile_buffers_submitted.update(ingest.submitted_tiles)
+        if ingest.reference_position is not None:
+            self._tile_reference_position = ingest.reference_position
+            self._tile_reference_set = True
+        self._tile_ingest = None
+
     def _stop_tile_worker(self):
         """Shut down the background tile processing thread.
 
@@ -20,6 +20,171 @@ AXIS_COLORS = {
 }
 
 
+class ChannelCompositor:
+    """Additive multi-channel compositor with cached per-channel LUTs.
+
+    Each channel's 2D MIP is quantized once to uint8 through a lookup table
+    built from its (contrast, colormap) settings, then summed into a reused
+    RGB buffer with saturating integer math. Channels whose data and settings
+    are unchanged since the previous call reuse their quantized layer, and if
+    nothing changed at all the previous composite is returned as-is — so
+    moving the crosshair or panning does not re-blend anything.
+    """
+
+    # Which RGB components each channel colour contributes to
+    COLOR_MASKS = {
+        "blue": (False, False, True),
+        "cyan": (False, True, True),
+        "green": (False, True, False),
+        "red": (True, False, False),
+        "magenta": (True, False, True),
+        "yellow": (True, True, False),
+        "gray": (True, True, True),
+    }
+
+    # Contrast-slider drags produce a new window per tick; keep only recent LUTs
+    MAX_CACHED_LUTS = 32
+
+    def __init__(self):
+        # channel_id -> {"data", "key", "layer"}
+        self._layers: Dict[int, dict] = {}
+        # (contrast_min, contrast_max, dtype.str) -> uint8 LUT
+        self._luts: Dict[Tuple[int, int, str], np.ndarray] = {}
+        self._accum: Optional[np.ndarray] = None
+        self._output: Optional[np.ndarray] = None
+        self._output_key: Optional[tuple] = None
+
+    def clear(self):
+        """Drop all cached layers, LUTs and buffers."""
+        self._layers.clear()
+        self._luts.clear()
+        self._accum = None
+        self._output = None
+        self._output_key = None
+
+    def composite(
+        self, channel_mips: Dict[int, np.ndarray], channel_settings: Dict[int, dict]
+    ) -> Optional[np.ndarray]:
+        """Blend channels into an RGB image.
+
+        Args:
+            channel_mips: Dict mapping channel_id to 2D MIP array
+            channel_settings: Dict mapping channel_id to settings dict
+                (see ``SlicePlaneViewer.set_multi_channel_mip``)
+
+        Returns:
+            RGB image as uint8 array (H, W, 3), or None if no data. The array
+            is an internal buffer reused by the next call — copy it if it
+            must outlive that.
+        """
+        out_shape = None
+        for ch_data in channel_mips.values():
+            if ch_data is not None and ch_data.size > 0:
+                out_shape = ch_data.shape
+                break
+
+        if out_shape is None:
+            return None
+
+        active = []
+        changed = False
+        for ch_id, ch_data in channel_mips.items():
+            if ch_data is None or ch_data.size == 0 or ch_data.shape != out_shape:
+                continue
+
+            settings = channel_settings.get(ch_id, {})
+            if not settings.get("visible", True):
+                continue
+
+            colormap_name = settings.get("colormap", "gray")
+            mask = self.COLOR_MASKS.get(colormap_name, self.COLOR_MASKS["gray"])
+            key = (
+                int(settings.get("contrast_min", 0)),
+                int(settings.get("contrast_max", 65535)),
+                mask,
+            )
+
+            cached = self._layers.get(ch_id)
+            if cached is None or not self._same_input(cached, ch_data, key):
+                cached = {
+                    # Copy so in-place edits by the caller are still detected
+                    "data": ch_data.copy(),
+                    "key": key,
+                    "layer": self._quantize(ch_data, key[0], key[1]),
+                }
+                self._layers[ch_id] = cached
+                changed = True
+
+            active.append((ch_id, mask, cached["layer"]))
+
+        # Forget channels that are no longer supplied
+        for ch_id in list(self._layers):
+            if ch_id not in channel_mips:
+                del self._layers[ch_id]
+
+        output_key = (out_shape, tuple((ch_id, mask) for ch_id, mask, _ in active))
+        if not changed and self._output is not None and self._output_key == output_key:
+            return self._output
+
+        if self._output is None or self._output.shape[:2] != out_shape:
+            self._accum = np.empty((*out_shape, 3), dtype=np.uint16)
+            self._output = np.empty((*out_shape, 3), dtype=np.uint8)
+
+        accum = self._accum
+        accum.fill(0)
+        for _, mask, layer in active:
+            for component, enabled in enumerate(mask):
+                if enabled:
+                    np.add(accum[..., component], layer, out=accum[..., component])
+
+        # Saturating add: uint16 accumulator holds up to 257 full-scale channels
+        np.minimum(accum, 255, out=accum)
+        np.copyto(self._output, accum, casting="unsafe")
+        self._output_key = output_key
+        return self._output
+
+    @staticmethod
+    def _same_input(cached: dict, data: np.ndarray, key: tuple) -> bool:
+        """True if ``data``/``key`` match what produced the cached layer."""
+        if cached["key"] != key:
+            return False
+        prev = cached["data"]
+        # MIPs are recomputed on every refresh, so compare contents; this is
+        # still far cheaper than re-quantizing and re-blending.
+        return (
+            prev.shape == data.shape
+            and prev.dtype == data.dtype
+            and np.array_equal(prev, data)
+        )
+
+    def _quantize(
+        self, data: np.ndarray, contrast_min: int, contrast_max: int
+    ) -> np.ndarray:
+        """Map ``data`` to uint8 intensity through the contrast window."""
+        if contrast_max <= contrast_min:
+            return np.zeros(data.shape, dtype=np.uint8)
+
+        if data.dtype in (np.uint8, np.uint16):
+            lut_key = (contrast_min, contrast_max, data.dtype.str)
+            lut = self._luts.get(lut_key)
+            if lut is None:
+                levels = np.arange(np.iinfo(data.dtype).max + 1, dtype=np.float32)
+                lut = self._normalize(levels, contrast_min, contrast_max)
+                if len(self._luts) >= self.MAX_CACHED_LUTS:
+                    self._luts.pop(next(iter(self._luts)))
+                self._luts[lut_key] = lut
+            return lut[data]
+
+        return self._normalize(data.astype(np.float32), contrast_min, contrast_max)
+
+    @staticmethod
+    def _normalize(
+        values: np.ndarray, contrast_min: int, contrast_max: int
+    ) -> np.ndarray:
+        scaled = np.clip((values - contrast_min) / (contrast_max - contrast_min), 0, 1)
+        return (scaled * 255).astype(np.uint8)
+
+
 class SlicePlaneViewer(QFrame):
     """2D slice plane viewer with colored borders and overlays.
 
@@ -31,17 +196,6 @@ class SlicePlaneViewer(QFrame):
     # Signal emitted when user double-clicks to move (axis1_value, axis2_value)
     position_clicked = pyqtSignal(float, float)
 
-    # Colormaps for multi-channel display
-    CHANNEL_COLORMAPS = {
-        "blue": lambda v: np.stack([np.zeros_like(v), np.zeros_like(v), v], axis=-1),
-        "cyan": lambda v: np.stack([np.zeros_like(v), v, v], axis=-1),
-        "green": lambda v: np.stack([np.zeros_like(v), v, np.zeros_like(v)], axis=-1),
-        "red": lambda v: np.stack([v, np.zeros_like(v), np.zeros_like(v)], axis=-1),
-        "magenta": lambda v: np.stack([v, np.zeros_like(v), v], axis=-1),
-        "yellow": lambda v: np.stack([v, v, np.zeros_like(v)], axis=-1),
-        "gray": lambda v: np.stack([v, v, v], axis=-1),
-    }
-
     def __init__(
         self,
         plane: str,
@@ -89,6 +243,7 @@ class SlicePlaneViewer(QFrame):
         # Multi-channel MIP data: channel_id -> {data, colormap, contrast, visible}
         self._channel_mips: Dict[int, np.ndarray] = {}
         self._channel_settings: Dict[int, dict] = {}
+        self._compositor = ChannelCompositor()
 
         # Overlay positions (in physical coordinates, mm)
         self._holder_pos: Optional[Tuple[float, float]] = None  # (h, v)
@@ -558,58 +713,7 @@ class SlicePlaneViewer(QFrame):
         """
         if not self._channel_mips:
             return None
-
-        # Determine output shape from first available channel
-        out_shape = None
-        for ch_data in self._channel_mips.values():
-            if ch_data is not None and ch_data.size > 0:
-                out_shape = ch_data.shape
-                break
-
-        if out_shape is None:
-            return None
-
-        # Initialize RGB accumulator as float
-        rgb_accum = np.zeros((*out_shape, 3), dtype=np.float32)
-
-        for ch_id, ch_data in self._channel_mips.items():
-            if ch_data is None or ch_data.size == 0:
-                continue
-
-            settings = self._channel_settings.get(ch_id, {})
-
-            # Check visibility
-            if not settings.get("visible", True):
-                continue
-
-            # Get contrast limits
-            contrast_min = settings.get("contrast_min", 0)
-            contrast_max = settings.get("contrast_max", 65535)
-
-            # Normalize data using contrast limits
-            data = ch_data.astype(np.float32)
-            if contrast_max > contrast_min:
-                data = np.clip(
-                    (data - contrast_min) / (contrast_max - contrast_min), 0, 1
-                )
-            else:
-                data = np.zeros_like(data)
-
-            # Get colormap and apply
-            colormap_name = settings.get("colormap", "gray")
-            colormap_fn = self.CHANNEL_COLORMAPS.get(
-                colormap_name, self.CHANNEL_COLORMAPS["gray"]
-            )
-
-            # Apply colormap (returns H, W, 3)
-            ch_rgb = colormap_fn(data)
-
-            # Additive blending
-            rgb_accum += ch_rgb
-
-        # Clip to valid range and convert to uint8
-        rgb_accum = np.clip(rgb_accum, 0, 1)
-        return (rgb_accum * 255).astype(np.uint8)
+        return self._compositor.composite(self._channel_mips, self._channel_settings)
 
     def mousePressEvent(self, event):
         """Handle mouse press for pan gesture start."""
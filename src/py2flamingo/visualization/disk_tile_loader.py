@@ -338,6 +338,7 @@ def load_tile_to_buffer(
         z_max=tile_info.z_max,
         reference_position=ref_pos,
     )
+    buffer.reserve(tile_info.n_planes * len(tile_info.channels))
 
     # raw_files is keyed by the same channel scheme as `channels` (left side
     # I0 -> C, right side I1 -> C+4), so the file key IS the channel_id — no
@@ -364,11 +365,12 @@ def load_tile_to_buffer(
 
         # Diagnostic: signal statistics for this channel's frames
         if frames_added > 0:
-            ch_frames = buffer.frames[frames_before:]
-            maxvals = [f[0].max() for f in ch_frames]
-            nonzero_counts = [np.count_nonzero(f[0]) for f in ch_frames]
-            total_pixels = ch_frames[0][0].size
-            frames_with_signal = sum(1 for m in maxvals if m > 0)
+            ch_frames = buffer.stack[frames_before:]
+            flat = ch_frames.reshape(frames_added, -1)
+            maxvals = flat.max(axis=1)
+            nonzero_counts = np.count_nonzero(flat, axis=1)
+            total_pixels = flat.shape[1]
+            frames_with_signal = int(np.count_nonzero(maxvals))
             logger.info(
                 f"  Channel {channel_id} "
                 f"(C{channel_id % 4:02d} I{channel_id // 4}, {raw_path.name}): "
@@ -13,6 +13,7 @@ import numpy as np
 import sparse
 from scipy import ndimage
 
+from py2flamingo.utils.intensity_histogram import IntensityHistogram
 from py2flamingo.visualization.axis_orientation import AxisOrientation
 from py2flamingo.visualization.coordinate_transforms import TransformQuality
 
@@ -473,6 +474,19 @@ class DualResolutionVoxelStorage:
         self.display_cache: Dict[int, np.ndarray] = {}  # Channel -> dense array
         self.display_dirty: Dict[int, bool] = {}  # Track which channels need update
         self._display_epoch: Dict[int, int] = {}  # Incremented on each storage write
+        # Dirty-region tracking for incremental viewer updates: the storage-
+        # voxel box written since the last downsample, and the display-voxel
+        # box changed since the viewer last took it (see take_display_changes).
+        self._pending_write_box: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._display_changes: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._display_region_min: Dict[int, np.ndarray] = {}
+        # Intensity histogram of each display cache, for auto-contrast. Built on
+        # first query and dropped whenever the cache changes (see
+        # _mark_display_changed), except that the downsampler updates it in
+        # place from the blocks it rewrote. The generation guards against
+        # stale counts.
+        self._display_histograms: Dict[int, IntensityHistogram] = {}
+        self._histogram_generation: Dict[int, int] = {}
 
         # Memory-efficient display: 8-bit dense caches, rescaled per channel.
         # Halves display_cache, the transform cache and napari's own copies.
@@ -638,10 +652,55 @@ class DualResolutionVoxelStorage:
             )
             self.display_dirty[ch] = False
             self.channel_display_scale[ch] = 1.0
+            self._pending_write_box.pop(ch, None)
+            self._display_region_min.pop(ch, None)
+            self._mark_display_changed(ch)
 
             # Initialize max value tracking
             self.channel_max_values[ch] = 0
 
+    @staticmethod
+    def _union_box(box, lo: np.ndarray, hi: np.ndarray):
+        if box is None:
+            return lo, hi
+        return np.minimum(box[0], lo), np.maximum(box[1], hi)
+
+    def _mark_display_changed(self, channel_id: int, lo=None, hi=None):
+        """Record a changed display-voxel box; no bounds means the whole cache."""
+        self._display_histograms.pop(channel_id, None)
+        self._histogram_generation[channel_id] = (
+            self._histogram_generation.get(channel_id, 0) + 1
+        )
+        if lo is None:
+            lo, hi = np.zeros(3, dtype=int), np.array(self.display_dims)
+        lo = np.clip(lo, 0, self.display_dims)
+        hi = np.clip(hi, 0, self.display_dims)
+        if np.any(hi <= lo):
+            return
+        self._display_changes[channel_id] = self._union_box(
+            self._display_changes.get(channel_id), lo, hi
+        )
+
+    def _display_box(self, lo, hi) -> Tuple[slice, ...]:
+        """(Z, Y, X) slices of a display-voxel box, clipped to the cache."""
+        lo = np.clip(lo, 0, self.display_dims)
+        hi = np.clip(hi, lo, self.display_dims)
+        return tuple(slice(int(a), int(b)) for a, b in zip(lo, hi))
+
+    def take_display_changes(self, channel_id: int) -> Optional[Tuple[slice, ...]]:
+        """Pop the display region that changed since the last call.
+
+        The viewer calls this right after fetching a display volume: None
+        means its copy is still current, otherwise only the returned (Z, Y, X)
+        slices need to be rewritten.
+        """
+        with self._storage_lock:
+            box = self._display_changes.pop(channel_id, None)
+        if box is None:
+            return None
+        lo, hi = box
+        return tuple(slice(int(a), int(b)) for a, b in zip(lo, hi))
+
     def world_to_storage_voxel(self, world_coords: np.ndarray) -> np.ndarray:
         """
         Convert world coordinates (µm) to storage voxel indices.
@@ -790,6 +849,11 @@ class DualResolutionVoxelStorage:
             self._update_bounds(world_coords[valid_mask])
             self.display_dirty[channel_id] = True
             self._display_epoch[channel_id] = self._display_epoch.get(channel_id, 0) + 1
+            self._pending_write_box[channel_id] = self._union_box(
+                self._pending_write_box.get(channel_id),
+                valid_voxels.min(axis=0),
+                valid_voxels.max(axis=0) + 1,
+            )
             cache_key = f"{channel_id}_rotated"
             if cache_key in self.transform_cache:
                 del self.transform_cache[cache_key]
@@ -842,6 +906,7 @@ class DualResolutionVoxelStorage:
                     self.channel_display_scale[ch] = 1.0
                 self.display_dirty[ch] = not self.storage_data[ch].is_empty
                 self.channel_max_values[ch] = int(self.display_cache[ch].max())
+                self._mark_display_changed(ch)
             self.transform_cache.clear()
 
         logger.info(
@@ -850,6 +915,25 @@ class DualResolutionVoxelStorage:
         )
         return True
 
+    def intensity_histogram(self, channel_id: int) -> IntensityHistogram:
+        """Histogram of the channel's display cache (display units).
+
+        Kept until the cache next changes, so repeated auto-contrast queries
+        on an unchanged channel do not rescan the volume.
+        """
+        with self._storage_lock:
+            histogram = self._display_histograms.get(channel_id)
+            generation = self._histogram_generation.get(channel_id, 0)
+        if histogram is not None:
+            return histogram
+
+        histogram = IntensityHistogram.from_array(self.display_cache[channel_id])
+        with self._storage_lock:
+            # Only keep it if the cache did not change while we counted
+            if self._histogram_generation.get(channel_id, 0) == generation:
+                self._display_histograms[channel_id] = histogram
+        return histogram
+
     def display_bytes(self) -> int:
         """Bytes held by the dense display caches."""
         return int(sum(c.nbytes for c in self.display_cache.values()))
@@ -907,6 +991,9 @@ class DualResolutionVoxelStorage:
             cache[...] = converted
         else:
             cache[dst] = converted
+        # Callers may have cleared the rest of the cache first
+        with self._storage_lock:
+            self._mark_display_changed(channel_id)
         return cache
 
     # ========== Isotropic storage grid ==========
@@ -1045,11 +1132,14 @@ class DualResolutionVoxelStorage:
             # writes occurred while we were computing (which would mean our cache
             # is stale and needs another pass).
             snapshot_epoch = self._display_epoch.get(channel_id, 0)
+            write_box = self._pending_write_box.pop(channel_id, None)
 
         # === No lock: all computation on snapshot ===
         if snapshot_keys.size == 0:
             # No data, return empty display
             self.display_cache[channel_id].fill(0)
+            with self._storage_lock:
+                self._mark_display_changed(channel_id)
             return self.display_cache[channel_id]
 
         logger.debug(
@@ -1118,6 +1208,37 @@ class DualResolutionVoxelStorage:
         )
         logger.debug(f"  Downsampled shape: {downsampled.shape}")
 
+        # Block-max placement is anchored on the region's min corner, so only
+        # while that anchor (and the 8-bit scale, checked below) holds still are
+        # the changed display voxels confined to the blocks just written.
+        with self._storage_lock:
+            prev_min = self._display_region_min.get(channel_id)
+            histogram = self._display_histograms.get(channel_id)
+            generation = self._histogram_generation.get(channel_id, 0)
+        changed_box = None
+        if (
+            write_box is not None
+            and prev_min is not None
+            and np.array_equal(prev_min, min_coords)
+        ):
+            margin = 2 if want_smoothing else 0
+            ratio_arr = np.array(ratio)
+            changed_box = (
+                display_origin + (write_box[0] - min_coords) // ratio_arr - margin,
+                display_origin
+                + (write_box[1] - 1 - min_coords) // ratio_arr
+                + 1
+                + margin,
+            )
+        # Count what those blocks held, so a kept histogram can be updated in
+        # place rather than rebuilt from the whole cache
+        old_counts = None
+        if histogram is not None and changed_box is not None:
+            box = self._display_box(*changed_box)
+            old_counts = IntensityHistogram.from_array(
+                self.display_cache[channel_id][box]
+            ).counts
+
         # Clear display cache
         self.display_cache[channel_id].fill(0)
 
@@ -1166,6 +1287,8 @@ class DualResolutionVoxelStorage:
                 f"X=[{self.config.chamber_origin[2]/1000:.1f}, {(self.config.chamber_origin[2] + self.config.chamber_dimensions[2])/1000:.1f}]"
             )
             with self._storage_lock:
+                self._mark_display_changed(channel_id)
+                self._display_region_min.pop(channel_id, None)
                 if self._display_epoch.get(channel_id, 0) == snapshot_epoch:
                     self.display_dirty[channel_id] = False
             return self.display_cache[channel_id]
@@ -1185,6 +1308,7 @@ class DualResolutionVoxelStorage:
         # Copy to display cache, rescaling if the cache is 8-bit. The scale is
         # taken from the whole downsampled block, not the clipped sub-region,
         # so it stays consistent with what raw_from_display() reports.
+        old_scale = self.channel_display_scale.get(channel_id, 1.0)
         scale = self._set_display_scale(channel_id, downsampled)
         region = self._apply_display_scale(
             downsampled[
@@ -1199,10 +1323,22 @@ class DualResolutionVoxelStorage:
             valid_start[1] : valid_end[1],
             valid_start[2] : valid_end[2],
         ] = region
+        if scale != old_scale:
+            changed_box = None
+
+        updated = None
+        if old_counts is not None and changed_box is not None:
+            new_counts = IntensityHistogram.from_array(
+                self.display_cache[channel_id][box]
+            ).counts
+            updated = IntensityHistogram(histogram.counts - old_counts + new_counts)
 
         # Track max value from DISPLAY data (what user sees in napari)
         # PERFORMANCE: Only log significant changes (>20%) to reduce log spam
-        display_max = int(np.max(self.display_cache[channel_id]))
+        if updated is not None:
+            display_max = updated.max()
+        else:
+            display_max = int(np.max(self.display_cache[channel_id]))
         old_max = self.channel_max_values[channel_id]
         if display_max > old_max:
             self.channel_max_values[channel_id] = display_max
@@ -1216,6 +1352,19 @@ class DualResolutionVoxelStorage:
         # If the worker wrote new data in between, epoch will have advanced
         # and we leave dirty=True so the next call recomputes.
         with self._storage_lock:
+            # Keep the updated histogram only if nothing else changed the
+            # cache since it was read
+            keep = (
+                updated is not None
+                and self._histogram_generation.get(channel_id, 0) == generation
+            )
+            if changed_box is None:
+                self._mark_display_changed(channel_id)
+            else:
+                self._mark_display_changed(channel_id, *changed_box)
+            if keep:
+                self._display_histograms[channel_id] = updated
+            self._display_region_min[channel_id] = min_coords
             if self._display_epoch.get(channel_id, 0) == snapshot_epoch:
                 self.display_dirty[channel_id] = False
         return self.display_cache[channel_id]
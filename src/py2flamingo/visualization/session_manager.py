@@ -21,7 +21,9 @@ Session structure:
 import asyncio
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -121,6 +123,204 @@ def _find_zarr_array(root, zarr_path, max_depth=5):
     raise ValueError(f"No array data found in {zarr_path}")
 
 
+# Decoded chunks kept per opened stitched store, so panning back over a region
+# napari has already shown does not go back to disk.
+DEFAULT_CHUNK_CACHE_BYTES = 512 * 1024 * 1024
+
+
+class _ChunkCache:
+    """Thread-safe LRU of decoded chunks, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CHUNK_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value: np.ndarray) -> None:
+        if value.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = value
+            self._bytes += value.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+
+class _CachedZarrArray:
+    """Array-like view of a zarr array that serves repeated reads from a cache.
+
+    Wrapped with ``dask.array.from_array`` on the array's own chunk grid, every
+    read is one chunk, so the slice bounds make a stable cache key.
+    """
+
+    def __init__(self, arr, cache: _ChunkCache, cache_id):
+        self._arr = arr
+        self._cache = cache
+        self._cache_id = cache_id
+        self.shape = tuple(arr.shape)
+        self.dtype = arr.dtype
+        self.ndim = len(self.shape)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if not all(isinstance(k, slice) and k.step in (None, 1) for k in key):
+            return np.asarray(self._arr[key])
+
+        cache_key = (self._cache_id,) + tuple((k.start, k.stop) for k in key)
+        block = self._cache.get(cache_key)
+        if block is None:
+            block = np.asarray(self._arr[key])
+            self._cache.put(cache_key, block)
+        return block
+
+
+def _find_ngff_multiscales(root, max_depth=5):
+    """Find the first group carrying NGFF ``multiscales`` metadata.
+
+    OME-Zarr v0.4 keeps it in the group attributes; v0.5 nests it under
+    ``attrs["ome"]``. Writers differ in how deep they put the image group.
+
+    Returns:
+        (group, multiscales[0]) or None if the store has no such metadata.
+    """
+
+    def _search(node, depth):
+        if depth > max_depth or not hasattr(node, "keys"):
+            return None
+        attrs = dict(getattr(node, "attrs", {}) or {})
+        multiscales = attrs.get("multiscales") or attrs.get("ome", {}).get(
+            "multiscales"
+        )
+        if multiscales:
+            return node, multiscales[0]
+        for key in node.keys():
+            try:
+                child = node[key]
+            except Exception:
+                continue
+            if hasattr(child, "shape"):
+                continue
+            found = _search(child, depth + 1)
+            if found is not None:
+                return found
+        return None
+
+    return _search(root, 0)
+
+
+def _open_zarr_levels(root, zarr_path) -> List[Tuple[Any, np.ndarray]]:
+    """Open every resolution level of a stitched OME-Zarr store.
+
+    Returns:
+        List of (zarr array, ZYX downsample factor relative to level 0),
+        finest first. Stores without NGFF metadata give just the array
+        :func:`_find_zarr_array` finds, with factor 1.
+    """
+    found = _find_ngff_multiscales(root)
+    if found is None:
+        return [(_find_zarr_array(root, zarr_path), np.ones(3))]
+
+    group, multiscale = found
+    levels = []
+    for dataset in multiscale.get("datasets", []):
+        try:
+            arr = group[dataset["path"]]
+        except Exception as e:
+            logger.warning(f"  Skipping pyramid level {dataset.get('path')}: {e}")
+            continue
+        scale = None
+        for transform in dataset.get("coordinateTransformations", []):
+            if transform.get("type") == "scale":
+                scale = np.asarray(transform["scale"], dtype=float)[-3:]
+        levels.append((arr, scale))
+
+    if not levels:
+        return [(_find_zarr_array(root, zarr_path), np.ones(3))]
+
+    base_arr, base_scale = levels[0]
+    base_shape = np.asarray(base_arr.shape[-3:], dtype=float)
+    result = []
+    for arr, scale in levels:
+        if scale is not None and base_scale is not None and np.all(base_scale > 0):
+            factor = scale / base_scale
+        else:
+            factor = base_shape / np.maximum(np.asarray(arr.shape[-3:], float), 1)
+        result.append((arr, factor))
+
+    logger.info(
+        f"  NGFF multiscales: {len(result)} level(s), "
+        f"factors={[f.tolist() for _, f in result]}"
+    )
+    return result
+
+
+def _select_display_level(
+    factors: List[np.ndarray],
+    native_voxel_um: np.ndarray,
+    target_voxel_um=None,
+) -> int:
+    """Pick the coarsest pyramid level that still meets a display resolution.
+
+    Args:
+        factors: Per-level ZYX downsample factors relative to level 0.
+        native_voxel_um: Level-0 voxel size (ZYX µm).
+        target_voxel_um: Voxel size the data will be displayed at (scalar or
+            ZYX µm). None means full resolution.
+
+    Returns:
+        Index of the level whose voxels are as coarse as possible without
+        exceeding the target on any axis (0 if none qualifies).
+    """
+    if target_voxel_um is None:
+        return 0
+    target = np.broadcast_to(np.asarray(target_voxel_um, dtype=float), (3,))
+    chosen = 0
+    for i, factor in enumerate(factors):
+        voxel = np.asarray(native_voxel_um, dtype=float) * factor
+        if np.all(voxel <= target * (1 + 1e-6)):
+            chosen = i
+    return chosen
+
+
+def _lazy_zarr_levels(levels, cache: _ChunkCache) -> list:
+    """Wrap opened zarr levels as lazy, chunk-cached uint16 dask arrays."""
+    import dask.array as da
+
+    lazy = []
+    for i, (arr, _) in enumerate(levels):
+        cached = _CachedZarrArray(arr, cache, cache_id=i)
+        data = da.from_array(
+            cached,
+            chunks=arr.chunks,
+            meta=np.empty((0,) * cached.ndim, dtype=arr.dtype),
+            name=False,
+        )
+        lazy.append(data.astype(np.uint16))
+    return lazy
+
+
+def _read_first_chunk(volume) -> None:
+    """Read one chunk of a lazy level now, while a failure can still be handled.
+
+    Opening the levels only touches metadata; without this an unreadable store
+    would first fail when napari or the resampler reads it, past any fallback.
+    """
+    volume.blocks[(0,) * volume.ndim].compute()
+
+
 def _load_ome_tiff(tiff_path: Path) -> np.ndarray:
     """Load a pyramidal OME-TIFF into memory as a numpy array.
 
@@ -178,7 +378,8 @@ def downsample_to_voxel_grid(volume: np.ndarray, zoom_factors) -> np.ndarray:
     # only interpolates, never has to invent detail.
     safe = np.clip(zoom_factors, 1e-12, None)
     strides = np.maximum(1, np.floor(1.0 / safe).astype(int))
-    coarse = volume[:: strides[0], :: strides[1], :: strides[2]]
+    # Lazy (dask) volumes are only read at the strided positions
+    coarse = np.asarray(volume[:: strides[0], :: strides[1], :: strides[2]])
 
     coarse_shape = np.asarray(coarse.shape, dtype=float)
     # Exact residual factor coarse -> target so the output shape matches what a
@@ -188,6 +389,145 @@ def downsample_to_voxel_grid(volume: np.ndarray, zoom_factors) -> np.ndarray:
     return out
 
 
+# Source planes read per step by reduce_to_display_grid
+DEFAULT_REDUCE_SLAB_BYTES = 64 * 1024 * 1024
+
+
+def _bin_starts(src: int, dst: int) -> np.ndarray:
+    """First source index of each of ``dst`` bins spanning ``src`` samples.
+
+    When upsampling, neighbouring bins share a start and each takes that one
+    sample (nearest neighbour), which is also what ``ufunc.reduceat`` yields
+    for non-increasing indices.
+    """
+    return (np.arange(dst, dtype=np.int64) * src) // dst
+
+
+def reduce_to_display_grid(
+    source,
+    target_shape: Tuple[int, int, int],
+    reduce: str = "mean",
+    slab_bytes: int = DEFAULT_REDUCE_SLAB_BYTES,
+) -> Tuple[np.ndarray, Tuple[float, float]]:
+    """Block-reduce a (Z, Y, X) source onto a display grid, slab by slab.
+
+    ``source`` only needs ``shape``, ``dtype`` and Z slicing, so an
+    ``np.memmap``, a zarr array or a lazy TIFF page stack all stream: peak
+    memory is one slab of source planes plus the output grid, instead of
+    ``scipy.ndimage.zoom`` over (and often a float copy of) the whole input.
+    Source min/max are collected in the same pass; normalization is affine,
+    so it can be applied to the reduced grid afterwards.
+
+    Args:
+        source: 3D array-like.
+        target_shape: Display grid (Z, Y, X).
+        reduce: "mean" (float32 output) or "max" (source dtype output).
+        slab_bytes: Approximate bytes of source read per step; rounded to the
+            source's Z chunk depth when it has one.
+
+    Returns:
+        (grid, (source_min, source_max))
+    """
+    if reduce not in ("mean", "max"):
+        raise ValueError(f"reduce must be 'mean' or 'max', got {reduce!r}")
+
+    src_shape = tuple(int(n) for n in source.shape)
+    target_shape = tuple(int(n) for n in target_shape)
+    dtype = np.dtype(source.dtype)
+    starts = [_bin_starts(s, t) for s, t in zip(src_shape, target_shape)]
+    ends = [
+        np.maximum(np.append(st[1:], s), st + 1) for st, s in zip(starts, src_shape)
+    ]
+    z_starts, z_ends = starts[0], ends[0]
+
+    plane_bytes = src_shape[1] * src_shape[2] * dtype.itemsize
+    depth = max(1, slab_bytes // max(plane_bytes, 1))
+    chunks = getattr(source, "chunks", None)
+    if chunks and isinstance(chunks[0], int):
+        depth = max(chunks[0], depth // chunks[0] * chunks[0])
+
+    if reduce == "mean":
+        grid = np.zeros(target_shape, dtype=np.float32)
+    elif dtype.kind == "f":
+        grid = np.full(target_shape, -np.inf, dtype=dtype)
+    else:
+        grid = np.full(target_shape, np.iinfo(dtype).min, dtype=dtype)
+
+    vmin, vmax = np.inf, -np.inf
+    for z0 in range(0, src_shape[0], depth):
+        z1 = min(z0 + depth, src_shape[0])
+        slab = np.asarray(source[z0:z1])
+        vmin = min(vmin, float(slab.min()))
+        vmax = max(vmax, float(slab.max()))
+
+        if reduce == "mean":
+            slab = np.add.reduceat(slab, starts[1], axis=1, dtype=np.float32)
+            slab = np.add.reduceat(slab, starts[2], axis=2)
+        else:
+            slab = np.maximum.reduceat(slab, starts[1], axis=1)
+            slab = np.maximum.reduceat(slab, starts[2], axis=2)
+
+        # Target Z bins that overlap this slab
+        first = np.searchsorted(z_ends, z0, side="right")
+        last = np.searchsorted(z_starts, z1, side="left")
+        for j in range(first, last):
+            lo = max(z_starts[j], z0) - z0
+            hi = min(z_ends[j], z1) - z0
+            if reduce == "mean":
+                grid[j] += slab[lo:hi].sum(axis=0)
+            else:
+                np.maximum(grid[j], slab[lo:hi].max(axis=0), out=grid[j])
+        del slab
+
+    if reduce == "mean":
+        counts = [(e - st).astype(np.float32) for st, e in zip(starts, ends)]
+        grid /= counts[0][:, None, None]
+        grid /= counts[1][None, :, None]
+        grid /= counts[2][None, None, :]
+    return grid, (vmin, vmax)
+
+
+class _TiffPageStack:
+    """(Z, Y, X) view of a page-per-plane TIFF that decodes planes on demand.
+
+    For compressed stacks that ``tifffile.memmap`` cannot map; supports the
+    Z slicing reduce_to_display_grid needs.
+    """
+
+    def __init__(self, tif, series):
+        self._tif = tif
+        self._pages = series.pages
+        self.shape = tuple(series.shape)
+        self.dtype = np.dtype(series.dtype)
+        self.ndim = 3
+
+    def __getitem__(self, key: slice) -> np.ndarray:
+        return np.stack(
+            [self._pages[i].asarray() for i in range(*key.indices(self.shape[0]))]
+        )
+
+    def close(self):
+        self._tif.close()
+
+
+def _open_tiff_for_streaming(file_path: Path):
+    """Open a TIFF without reading it: memmap, page stack, or a full read."""
+    import tifffile
+
+    try:
+        return tifffile.memmap(str(file_path), mode="r")
+    except ValueError:
+        pass
+    tif = tifffile.TiffFile(str(file_path))
+    series = tif.series[0]
+    if len(series.shape) == 3 and len(series.pages) == series.shape[0]:
+        return _TiffPageStack(tif, series)
+    try:
+        return series.asarray()
+    finally:
+        tif.close()
+
+
 def _ims_attr_str(attrs, name: str) -> Optional[str]:
     """Decode an Imaris HDF5 attribute (stored as an array of single-char bytes)
     into a Python string. Returns None if absent."""
@@ -949,14 +1289,19 @@ def find_stitched_stores(output_dir: Path) -> List[Path]:
 
 
 def load_stitched_volume(
-    output_dir: Path, voxel_storage=None, store_override: Path = None
+    output_dir: Path,
+    voxel_storage=None,
+    store_override: Path = None,
+    target_voxel_um=None,
 ) -> dict:
-    """Load stitched OME-Zarr output at native resolution for direct napari display.
+    """Open stitched OME-Zarr output lazily for direct napari display.
 
     Returns volume data + world coordinates for each channel so the caller
-    can add them as napari layers with correct scale/translate.  No
-    downsampling is applied — the data is displayed at whatever resolution
-    it was stitched at.
+    can add them as napari layers with correct scale/translate.  OME-Zarr
+    volumes come back as lazy, chunk-cached dask arrays: ``volume`` is the
+    coarsest NGFF pyramid level that still meets ``target_voxel_um`` and
+    ``multiscale`` holds every level. Only one chunk is read up front, to
+    catch an unreadable store while the OME-TIFF fallback can still apply.
 
     Supports two metadata versions:
       v1: Per-channel stores (channel_00.ome.zarr, channel_01.ome.zarr, ...)
@@ -965,16 +1310,20 @@ def load_stitched_volume(
     Args:
         output_dir: Path to the stitching output directory containing
                     stitch_metadata.json and .ome.zarr stores
-        voxel_storage: Optional — used only to read display_voxel_size and
-                       chamber_origin for coordinate mapping.  May be None.
+        voxel_storage: Optional — its display_voxel_size is the default
+                       ``target_voxel_um``.  May be None.
         store_override: If provided, use this file instead of the one
                         referenced in stitch_metadata.json.
+        target_voxel_um: Voxel size (scalar or ZYX µm) the data will be
+                        displayed at. None selects full resolution.
 
     Returns:
         dict with keys:
             channels (list[dict]): Per-channel info with keys:
-                ch_id (int), volume (np.ndarray), origin_um (np.ndarray),
-                voxel_size_um (np.ndarray)
+                ch_id (int), volume (np.ndarray or dask array), origin_um
+                (np.ndarray), voxel_size_um (np.ndarray, of ``volume``'s
+                level), and for OME-Zarr also multiscale (list of dask
+                arrays, finest first) and level (index of ``volume``)
             metadata (dict): Raw stitch_metadata.json content
 
     Raises:
@@ -998,10 +1347,15 @@ def load_stitched_volume(
         metadata["store_path"] = str(Path(store_override).name)
         logger.info(f"  Using store override: {metadata['store_path']}")
 
+    if target_voxel_um is None and voxel_storage is not None:
+        target_voxel_um = voxel_storage.config.display_voxel_size
+
     # Version dispatch: v2 has single multi-channel store
     version = metadata.get("version", 1)
     if version >= 2 and "store_path" in metadata:
-        channels = _load_multichannel_store(output_dir, metadata, native_voxel)
+        channels = _load_multichannel_store(
+            output_dir, metadata, native_voxel, target_voxel_um
+        )
     else:
         # v1: per-channel stores
         channels = []
@@ -1009,7 +1363,7 @@ def load_stitched_volume(
             ch_id = int(ch_str)
             try:
                 vol_info = _load_stitched_channel(
-                    output_dir, ch_meta, ch_id, native_voxel
+                    output_dir, ch_meta, ch_id, native_voxel, target_voxel_um
                 )
                 channels.append(vol_info)
             except Exception as e:
@@ -1024,14 +1378,13 @@ def _load_multichannel_store(
     output_dir: Path,
     metadata: dict,
     native_voxel: dict,
+    target_voxel_um=None,
 ) -> List[dict]:
     """Load a single multi-channel (C,Z,Y,X) OME-Zarr store.
 
     Returns per-channel dicts in the same format as the v1 loader
     so downstream code (sample_view.py) needs no changes.
     """
-    import dask.array as da
-
     store_path = output_dir / metadata["store_path"]
 
     # If the referenced store doesn't exist, search for loadable alternatives.
@@ -1056,6 +1409,8 @@ def _load_multichannel_store(
     # Dispatch on file type, with fallback to TIFF if zarr fails
     suffix = store_path.suffix.lower()
     volume = None
+    multiscale = None
+    level = 0
 
     # Imaris .ims is HDF5, not zarr — read it directly (coarse pyramid level)
     # and return per-channel dicts with the level's effective voxel size.
@@ -1069,17 +1424,26 @@ def _load_multichannel_store(
             # Open zarr store
             store = _create_zarr_store(str(store_path))
             root = zarr.open_group(store=store, mode="r")
-            arr = _find_zarr_array(root, store_path)
+            levels = _open_zarr_levels(root, store_path)
+            arr = levels[0][0]
 
             logger.info(
                 f"  Multi-channel store: shape={arr.shape}, dtype={arr.dtype}, "
                 f"origin_um={origin_um}, voxel_size_um={voxel_size_um}"
             )
 
-            # Read into memory
-            logger.info("  Loading multi-channel volume into memory...")
-            data = da.from_zarr(arr)
-            volume = data.compute().astype(np.uint16)
+            # Lazy: only the chunks napari (or the caller) touches get read
+            multiscale = _lazy_zarr_levels(levels, _ChunkCache())
+            level = _select_display_level(
+                [f for _, f in levels], voxel_size_um, target_voxel_um
+            )
+            volume = multiscale[level]
+            _read_first_chunk(volume)
+            voxel_size_um = voxel_size_um * levels[level][1]
+            logger.info(
+                f"  Display level {level}: shape={volume.shape}, "
+                f"effective voxel µm={voxel_size_um.tolist()}"
+            )
         except (ValueError, KeyError, Exception) as e:
             # Zarr failed — try falling back to any OME-TIFF in same directory
             tiff_files = list(store_path.parent.glob("*.ome.tif"))
@@ -1090,11 +1454,21 @@ def _load_multichannel_store(
                     f"falling back to OME-TIFF: {tiff_fallback}"
                 )
                 volume = _load_ome_tiff(tiff_fallback)
+                multiscale = None
+                level = 0
+                voxel_size_um = np.array(
+                    [native_voxel["z"], native_voxel["y"], native_voxel["x"]]
+                )
             else:
                 raise
 
     logger.info(f"  Loaded shape: {volume.shape}")
 
+    def _pyramid(select):
+        if multiscale is None:
+            return {}
+        return {"multiscale": [select(m) for m in multiscale], "level": level}
+
     channels = []
 
     if volume.ndim == 4:
@@ -1108,6 +1482,7 @@ def _load_multichannel_store(
                     "volume": volume[i],
                     "origin_um": origin_um.copy(),
                     "voxel_size_um": voxel_size_um.copy(),
+                    **_pyramid(lambda m: m[i]),
                 }
             )
     elif volume.ndim == 3:
@@ -1119,6 +1494,7 @@ def _load_multichannel_store(
                 "volume": volume,
                 "origin_um": origin_um.copy(),
                 "voxel_size_um": voxel_size_um.copy(),
+                **_pyramid(lambda m: m),
             }
         )
     elif volume.ndim == 2:
@@ -1153,14 +1529,14 @@ def _load_stitched_channel(
     ch_meta: dict,
     ch_id: int,
     native_voxel: dict,
+    target_voxel_um=None,
 ) -> dict:
-    """Load a single stitched channel at native resolution.
+    """Open a single stitched channel lazily at the display pyramid level.
 
     Returns:
-        dict with ch_id, volume (np.ndarray), origin_um, voxel_size_um
+        dict with ch_id, volume (lazy dask array), origin_um, voxel_size_um,
+        multiscale and level
     """
-    import dask.array as da
-
     zarr_path = output_dir / ch_meta["path"]
     if not zarr_path.exists():
         raise FileNotFoundError(f"Channel zarr not found: {zarr_path}")
@@ -1168,33 +1544,36 @@ def _load_stitched_channel(
     origin_um = np.array(ch_meta["origin_um"])  # [z, y, x] in µm
     voxel_size_um = np.array([native_voxel["z"], native_voxel["y"], native_voxel["x"]])
 
-    # Open zarr store at level 0 (full resolution)
     store = _create_zarr_store(str(zarr_path))
     root = zarr.open_group(store=store, mode="r")
 
-    # Find the level-0 array (OME-Zarr v0.5 may nest Groups)
-    arr = _find_zarr_array(root, zarr_path)
+    # Every pyramid level (OME-Zarr v0.5 may nest Groups)
+    levels = _open_zarr_levels(root, zarr_path)
+    arr = levels[0][0]
 
     logger.info(
         f"  Channel {ch_id}: shape={arr.shape}, dtype={arr.dtype}, "
         f"origin_um={origin_um}, voxel_size_um={voxel_size_um}"
     )
 
-    # Read into memory via dask (handles chunked/sharded stores)
-    logger.info(f"  Loading volume into memory...")
-    data = da.from_zarr(arr)
-    volume = data.compute().astype(np.uint16)
-    logger.info(f"  Loaded shape: {volume.shape}")
+    multiscale = _lazy_zarr_levels(levels, _ChunkCache())
+    level = _select_display_level(
+        [f for _, f in levels], voxel_size_um, target_voxel_um
+    )
+    _read_first_chunk(multiscale[level])
+    logger.info(f"  Display level {level}: shape={multiscale[level].shape}")
 
     return {
         "ch_id": ch_id,
-        "volume": volume,
+        "volume": multiscale[level],
         "origin_um": origin_um,
-        "voxel_size_um": voxel_size_um,
+        "voxel_size_um": voxel_size_um * levels[level][1],
+        "multiscale": multiscale,
+        "level": level,
     }
 
 
-def load_test_data(file_path: Path, voxel_storage) -> bool:
+def load_test_data(file_path: Path, voxel_storage, reduce: str = "mean") -> bool:
     """Load test data from various formats into voxel storage.
 
     Supports:
@@ -1202,9 +1581,13 @@ def load_test_data(file_path: Path, voxel_storage) -> bool:
     - .tif / .tiff (TIFF stacks)
     - .npy (NumPy arrays)
 
+    TIFF and .npy inputs are memory-mapped (or decoded a page at a time) and
+    streamed onto the display grid, so they never have to fit in RAM.
+
     Args:
         file_path: Path to the data file
         voxel_storage: DualResolutionVoxelStorage to load into
+        reduce: How source voxels combine into a display voxel, "mean" or "max"
 
     Returns:
         True if loaded successfully
@@ -1233,10 +1616,12 @@ def load_test_data(file_path: Path, voxel_storage) -> bool:
     elif file_path.suffix in [".tif", ".tiff"]:
         # Load TIFF stack
         try:
-            from tifffile import imread
-
-            data = imread(str(file_path))
-            return _load_array_to_storage(data, voxel_storage)
+            data = _open_tiff_for_streaming(file_path)
+            try:
+                return _load_array_to_storage(data, voxel_storage, reduce=reduce)
+            finally:
+                if isinstance(data, _TiffPageStack):
+                    data.close()
         except ImportError:
             logger.error("tifffile not available. Install with: pip install tifffile")
             return False
@@ -1247,8 +1632,8 @@ def load_test_data(file_path: Path, voxel_storage) -> bool:
     elif file_path.suffix == ".npy":
         # Load NumPy array
         try:
-            data = np.load(str(file_path))
-            return _load_array_to_storage(data, voxel_storage)
+            data = np.load(str(file_path), mmap_mode="r")
+            return _load_array_to_storage(data, voxel_storage, reduce=reduce)
         except Exception as e:
             logger.exception(f"Failed to load NumPy array: {e}")
             return False
@@ -1259,14 +1644,15 @@ def load_test_data(file_path: Path, voxel_storage) -> bool:
 
 
 def _load_array_to_storage(
-    data: np.ndarray, voxel_storage, channel_id: int = 0
+    data: np.ndarray, voxel_storage, channel_id: int = 0, reduce: str = "mean"
 ) -> bool:
     """Load a numpy array into voxel storage.
 
     Args:
-        data: 3D or 4D numpy array (ZYX or CZYX)
+        data: 3D or 4D array (ZYX or CZYX); memmaps and lazy arrays stream
         voxel_storage: Storage to load into
         channel_id: Channel to load single-channel data into
+        reduce: "mean" or "max" block reduction onto the display grid
 
     Returns:
         True if successful
@@ -1274,11 +1660,11 @@ def _load_array_to_storage(
     # Handle different array shapes
     if data.ndim == 3:
         # Single channel ZYX
-        _load_single_channel(data, voxel_storage, channel_id)
+        _load_single_channel(data, voxel_storage, channel_id, reduce)
     elif data.ndim == 4:
         # Multi-channel CZYX
         for ch in range(min(data.shape[0], voxel_storage.num_channels)):
-            _load_single_channel(data[ch], voxel_storage, ch)
+            _load_single_channel(data[ch], voxel_storage, ch, reduce)
     else:
         logger.error(f"Unsupported array dimensions: {data.ndim}")
         return False
@@ -1286,25 +1672,31 @@ def _load_array_to_storage(
     return True
 
 
-def _load_single_channel(data: np.ndarray, voxel_storage, channel_id: int):
+def _load_single_channel(
+    data: np.ndarray, voxel_storage, channel_id: int, reduce: str = "mean"
+):
     """Load a single channel 3D array into storage."""
-    # Resize if necessary to match storage dimensions
-    target_shape = voxel_storage.display_dims
-
-    if data.shape != target_shape:
-        logger.info(f"Resizing data from {data.shape} to {target_shape}")
-        from scipy.ndimage import zoom
-
-        zoom_factors = tuple(t / s for t, s in zip(target_shape, data.shape))
-        data = zoom(data, zoom_factors, order=1)
+    # Stream onto the display grid if the shapes differ; the source is only
+    # ever read one slab at a time.
+    target_shape = tuple(voxel_storage.display_dims)
+    source_dtype = np.dtype(data.dtype)
+
+    if tuple(data.shape) != target_shape:
+        logger.info(f"Reducing data from {data.shape} to {target_shape} ({reduce})")
+        data, (data_min, data_max) = reduce_to_display_grid(data, target_shape, reduce)
+    else:
+        data = np.asarray(data)
+        data_min, data_max = float(data.min()), float(data.max())
 
-    # Normalize to uint16 if needed
-    if data.dtype != np.uint16:
-        data_min, data_max = data.min(), data.max()
+    # Normalize to uint16 if needed, against the source's global range
+    if source_dtype != np.uint16:
         if data_max > data_min:
+            data = np.asarray(data, dtype=np.float32)
             data = ((data - data_min) / (data_max - data_min) * 65535).astype(np.uint16)
         else:
             data = data.astype(np.uint16)
+    elif data.dtype != np.uint16:
+        data = np.rint(data).astype(np.uint16)
 
     # Load into display cache (rescales when the cache is 8-bit)
     voxel_storage.store_display_volume(channel_id, data)
@@ -0,0 +1,235 @@
+"""
+Off-GUI ingest of live tile-workflow frames.
+
+Frames used to reach the tile buffers through the GUI thread: the camera
+receiver's deque, a display timer draining at most 25 frames per tick, a Qt
+signal per frame, and a slot that downsampled each frame before buffering it.
+Any GUI stall (napari redraw, a dialog) backed the deque up until it dropped
+Z planes.
+
+TileFrameIngest takes the GUI out of that path:
+
+Receiver thread (per frame, ~µs):
+  - CameraService frame listener puts (image, header) on an unbounded queue
+
+Ingest thread (per frame, ~0.5ms):
+  - downsample, append to the current tile's TileFrameBuffer
+
+Ingest thread (on tile change / finish):
+  - submit the completed buffer to TileProcessingWorker
+
+GUI thread:
+  - tile_started once per tile, progress at most every ``progress_interval_s``
+
+Tile boundaries are markers on the same queue as the frames, so a frame
+received before ``begin_tile()`` always lands in the tile that was active when
+it arrived, however far behind the ingest thread is.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from py2flamingo.visualization.tile_processing_worker import TileFrameBuffer
+
+logger = logging.getLogger(__name__)
+
+# Queue markers (frames are (image, header) tuples)
+_BEGIN_TILE = object()
+_FINISH = object()
+
+
+class TileFrameIngest(QObject):
+    """Bins live tile-workflow frames into per-tile buffers on its own thread.
+
+    Signals:
+        tile_started(dict): First frame of a new tile arrived. Args: position
+        progress(dict): Throttled progress. Keys: tile_index, frame_count,
+            position
+    """
+
+    tile_started = pyqtSignal(dict)
+    progress = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        tile_worker,
+        downsample: Callable[[np.ndarray], np.ndarray],
+        voxel_storage=None,
+        default_r: float = 0.0,
+        progress_interval_s: float = 0.25,
+    ):
+        """
+        Args:
+            tile_worker: TileProcessingWorker receiving completed buffers
+            downsample: Frame -> storage-resolution frame (thread-safe)
+            voxel_storage: Storage whose reference position is set from the
+                first tile (None to skip)
+            default_r: Rotation for tiles whose position has no "r"
+            progress_interval_s: Minimum time between progress signals
+        """
+        super().__init__()
+        self._tile_worker = tile_worker
+        self._downsample = downsample
+        self._voxel_storage = voxel_storage
+        self._default_r = default_r
+        self._progress_interval_s = progress_interval_s
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+        # Ingest-thread state
+        self._position: Optional[dict] = None
+        self._buffer: Optional[TileFrameBuffer] = None
+        self._z_index = 0
+        self._last_progress = 0.0
+
+        self.reference_position: Optional[dict] = None
+        self.submitted_tiles: Dict[Tuple[float, float], bool] = {}
+        self.frames_ingested = 0
+        self.frames_discarded = 0
+
+    # ------------------------------------------------------------------
+    # Called from other threads
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the ingest thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="TileFrameIngest", daemon=True
+        )
+        self._thread.start()
+
+    def on_frame(self, image: np.ndarray, header) -> None:
+        """CameraService frame listener. Runs on the receiver thread."""
+        self._queue.put((image, header))
+
+    def begin_tile(self, position: dict) -> None:
+        """Frames received from now on belong to ``position``'s workflow."""
+        self._queue.put((_BEGIN_TILE, position))
+
+    def finish(self, timeout: float = 30.0) -> bool:
+        """Ingest everything queued, submit the last tile and stop.
+
+        Returns:
+            True if the thread finished within ``timeout``
+        """
+        if self._thread is None:
+            return True
+        self._queue.put((_FINISH, None))
+        self._thread.join(timeout)
+        finished = not self._thread.is_alive()
+        if not finished:
+            logger.warning(f"Tile frame ingest did not finish within {timeout}s")
+        logger.info(
+            f"Tile frame ingest stopped: {self.frames_ingested} frames in "
+            f"{len(self.submitted_tiles)} tiles, "
+            f"{self.frames_discarded} frames outside any tile"
+        )
+        return finished
+
+    # ------------------------------------------------------------------
+    # Ingest thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item, payload = self._queue.get()
+            try:
+                if item is _FINISH:
+                    self._submit_current()
+                    return
+                if item is _BEGIN_TILE:
+                    self._position = payload
+                    self._z_index = 0
+                    continue
+                self._ingest(item, payload)
+            except Exception as e:
+                logger.error(f"Tile frame ingest error: {e}", exc_info=True)
+
+    def _ingest(self, image: np.ndarray, header) -> None:
+        position = self._position
+        if position is None:
+            # Live-view frames before the first workflow starts
+            self.frames_discarded += 1
+            return
+
+        tile_key = (position["x"], position["y"])
+        if self._buffer is None or self._buffer.tile_key != tile_key:
+            self._start_buffer(position, tile_key)
+
+        buffer = self._buffer
+        if buffer.source_frame_shape is None:
+            buffer.source_frame_shape = tuple(image.shape[:2])
+        downsampled = self._downsample(image)
+        buffer.append(downsampled, self._z_index)
+        self._z_index += 1
+        self.frames_ingested += 1
+
+        frame_count = buffer.frame_count
+        if frame_count <= 30 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"  FRAME {frame_count}: z_idx={self._z_index - 1} "
+                f"frame_num={header.frame_number} raw_max={int(image.max())} "
+                f"ds_max={int(downsampled.max())} tile={tile_key} "
+                f"channels={buffer.channels}"
+            )
+
+        now = time.monotonic()
+        if now - self._last_progress >= self._progress_interval_s:
+            self._last_progress = now
+            self.progress.emit(
+                {
+                    "tile_index": len(self.submitted_tiles) + 1,
+                    "frame_count": frame_count,
+                    "position": position,
+                }
+            )
+
+    def _start_buffer(self, position: dict, tile_key: Tuple[float, float]) -> None:
+        self._submit_current()
+
+        z_min = position["z_min"]
+        z_max = position["z_max"]
+        if self.reference_position is None:
+            self.reference_position = {
+                "x": position["x"],
+                "y": position["y"],
+                "z": (z_min + z_max) / 2,
+                "r": position.get("r", self._default_r),
+            }
+            if self._voxel_storage is not None:
+                self._voxel_storage.set_reference_position(self.reference_position)
+
+        self._buffer = TileFrameBuffer(
+            tile_key=tile_key,
+            position=position,
+            channels=position.get("channels", [0]),
+            z_min=z_min,
+            z_max=z_max,
+            reference_position=self.reference_position,
+            planes_per_channel=position.get("num_planes"),
+        )
+        self._last_progress = 0.0
+        logger.info(
+            f"Tile ingest: new buffer for ({position['x']:.3f}, {position['y']:.3f})"
+        )
+        self.tile_started.emit(position)
+
+    def _submit_current(self) -> None:
+        buffer = self._buffer
+        self._buffer = None
+        if buffer is None or buffer.frame_count == 0:
+            return
+        logger.info(
+            f"Tile {buffer.tile_key} complete: {buffer.frame_count} frames buffered, "
+            f"submitting to worker"
+        )
+        self.submitted_tiles[buffer.tile_key] = True
+        if self._tile_worker is not None:
+            self._tile_worker.submit_tile(buffer)
@@ -28,6 +28,7 @@ from PyQt5.QtCore import (
     QMutexLocker,
     QObject,
     QRunnable,
+    Qt,
     QThreadPool,
     pyqtSignal,
     pyqtSlot,
@@ -39,6 +40,7 @@ try:
         affine_transform_auto,
         combined_transform_gpu,
         gaussian_filter_auto,
+        is_gpu_beneficial,
         shift_auto,
     )
 
@@ -46,6 +48,7 @@ try:
 except ImportError:
     GPU_TRANSFORMS_IMPORTED = False
     affine_transform_auto = None
+    is_gpu_beneficial = None
     gaussian_filter_auto = None
     shift_auto = None
     combined_transform_gpu = None
@@ -106,8 +109,34 @@ class RotationTransformWorker(BaseTransformWorker):
     """Worker for rotation transforms using affine_transform.
 
     Automatically uses GPU acceleration when available and beneficial.
+    On the CPU path, the per-plane coordinate map is taken from (or added
+    to) ``map_cache`` so repeated angles skip rebuilding it. With a
+    ``result_cache`` the finished rotation is looked up and stored by volume
+    content; the volume is hashed here, off the GUI thread.
     """
 
+    def __init__(
+        self,
+        request: TransformRequest,
+        map_cache: Optional["RotationMapCache"] = None,
+        result_cache: Optional["ByteBudgetCache"] = None,
+    ):
+        super().__init__(request)
+        self.map_cache = map_cache
+        self.result_cache = result_cache
+
+    @staticmethod
+    def _result_key(volume: np.ndarray, rotation_deg: float, center) -> Tuple:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((volume.shape, volume.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(volume).view(np.uint8).data)
+        return (
+            "rotation",
+            digest.hexdigest(),
+            round(float(rotation_deg), 6),
+            tuple(round(float(c), 6) for c in center),
+        )
+
     def run(self):
         """Execute rotation transform."""
         if self._cancelled:
@@ -128,6 +157,14 @@ class RotationTransformWorker(BaseTransformWorker):
             if center_voxels is None:
                 center_voxels = np.array(volume.shape) / 2
 
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = self._result_key(volume, rotation_deg, center_voxels)
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    self.signals.completed.emit(self.request.request_id, cached)
+                    return
+
             # Create rotation matrix (Y-axis rotation for sample holder)
             rot = Rotation.from_euler("y", rotation_deg, degrees=True)
             rot_matrix = rot.as_matrix()
@@ -142,11 +179,23 @@ class RotationTransformWorker(BaseTransformWorker):
                 self.signals.cancelled.emit(self.request.request_id)
                 return
 
-            # Apply affine transform (GPU-accelerated if available)
-            if GPU_TRANSFORMS_IMPORTED and affine_transform_auto is not None:
+            use_gpu = (
+                GPU_TRANSFORMS_IMPORTED
+                and affine_transform_auto is not None
+                and is_gpu_beneficial(volume)
+            )
+            if use_gpu:
                 result = affine_transform_auto(
                     volume, rot_matrix, offset=offset, order=1, mode="constant", cval=0
                 )
+            elif self.map_cache is not None:
+                coords = self.map_cache.get_map(
+                    (volume.shape[0], volume.shape[2]), rotation_deg, center
+                )
+                result = self._apply_plane_map(volume, coords)
+                if result is None:
+                    self.signals.cancelled.emit(self.request.request_id)
+                    return
             else:
                 # CPU fallback
                 from scipy import ndimage
@@ -163,12 +212,39 @@ class RotationTransformWorker(BaseTransformWorker):
 
             self.signals.progress.emit(self.request.request_id, 90)
 
+            if cache_key is not None:
+                self.result_cache.put(cache_key, result)
             self.signals.completed.emit(self.request.request_id, result)
 
         except Exception as e:
             logger.exception(f"Rotation transform error: {e}")
             self.signals.error.emit(self.request.request_id, str(e))
 
+    def _apply_plane_map(
+        self, volume: np.ndarray, coords: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Resample every (Z, X) plane through a shared coordinate map.
+
+        A Y-axis rotation leaves axis 1 untouched, so each Y plane is rotated
+        independently by the same 2D map. Returns None if cancelled mid-way.
+        """
+        from scipy import ndimage
+
+        result = np.empty(volume.shape, dtype=volume.dtype)
+        n_planes = volume.shape[1]
+        for j in range(n_planes):
+            if self._cancelled:
+                return None
+            plane = ndimage.map_coordinates(
+                volume[:, j, :].astype(np.float32),
+                coords,
+                order=1,
+                mode="constant",
+                cval=0,
+            )
+            result[:, j, :] = plane.astype(volume.dtype)
+        return result
+
 
 class TranslationWorker(BaseTransformWorker):
     """Worker for translation (shift) operations.
@@ -348,38 +424,126 @@ class CombinedTransformWorker(BaseTransformWorker):
             self.signals.error.emit(self.request.request_id, str(e))
 
 
-class LRUCache:
-    """Simple LRU cache for transform results."""
+class ByteBudgetCache:
+    """LRU cache bounded by the total ``nbytes`` of its values.
 
-    def __init__(self, max_size: int = 10):
-        self.max_size = max_size
-        self.cache: OrderedDict[str, np.ndarray] = OrderedDict()
+    Transform results scale with the display volume, so a count-based cap
+    either wastes memory on small volumes or blows past it on large ones.
+    Values larger than the whole budget are not cached.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.cache: OrderedDict[Any, np.ndarray] = OrderedDict()
         self.mutex = QMutex()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    def get(self, key: str) -> Optional[np.ndarray]:
+    def get(self, key) -> Optional[np.ndarray]:
         """Get item from cache, returns None if not found."""
         with QMutexLocker(self.mutex):
             if key in self.cache:
                 # Move to end (most recently used)
                 self.cache.move_to_end(key)
+                self.hits += 1
                 return self.cache[key]
+            self.misses += 1
             return None
 
-    def put(self, key: str, value: np.ndarray):
-        """Put item in cache."""
+    def put(self, key, value: np.ndarray):
+        """Put item in cache, evicting least recently used items to fit."""
+        size = value.nbytes
         with QMutexLocker(self.mutex):
             if key in self.cache:
-                self.cache.move_to_end(key)
-            else:
-                if len(self.cache) >= self.max_size:
-                    # Remove oldest
-                    self.cache.popitem(last=False)
-                self.cache[key] = value
+                self.current_bytes -= self.cache.pop(key).nbytes
+            if size > self.max_bytes:
+                return
+            while self.cache and self.current_bytes + size > self.max_bytes:
+                _, evicted = self.cache.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+            self.cache[key] = value
+            self.current_bytes += size
 
     def clear(self):
-        """Clear the cache."""
+        """Clear the cache (statistics are kept)."""
         with QMutexLocker(self.mutex):
             self.cache.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count, byte usage and hit/miss/eviction counters."""
+        with QMutexLocker(self.mutex):
+            return {
+                "entries": len(self.cache),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class RotationMapCache:
+    """Precomputed (Z, X) sampling maps for Y-axis rotations.
+
+    The map for a given plane shape, angle and centre depends only on the
+    geometry, so it is shared across channels and across data updates of
+    the same display volume.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._maps = ByteBudgetCache(max_bytes)
+
+    @staticmethod
+    def _key(plane_shape, rotation_deg: float, center) -> Tuple:
+        # Round so slider values that differ only by float noise share a map
+        return (
+            tuple(int(n) for n in plane_shape),
+            round(float(rotation_deg), 6),
+            round(float(center[0]), 6),
+            round(float(center[2]), 6),
+        )
+
+    def get_map(self, plane_shape, rotation_deg: float, center) -> np.ndarray:
+        """Return input coordinates (2, Z, X) for each output (Z, X) pixel.
+
+        Matches ``ndimage.affine_transform`` with the rotation matrix from
+        ``Rotation.from_euler("y", rotation_deg)`` about ``center``.
+        """
+        key = self._key(plane_shape, rotation_deg, center)
+        coords = self._maps.get(key)
+        if coords is not None:
+            return coords
+
+        from scipy.spatial.transform import Rotation
+
+        # Same matrix/offset arithmetic (and summation order) as scipy's
+        # affine_transform, so sampled positions and edge handling agree.
+        rot_matrix = Rotation.from_euler("y", rotation_deg, degrees=True).as_matrix()
+        center = np.asarray(center, dtype=np.float64)
+        offset = center - rot_matrix @ center
+        zz, xx = np.meshgrid(
+            np.arange(plane_shape[0], dtype=np.float64),
+            np.arange(plane_shape[1], dtype=np.float64),
+            indexing="ij",
+        )
+        coords = np.stack(
+            [
+                (offset[0] + rot_matrix[0, 0] * zz) + rot_matrix[0, 2] * xx,
+                (offset[2] + rot_matrix[2, 0] * zz) + rot_matrix[2, 2] * xx,
+            ]
+        )
+        self._maps.put(key, coords)
+        return coords
+
+    def clear(self):
+        self._maps.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._maps.stats()
 
 
 class TransformManager(QObject):
@@ -389,8 +553,9 @@ class TransformManager(QObject):
     and receiving results via signals. Handles:
     - Thread pool management
     - Request queuing and prioritization
-    - Result caching with LRU eviction
-    - Request cancellation
+    - Result caching bounded by total bytes, with hit/miss statistics
+    - Reusable rotation coordinate maps shared across channels
+    - Cancellation of stale requests when a newer one arrives for a channel
     """
 
     # Signals
@@ -399,12 +564,19 @@ class TransformManager(QObject):
     transform_completed = pyqtSignal(str, int, object)  # request_id, channel_id, result
     transform_error = pyqtSignal(str, str)  # request_id, error_message
 
-    def __init__(self, max_workers: int = 2, cache_size: int = 10, parent=None):
+    def __init__(
+        self,
+        max_workers: int = 2,
+        cache_bytes: int = 512 * 1024**2,
+        map_cache_bytes: int = 256 * 1024**2,
+        parent=None,
+    ):
         """Initialize the transform manager.
 
         Args:
             max_workers: Maximum concurrent transform operations
-            cache_size: Maximum number of cached results
+            cache_bytes: Byte budget for cached transform results
+            map_cache_bytes: Byte budget for cached rotation coordinate maps
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -413,25 +585,126 @@ class TransformManager(QObject):
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(max_workers)
 
-        # Result cache
-        self.cache = LRUCache(max_size=cache_size)
+        # Result cache and reusable rotation maps
+        self.cache = ByteBudgetCache(max_bytes=cache_bytes)
+        self.rotation_maps = RotationMapCache(max_bytes=map_cache_bytes)
 
-        # Active workers (for cancellation)
-        self.active_workers: Dict[str, BaseTransformWorker] = {}
+        # Active workers (for cancellation): request_id -> (channel_id, worker)
+        self.active_workers: Dict[str, Tuple[int, BaseTransformWorker]] = {}
+        # Newest request per channel; only its result is emitted
+        self._latest_request: Dict[int, str] = {}
         self.workers_mutex = QMutex()
 
         # Request counter for unique IDs
         self._request_counter = 0
 
         logger.info(
-            f"TransformManager initialized with {max_workers} workers, cache size {cache_size}"
+            f"TransformManager initialized with {max_workers} workers, "
+            f"cache budget {cache_bytes / 1024**2:.0f} MB"
         )
 
+    def submit_rotation(
+        self,
+        channel_id: int,
+        volume: np.ndarray,
+        rotation_deg: float,
+        center_voxels: Optional[Tuple[float, float, float]] = None,
+        priority: int = 0,
+    ) -> str:
+        """Rotate ``volume`` about Y in the background.
+
+        Any still-pending rotation for the same channel is cancelled, so
+        scrubbing the rotation slider only computes the newest angle. The
+        worker serves repeated requests from the result cache; either way
+        only the channel's newest request is emitted.
+
+        Returns:
+            The request ID that ``transform_completed`` will carry.
+        """
+        if center_voxels is None:
+            center_voxels = tuple(np.array(volume.shape) / 2)
+
+        self._request_counter += 1
+        request_id = f"rotation_{channel_id}_{self._request_counter}"
+        self.cancel_channel(channel_id)
+
+        request = TransformRequest(
+            request_id=request_id,
+            transform_type="rotation",
+            channel_id=channel_id,
+            volume=volume,
+            parameters={
+                "rotation_deg": rotation_deg,
+                "center_voxels": center_voxels,
+            },
+            priority=priority,
+        )
+        worker = RotationTransformWorker(
+            request, map_cache=self.rotation_maps, result_cache=self.cache
+        )
+        # The manager owns the worker until it finishes so that cancel() and
+        # tryTake() never touch a runnable the pool has already deleted.
+        worker.setAutoDelete(False)
+        # Direct connections: bookkeeping runs on the worker thread, and the
+        # public signals are queued to GUI receivers by Qt as usual.
+        signals = worker.signals
+        signals.started.connect(
+            lambda rid: self.transform_started.emit(rid, channel_id),
+            Qt.DirectConnection,
+        )
+        signals.progress.connect(self.transform_progress, Qt.DirectConnection)
+        signals.completed.connect(
+            lambda rid, result: self._on_worker_completed(rid, channel_id, result),
+            Qt.DirectConnection,
+        )
+        signals.error.connect(self._on_worker_error, Qt.DirectConnection)
+        signals.cancelled.connect(self._forget_worker, Qt.DirectConnection)
+
+        with QMutexLocker(self.workers_mutex):
+            self.active_workers[request_id] = (channel_id, worker)
+            self._latest_request[channel_id] = request_id
+
+        self.thread_pool.start(worker, priority)
+        return request_id
+
+    def cancel_channel(self, channel_id: int):
+        """Cancel queued and running requests for one channel."""
+        with QMutexLocker(self.workers_mutex):
+            stale = [
+                (rid, worker)
+                for rid, (ch, worker) in self.active_workers.items()
+                if ch == channel_id
+            ]
+        for request_id, worker in stale:
+            worker.cancel()
+            # Not started yet: pull it from the queue so it never runs
+            if self.thread_pool.tryTake(worker):
+                self._forget_worker(request_id)
+
+    def _forget_worker(self, request_id: str):
+        with QMutexLocker(self.workers_mutex):
+            self.active_workers.pop(request_id, None)
+
+    def _on_worker_completed(self, request_id: str, channel_id: int, result):
+        self._forget_worker(request_id)
+        with QMutexLocker(self.workers_mutex):
+            is_latest = self._latest_request.get(channel_id) == request_id
+        if is_latest:
+            self.transform_completed.emit(request_id, channel_id, result)
+
+    def _on_worker_error(self, request_id: str, message: str):
+        self._forget_worker(request_id)
+        self.transform_error.emit(request_id, message)
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss and byte usage for the result and rotation-map caches."""
+        return {
+            "results": self.cache.stats(),
+            "rotation_maps": self.rotation_maps.stats(),
+        }
+
     def clear_cache(self):
-        """Clear the transform result cache."""
+        """Clear the transform result and rotation-map caches."""
         self.cache.clear()
+        self.rotation_maps.clear()
         logger.debug("Transform cache cleared")
-
-
-# Import json for cache key generation
-import json
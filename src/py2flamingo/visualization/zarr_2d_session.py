@@ -20,11 +20,18 @@ Session structures:
         ...
       rotation_1/
         ...
+
+Sessions are written by Zarr2DSessionWriter: images are compressed and
+written chunk-band by chunk-band on a thread pool, and ``session_metadata``
+is written last, once every dataset is on disk. A store without it is an
+unfinished save, which the loaders reject.
 """
 
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -47,39 +54,137 @@ if ZARR_AVAILABLE:
 DEFAULT_2D_CHUNK_SIZE = (512, 512)
 DEFAULT_COMPRESSOR = "zstd"
 DEFAULT_COMPRESSION_LEVEL = 3
+# Chunk-row bands compressed concurrently (Blosc releases the GIL)
+DEFAULT_WRITE_WORKERS = min(8, os.cpu_count() or 1)
 
 
-def _create_2d_dataset(group, name: str, data: np.ndarray):
-    """Create a chunked, compressed 2D dataset in a zarr group.
+def _create_2d_dataset(group, name: str, shape: Tuple[int, ...], dtype):
+    """Create an empty chunked, compressed 2D dataset in a zarr group.
 
     Handles zarr v2 vs v3 codec API differences.
     """
-    chunks = tuple(min(c, s) for c, s in zip(DEFAULT_2D_CHUNK_SIZE, data.shape))
+    chunks = tuple(min(c, s) for c, s in zip(DEFAULT_2D_CHUNK_SIZE, shape))
 
     if ZARR_3_AVAILABLE:
-        group.create_dataset(
+        return group.create_dataset(
             name,
-            shape=data.shape,
-            data=data,
+            shape=shape,
             chunks=chunks,
             compressors=BloscCodec(
                 cname=DEFAULT_COMPRESSOR,
                 clevel=DEFAULT_COMPRESSION_LEVEL,
             ),
-            dtype=data.dtype,
+            dtype=dtype,
         )
-    else:
-        group.create_dataset(
-            name,
-            shape=data.shape,
-            data=data,
-            chunks=chunks,
-            compressor=Blosc(
-                cname=DEFAULT_COMPRESSOR,
-                clevel=DEFAULT_COMPRESSION_LEVEL,
-            ),
-            dtype=data.dtype,
+    return group.create_dataset(
+        name,
+        shape=shape,
+        chunks=chunks,
+        compressor=Blosc(
+            cname=DEFAULT_COMPRESSOR,
+            clevel=DEFAULT_COMPRESSION_LEVEL,
+        ),
+        dtype=dtype,
+    )
+
+
+def _parent_group(root, key: str):
+    """Resolve "rotation_0/stitched_best_focus" to (rotation_0 group, name)."""
+    parts = key.split("/")
+    group = root
+    for part in parts[:-1]:
+        if part not in group:
+            group = group.create_group(part)
+        else:
+            group = group[part]
+    return group, parts[-1]
+
+
+def _write_band(array, image: np.ndarray, y0: int, y1: int) -> None:
+    """Write one chunk-aligned row band; bands never share a chunk."""
+    array[y0:y1] = image[y0:y1]
+
+
+class Zarr2DSessionWriter:
+    """Background, chunk-parallel writer for a 2D overview session.
+
+    Images can be added as soon as each one is ready (e.g. per rotation as it
+    finishes scanning); add() only creates the dataset and queues its row
+    bands, so it returns immediately. finish() waits for the data and then
+    commits ``session_metadata`` in a single attribute write.
+
+    Arrays passed to add() must not be modified until the session is finished.
+    """
+
+    def __init__(
+        self,
+        save_path: Path,
+        format_type: str,
+        max_workers: Optional[int] = None,
+    ):
+        if not ZARR_AVAILABLE:
+            raise RuntimeError("zarr not available. Install with: pip install zarr")
+
+        self.save_path = Path(save_path)
+        store = _create_zarr_store(str(self.save_path))
+        self._root = zarr.group(store=store, overwrite=True)
+        self._root.attrs["format_version"] = "1.0"
+        self._root.attrs["format_type"] = format_type
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_WRITE_WORKERS,
+            thread_name_prefix="zarr2d-write",
         )
+        self._futures: List[Future] = []
+        self._keys: List[str] = []
+
+    def add(self, key: str, image: Optional[np.ndarray]) -> None:
+        """Queue one image. Hierarchical keys create sub-groups."""
+        if image is None:
+            return
+        group, name = _parent_group(self._root, key)
+        array = _create_2d_dataset(group, name, image.shape, image.dtype)
+        band = array.chunks[0]
+        for y0 in range(0, image.shape[0], band):
+            self._futures.append(
+                self._pool.submit(_write_band, array, image, y0, y0 + band)
+            )
+        self._keys.append(key)
+        logger.debug(
+            f"Queued dataset '{key}': shape={image.shape}, dtype={image.dtype}"
+        )
+
+    @property
+    def progress(self) -> Tuple[int, int]:
+        """(bands written, bands queued)."""
+        return sum(f.done() for f in self._futures), len(self._futures)
+
+    def finish(self, metadata: Dict[str, Any]) -> Path:
+        """Wait for every dataset, then write the session metadata.
+
+        Raises:
+            Whatever a band write raised; the metadata is then never written.
+        """
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._pool.shutdown(wait=True)
+
+        self._root.attrs["session_metadata"] = metadata
+        logger.info(
+            f"2D zarr session saved: {self.save_path} ({len(self._keys)} datasets)"
+        )
+        return self.save_path
+
+    def finish_async(self, metadata: Dict[str, Any]) -> Future:
+        """finish() on a separate thread; the future resolves to the path."""
+        committer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="zarr2d-commit"
+        )
+        future = committer.submit(self.finish, metadata)
+        committer.shutdown(wait=False)
+        return future
 
 
 def save_2d_zarr_session(
@@ -105,43 +210,10 @@ def save_2d_zarr_session(
     Raises:
         RuntimeError: If zarr is not available.
     """
-    if not ZARR_AVAILABLE:
-        raise RuntimeError("zarr not available. Install with: pip install zarr")
-
-    save_path = Path(save_path)
-    store = _create_zarr_store(str(save_path))
-    root = zarr.group(store=store, overwrite=True)
-
-    # Write metadata to .zattrs
-    root.attrs["format_version"] = "1.0"
-    root.attrs["format_type"] = format_type
-    root.attrs["session_metadata"] = metadata
-
-    # Write each image as a dataset
+    writer = Zarr2DSessionWriter(save_path, format_type)
     for key, image in images_dict.items():
-        if image is None:
-            continue
-
-        # Handle hierarchical paths (e.g. "rotation_0/stitched_best_focus")
-        parts = key.split("/")
-        if len(parts) > 1:
-            # Ensure parent groups exist
-            group = root
-            for part in parts[:-1]:
-                if part not in group:
-                    group = group.create_group(part)
-                else:
-                    group = group[part]
-            dataset_name = parts[-1]
-        else:
-            group = root
-            dataset_name = key
-
-        _create_2d_dataset(group, dataset_name, image)
-        logger.debug(f"Saved dataset '{key}': shape={image.shape}, dtype={image.dtype}")
-
-    logger.info(f"2D zarr session saved: {save_path} ({len(images_dict)} datasets)")
-    return save_path
+        writer.add(key, image)
+    return writer.finish(metadata)
 
 
 def load_2d_zarr_session(
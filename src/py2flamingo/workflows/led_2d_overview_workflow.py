@@ -931,8 +931,7 @@ class LED2DOverviewWorkflow(QObject):
         try:
             if tracker is not None:
                 tracker.arm()
-            for axis, target in targets.items():
-                stage_service.move_to_position(axis, target)
+            stage_service.move_to_positions(targets)
             if tracker is not None:
                 tracker.wait_for_motion_complete(
                     timeout=max(0.0, deadline - time.monotonic()),
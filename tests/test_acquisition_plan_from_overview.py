@@ -358,3 +358,57 @@ class TestFootprintsThatMerelyTouch:
             0.0, 0.0, 2.0, 2.0, [_OverviewTile(2.0, 0.0, 5.0, 9.0)], 2.0, 2.0
         )
         assert (lo, hi, n) == (None, None, 0)
+
+
+class TestOverviewTileIndex:
+    """The bucketed index must give exactly what the per-tile scans give.
+
+    Planning queries it once per acquisition tile; any disagreement with
+    overlapping_overview_tiles / inherit_z_range would change which tiles are
+    kept and how deep they go.
+    """
+
+    @staticmethod
+    def _overview(nx=12, ny=9):
+        tiles = []
+        for i, (x, y) in enumerate(_grid(nx, ny)):
+            if i % 5 == 0:
+                tiles.append((x, y))  # no recorded Z, still covers ground
+            else:
+                tiles.append(_OverviewTile(x, y, 1.0 + i % 7, 3.0 + i % 11))
+        return tiles
+
+    def test_batch_queries_match_the_per_tile_scans(self):
+        from py2flamingo.utils.tile_geometry import (
+            OverviewTileIndex,
+            inherit_z_range,
+            overlapping_overview_tiles,
+        )
+
+        overview = self._overview()
+        index = OverviewTileIndex(overview, OVERVIEW_FOV, OVERVIEW_FOV)
+        positions = [
+            (1.0 + 0.37 * i, 10.5 + 0.41 * j) for i in range(70) for j in range(50)
+        ]
+        args = (OVERVIEW_FOV, SHEET_FOV_Y)
+
+        results = index.query_many(positions, *args)
+
+        assert len(index) == len(overview)
+        for (x, y), (covers, lo, hi, n) in zip(positions, results):
+            expected = overlapping_overview_tiles(
+                x, y, *args, overview, OVERVIEW_FOV, OVERVIEW_FOV
+            )
+            assert covers == expected
+            assert (lo, hi, n) == inherit_z_range(
+                x, y, *args, overview, OVERVIEW_FOV, OVERVIEW_FOV
+            )
+
+    def test_footprint_wider_than_the_overview_walks_occupied_cells(self):
+        from py2flamingo.utils.tile_geometry import OverviewTileIndex
+
+        overview = self._overview(3, 3)
+        index = OverviewTileIndex(overview, 0.0, 0.0)
+        covers, lo, hi, n = index.query(4.0, 13.0, 100.0, 100.0)
+        assert covers == 9
+        assert n == 7 and (lo, hi) == (1.0, 11.0)
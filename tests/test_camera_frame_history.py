@@ -0,0 +1,84 @@
+"""Zero-copy frame sharing between CameraService and CameraController.
+
+The receiver reads each frame straight into one buffer and wraps it in a
+read-only array. The controller's history and snapshot capture keep references
+to that array instead of copying it, and the history is bounded by bytes, not
+frame count. No hardware, no Qt event loop.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_camera_frame_history.py -q
+"""
+
+import socket
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from py2flamingo.controllers.camera_controller import CameraController
+from py2flamingo.services.camera_service import CameraService, FrameHistory
+
+
+def _frame(value, shape=(4, 8)):
+    image = np.full(shape, value, dtype=np.uint16)
+    image.flags.writeable = False
+    return image
+
+
+def test_history_is_bounded_by_bytes_and_keeps_newest():
+    history = FrameHistory(budget_bytes=3 * 64)  # three 4x8 uint16 frames
+    for n in range(5):
+        history.append(_frame(n), None, n)
+    assert len(history) == 3 and history.nbytes == 3 * 64
+    assert history.latest()[2] == 4
+
+    # A frame larger than the whole budget still replaces everything else
+    history.append(_frame(9, shape=(64, 64)), None, 5)
+    assert len(history) == 1 and history.latest()[2] == 5
+
+    history.clear()
+    assert history.latest() is None and history.nbytes == 0
+
+
+class _FakeCameraService:
+    def set_image_callback(self, cb):
+        self.callback = cb
+
+
+def test_controller_shares_frames_instead_of_copying():
+    service = _FakeCameraService()
+    controller = CameraController(service, history_budget_bytes=2 * 64)
+    header = SimpleNamespace(frame_number=0)
+
+    controller._capture_next_frame = True
+    first = _frame(1)
+    service.callback(first, header)
+    assert controller._captured_snapshot[0] is first
+    assert not controller._capture_next_frame
+
+    for value in (2, 3):
+        service.callback(_frame(value), header)
+    image, _, number = controller.get_latest_frame()
+    assert number == 3 and int(image[0, 0]) == 3
+    assert len(controller._frame_buffer) == 2
+    # The snapshot outlives the history entry it came from
+    assert int(controller._captured_snapshot[0][0, 0]) == 1
+
+
+def test_receive_exact_reads_across_partial_sends():
+    a, b = socket.socketpair()
+    payload = np.arange(5000, dtype=np.uint16).tobytes()
+    try:
+
+        def send():
+            for i in range(0, len(payload), 777):
+                b.sendall(payload[i : i + 777])
+            b.close()
+
+        t = threading.Thread(target=send)
+        t.start()
+        data = CameraService._receive_exact(None, a, len(payload))
+        t.join()
+        assert bytes(data) == payload
+        assert CameraService._receive_exact(None, a, 10) is None
+    finally:
+        a.close()
@@ -0,0 +1,147 @@
+"""Multi-command bursts.
+
+``ProtocolEncoder.encode_commands`` packs several commands into one buffer,
+``CommandClient.send_batch`` writes it with a single send and hands back one
+future per command, and the dispatcher resolves those futures as responses
+arrive (same-code responses in send order). ``StageService.move_to_positions``
+uses this to move several axes in one round trip. Runs over a local socket
+pair, no hardware.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_command_batch.py -q
+"""
+
+import socket
+import struct
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from py2flamingo.core.socket_reader import CommandClient, MessageDispatcher
+from py2flamingo.core.tcp_protocol import ProtocolEncoder
+from py2flamingo.services.stage_service import StageService
+
+SET_POSITION = 0x6005
+
+encoder = ProtocolEncoder()
+
+
+def _commands(n=3):
+    return [
+        {"code": SET_POSITION, "params": [0, 0, 0, axis, 0, 0, 1], "value": axis * 1.5}
+        for axis in range(1, n + 1)
+    ]
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk, "peer closed"
+        data += chunk
+    return data
+
+
+@pytest.fixture
+def client_and_server():
+    ours, theirs = socket.socketpair()
+    theirs.settimeout(5)
+    client = CommandClient(ours)
+    client.start()
+    yield client, theirs
+    client.stop()
+    ours.close()
+    theirs.close()
+
+
+def test_encode_commands_matches_individual_encoding():
+    commands = _commands()
+    batch = encoder.encode_commands(commands)
+
+    assert bytes(batch) == b"".join(encoder.encode_command(**c) for c in commands)
+    with pytest.raises(ValueError):
+        encoder.encode_commands([{"code": SET_POSITION, "params": [0] * 8}])
+
+
+def test_same_code_futures_resolve_in_send_order(client_and_server):
+    client, server = client_and_server
+    batch = encoder.encode_commands(_commands())
+    futures = client.send_batch(batch, [SET_POSITION] * 3)
+
+    echoed = _recv_exact(server, len(batch))
+    assert echoed == bytes(batch)
+    server.sendall(echoed)  # the server acknowledges with the command itself
+
+    responses = [f.result(timeout=5) for f in futures]
+    assert [r.int32_data0 for r in responses] == [1, 2, 3]
+    assert [r.value for r in responses] == [1.5, 3.0, 4.5]
+
+
+def test_cancelled_future_is_skipped():
+    dispatcher = MessageDispatcher()
+    first = dispatcher.register_pending_future(SET_POSITION)
+    second = dispatcher.register_pending_future(SET_POSITION)
+    first.cancel()
+
+    message = SimpleNamespace(command_code=SET_POSITION, is_unsolicited=False)
+    dispatcher.dispatch(message)
+
+    assert second.result(timeout=0) is message
+
+
+def test_closing_fails_outstanding_futures(client_and_server):
+    client, server = client_and_server
+    futures = client.send_batch(
+        encoder.encode_commands(_commands(2)), [SET_POSITION, None]
+    )
+    assert futures[1] is None
+
+    server.close()
+    with pytest.raises(ConnectionError):
+        futures[0].result(timeout=5)
+
+
+class _BatchConnection:
+    """Connection double routing bursts through a real CommandClient."""
+
+    has_async_reader = True
+
+    def __init__(self, client):
+        self.encoder = encoder
+        self.client = client
+        self.writes = []
+
+    def is_connected(self):
+        return True
+
+    def send_command_batch(self, batch, expected_response_codes):
+        self.writes.append(bytes(batch))
+        return self.client.send_batch(batch, expected_response_codes)
+
+
+def test_move_to_positions_sends_one_burst(client_and_server):
+    client, server = client_and_server
+    connection = _BatchConnection(client)
+    targets = {4: 90.0, 1: 10.0, 2: 20.0, 3: 30.0}
+
+    echo = threading.Thread(
+        target=lambda: server.sendall(_recv_exact(server, 128 * len(targets)))
+    )
+    echo.start()
+    StageService(connection).move_to_positions(targets)
+    echo.join()
+
+    assert len(connection.writes) == 1
+    sent = connection.writes[0]
+    axes = [struct.unpack_from("<i", sent, i + 24)[0] for i in range(0, 512, 128)]
+    values = [struct.unpack_from("<d", sent, i + 40)[0] for i in range(0, 512, 128)]
+    assert axes == [4, 1, 2, 3]
+    assert values == [90.0, 10.0, 20.0, 30.0]
+
+
+def test_move_to_positions_raises_when_the_connection_drops(client_and_server):
+    client, server = client_and_server
+    server.close()
+
+    with pytest.raises(RuntimeError, match="Failed to move stage axis 1"):
+        StageService(_BatchConnection(client)).move_to_positions({1: 1.0, 2: 2.0})
@@ -0,0 +1,147 @@
+"""
+Tests for incremental napari layer updates.
+
+The voxel storage reports the display-voxel box that changed since the viewer
+last looked (``take_display_changes``); SampleView then rewrites only that box
+in the layer's existing buffer, skips unchanged volumes, and falls back to a
+full copy whenever the buffer cannot be reused.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from py2flamingo.views.sample_view import SampleView
+from py2flamingo.visualization.dual_resolution_storage import (
+    DualResolutionConfig,
+    DualResolutionVoxelStorage,
+)
+
+FULL = (slice(0, 80), slice(0, 80), slice(0, 80))
+
+
+@pytest.fixture
+def storage():
+    config = DualResolutionConfig(
+        storage_voxel_size=(5, 5, 5),
+        display_voxel_size=(50, 50, 50),
+        sample_region_radius=1000,
+        chamber_dimensions=(4000, 4000, 4000),
+        chamber_origin=(0, 0, 0),
+        sample_region_center=(2000, 2000, 2000),
+    )
+    return DualResolutionVoxelStorage(config)
+
+
+def _write(storage, lo_um, hi_um, value, n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(lo_um, hi_um, size=(n, 3))
+    storage.update_storage(
+        0, coords, np.full(n, value, dtype=np.uint16), 1.0, update_mode="maximum"
+    )
+
+
+def _changed_box(before, after):
+    idx = np.argwhere(before != after)
+    return idx.min(axis=0), idx.max(axis=0) + 1
+
+
+def _contains(region, box):
+    lo, hi = box
+    return all(s.start <= a and b <= s.stop for s, a, b in zip(region, lo, hi))
+
+
+class TestStorageChanges:
+    def test_new_storage_reports_full_change_once(self, storage):
+        assert storage.take_display_changes(0) == FULL
+        assert storage.take_display_changes(0) is None
+
+    def test_write_inside_region_reports_only_its_blocks(self, storage):
+        storage.take_display_changes(0)
+        _write(storage, 1500, 2500, 100)
+        storage.get_display_volume(0)
+        # First build anchors the block grid: reported as a full change
+        assert storage.take_display_changes(0) == FULL
+        before = storage.get_display_volume(0).copy()
+
+        _write(storage, 1900, 2000, 4000, n=500, seed=1)
+        after = storage.get_display_volume(0)
+        region = storage.take_display_changes(0)
+
+        assert region is not None and region != FULL
+        assert _contains(region, _changed_box(before, after))
+        assert all(s.stop - s.start <= 4 for s in region)
+        assert storage.take_display_changes(0) is None
+
+    def test_write_that_moves_region_corner_is_full(self, storage):
+        _write(storage, 1500, 2500, 100)
+        storage.get_display_volume(0)
+        storage.take_display_changes(0)
+
+        _write(storage, 1000, 1100, 200, n=200, seed=2)
+        storage.get_display_volume(0)
+        assert storage.take_display_changes(0) == FULL
+
+    def test_external_store_is_full(self, storage):
+        storage.take_display_changes(1)
+        storage.store_display_volume(1, np.ones(storage.display_dims, np.uint16))
+        assert storage.take_display_changes(1) == FULL
+
+
+class _FakeLayer:
+    def __init__(self, data):
+        self.data = data
+        self.refreshes = 0
+
+    def refresh(self, extent=True):
+        self.refreshes += 1
+
+
+def _view(layer):
+    return SimpleNamespace(
+        channel_layers={0: layer},
+        _pushed_layer_data={},
+        logger=logging.getLogger("test"),
+    )
+
+
+class TestPushChannelVolume:
+    def test_partial_then_skip_then_full(self):
+        layer = _FakeLayer(np.zeros((4, 4, 4), np.uint16))
+        view = _view(layer)
+        volume = np.ones((4, 4, 4), np.uint16)
+
+        # Unknown buffer: full copy
+        assert SampleView._push_channel_volume(view, 0, volume, None)
+        buffer = layer.data
+        assert buffer is not volume and (buffer == 1).all()
+
+        # Changed sub-box: written in place, same buffer, no reassignment
+        volume[1:2, 1:3, 0:1] = 7
+        region = (slice(1, 2), slice(1, 3), slice(0, 1))
+        assert SampleView._push_channel_volume(view, 0, volume, region)
+        assert layer.data is buffer and layer.refreshes == 1
+        np.testing.assert_array_equal(buffer, volume)
+
+        # Nothing changed: skipped
+        assert not SampleView._push_channel_volume(view, 0, volume, None)
+
+        # Moved stage (different transform): full copy
+        assert SampleView._push_channel_volume(view, 0, volume, None, ("moved",))
+        assert layer.data is not buffer
+
+    def test_reassigned_or_retyped_layer_gets_full_copy(self):
+        layer = _FakeLayer(None)
+        view = _view(layer)
+        SampleView._push_channel_volume(view, 0, np.ones((2, 2, 2), np.uint16), None)
+
+        layer.data = np.zeros((2, 2, 2), np.uint16)  # e.g. "Clear Data"
+        volume = np.full((2, 2, 2), 3, np.uint16)
+        SampleView._push_channel_volume(view, 0, volume, FULL)
+        np.testing.assert_array_equal(layer.data, volume)
+
+        small = np.full((2, 2, 2), 9, np.uint8)
+        SampleView._push_channel_volume(view, 0, small, FULL)
+        assert layer.data.dtype == np.uint8 and layer.refreshes == 0
@@ -0,0 +1,128 @@
+"""
+Tests for the streaming reducer that loads large arrays onto the display grid.
+
+``reduce_to_display_grid`` walks the source a Z slab at a time and block-
+reduces it (mean or max) into the display volume, collecting the source range
+in the same pass. ``load_test_data`` memory-maps .npy / TIFF input and streams
+it through the reducer instead of zooming the whole array in memory.
+"""
+
+import numpy as np
+import pytest
+import tifffile
+
+from py2flamingo.visualization.session_manager import (
+    load_test_data,
+    reduce_to_display_grid,
+)
+
+
+class _CountingSource:
+    """Array-like that records which Z slabs were read."""
+
+    def __init__(self, data):
+        self._data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.reads = []
+
+    def __getitem__(self, key):
+        self.reads.append((key.start, key.stop))
+        return self._data[key]
+
+
+class _FakeVoxelStorage:
+    def __init__(self, display_dims, num_channels=2):
+        self.display_dims = display_dims
+        self.num_channels = num_channels
+        self.display_cache = {}
+        self.display_dirty = {}
+        self.channel_max_values = {}
+
+    def store_display_volume(self, channel_id, volume):
+        self.display_cache[channel_id] = np.asarray(volume).copy()
+
+
+def _brute_force(source, target_shape, reduce):
+    """Per-voxel reference over the same bins the reducer uses."""
+    bins = []
+    for s, t in zip(source.shape, target_shape):
+        starts = (np.arange(t) * s) // t
+        ends = np.maximum(np.append(starts[1:], s), starts + 1)
+        bins.append(list(zip(starts, ends)))
+    out = np.zeros(target_shape, dtype=np.float64)
+    for k, (z0, z1) in enumerate(bins[0]):
+        for j, (y0, y1) in enumerate(bins[1]):
+            for i, (x0, x1) in enumerate(bins[2]):
+                block = source[z0:z1, y0:y1, x0:x1]
+                out[k, j, i] = block.mean() if reduce == "mean" else block.max()
+    return out
+
+
+@pytest.mark.parametrize("reduce", ["mean", "max"])
+def test_integer_ratio_matches_block_reduction(reduce):
+    rng = np.random.default_rng(0)
+    source = rng.integers(0, 4000, size=(8, 12, 16), dtype=np.uint16)
+    grid, (lo, hi) = reduce_to_display_grid(source, (4, 3, 4), reduce)
+
+    blocks = source.reshape(4, 2, 3, 4, 4, 4)
+    expected = getattr(blocks, reduce)(axis=(1, 3, 5))
+    np.testing.assert_allclose(grid, expected, rtol=1e-5)
+    assert (lo, hi) == (source.min(), source.max())
+    assert grid.dtype == (np.float32 if reduce == "mean" else np.uint16)
+
+
+@pytest.mark.parametrize("reduce", ["mean", "max"])
+def test_uneven_and_upsampled_axes(reduce):
+    rng = np.random.default_rng(1)
+    source = rng.random((7, 5, 11)).astype(np.float32)
+    # Z and X shrink by a non-integer ratio; Y is upsampled (nearest)
+    target = (3, 9, 4)
+    grid, _ = reduce_to_display_grid(source, target, reduce, slab_bytes=1)
+    np.testing.assert_allclose(grid, _brute_force(source, target, reduce), rtol=1e-5)
+
+
+def test_streams_one_slab_at_a_time():
+    source = _CountingSource(np.ones((40, 8, 8), dtype=np.uint16))
+    plane = 8 * 8 * 2
+    grid, _ = reduce_to_display_grid(source, (5, 4, 4), slab_bytes=6 * plane)
+
+    assert all(stop - start <= 6 for start, stop in source.reads)
+    assert sum(stop - start for start, stop in source.reads) == 40
+    assert np.allclose(grid, 1.0)
+
+
+def test_load_test_data_normalizes_against_source_range(tmp_path):
+    rng = np.random.default_rng(2)
+    source = rng.random((2, 10, 20, 20)).astype(np.float32) * 5.0 - 1.0
+    path = tmp_path / "vol.npy"
+    np.save(path, source)
+
+    storage = _FakeVoxelStorage((5, 10, 10))
+    assert load_test_data(path, storage)
+
+    for ch in range(2):
+        out = storage.display_cache[ch]
+        assert out.dtype == np.uint16 and out.shape == (5, 10, 10)
+        mean = source[ch].reshape(5, 2, 10, 2, 10, 2).mean(axis=(1, 3, 5))
+        lo, hi = source[ch].min(), source[ch].max()
+        expected = ((mean - lo) / (hi - lo) * 65535).astype(np.uint16)
+        assert np.abs(out.astype(int) - expected.astype(int)).max() <= 1
+        assert storage.display_dirty[ch] is False
+
+
+def test_load_compressed_tiff_page_by_page(tmp_path):
+    source = np.arange(6 * 8 * 8, dtype=np.uint16).reshape(6, 8, 8)
+    path = tmp_path / "stack.tif"
+    tifffile.imwrite(
+        path,
+        source,
+        compression="zlib",
+        photometric="minisblack",
+        metadata={"axes": "ZYX"},
+    )
+
+    storage = _FakeVoxelStorage((3, 4, 4))
+    assert load_test_data(path, storage, reduce="max")
+    expected = source.reshape(3, 2, 4, 2, 4, 2).max(axis=(1, 3, 5))
+    np.testing.assert_array_equal(storage.display_cache[0], expected)
@@ -0,0 +1,141 @@
+"""Adaptive live display rate.
+
+The display timer reports each tick to DisplayRateGovernor; late ticks (GUI
+event loop behind) or a high share of time spent rendering lower the rate,
+and it climbs back to the configured maximum once the load is gone. Views
+skip rendering while hidden or minimized and when handed a frame they
+already show. Driven by a fake clock, no event loop.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_display_rate_governor.py -q
+"""
+
+import numpy as np
+
+from py2flamingo.controllers.camera_controller import CameraController
+from py2flamingo.controllers.display_rate_governor import DisplayRateGovernor
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(governor, clock, seconds, tick_period, render_s=0.0):
+    """Tick every ``tick_period`` for ``seconds``, rendering ``render_s`` each."""
+    changes = []
+    end = clock.now + seconds
+    while clock.now < end:
+        clock.now += tick_period
+        if render_s:
+            governor.record_render("view", render_s)
+        interval = governor.tick()
+        if interval is not None:
+            changes.append(interval)
+    return changes
+
+
+def test_late_ticks_lower_the_rate_to_what_the_loop_delivers():
+    clock = _Clock()
+    governor = DisplayRateGovernor(max_fps=30, min_fps=2, clock=clock)
+
+    # The event loop only gets to the timer every 200 ms (5 FPS)
+    changes = _run(governor, clock, seconds=10, tick_period=0.2)
+
+    assert changes and changes == sorted(changes)
+    assert 5 <= governor.rate_fps < 10
+    assert _run(governor, clock, seconds=10, tick_period=0.2) == []  # settled
+
+
+def test_rate_never_drops_below_the_floor():
+    clock = _Clock()
+    governor = DisplayRateGovernor(max_fps=30, min_fps=5, clock=clock)
+    _run(governor, clock, seconds=60, tick_period=1.0)
+    assert governor.rate_fps == 5 and governor.interval_ms == 200
+
+
+def test_render_load_lowers_the_rate_and_it_recovers():
+    clock = _Clock()
+    governor = DisplayRateGovernor(max_fps=30, min_fps=2, clock=clock)
+
+    # Ticks on time, but 25 ms of rendering per 33 ms tick
+    _run(governor, clock, seconds=3, tick_period=1 / 30, render_s=0.025)
+    lowered = governor.rate_fps
+    assert lowered < 30
+
+    # Load gone: climbs back to the configured maximum, never past it
+    _run(governor, clock, seconds=30, tick_period=1 / 30)
+    assert governor.rate_fps == 30
+
+    stats = governor.stats()
+    assert stats["rate_fps"] == 30
+    assert abs(stats["views"]["view"]["mean_render_ms"] - 25.0) < 1e-9
+
+
+def test_steady_rate_when_keeping_up():
+    clock = _Clock()
+    governor = DisplayRateGovernor(max_fps=30, clock=clock)
+    assert _run(governor, clock, seconds=5, tick_period=1 / 30, render_s=0.002) == []
+
+
+class _Window:
+    def __init__(self):
+        self.minimized = False
+
+    def isMinimized(self):
+        return self.minimized
+
+
+class _Widget:
+    def __init__(self):
+        self.visible = True
+        self._window = _Window()
+
+    def isVisible(self):
+        return self.visible
+
+    def window(self):
+        return self._window
+
+
+def test_hidden_minimized_and_repeated_frames_are_skipped():
+    governor = DisplayRateGovernor()
+    widget = _Widget()
+    governor.register("live", widget)
+    a, b, c = (np.zeros((2, 2)) for _ in range(3))
+
+    assert governor.should_render("live", a)
+    assert not governor.should_render("live", a)  # already shown
+    widget.visible = False
+    assert not governor.should_render("live", b)
+    widget.visible = True
+    widget._window.minimized = True
+    assert not governor.should_render("live", c)
+    widget._window.minimized = False
+    assert governor.should_render("live", c)
+
+    with governor.render("live"):
+        pass
+    views = governor.stats()["views"]["live"]
+    assert views["skipped"] == 3 and views["rendered"] == 1
+
+
+class _FakeCameraService:
+    def set_image_callback(self, cb):
+        pass
+
+    def get_latest_frame(self, clear_buffer=True):
+        return None
+
+
+def test_controller_applies_the_governed_interval():
+    controller = CameraController(_FakeCameraService())
+    controller.set_max_display_fps(20)
+    assert controller.display_governor.max_fps == 20
+    assert controller._display_timer_interval_ms == 50
+
+    controller.display_governor.tick = lambda: 125
+    controller._pull_and_display_frame()
+    assert controller._display_timer.interval() == 125
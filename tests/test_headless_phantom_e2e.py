@@ -108,6 +108,62 @@ class TestHeadlessIOLoaders(unittest.TestCase):
             with self.assertRaises(ValueError):
                 load_volumes(p)
 
+    def test_lazy_npy_channels_are_memmap_views(self):
+        with tempfile.TemporaryDirectory() as d:
+            arr = np.arange(4 * 6 * 8 * 8, dtype=np.uint16).reshape(4, 6, 8, 8)
+            p = Path(d) / "czyx.npy"
+            np.save(p, arr)
+            vols = load_volumes(p, lazy=True, z_range=(2, 5))
+            self.assertEqual(sorted(vols), [0, 1, 2, 3])
+            for c, v in vols.items():
+                self.assertIsInstance(v, np.memmap)
+                np.testing.assert_array_equal(v, arr[c, 2:5])
+            del vols
+
+            eager = load_volumes(p, channel=2)
+            self.assertNotIsInstance(eager[2], np.memmap)
+            np.testing.assert_array_equal(eager[2], arr[2])
+
+    def test_lazy_tiff_hyperstack_and_compressed_fallback(self):
+        with tempfile.TemporaryDirectory() as d:
+            arr = np.arange(2 * 3 * 2 * 4 * 5, dtype=np.uint16).reshape(2, 3, 2, 4, 5)
+            p = Path(d) / "h.tif"
+            tifffile.imwrite(p, arr, imagej=True, metadata={"axes": "TZCYX"})
+            vols = load_volumes(p, lazy=True)
+            self.assertIsInstance(vols[1], np.memmap)
+            np.testing.assert_array_equal(vols[1], arr[0, :, 1])
+            del vols
+
+            c = Path(d) / "c.tif"
+            tifffile.imwrite(
+                c,
+                arr[0, :, 0],
+                compression="zlib",
+                photometric="minisblack",
+                metadata={"axes": "ZYX"},
+            )
+            vols = load_volumes(c, lazy=True)
+            np.testing.assert_array_equal(vols[0], arr[0, :, 0])
+
+    def test_lazy_zarr_reads_channel_on_first_use(self):
+        import zarr
+
+        from py2flamingo.pipeline.headless_services import InMemoryVoxelStorage
+
+        with tempfile.TemporaryDirectory() as d:
+            arr = np.arange(3 * 4 * 6 * 6, dtype=np.uint16).reshape(3, 4, 6, 6)
+            p = Path(d) / "v.zarr"
+            root = zarr.open_group(str(p), mode="w")
+            root.create_array("0", data=arr, chunks=(1, 2, 6, 6))
+            vols = load_volumes(p, lazy=True)
+            self.assertFalse(isinstance(vols[1], np.ndarray))
+
+            storage = InMemoryVoxelStorage(vols)
+            vol = storage.get_display_volume(1)
+            self.assertIsInstance(vol, np.ndarray)
+            np.testing.assert_array_equal(vol, arr[1])
+            self.assertIs(storage.get_display_volume(1), vol)
+
 
 class TestPhantomPipelineE2E(unittest.TestCase):
     """The full file → build → run → assert loop."""
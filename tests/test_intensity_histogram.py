@@ -0,0 +1,153 @@
+"""Histogram-backed auto-contrast.
+
+IntensityHistogram answers the percentile, max and top-N queries auto-contrast
+used to compute with full scans, exactly for uint8/uint16 data. The voxel
+storage builds one per display cache on first query, updates it in place as
+merged tiles rewrite blocks of the cache, and drops it when the whole cache is
+replaced, so auto-contrast on a channel that is still acquiring is a lookup.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_intensity_histogram.py -q
+"""
+
+import numpy as np
+import pytest
+
+from py2flamingo.utils.intensity_histogram import IntensityHistogram
+from py2flamingo.visualization.dual_resolution_storage import (
+    DualResolutionConfig,
+    DualResolutionVoxelStorage,
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    values = rng.gamma(2.0, 400.0, size=(256, 300)).astype(np.uint16)
+    values[:40] = 0
+    return values
+
+
+@pytest.mark.parametrize("q", [0, 5, 50, 99, 99.5, 99.9, 100])
+def test_percentiles_match_numpy(frame, q):
+    hist = IntensityHistogram.from_array(frame)
+    assert hist.percentile(q) == pytest.approx(np.percentile(frame, q), abs=1e-9)
+    nonzero = frame[frame > 0]
+    assert hist.percentile(q, ignore_zero=True) == pytest.approx(
+        np.percentile(nonzero, q), abs=1e-9
+    )
+
+
+def test_extremes_counts_and_top_mean_match_numpy(frame):
+    hist = IntensityHistogram.from_array(frame)
+    flat = frame.ravel()
+
+    assert hist.total == flat.size
+    assert (hist.min(), hist.max()) == (0, int(flat.max()))
+    assert hist.min(ignore_zero=True) == int(flat[flat > 0].min())
+    assert hist.count_at_least(1000) == int(np.sum(flat >= 1000))
+    assert hist.count_above(999.5) == int(np.sum(flat > 999.5))
+
+    top = np.partition(flat, -500)[-500:]
+    assert hist.mean_of_top(500) == pytest.approx(float(top.mean()))
+    assert hist.mean_of_top(10**9) == pytest.approx(float(flat.mean()))
+
+
+def test_empty_and_non_integer_input():
+    empty = IntensityHistogram()
+    assert (empty.max(), empty.percentile(99), empty.mean_of_top(5)) == (0, 0.0, 0.0)
+
+    floats = np.array([-3.0, 1.4, 1.6, 70000.0])
+    assert not IntensityHistogram.supports(floats)
+    hist = IntensityHistogram.from_array(floats)
+    assert np.flatnonzero(hist.counts).tolist() == [0, 1, 2, 65535]
+
+
+@pytest.fixture
+def storage():
+    config = DualResolutionConfig(
+        storage_voxel_size=(5, 5, 5),
+        display_voxel_size=(50, 50, 50),
+        sample_region_radius=1000,
+        chamber_dimensions=(4000, 4000, 4000),
+        chamber_origin=(0, 0, 0),
+        sample_region_center=(2000, 2000, 2000),
+    )
+    return DualResolutionVoxelStorage(config)
+
+
+def _write(storage, value, n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(1500, 2500, size=(n, 3))
+    storage.update_storage(
+        0, coords, np.full(n, value, dtype=np.uint16), 1.0, update_mode="maximum"
+    )
+
+
+def _assert_matches_cache(storage, hist):
+    np.testing.assert_array_equal(
+        hist.counts,
+        np.bincount(storage.display_cache[0].ravel(), minlength=hist.BINS),
+    )
+
+
+def test_storage_histogram_tracks_the_display_cache(storage, monkeypatch):
+    _write(storage, 800)
+    counted = []
+    from_array = IntensityHistogram.from_array
+
+    def counting(values):
+        counted.append(values.shape)
+        return from_array(values)
+
+    monkeypatch.setattr(IntensityHistogram, "from_array", counting)
+
+    # Rebuilding the display does not count it; the first query does
+    storage.downsample_to_display(0)
+    assert counted == []
+    first = storage.intensity_histogram(0)
+    _assert_matches_cache(storage, first)
+
+    # Reused while the cache is unchanged: no rescan
+    assert storage.intensity_histogram(0) is first
+    assert len(counted) == 1
+
+    # Any write drops it; the next query counts the new cache
+    volume = np.zeros_like(storage.display_cache[0])
+    volume[10:20, 10:20, 10:20] = 1200
+    storage.store_display_volume(0, volume)
+    rebuilt = storage.intensity_histogram(0)
+    assert rebuilt is not first
+    _assert_matches_cache(storage, rebuilt)
+    assert storage.intensity_histogram(0) is rebuilt
+
+
+def test_region_write_updates_the_histogram_in_place(storage, monkeypatch):
+    _write(storage, 800)
+    storage.downsample_to_display(0)
+    before = storage.intensity_histogram(0)
+
+    # New tile data inside the occupied region: only its blocks are rewritten
+    rng = np.random.default_rng(1)
+    coords = rng.uniform(1900, 2100, size=(200, 3))
+    storage.update_storage(
+        0, coords, np.full(200, 3000, dtype=np.uint16), 1.0, update_mode="maximum"
+    )
+    whole = storage.display_cache[0].shape
+    counted = []
+    from_array = IntensityHistogram.from_array
+
+    def counting(values):
+        counted.append(values.shape)
+        return from_array(values)
+
+    monkeypatch.setattr(IntensityHistogram, "from_array", counting)
+    storage.downsample_to_display(0)
+    after = storage.intensity_histogram(0)
+
+    assert after is not before
+    assert counted and whole not in counted  # never the whole cache
+    monkeypatch.undo()
+    np.testing.assert_array_equal(
+        after.counts, IntensityHistogram.from_array(storage.display_cache[0]).counts
+    )
+    assert storage.channel_max_values[0] == after.max()
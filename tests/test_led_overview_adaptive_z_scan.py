@@ -305,6 +305,9 @@ class _NullStage:
     def move_to_position(self, *a, **k):
         return True
 
+    def move_to_positions(self, targets):
+        pass
+
 
 def _run_scan_loop(monkeypatch, config, sample, grid=(3, 3)):
     """Run the real ``_scan_tiles_continuous`` with the hardware stubbed out.
@@ -42,6 +42,10 @@ class FakeStage:
         self._target[axis] = position_mm
         self._polls = 0  # in transit
 
+    def move_to_positions(self, targets):
+        for axis, val in targets.items():
+            self.move_to_position(axis, val)
+
     def get_axis_position(self, axis):
         self._polls += 1
         if self._polls >= self._moves_to_arrive:
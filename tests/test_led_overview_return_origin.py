@@ -41,6 +41,10 @@ class _FakeStageService:
     def move_to_position(self, axis, val):
         self.moves.append((axis, val))
 
+    def move_to_positions(self, targets):
+        for axis, val in targets.items():
+            self.move_to_position(axis, val)
+
 
 class _FakeSignal:
     def __init__(self):
@@ -22,6 +22,8 @@ from py2flamingo.utils.limited_acquisition import (  # noqa: E402
     plan_halfrotate_split,
     plan_multiview_acquisition,
     plan_multiview_sectors,
+    rotate_xz_array,
+    sector_membership,
     sector_width_deg,
 )
 
@@ -243,5 +245,97 @@ class TestPlanMultiviewAcquisition(unittest.TestCase):
         self.assertAlmostEqual(p180[0].x, 2.0, places=6)
 
 
+def _per_tile_assignment(tiles_xz, n, center, good, start, overlap, sign):
+    """The original per-tile, per-sector rule the array path must reproduce."""
+    import math
+
+    def wrap(a):
+        a = math.fmod(a, 360.0)
+        return a + 360.0 if a <= -180.0 else a - 360.0 if a > 180.0 else a
+
+    plans = plan_multiview_sectors(n, good, start, overlap, sign)
+    limit = plans[0].sector_half_width_deg + overlap
+    result = {k: [] for k in range(n)}
+    for t_idx, (x, z) in enumerate(tiles_xz):
+        dx, dz = x - center[0], z - center[1]
+        if abs(dx) < 1e-9 and abs(dz) < 1e-9:
+            for k in range(n):
+                result[k].append(t_idx)
+            continue
+        phi = math.degrees(math.atan2(dz, dx))
+        for k, plan in enumerate(plans):
+            if abs(wrap(phi - plan.sector_center_deg)) <= limit + 1e-9:
+                result[k].append(t_idx)
+    return result
+
+
+class TestArrayPlanning(unittest.TestCase):
+    def _grid(self, n_side=60):
+        import numpy as np
+
+        # Regular grid through the center: many tiles exactly on sector boundaries
+        xs = np.linspace(-3.0, 3.0, n_side + 1)
+        gx, gz = np.meshgrid(xs, xs)
+        return np.column_stack([gx.ravel(), gz.ravel()])
+
+    def test_assignment_identical_to_per_tile_rule(self):
+        tiles = self._grid()
+        as_tuples = [tuple(t) for t in tiles.tolist()]
+        for n in (2, 3, 4, 8):
+            for overlap in (0.0, 7.5):
+                for good, start, sign in ((45.0, 0.0, 1.0), (0.0, 30.0, -1.0)):
+                    args = (n, (0.0, 0.0), good, start, overlap, sign)
+                    self.assertEqual(
+                        assign_tiles_to_angles(as_tuples, *args),
+                        _per_tile_assignment(as_tuples, *args),
+                        f"n={n} overlap={overlap} good={good} sign={sign}",
+                    )
+
+    def test_membership_accepts_xz_or_xyz(self):
+        import numpy as np
+
+        xz = self._grid(10)
+        xyz = np.column_stack([xz[:, 0], np.full(len(xz), 5.0), xz[:, 1]])
+        a = sector_membership(xz, 4, (0.5, -0.5), overlap_deg=5.0)
+        b = sector_membership(xyz, 4, (0.5, -0.5), overlap_deg=5.0)
+        self.assertEqual(a.shape, (len(xz), 4))
+        self.assertTrue((a == b).all())
+        with self.assertRaises(ValueError):
+            sector_membership(np.zeros((3, 5)), 4, (0.0, 0.0))
+
+    def test_rotation_matches_per_point_formula(self):
+        import math
+
+        import numpy as np
+
+        x = np.array([1.0, -2.0, 0.3])
+        z = np.array([0.0, 4.0, -1.1])
+        angles = [0.0, 90.0, -135.0]
+        xr, zr = rotate_xz_array(x, z, 0.5, 1.5, angles)
+        self.assertEqual(xr.shape, (3, 3))
+        for i in range(3):
+            for k, angle in enumerate(angles):
+                a = math.radians(angle)
+                dx, dz = x[i] - 0.5, z[i] - 1.5
+                self.assertAlmostEqual(
+                    xr[i, k], 0.5 + dx * math.cos(a) + dz * math.sin(a)
+                )
+                self.assertAlmostEqual(
+                    zr[i, k], 1.5 - dx * math.sin(a) + dz * math.cos(a)
+                )
+
+    def test_plan_order_is_angle_major_source_minor(self):
+        tiles = [(x, 5.0, z, z - 0.5, z + 0.5) for x, z in self._grid(8).tolist()]
+        plan = plan_multiview_acquisition(tiles, 4, (0.0, 0.0), overlap_deg=10.0)
+        expected = _per_tile_assignment(
+            [(t[0], t[2]) for t in tiles], 4, (0.0, 0.0), 45.0, 0.0, 10.0, 1.0
+        )
+        self.assertEqual(
+            [(p.angle_index, p.source_index) for p in plan],
+            [(k, i) for k in range(4) for i in expected[k]],
+        )
+        self.assertEqual(plan_multiview_acquisition([], 4, (0.0, 0.0)), [])
+
+
 if __name__ == "__main__":
     unittest.main()
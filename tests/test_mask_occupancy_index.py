@@ -0,0 +1,55 @@
+"""MaskOccupancyIndex must answer tile-window queries exactly like a mask scan.
+
+generate_tile_profile queries the index once per tile per angle instead of
+slicing the 3D mask each time; any disagreement with mask_z_profile_at_xy
+would silently change a tile's Z range or drop a tile.
+
+Run: python3 -m pytest tests/test_mask_occupancy_index.py -q
+"""
+
+import numpy as np
+import pytest
+
+from py2flamingo.utils.acquisition_profile_generator import (
+    MaskOccupancyIndex,
+    mask_z_profile_at_xy,
+)
+
+
+@pytest.fixture
+def sparse_mask():
+    rng = np.random.default_rng(3)
+    mask = rng.random((24, 50, 40)) > 0.995
+    mask[4:9, 10:14, 30:35] = True
+    return mask
+
+
+def test_window_queries_match_mask_scan(sparse_mask):
+    index = MaskOccupancyIndex(sparse_mask)
+    rng = np.random.default_rng(7)
+    for _ in range(300):
+        yc, xc = int(rng.integers(-5, 55)), int(rng.integers(-5, 45))
+        hy, hx = int(rng.integers(0, 8)), int(rng.integers(0, 8))
+        assert index.z_extent(yc, xc, hy, hx) == mask_z_profile_at_xy(
+            sparse_mask, yc, xc, hy, hx
+        )
+
+
+def test_bounding_box_matches_argwhere(sparse_mask):
+    lo, hi = MaskOccupancyIndex(sparse_mask).bounding_box()
+    nonzero = np.argwhere(sparse_mask)
+    np.testing.assert_array_equal(lo, nonzero.min(axis=0))
+    np.testing.assert_array_equal(hi, nonzero.max(axis=0))
+
+
+def test_empty_mask():
+    index = MaskOccupancyIndex(np.zeros((3, 4, 5), dtype=bool))
+    assert index.is_empty
+    assert index.bounding_box() is None
+    assert index.window_count(0, 4, 0, 5) == 0
+    assert index.z_extent(2, 2, 2, 2) is None
+
+
+def test_rejects_non_3d_mask():
+    with pytest.raises(ValueError):
+        MaskOccupancyIndex(np.zeros((4, 4), dtype=bool))
@@ -728,6 +728,184 @@ class TestExternalCommandRunner(unittest.TestCase):
         # No output files → output_data is None but the node still completes.
         self.assertIsNone(ctx.get_port_value(n.get_output("output_data").id).data)
 
+    def test_shm_transport_round_trips_array(self):
+        # The child maps the input block and hands its result back the same
+        # way; the runner copies it out and releases both blocks.
+        import tempfile
+
+        script = (
+            "import os, sys\n"
+            "from pathlib import Path\n"
+            "from py2flamingo.pipeline.engine.shared_arrays import "
+            "attach_array, publish_array\n"
+            "vol, block = attach_array(os.environ['FLAMINGO_INPUT'])\n"
+            "out = Path(os.environ['FLAMINGO_OUTPUT_DIR']) / 'out.shm.json'\n"
+            "publish_array(vol * 2, out, untrack=True)\n"
+            "del vol\n"
+            "block.close()\n"
+        )
+        with tempfile.TemporaryDirectory() as d:
+            script_path = Path(d) / "double.py"
+            script_path.write_text(script)
+            p, n = _single(
+                NodeType.EXTERNAL_COMMAND,
+                config={
+                    "command_template": (
+                        f"PYTHONPATH='{_SRC}' '{sys.executable}' '{script_path}'"
+                    ),
+                    "output_format": "numpy",
+                    "timeout_seconds": 60,
+                    "transport": "shm",
+                },
+            )
+            volume = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+            runner = self._runner()
+            ctx = ExecutionContext(services={})
+            with patch.object(runner, "_get_input", return_value=volume):
+                runner.run(n, p, ctx)
+
+        out = ctx.get_port_value(n.get_output("output_data").id).data
+        np.testing.assert_array_equal(out, volume * 2)
+        self.assertEqual(out.dtype, np.uint16)
+
+    def test_shm_blocks_are_released_when_the_command_fails(self):
+        # Every block a child hands back is unlinked, read or not, and also
+        # when it exits non-zero.
+        import tempfile
+        from multiprocessing import shared_memory
+
+        script = (
+            "import os, sys\n"
+            "from pathlib import Path\n"
+            "import numpy as np\n"
+            "from py2flamingo.pipeline.engine.shared_arrays import publish_array\n"
+            "out = Path(os.environ['FLAMINGO_OUTPUT_DIR'])\n"
+            "names = [publish_array(np.ones(8), out / f'{i}.shm.json', "
+            "untrack=True).name for i in range(2)]\n"
+            "Path(sys.argv[1]).write_text(' '.join(names))\n"
+            "sys.exit(3)\n"
+        )
+        with tempfile.TemporaryDirectory() as d:
+            script_path = Path(d) / "fail.py"
+            script_path.write_text(script)
+            names_path = Path(d) / "names.txt"
+            p, n = _single(
+                NodeType.EXTERNAL_COMMAND,
+                config={
+                    "command_template": (
+                        f"PYTHONPATH='{_SRC}' '{sys.executable}' "
+                        f"'{script_path}' '{names_path}'"
+                    ),
+                    "output_format": "numpy",
+                    "timeout_seconds": 60,
+                    "transport": "shm",
+                },
+            )
+            runner = self._runner()
+            with patch.object(runner, "_get_input", return_value=None):
+                with self.assertRaises(RuntimeError):
+                    runner.run(n, p, ExecutionContext(services={}))
+            names = names_path.read_text().split()
+
+        self.assertEqual(len(names), 2)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_reading_a_returned_block_leaves_the_tracker_quiet(self):
+        # attach_array already unregisters the block; unlinking it must not
+        # unregister it again (the tracker prints a KeyError for that).
+        import subprocess
+
+        script = (
+            "import numpy as np\n"
+            "from py2flamingo.pipeline.engine.shared_arrays import "
+            "publish_array, read_array\n"
+            "import tempfile, pathlib\n"
+            "d = pathlib.Path(tempfile.mkdtemp())\n"
+            "publish_array(np.arange(5), d / 'a.shm.json', untrack=True).close()\n"
+            "assert read_array(d / 'a.shm.json').tolist() == [0, 1, 2, 3, 4]\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            env=dict(os.environ, PYTHONPATH=str(_SRC)),
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("KeyError", result.stderr)
+        self.assertNotIn("leaked", result.stderr)
+
+    def test_shm_transport_falls_back_to_npy(self):
+        from py2flamingo.pipeline.engine.node_runners import external_command_runner
+
+        p, n = _single(
+            NodeType.EXTERNAL_COMMAND,
+            config={
+                "command_template": "cp '{input_file}' '{output_dir}/out.npy'",
+                "output_format": "numpy",
+                "timeout_seconds": 30,
+                "transport": "shm",
+            },
+        )
+        volume = np.ones((4, 5), dtype=np.float32)
+        runner = self._runner()
+        ctx = ExecutionContext(services={})
+        with patch.object(runner, "_get_input", return_value=volume), patch.object(
+            external_command_runner,
+            "publish_array",
+            side_effect=OSError("no shm"),
+        ):
+            runner.run(n, p, ctx)
+
+        out = ctx.get_port_value(n.get_output("output_data").id).data
+        np.testing.assert_array_equal(out, volume)
+        self.assertIsInstance(out, np.memmap)
+
+    def test_npy_transport_hands_the_child_a_npy_file(self):
+        # A path-only tool gets a real .npy it can np.load, never a
+        # shared-memory descriptor.
+        import tempfile
+
+        from py2flamingo.pipeline.engine.node_runners import external_command_runner
+
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "import numpy as np\n"
+            "assert sys.argv[1].endswith('.npy'), sys.argv[1]\n"
+            "vol = np.load(sys.argv[1], mmap_mode='r')\n"
+            "np.save(str(Path(sys.argv[2]) / 'out.npy'), vol + 1)\n"
+        )
+        with tempfile.TemporaryDirectory() as d:
+            script_path = Path(d) / "inc.py"
+            script_path.write_text(script)
+            p, n = _single(
+                NodeType.EXTERNAL_COMMAND,
+                config={
+                    "command_template": (
+                        f"'{sys.executable}' '{script_path}' "
+                        "'{input_file}' '{output_dir}'"
+                    ),
+                    "output_format": "numpy",
+                    "timeout_seconds": 60,
+                    "transport": "npy",
+                },
+            )
+            volume = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+            runner = self._runner()
+            ctx = ExecutionContext(services={})
+            with patch.object(runner, "_get_input", return_value=volume), patch.object(
+                external_command_runner, "publish_array"
+            ) as publish:
+                runner.run(n, p, ctx)
+
+        publish.assert_not_called()
+        out = ctx.get_port_value(n.get_output("output_data").id).data
+        np.testing.assert_array_equal(out, volume + 1)
+        self.assertIsInstance(out, np.memmap)
+
 
 # ---------------------------------------------------------------------------
 # SampleViewDataRunner
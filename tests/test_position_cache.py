@@ -0,0 +1,190 @@
+"""Shared stage position cache.
+
+Every StageService on a connection reads and feeds the connection's
+PositionCache: queries record their result, moves invalidate the axis,
+motion-stopped callbacks publish the commanded target, and readers that
+accept a recent enough value skip the round trip. Concurrent readers of one
+axis share a single query. No hardware.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_position_cache.py -q
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from py2flamingo.services.position_cache import PositionCache
+from py2flamingo.services.stage_service import AxisCode, StageService
+from py2flamingo.services.status_service import StatusService
+
+X, Y, Z, R = 1, 2, 3, 4
+
+
+def _message(axis, value=0.0, status=1):
+    return SimpleNamespace(int32_data0=axis, value=value, status_code=status)
+
+
+def test_values_expire_and_moves_invalidate():
+    cache = PositionCache()
+    cache.update(X, 5.0)
+
+    assert cache.get(X, max_age_s=10) == 5.0
+    time.sleep(0.02)
+    assert cache.get(X, max_age_s=0.01) is None
+
+    cache.begin_move(X, 6.0)
+    assert cache.get(X, max_age_s=10) is None
+    cache.update(X, 5.5)  # observed after the move was commanded
+    assert cache.get(X, max_age_s=10) == 5.5
+
+
+def test_motion_stopped_publishes_the_commanded_target():
+    cache = PositionCache()
+    cache.begin_move(X, 6.0)
+    cache.begin_move(Z, 14.0)
+
+    cache.on_motion_stopped(_message(Z, status=0))  # not a completed stop
+    assert cache.get(Z, 10) is None
+
+    cache.on_motion_stopped(_message(Z))
+    assert cache.get(Z, 10) == 14.0 and cache.get(X, 10) is None
+
+    # Duplicate or unnamed stops leave axes that are still moving alone
+    cache.on_motion_stopped(_message(Z))
+    cache.on_motion_stopped(_message(0))
+    assert cache.get(X, 10) is None
+
+    cache.on_motion_stopped(_message(X))
+    assert cache.get(X, 10) == 6.0
+
+
+def test_late_position_responses_are_cached_unless_moving():
+    cache = PositionCache()
+    cache.on_position_message(_message(Y, value=0.0))  # XYZ read 0.0 in motion
+    assert cache.get(Y, 10) is None
+    cache.on_position_message(_message(Y, value=12.5))
+    cache.on_position_message(_message(R, value=0.0))
+    assert cache.get(Y, 10) == 12.5 and cache.get(R, 10) == 0.0
+
+
+def test_concurrent_readers_share_one_query():
+    cache = PositionCache()
+    release = threading.Event()
+    calls = []
+
+    def query():
+        calls.append(1)
+        release.wait(5)
+        return 7.25
+
+    results = []
+    readers = [
+        threading.Thread(target=lambda: results.append(cache.fetch(X, 1.0, query)))
+        for _ in range(4)
+    ]
+    for t in readers:
+        t.start()
+    time.sleep(0.1)
+    release.set()
+    for t in readers:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [7.25] * 4
+    assert cache.fetch(X, 1.0, query) == 7.25 and len(calls) == 1
+
+
+def test_failed_query_is_shared_not_repeated():
+    cache = PositionCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def query():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return None
+
+    first = threading.Thread(target=lambda: cache.fetch(Z, 1.0, query))
+    first.start()
+    started.wait(5)
+    waiter = []
+    second = threading.Thread(target=lambda: waiter.append(cache.fetch(Z, 1.0, query)))
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert waiter == [None] and len(calls) == 1
+
+
+def test_query_in_flight_across_a_move_is_not_fresh():
+    cache = PositionCache()
+    started, release = threading.Event(), threading.Event()
+
+    def query():
+        started.set()
+        release.wait(5)
+        return 5.0  # the pre-move position
+
+    reader = threading.Thread(target=lambda: cache.fetch(X, 1.0, query))
+    reader.start()
+    started.wait(5)
+    cache.begin_move(X, 10.0)
+    release.set()
+    reader.join(5)
+
+    assert cache.get(X, 1.0) is None
+    cache.on_motion_stopped(_message(X))
+    assert cache.get(X, 1.0) == 10.0
+
+
+class _Connection:
+    def __init__(self):
+        self.position_cache = PositionCache()
+
+    def is_connected(self):
+        return True
+
+
+def test_stage_service_reads_and_feeds_the_shared_cache(monkeypatch):
+    connection = _Connection()
+    queries = []
+
+    def fake_query(self, axis):
+        queries.append(axis)
+        return float(axis * 10)
+
+    monkeypatch.setattr(StageService, "_query_axis_position", fake_query)
+    first, second = StageService(connection), StageService(connection)
+
+    assert first.get_position().x == 10.0  # no freshness bound: always queries
+    assert len(queries) == 4
+
+    pos = second.get_position(max_age_s=5.0)
+    assert (pos.x, pos.y, pos.z, pos.r) == (10.0, 20.0, 30.0, 40.0)
+    assert len(queries) == 4  # served from the cache
+
+    monkeypatch.setattr(
+        StageService, "_send_command", lambda *a, **k: {"success": True}
+    )
+    second.move_to_position(AxisCode.Y_AXIS, 9.0)
+    second.get_position(max_age_s=5.0)
+    assert queries[4:] == [AxisCode.Y_AXIS]
+
+    status = StatusService(connection)
+    assert status.get_position() == (10.0, 20.0, 30.0)
+
+
+def test_stage_query_sent_before_a_move_is_not_fresh(monkeypatch):
+    connection = _Connection()
+    cache = connection.position_cache
+
+    def query_then_move(self, axis):
+        cache.begin_move(axis, 10.0)  # commanded while the query was in flight
+        return 5.0
+
+    monkeypatch.setattr(StageService, "_query_axis_position", query_then_move)
+    assert StageService(connection).get_axis_position(X) == 5.0
+    assert cache.get(X, 1.0) is None
@@ -11,6 +11,7 @@ from __future__ import annotations
 import sys
 import tempfile
 import unittest
+import unittest.mock
 from pathlib import Path
 
 import numpy as np
@@ -22,6 +23,7 @@ if str(_SRC) not in sys.path:
 
 from py2flamingo.psf_analysis import (  # noqa: E402
     PSFAnalysisService,
+    PSFResultCache,
     PSFSettings,
     load_volume,
 )
@@ -131,6 +133,116 @@ class TestPSFFileRoundTrip(unittest.TestCase):
             self.assertGreaterEqual(result.n_accepted, 3)
             self.assertAlmostEqual(result.summary()["fwhm_x_um_mean"], 1.8, delta=0.3)
 
+    def test_load_volume_reads_only_requested_channel_and_z(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            arr = np.arange(3 * 10 * 4 * 4, dtype=np.uint16).reshape(3, 10, 4, 4)
+            p = Path(tmp) / "beads.npy"
+            np.save(p, arr)
+            vol, _ = load_volume(p, channel=1, z_range=(3, 7))
+            self.assertNotIsInstance(vol, np.memmap)
+            np.testing.assert_array_equal(vol, arr[1, 3:7])
+
+            vol, _ = load_volume(p, channel=2)
+            self.assertNotIsInstance(vol, np.memmap)
+            np.testing.assert_array_equal(vol, arr[2])
+
+    def test_cli_analyzes_only_the_requested_z_range(self):
+        from py2flamingo.psf_analysis import __main__ as cli
+
+        with tempfile.TemporaryDirectory() as tmp:
+            info = write_bead_dataset(
+                tmp,
+                shape=(24, 120, 120),
+                voxel_size_um=(3.0, 0.5, 0.5),
+                fwhm_um=(9.0, 1.8, 1.8),
+                n_beads=3,
+                seed=4,
+            )
+            loaded = []
+
+            def load(*args, **kwargs):
+                loaded.append(load_volume(*args, **kwargs)[0])
+                return loaded[-1], (3.0, 0.5, 0.5)
+
+            with unittest.mock.patch.object(cli, "load_volume", load):
+                rc = cli.main(
+                    [str(info["volume"]), "--z-range", "4", "20", "--no-cache"]
+                )
+            self.assertEqual(rc, 0)
+            self.assertEqual(loaded[0].shape, (16, 120, 120))
+
+
+class TestPSFResultCache(unittest.TestCase):
+    VOXEL = (2.0, 0.4, 0.4)
+
+    def setUp(self):
+        self.vol, _ = make_bead_volume(
+            (30, 200, 200), voxel_size_um=self.VOXEL, n_beads=6, seed=4
+        )
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = PSFResultCache(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _analyze(self, settings, service=None):
+        return (service or PSFAnalysisService()).analyze(
+            self.vol, voxel_size_um=self.VOXEL, settings=settings, cache=self.cache
+        )
+
+    def test_cached_rerun_matches_fresh_result(self):
+        settings = PSFSettings(window_um=8.0)
+        fresh = PSFAnalysisService().analyze(
+            self.vol, voxel_size_um=self.VOXEL, settings=settings
+        )
+        self._analyze(settings)
+
+        service = PSFAnalysisService()
+        service._detect_beads = unittest.mock.Mock(side_effect=AssertionError)
+        service._fit_bead = unittest.mock.Mock(side_effect=AssertionError)
+        cached = self._analyze(settings, service)
+
+        self.assertEqual(
+            [b.to_dict() for b in cached.beads], [b.to_dict() for b in fresh.beads]
+        )
+        for a, b in zip(cached.beads, fresh.beads):
+            for axis in a.fits:
+                np.testing.assert_array_equal(
+                    a.fits[axis].fit_curve, b.fits[axis].fit_curve
+                )
+
+    def test_downstream_change_only_fits_new_beads(self):
+        self._analyze(PSFSettings(window_um=8.0, min_separation_um=1000.0))
+
+        service = PSFAnalysisService()
+        fit = unittest.mock.Mock(wraps=service._fit_bead)
+        service._fit_bead = fit
+        relaxed = self._analyze(
+            PSFSettings(window_um=8.0, min_separation_um=1.0), service
+        )
+        # Everything was "crowded" before, so every accepted bead is new...
+        self.assertEqual(
+            fit.call_count,
+            relaxed.n_detected - sum(b.reject_reason == "edge" for b in relaxed.beads),
+        )
+
+        fit.reset_mock()
+        strict = self._analyze(
+            PSFSettings(window_um=8.0, min_separation_um=1.0, min_r_squared=0.999),
+            service,
+        )
+        # ...and a stricter quality gate reuses all of them
+        self.assertEqual(fit.call_count, 0)
+        self.assertLessEqual(strict.n_accepted, relaxed.n_accepted)
+
+    def test_new_window_invalidates_fits(self):
+        self._analyze(PSFSettings(window_um=8.0))
+        service = PSFAnalysisService()
+        fit = unittest.mock.Mock(wraps=service._fit_bead)
+        service._fit_bead = fit
+        self._analyze(PSFSettings(window_um=6.0), service)
+        self.assertGreater(fit.call_count, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,181 @@
+"""Event-driven completion and pipelined staging in WorkflowQueueService.
+
+Queued workflows are confirmed started by the 0x9004/0x3011 callbacks and
+finished by the 0xA002 idle broadcast; SYSTEM_STATE_GET polling is only a
+watchdog for when the callbacks go quiet. The next queued file is read and
+validated while the current workflow runs. These tests drive the queue with a
+fake controller whose "firmware" fires the callbacks from another thread — no
+Qt event loop, no hardware.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_queue_event_driven_completion.py -q
+"""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from py2flamingo.services.workflow_queue_service import WorkflowQueueService
+
+
+def _msg():
+    return SimpleNamespace(int32_data0=1, int32_data1=1, int32_data2=0, double_data=0.0)
+
+
+class _FakeConn:
+    def __init__(self, idle=True):
+        self.polls = 0
+        self.idle = idle
+
+    def register_callback(self, code, handler):
+        pass
+
+    def unregister_callback(self, code, handler):
+        pass
+
+    def query_system_state(self):
+        self.polls += 1
+        return {"state": 0, "is_idle": self.idle}
+
+
+class _FakeController:
+    """Records calls; each start makes the 'firmware' run a short workflow."""
+
+    def __init__(self, send_progress=True):
+        self.svc = None
+        self.events = []
+        self.send_progress = send_progress
+        self.is_executing = False
+
+    def read_workflow(self, path):
+        self.events.append(("read", Path(path).name))
+        return (True, "read", Path(path).read_bytes())
+
+    def load_workflow(self, path):
+        self.events.append(("load", Path(path).name))
+        return (True, "loaded")
+
+    def load_workflow_data(self, path, data):
+        self.events.append(("load_staged", Path(path).name))
+        return (True, "loaded")
+
+    def start_workflow(self):
+        self.events.append(("start",))
+
+        def firmware():
+            time.sleep(0.02)
+            if self.send_progress:
+                self.svc._on_progress_update(_msg())
+            time.sleep(0.02)
+            self.svc._on_system_idle(_msg())
+
+        threading.Thread(target=firmware, daemon=True).start()
+        return (True, "started")
+
+    def on_workflow_completed(self):
+        self.events.append(("completed",))
+
+    def stop_workflow(self):
+        pass
+
+
+def _run_queue(tmp_path, controller, conn, n=3, timeout=10.0):
+    files = []
+    for i in range(n):
+        f = tmp_path / f"tile_{i}.txt"
+        f.write_text(f"<Workflow Settings>{i}</Workflow Settings>")
+        files.append(f)
+
+    svc = WorkflowQueueService(controller, connection_service=conn)
+    svc._return_to_origin_after_queue = False
+    controller.svc = svc
+    svc.enqueue(files)
+
+    t0 = time.monotonic()
+    assert svc.start()
+    svc._execution_thread.join(timeout)
+    return svc, time.monotonic() - t0, files
+
+
+def test_callbacks_drive_the_queue_without_polling(tmp_path):
+    controller = _FakeController()
+    conn = _FakeConn()
+    svc, elapsed, files = _run_queue(tmp_path, controller, conn)
+
+    assert all(item.completed for item in svc._queue)
+    assert conn.polls == 0
+    # Three tiny workflows: no fixed 2 s send delay or 3 s inter-item sleep
+    assert elapsed < 2.0
+
+
+def test_next_workflow_is_staged_while_current_runs(tmp_path):
+    controller = _FakeController()
+    svc, _, files = _run_queue(tmp_path, controller, _FakeConn())
+
+    events = controller.events
+    # Only the first item is loaded from disk at its turn; later ones were
+    # read right after the previous start and installed from memory.
+    assert events[0] == ("load", "tile_0.txt")
+    assert [e for e in events if e[0] == "load"] == [("load", "tile_0.txt")]
+    assert events.index(("read", "tile_1.txt")) < events.index(
+        ("load_staged", "tile_1.txt")
+    )
+    first_start = events.index(("start",))
+    assert events.index(("read", "tile_1.txt")) > first_start
+    assert all(item.staged_data is None for item in svc._queue)
+
+
+def test_staged_file_edited_before_its_turn_is_detected(tmp_path):
+    controller = _FakeController()
+    svc = WorkflowQueueService(controller, connection_service=_FakeConn())
+    controller.svc = svc
+    f = tmp_path / "tile.txt"
+    f.write_text("old")
+    svc.enqueue([tmp_path / "first.txt", f])
+    svc._current_index = 0
+    svc._stage_next_workflow()
+    assert svc._queue[1].staged_data == b"old"
+
+    f.write_text("edited, now longer")
+    assert svc._queue[1].staged_stat != svc._file_stat(f)
+
+
+def test_idle_before_confirmation_is_not_taken_as_completion():
+    # A stale idle (previous workflow) or one that precedes a slow start must
+    # not finish this workflow; the start wait keeps waiting for busy.
+    conn = _FakeConn(idle=True)
+    svc = WorkflowQueueService(_FakeController(), connection_service=conn)
+    svc.POST_WORKFLOW_SEND_DELAY = 0.05
+    svc.WORKFLOW_START_POLL_INTERVAL = 0.05
+    svc.MAX_WORKFLOW_START_TIMEOUT = 0.3
+
+    svc._on_system_idle(_msg())
+    assert svc._wait_for_workflow_start() is False
+    assert not svc._completion_event.is_set()
+
+    # Busy seen after the idle: started, but still not complete
+    svc._on_system_idle(_msg())
+    conn.idle = False
+    assert svc._wait_for_workflow_start() is True
+    assert not svc._completion_event.is_set()
+
+
+def test_watchdog_polls_only_when_callbacks_are_silent():
+    svc = WorkflowQueueService(_FakeController(), connection_service=_FakeConn())
+    conn = svc._connection_service
+    svc.STATE_POLL_INTERVAL = 0.05
+    svc._queue = [SimpleNamespace(file_path=Path("a.txt"))]
+    svc._workflow_running = True
+
+    # Callbacks keep arriving: no polls, then idle completes the wait
+    def chatter():
+        for _ in range(6):
+            svc._last_callback_time = time.monotonic()
+            time.sleep(0.02)
+        svc._on_system_idle(_msg())
+
+    svc._last_callback_time = time.monotonic()
+    threading.Thread(target=chatter, daemon=True).start()
+    assert svc._wait_for_completion(svc._queue[0]) == (True, None)
+    assert conn.polls == 0
+    assert svc._completed_via_callback is True
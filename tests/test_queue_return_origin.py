@@ -39,6 +39,10 @@ class _FakeStageService:
     def move_to_position(self, axis, val):
         self.moves.append((axis, val))
 
+    def move_to_positions(self, targets):
+        for axis, val in targets.items():
+            self.move_to_position(axis, val)
+
 
 class _DummyController:
     def stop_workflow(self):
@@ -0,0 +1,129 @@
+"""
+Tests for the cached multi-channel compositor behind SlicePlaneViewer.
+
+The compositor quantizes each channel once through a (contrast, colour) LUT
+and reuses its layers and output buffer while inputs are unchanged. These
+check it still produces the same image as straightforward float blending,
+and that unchanged channels are not re-quantized.
+"""
+
+import numpy as np
+import pytest
+
+from py2flamingo.views.widgets.slice_plane_viewer import ChannelCompositor
+
+
+def _float_blend(channel_mips, channel_settings):
+    """Reference: per-channel float normalization + additive RGB blending."""
+    shape = next(iter(channel_mips.values())).shape
+    accum = np.zeros((*shape, 3), dtype=np.float32)
+    for ch_id, data in channel_mips.items():
+        settings = channel_settings[ch_id]
+        if not settings.get("visible", True):
+            continue
+        lo, hi = settings["contrast_min"], settings["contrast_max"]
+        norm = np.clip((data.astype(np.float32) - lo) / (hi - lo), 0, 1)
+        mask = ChannelCompositor.COLOR_MASKS[settings["colormap"]]
+        for c, on in enumerate(mask):
+            if on:
+                accum[..., c] += norm
+    return (np.clip(accum, 0, 1) * 255).astype(np.uint8)
+
+
+def _settings(colormap, lo=0, hi=4000, visible=True):
+    return {
+        "visible": visible,
+        "colormap": colormap,
+        "contrast_min": lo,
+        "contrast_max": hi,
+    }
+
+
+@pytest.fixture
+def mips():
+    rng = np.random.default_rng(0)
+    return {
+        ch: rng.integers(0, 5000, size=(40, 60), dtype=np.uint16) for ch in range(4)
+    }
+
+
+def test_single_channel_matches_float_path(mips):
+    settings = {0: _settings("green", 100, 3000)}
+    out = ChannelCompositor().composite({0: mips[0]}, settings)
+    np.testing.assert_array_equal(out, _float_blend({0: mips[0]}, settings))
+
+
+def test_multi_channel_within_one_level_of_float_path(mips):
+    # Summing already-quantized layers can differ from quantizing the float
+    # sum by at most one level per additional channel.
+    colours = ["blue", "green", "red", "magenta"]
+    settings = {ch: _settings(colours[ch], 50 * ch, 3000 + ch) for ch in mips}
+    out = ChannelCompositor().composite(mips, settings)
+    ref = _float_blend(mips, settings)
+    assert out.dtype == np.uint8 and out.shape == (40, 60, 3)
+    assert np.abs(out.astype(int) - ref.astype(int)).max() <= len(mips) - 1
+
+
+def test_saturates_instead_of_wrapping():
+    full = np.full((4, 4), 1000, dtype=np.uint16)
+    settings = {ch: _settings("gray", 0, 1000) for ch in range(3)}
+    out = ChannelCompositor().composite({ch: full for ch in range(3)}, settings)
+    assert (out == 255).all()
+
+
+def test_hidden_channels_and_unknown_colormap():
+    data = np.full((2, 2), 500, dtype=np.uint16)
+    settings = {
+        0: _settings("not-a-colormap", 0, 1000),
+        1: _settings("red", 0, 1000, visible=False),
+    }
+    out = ChannelCompositor().composite({0: data, 1: data}, settings)
+    # Unknown colormap falls back to gray; hidden channel contributes nothing
+    assert (out == 127).all()
+
+
+def test_unchanged_inputs_reuse_layers_and_output(mips, monkeypatch):
+    compositor = ChannelCompositor()
+    settings = {ch: _settings("gray", 0, 4000) for ch in mips}
+    first = compositor.composite(mips, settings).copy()
+
+    calls = []
+    original = compositor._quantize
+    monkeypatch.setattr(
+        compositor,
+        "_quantize",
+        lambda data, lo, hi: calls.append(1) or original(data, lo, hi),
+    )
+
+    # Fresh but equal arrays (as produced by recomputing MIPs) hit the cache
+    again = compositor.composite({ch: m.copy() for ch, m in mips.items()}, settings)
+    assert calls == []
+    np.testing.assert_array_equal(again, first)
+
+    # Changing one channel's contrast re-quantizes only that channel
+    settings[2] = _settings("gray", 0, 2000)
+    compositor.composite(mips, settings)
+    assert len(calls) == 1
+
+
+def test_in_place_edit_is_detected():
+    compositor = ChannelCompositor()
+    data = np.zeros((3, 3), dtype=np.uint16)
+    settings = {0: _settings("gray", 0, 100)}
+    assert compositor.composite({0: data}, settings).max() == 0
+    data[1, 1] = 100
+    assert compositor.composite({0: data}, settings)[1, 1, 0] == 255
+
+
+def test_float_input_uses_arithmetic_path():
+    data = np.array([[0.0, 50.0, 100.0]], dtype=np.float32)
+    out = ChannelCompositor().composite({0: data}, {0: _settings("red", 0, 100)})
+    assert out[0, :, 0].tolist() == [0, 127, 255]
+    assert (out[..., 1:] == 0).all()
+
+
+def test_degenerate_contrast_and_empty_input():
+    compositor = ChannelCompositor()
+    data = np.full((2, 2), 7, dtype=np.uint16)
+    assert (compositor.composite({0: data}, {0: _settings("gray", 5, 5)}) == 0).all()
+    assert compositor.composite({}, {}) is None
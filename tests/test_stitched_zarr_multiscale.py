@@ -0,0 +1,223 @@
+"""Tests for lazy, multiscale loading of stitched OME-Zarr output.
+
+The Load Stitched path used to ``da.from_zarr(level0).compute()`` — the whole
+native-resolution volume in RAM just to resample it to the display grid. It
+now reads the NGFF ``multiscales`` metadata, hands back every pyramid level as
+a lazy chunk-cached dask array, and selects the coarsest level that still
+meets the requested display voxel size.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+zarr = pytest.importorskip("zarr")
+da = pytest.importorskip("dask.array")
+
+from py2flamingo.visualization.session_manager import (  # noqa: E402
+    _CachedZarrArray,
+    _ChunkCache,
+    _select_display_level,
+    load_stitched_volume,
+)
+
+
+def _write_pyramid(path: Path, shape_czyx, n_levels=3, ngff_version="0.4"):
+    """Write a (C, Z, Y, X) pyramid, halving Y and X per level.
+
+    Each level is filled with its index + 1 (times 10 per channel) so the
+    chosen level is visible in the data.
+    """
+    root = zarr.open_group(str(path), mode="w")
+    datasets = []
+    c, z, y, x = shape_czyx
+    for level in range(n_levels):
+        shape = (c, z, y >> level, x >> level)
+        arr = root.create_array(
+            str(level), shape=shape, chunks=(1, z, 8, 8), dtype="uint16"
+        )
+        fill = (np.arange(c)[:, None, None, None] + 1) * 10 + level
+        arr[:] = np.broadcast_to(fill, shape).astype(np.uint16)
+        datasets.append(
+            {
+                "path": str(level),
+                "coordinateTransformations": [
+                    {
+                        "type": "scale",
+                        "scale": [1.0, 2.0, 0.5 * 2**level, 0.5 * 2**level],
+                    }
+                ],
+            }
+        )
+    multiscales = [{"version": ngff_version, "datasets": datasets}]
+    if ngff_version == "0.5":
+        root.attrs["ome"] = {"version": "0.5", "multiscales": multiscales}
+    else:
+        root.attrs["multiscales"] = multiscales
+
+
+def _write_metadata(output_dir: Path, store_name: str):
+    meta = {
+        "version": 2,
+        "store_path": store_name,
+        "voxel_size_um": {"z": 2.0, "y": 0.5, "x": 0.5},
+        "channel_ids": [1, 4],
+        "origin_um": [0.0, 10.0, 20.0],
+    }
+    (output_dir / "stitch_metadata.json").write_text(json.dumps(meta))
+
+
+@pytest.mark.parametrize("ngff_version", ["0.4", "0.5"])
+def test_picks_coarsest_level_meeting_target(tmp_path, ngff_version):
+    _write_pyramid(tmp_path / "stitched.ome.zarr", (2, 4, 64, 48), 3, ngff_version)
+    _write_metadata(tmp_path, "stitched.ome.zarr")
+
+    chans = load_stitched_volume(tmp_path, target_voxel_um=(2.0, 1.5, 1.5))["channels"]
+
+    assert [c["ch_id"] for c in chans] == [1, 4]
+    # Level 2 would be 2 µm in Y/X (> 1.5), so level 1 at 1 µm is chosen
+    assert chans[0]["level"] == 1
+    assert isinstance(chans[0]["volume"], da.Array)
+    assert chans[0]["volume"].shape == (4, 32, 24)
+    np.testing.assert_allclose(chans[0]["voxel_size_um"], [2.0, 1.0, 1.0])
+    np.testing.assert_allclose(chans[0]["origin_um"], [0.0, 10.0, 20.0])
+    assert int(np.asarray(chans[1]["volume"]).max()) == 21
+    assert [m.shape for m in chans[0]["multiscale"]] == [
+        (4, 64, 48),
+        (4, 32, 24),
+        (4, 16, 12),
+    ]
+
+
+def test_no_target_is_full_resolution_and_lazy(tmp_path):
+    _write_pyramid(tmp_path / "stitched.ome.zarr", (1, 2, 32, 32), 2)
+    _write_metadata(tmp_path, "stitched.ome.zarr")
+
+    chan = load_stitched_volume(tmp_path)["channels"][0]
+
+    assert chan["level"] == 0
+    assert chan["volume"].dtype == np.uint16
+    np.testing.assert_allclose(chan["voxel_size_um"], [2.0, 0.5, 0.5])
+    assert int(chan["volume"][0, :4, :4].compute().max()) == 10
+
+
+def test_voxel_storage_display_size_is_the_default_target(tmp_path):
+    class _Storage:
+        class config:
+            display_voxel_size = (50.0, 50.0, 50.0)
+
+    _write_pyramid(tmp_path / "stitched.ome.zarr", (1, 2, 32, 32), 3)
+    _write_metadata(tmp_path, "stitched.ome.zarr")
+
+    chan = load_stitched_volume(tmp_path, voxel_storage=_Storage())["channels"][0]
+    assert chan["level"] == 2
+
+
+def test_store_without_multiscales_metadata_still_loads(tmp_path):
+    root = zarr.open_group(str(tmp_path / "plain.ome.zarr"), mode="w")
+    arr = root.create_array("0", shape=(3, 8, 8), chunks=(3, 4, 4), dtype="uint16")
+    arr[:] = 5
+    _write_metadata(tmp_path, "plain.ome.zarr")
+
+    chan = load_stitched_volume(tmp_path, target_voxel_um=100.0)["channels"][0]
+    assert chan["level"] == 0
+    assert chan["volume"].shape == (3, 8, 8)
+    assert int(np.asarray(chan["volume"]).sum()) == 5 * 3 * 8 * 8
+
+
+def test_select_display_level_never_exceeds_target():
+    factors = [np.ones(3), np.array([1, 2, 2]), np.array([1, 4, 4])]
+    native = np.array([5.0, 1.0, 1.0])
+    assert _select_display_level(factors, native, None) == 0
+    assert _select_display_level(factors, native, (5.0, 3.0, 3.0)) == 1
+    assert _select_display_level(factors, native, 1.0) == 0  # Z never meets it
+
+
+def test_repeated_chunk_reads_come_from_the_cache(tmp_path):
+    root = zarr.open_group(str(tmp_path / "c.zarr"), mode="w")
+    arr = root.create_array("0", shape=(2, 8, 8), chunks=(2, 4, 4), dtype="uint16")
+    arr[:] = 1
+
+    reads = []
+
+    class _Spy:
+        shape, dtype, chunks = arr.shape, arr.dtype, arr.chunks
+
+        def __getitem__(self, key):
+            reads.append(key)
+            return arr[key]
+
+    cache = _ChunkCache(max_bytes=10**6)
+    cached = _CachedZarrArray(_Spy(), cache, cache_id=0)
+    lazy = da.from_array(cached, chunks=arr.chunks, meta=np.empty((0, 0, 0), "u2"))
+
+    assert int(lazy.sum().compute()) == 2 * 8 * 8
+    assert int(lazy[:, :4, :4].sum().compute()) == 2 * 4 * 4
+    assert len(reads) == 4  # one per chunk, the second pass was all hits
+
+
+def test_chunk_cache_is_bounded():
+    cache = _ChunkCache(max_bytes=200)
+    for i in range(3):
+        cache.put(i, np.zeros(100, dtype=np.uint8))
+    assert cache.get(0) is None
+    assert cache.get(2) is not None
+
+
+def test_resampling_a_lazy_level_matches_the_in_memory_volume(tmp_path):
+    from py2flamingo.visualization.session_manager import downsample_to_voxel_grid
+
+    _write_pyramid(tmp_path / "stitched.ome.zarr", (1, 4, 64, 48), 1)
+    _write_metadata(tmp_path, "stitched.ome.zarr")
+    lazy = load_stitched_volume(tmp_path)["channels"][0]["volume"]
+
+    factors = (0.5, 0.25, 0.25)
+    np.testing.assert_array_equal(
+        downsample_to_voxel_grid(lazy, factors),
+        downsample_to_voxel_grid(lazy.compute(), factors),
+    )
+
+
+def test_pyramid_is_handed_to_napari_as_a_lazy_multiscale_layer(tmp_path):
+    from types import SimpleNamespace
+
+    from py2flamingo.views.sample_view import SampleView
+    from py2flamingo.visualization.axis_orientation import AxisOrientation
+
+    _write_pyramid(tmp_path / "stitched.ome.zarr", (1, 4, 64, 48), 3)
+    _write_metadata(tmp_path, "stitched.ome.zarr")
+    chan = load_stitched_volume(tmp_path, target_voxel_um=2.0)["channels"][0]
+
+    added = []
+    viewer = SimpleNamespace(
+        dims=SimpleNamespace(ndisplay=3),
+        add_image=lambda data, **kwargs: added.append((data, kwargs)),
+    )
+    view = SimpleNamespace(
+        viewer=viewer,
+        channel_layers={},
+        voxel_storage=SimpleNamespace(
+            config=SimpleNamespace(
+                display_voxel_size=(4.0, 4.0, 4.0),
+                axis_orientation=lambda: AxisOrientation.legacy(invert_x=True),
+            )
+        ),
+    )
+    extent = np.asarray(chan["volume"].shape) * chan["voxel_size_um"]
+    SampleView._add_stitched_pyramid_layer(
+        view, 0, chan["multiscale"], extent, np.array([10, 20, 30]), (0, 0, 0)
+    )
+
+    ((data, kwargs),) = added
+    assert kwargs["multiscale"] is True and kwargs["visible"] is False
+    assert kwargs["metadata"]["stitched"] is True
+    assert all(isinstance(level, da.Array) for level in data)
+    assert [level.shape for level in data] == [m.shape for m in chan["multiscale"]]
+    # Level 0 voxels are (2, 0.5, 0.5) µm on a 4 µm display grid
+    np.testing.assert_allclose(kwargs["scale"], [0.5, 0.125, 0.125])
+    np.testing.assert_allclose(kwargs["translate"], [9.75, 19.5625, 29.5625])
+    assert viewer.dims.ndisplay == 3
@@ -0,0 +1,109 @@
+"""
+Tests for the tiled threshold analysis mode.
+
+``ThresholdSettings(tiled=True)`` smooths, thresholds and opens overlapping
+blocks on a thread pool, takes Otsu thresholds from a histogram summed over
+the blocks, and stitches connected components across block faces. Every
+output must match the monolithic path exactly.
+"""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from py2flamingo.pipeline.services.threshold_analysis_service import (
+    ThresholdAnalysisService,
+    ThresholdSettings,
+    _otsu_from_histogram,
+)
+
+
+def _volume(shape=(20, 37, 41), seed=0):
+    """Blobs of varying size (some spanning several tiles) plus noise."""
+    rng = np.random.default_rng(seed)
+    vol = rng.normal(100, 20, size=shape)
+    z, y, x = np.indices(shape)
+    for _ in range(12):
+        c = rng.uniform(0, shape)
+        r = rng.uniform(1.5, 9)
+        vol[(z - c[0]) ** 2 + (y - c[1]) ** 2 + (x - c[2]) ** 2 < r * r] += 400
+    return np.clip(vol, 0, None).astype(np.uint16)
+
+
+def _run(volumes, tiled, **kwargs):
+    settings = ThresholdSettings(
+        tiled=tiled, tile_shape=(7, 9, 11), max_workers=4, **kwargs
+    )
+    return ThresholdAnalysisService().analyze(volumes, settings)
+
+
+def _assert_same(mono, tiled):
+    assert mono.thresholds == tiled.thresholds
+    np.testing.assert_array_equal(mono.combined_mask, tiled.combined_mask)
+    np.testing.assert_array_equal(mono.labels, tiled.labels)
+    assert mono.object_count == tiled.object_count
+    for a, b in zip(mono.objects, tiled.objects):
+        assert a.label_id == b.label_id
+        assert a.bounding_box == b.bounding_box
+        assert a.volume_voxels == b.volume_voxels
+        assert a.centroid_voxel == pytest.approx(b.centroid_voxel)
+        assert a.source_channel == b.source_channel
+        assert a.mean_intensity == b.mean_intensity
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(channel_thresholds={0: 300}),
+        dict(channel_thresholds={0: 250}, gauss_sigma=1.2),
+        dict(
+            channel_thresholds={0: 250},
+            gauss_sigma=0.8,
+            opening_enabled=True,
+            opening_radius=1,
+            min_object_size=30,
+        ),
+        dict(channel_thresholds={0: 0, 1: 260}, otsu_channels=[0], gauss_sigma=1.0),
+    ],
+)
+def test_tiled_matches_monolithic(kwargs):
+    volumes = {0: _volume(seed=1), 1: _volume(seed=2)}
+    mono = _run(volumes, tiled=False, **kwargs)
+    tiled = _run(volumes, tiled=True, **kwargs)
+
+    assert mono.object_count > 0
+    _assert_same(mono, tiled)
+
+
+def test_components_spanning_blocks_are_one_object():
+    vol = np.zeros((10, 30, 30), dtype=np.uint16)
+    vol[2:8, 3:27, 14:16] = 1000  # crosses several 7x9x11 tiles
+    vol[0, 1, 1] = 1000  # isolated voxel, first in raster order
+    result = _run({0: vol}, tiled=True, channel_thresholds={0: 500})
+
+    assert result.object_count == 2
+    assert [o.volume_voxels for o in result.objects] == [1, 6 * 24 * 2]
+    assert (
+        result.objects[0].bounding_box
+        == ndimage.find_objects(ndimage.label(vol > 500)[0])[0]
+    )
+
+
+def test_opening_removes_everything():
+    vol = np.zeros((8, 8, 8), dtype=np.uint16)
+    vol[4, 4, 4] = 1000
+    kwargs = dict(channel_thresholds={0: 500}, opening_enabled=True)
+    mono = _run({0: vol}, tiled=False, **kwargs)
+    tiled = _run({0: vol}, tiled=True, **kwargs)
+
+    _assert_same(mono, tiled)
+    assert tiled.object_count == 0 and not tiled.combined_mask.any()
+
+
+def test_otsu_separates_two_populations():
+    hist = np.zeros(256)
+    hist[20:40] = 100
+    hist[200:220] = 50
+    threshold = _otsu_from_histogram(hist, np.arange(257, dtype=np.float64))
+    # Centre of the last background bin
+    assert threshold == 39.5
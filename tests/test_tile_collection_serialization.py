@@ -1,8 +1,8 @@
 """Tile-collection workflows go through the SAME serializer as the Workflow tab.
 
-`tile_collection_dialog._build_workflow_text` now builds a section dict via
-`build_tile_collection_section_dict` and serializes it with
-`dict_to_workflow_text` — the #4 consolidation. These tests lock the behaviour
+`tile_collection_dialog` renders each tile through a `TileCollectionTemplate`,
+which builds a section dict via `build_tile_collection_section_dict` and
+serializes it with `dict_to_workflow_text` — the #4 consolidation. These tests lock the behaviour
 that matters for the rig:
 
 * the per-tile Left/Right illumination-path override (smart limited
@@ -14,11 +14,13 @@ that matters for the rig:
 
 from types import SimpleNamespace
 
+from py2flamingo.services.tiff_size_validator import estimate_workflow_text
 from py2flamingo.utils.workflow_parser import (
     dict_to_workflow_text,
     parse_workflow_file,
 )
 from py2flamingo.utils.workflow_serialization import (
+    TileCollectionTemplate,
     build_tile_collection_section_dict,
     build_tile_illumination_source,
 )
@@ -176,3 +178,80 @@ def test_snapshot_uses_tile_z_for_both_positions():
     assert wf["Start Position"]["Z (mm)"] == 7.5
     assert wf["End Position"]["Z (mm)"] == 7.5
     assert wf["Experiment Settings"]["Plane spacing (um)"] == 1.0
+
+
+def _template(**overrides):
+    kwargs = dict(
+        camera=_camera(),
+        illumination_list=[_illum("Laser 2 488 nm", 20.0, laser_on=True)],
+        left_on=True,
+        right_on=False,
+        multi_laser=False,
+        save_settings=_save(),
+        is_zstack=True,
+        z_step_um=2.5,
+        z_velocity_mm_s=0.2,
+    )
+    kwargs.update(overrides)
+    return TileCollectionTemplate(**kwargs)
+
+
+def test_template_renders_exactly_what_the_serializer_renders():
+    pos = SimpleNamespace(x=3.0, y=4.0, z=12.0, r=1.5)
+    text = _template().render(
+        name="tile_7",
+        position=pos,
+        save_directory="tile_run_2026-08-05_X3.00_Y4.00",
+        z_min=12.0,
+        z_max=12.5,
+        right_on=True,
+    )
+
+    expected = dict_to_workflow_text(
+        build_tile_collection_section_dict(
+            name="tile_7",
+            position=pos,
+            camera=_camera(),
+            illumination_source=build_tile_illumination_source(
+                [_illum("Laser 2 488 nm", 20.0, laser_on=True)],
+                left_on=True,
+                right_on=True,
+            ),
+            multi_laser=False,
+            save_settings=dict(
+                _save(), save_directory="tile_run_2026-08-05_X3.00_Y4.00"
+            ),
+            z_min=12.0,
+            z_max=12.5,
+            is_zstack=True,
+            z_step_um=2.5,
+            z_velocity_mm_s=0.2,
+        )
+    )
+    assert text == expected
+
+
+def test_template_shares_illumination_sources_and_keeps_save_settings():
+    save = _save()
+    template = _template(save_settings=save)
+    pos = SimpleNamespace(x=0.0, y=0.0, z=1.0, r=0.0)
+    for i in range(5):
+        template.render(
+            name=f"t{i}", position=pos, save_directory=f"d{i}", z_min=1, z_max=2
+        )
+
+    assert template.illumination_source(True, False) is template.illumination_source(
+        True, False
+    )
+    assert len(template._sources) == 1
+    assert save["save_directory"] == "tile_run"  # caller's dict untouched
+
+
+def test_tiff_estimate_reads_rendered_text():
+    pos = SimpleNamespace(x=0.0, y=0.0, z=1.0, r=0.0)
+    text = _template().render(
+        name="t", position=pos, save_directory="d", z_min=1.0, z_max=2.0
+    )
+    estimate = estimate_workflow_text(text)
+    assert estimate.num_planes == 401
+    assert (estimate.image_width, estimate.image_height) == (2048, 1024)
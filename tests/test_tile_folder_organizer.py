@@ -8,17 +8,24 @@ every downstream tool -- so the skip reasons are asserted here too.
 """
 
 import sys
+import threading
 from pathlib import Path
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from py2flamingo.utils import tile_folder_organizer  # noqa: E402
 from py2flamingo.utils.tile_folder_organizer import (  # noqa: E402
+    JOURNAL_NAME,
     ReorganizeResult,
+    execute_reorganization_plan,
     infer_local_drive_root,
+    plan_tile_reorganization,
     reorganization_skip_reason,
     reorganize_tile_folders,
+    resume_reorganization,
+    rollback_reorganization,
 )
 
 
@@ -96,6 +103,138 @@ class TestReorganize:
         assert (tmp_path / "S" / "2026-08-05" / "X1.00_Y2.00" / "a.tif").exists()
 
 
+class TestPlanAndJournal:
+    """The move plan is computed up front and journaled, so a pass over a
+    multi-TB acquisition can be interrupted and resumed or rolled back."""
+
+    FLATS = {
+        "S_2026-08-05_X1.00_Y2.00": ("2026-08-05", "X1.00_Y2.00"),
+        "S_2026-08-05_X3.00_Y2.00": ("2026-08-05", "X3.00_Y2.00"),
+    }
+
+    def _server_folders(self, root):
+        return [
+            _make_server_folder(root, "20260805_000000", flat, ("a.tif", "b.raw"))
+            for flat in self.FLATS
+        ]
+
+    def test_plan_is_a_dry_run(self, tmp_path):
+        sources = self._server_folders(tmp_path)
+
+        plan = plan_tile_reorganization(str(tmp_path), "S", self.FLATS)
+
+        assert len(plan.moves) == 4
+        assert len(plan.folders) == 2
+        assert plan.summary() == "4 item(s) from 2 folder(s)"
+        assert all(src.exists() for src in sources)
+        assert not (tmp_path / "S").exists()
+
+    def test_cross_device_items_are_copied_and_verified(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tile_folder_organizer, "_same_device", lambda a, b: False)
+        self._server_folders(tmp_path)
+
+        result = reorganize_tile_folders(str(tmp_path), "S", self.FLATS, True)
+
+        assert result.moved == 2 and not result.failed
+        dest = tmp_path / "S" / "2026-08-05" / "X3.00_Y2.00"
+        assert sorted(p.name for p in dest.iterdir()) == ["a.tif", "b.raw"]
+        assert (dest / "a.tif").read_text() == "data"
+        assert not (tmp_path / JOURNAL_NAME).exists()
+
+    def test_checksum_mismatch_keeps_the_source(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tile_folder_organizer, "_same_device", lambda a, b: False)
+        monkeypatch.setattr(tile_folder_organizer, "_file_checksum", lambda p: "bad")
+        sources = self._server_folders(tmp_path)
+
+        result = reorganize_tile_folders(str(tmp_path), "S", self.FLATS, True)
+
+        assert result.moved == 0
+        assert len(result.failed) == 2
+        assert all((src / "a.tif").exists() for src in sources)
+        # The journal survives a failed pass so it can be resumed
+        assert (tmp_path / JOURNAL_NAME).exists()
+
+    def _interrupt_after_first_move(self, tmp_path, monkeypatch):
+        real_move = tile_folder_organizer._move_item
+        calls = []
+
+        def flaky(src, dest):
+            calls.append(src)
+            if len(calls) > 1:
+                raise OSError("network drive dropped")
+            return real_move(src, dest)
+
+        monkeypatch.setattr(tile_folder_organizer, "_move_item", flaky)
+        plan = plan_tile_reorganization(str(tmp_path), "S", self.FLATS)
+        execute_reorganization_plan(plan, tmp_path / JOURNAL_NAME)
+        monkeypatch.setattr(tile_folder_organizer, "_move_item", real_move)
+        return plan
+
+    def test_interrupted_pass_resumes_from_journal(self, tmp_path, monkeypatch):
+        self._server_folders(tmp_path)
+        self._interrupt_after_first_move(tmp_path, monkeypatch)
+
+        result = resume_reorganization(tmp_path / JOURNAL_NAME)
+
+        assert result.moved == 2 and not result.failed
+        for _, tile in self.FLATS.values():
+            folder = tmp_path / "S" / "2026-08-05" / tile
+            assert sorted(p.name for p in folder.iterdir()) == ["a.tif", "b.raw"]
+        assert not (tmp_path / JOURNAL_NAME).exists()
+
+    def test_next_run_picks_up_an_interrupted_journal(self, tmp_path, monkeypatch):
+        sources = self._server_folders(tmp_path)
+        self._interrupt_after_first_move(tmp_path, monkeypatch)
+
+        reorganize_tile_folders(str(tmp_path), "S", self.FLATS, True)
+
+        assert not any(src.exists() for src in sources)
+        assert not (tmp_path / JOURNAL_NAME).exists()
+
+    def test_interrupted_pass_rolls_back(self, tmp_path, monkeypatch):
+        sources = self._server_folders(tmp_path)
+        self._interrupt_after_first_move(tmp_path, monkeypatch)
+
+        assert rollback_reorganization(tmp_path / JOURNAL_NAME) == 1
+        for src in sources:
+            assert sorted(p.name for p in src.iterdir()) == ["a.tif", "b.raw"]
+        assert not (tmp_path / "S" / "2026-08-05" / "X1.00_Y2.00").exists()
+        assert not (tmp_path / JOURNAL_NAME).exists()
+
+    def test_rollback_leaves_items_already_back_at_their_source(
+        self, tmp_path, monkeypatch
+    ):
+        self._server_folders(tmp_path)
+        plan = self._interrupt_after_first_move(tmp_path, monkeypatch)
+        moved = plan.moves[0]
+        moved.src.write_text("restored by hand")
+
+        assert rollback_reorganization(tmp_path / JOURNAL_NAME) == 0
+        assert moved.src.read_text() == "restored by hand"
+        assert moved.dest.exists()
+        assert not (tmp_path / JOURNAL_NAME).exists()
+
+    def test_unfinished_journal_blocks_a_new_plan(self, tmp_path, monkeypatch):
+        sources = self._server_folders(tmp_path)
+        self._interrupt_after_first_move(tmp_path, monkeypatch)
+        journal = (tmp_path / JOURNAL_NAME).read_text()
+
+        def down(src, dest):
+            raise OSError("network drive still down")
+
+        monkeypatch.setattr(tile_folder_organizer, "_move_item", down)
+        result = reorganize_tile_folders(str(tmp_path), "S", self.FLATS, True)
+
+        assert not result.ran and result.moved == 0
+        assert len(result.failed) == 2
+        assert sources[1].exists()
+        # Still the old plan, with no lines from a second pass mixed in
+        assert (tmp_path / JOURNAL_NAME).read_text().startswith(journal)
+        with pytest.raises(FileExistsError):
+            plan = plan_tile_reorganization(str(tmp_path), "S", self.FLATS)
+            execute_reorganization_plan(plan, tmp_path / JOURNAL_NAME)
+
+
 class TestSkipReasons:
     def test_local_access_disabled(self, tmp_path):
         reason = reorganization_skip_reason(str(tmp_path), local_access_enabled=False)
@@ -184,7 +323,8 @@ class TestDialogHook:
 
     ``on_queue_completed`` is a signal handler: an exception there unwinds into
     the dispatcher and disappears, which is how a run can finish "successfully"
-    with the data still flat and nothing in the log explaining it.
+    with the data still flat and nothing in the log explaining it. The pass
+    itself runs on a worker, so a multi-TB copy does not freeze the dialog.
     """
 
     @staticmethod
@@ -195,14 +335,8 @@ class TestDialogHook:
 
         return TileCollectionDialog
 
-    def test_reorganize_wrapper_contains_exceptions(self, monkeypatch, tmp_path):
-        from py2flamingo.views.dialogs import tile_collection_dialog as mod
-
-        def boom(*args, **kwargs):
-            raise OSError("drive vanished mid-move")
-
-        monkeypatch.setattr(mod, "reorganize_tile_folders", boom)
-
+    @staticmethod
+    def _stub(tmp_path):
         stub = type("Stub", (), {})()
         stub._local_path = str(tmp_path)
         stub._base_save_directory = "S"
@@ -210,17 +344,71 @@ class TestDialogHook:
             "S_2026-08-05_X1.00_Y2.00": ("2026-08-05", "X1.00_Y2.00")
         }
         stub._local_access_enabled = True
+        stub._reorganize_workers = []
+        stub._forget_reorganize_worker = lambda w: stub._reorganize_workers.remove(w)
+        return stub
+
+    def _run(self, stub):
+        """Start the pass, then deliver its queued result as the GUI loop would.
+
+        Only queued calls are dispatched: spinning the whole event loop would
+        also run whatever other tests left behind on the shared QApplication.
+        """
+        from PyQt5.QtCore import QCoreApplication, QEvent
+
+        results = []
+        worker = self._dialog_cls()._reorganize_after_collection(
+            stub, lambda result: results.append((result, threading.current_thread()))
+        )
+        assert worker.wait(10_000)
+        QCoreApplication.sendPostedEvents(None, QEvent.MetaCall)
+
+        assert not stub._reorganize_workers
+        result, thread = results[0]
+        assert thread is threading.main_thread()
+        return result
+
+    def test_reorganize_runs_on_a_worker_and_reports_back(
+        self, qapp, monkeypatch, tmp_path
+    ):
+        _make_server_folder(
+            tmp_path, "20260805_000000", "S_2026-08-05_X1.00_Y2.00", ("a.tif",)
+        )
+        threads = []
+        real = tile_folder_organizer.execute_reorganization_plan
+
+        def spy(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(tile_folder_organizer, "execute_reorganization_plan", spy)
+
+        result = self._run(self._stub(tmp_path))
+
+        assert result.moved == 1
+        assert threads and threads[0] is not threading.main_thread()
+        assert (tmp_path / "S" / "2026-08-05" / "X1.00_Y2.00" / "a.tif").exists()
+
+    def test_reorganize_wrapper_contains_exceptions(self, qapp, monkeypatch, tmp_path):
+        from py2flamingo.views.dialogs import tile_collection_dialog as mod
+
+        def boom(*args, **kwargs):
+            raise OSError("drive vanished mid-move")
+
+        monkeypatch.setattr(mod, "reorganize_tile_folders", boom)
 
-        result = self._dialog_cls()._reorganize_after_collection(stub)
+        result = self._run(self._stub(tmp_path))
 
         assert not result.ran
         assert "drive vanished" in result.skip_reason
 
-    def test_reorganize_wrapper_tolerates_unset_attributes(self):
+    def test_reorganize_wrapper_tolerates_unset_attributes(self, qapp):
         """Reached when execution is attempted before any workflow was built."""
         stub = type("Stub", (), {})()
+        stub._reorganize_workers = []
+        stub._forget_reorganize_worker = lambda w: stub._reorganize_workers.remove(w)
 
-        result = self._dialog_cls()._reorganize_after_collection(stub)
+        result = self._run(stub)
 
         assert not result.ran
         assert result.moved == 0
@@ -0,0 +1,101 @@
+"""TileFrameBuffer's preallocated tile stack.
+
+Downsampled planes are copied into one contiguous (capacity, h, w) array as
+they arrive; the worker reads each channel as a view into it. No Qt event
+loop, no hardware.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_tile_frame_buffer.py -q
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from py2flamingo.visualization.tile_processing_worker import (
+    TileFrameBuffer,
+    TileProcessingWorker,
+)
+
+
+def _buffer(channels=(0,), planes_per_channel=None):
+    return TileFrameBuffer(
+        tile_key=(1.0, 2.0),
+        position={"x": 1.0, "y": 2.0},
+        channels=list(channels),
+        z_min=0.0,
+        z_max=1.0,
+        reference_position={"x": 1.0, "y": 2.0, "z": 0.5, "r": 0.0},
+        planes_per_channel=planes_per_channel,
+    )
+
+
+def _plane(value, shape=(6, 5)):
+    return np.full(shape, value, dtype=np.uint16)
+
+
+def test_stack_grows_and_keeps_arrival_order():
+    buffer = _buffer()
+    assert buffer.frame_count == 0 and buffer.stack.shape[0] == 0
+
+    for i in range(200):
+        buffer.append(_plane(i), i % 7)
+    assert buffer.stack.shape == (200, 6, 5)
+    assert list(buffer.stack[:, 0, 0]) == list(range(200))
+    assert list(buffer.z_indices) == [i % 7 for i in range(200)]
+
+    buffer.truncate(150)
+    assert buffer.frame_count == 150 and buffer.stack[-1, 0, 0] == 149
+
+
+def test_known_plane_count_allocates_once():
+    buffer = _buffer(channels=(0, 1), planes_per_channel=10)
+    buffer.append(_plane(0), 0)
+    backing = buffer.stack.base
+    for i in range(1, 23):  # two frames of camera overrun
+        buffer.append(_plane(i), i)
+    assert buffer.stack.base is backing
+
+
+def test_strided_downsample_is_copied_not_retained():
+    full = np.arange(40 * 40, dtype=np.uint16).reshape(40, 40)
+    buffer = _buffer()
+    buffer.append(full[::4, ::4], 0)
+    full[:] = 0
+    assert buffer.stack[0, 1, 1] == 4 * 40 + 4
+
+
+def test_channel_stacks_are_views_with_remainder_in_last():
+    buffer = _buffer(channels=(3, 7))
+    for i in range(9):
+        buffer.append(_plane(i), i)
+    first, second = buffer.channel_stacks(4)
+    assert list(first[:, 0, 0]) == [0, 1, 2, 3]
+    assert list(second[:, 0, 0]) == [4, 5, 6, 7, 8]
+    assert np.shares_memory(first, buffer.stack)
+
+
+def test_worker_routes_planes_to_channels_and_trims_overrun():
+    storage = MagicMock()
+    storage.memory_efficient = False
+    worker = TileProcessingWorker(storage, {})
+    buffer = _buffer(channels=(0, 1), planes_per_channel=3)
+    for i in range(8):  # 3 + 3 planes, then 2 overrun frames
+        buffer.append(_plane(100 + i), i)
+
+    worker._process_tile(buffer)
+
+    calls = storage.update_storage.call_args_list
+    assert [c.kwargs["channel_id"] for c in calls] == [0, 0, 0, 1, 1, 1]
+    assert [int(c.kwargs["pixel_values"][0]) for c in calls] == list(range(100, 106))
+    assert worker.channel_frame_counts == {((1.0, 2.0), 0): 3, ((1.0, 2.0), 1): 3}
+
+
+def test_channel_transition_detected_on_stack():
+    stack = np.concatenate(
+        [np.full((47, 4, 4), 148, np.uint16), np.full((50, 4, 4), 137, np.uint16)]
+    )
+    detected = TileProcessingWorker._detect_channel_transition(
+        stack, num_channels=2, expected_per_channel=50, tile_key=(0, 0)
+    )
+    # Within the smoothing window of the true boundary
+    assert abs(detected - 47) <= 5
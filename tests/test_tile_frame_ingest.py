@@ -0,0 +1,153 @@
+"""Off-GUI tile frame ingest.
+
+Live tile-workflow frames go from the camera receiver thread straight to
+``TileFrameIngest``, which downsamples them into per-tile ``TileFrameBuffer``s
+on its own thread and submits each finished tile to the worker. Tile
+boundaries travel on the same queue as the frames, so attribution depends on
+arrival order, not on how far behind the consumer is. No Qt event loop, no
+hardware.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_tile_frame_ingest.py -q
+"""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+from PyQt5.QtCore import Qt
+
+from py2flamingo.controllers.camera_controller import CameraController
+from py2flamingo.visualization.tile_frame_ingest import TileFrameIngest
+
+
+class _FakeWorker:
+    def __init__(self):
+        self.buffers = []
+
+    def submit_tile(self, buffer):
+        self.buffers.append(buffer)
+
+
+def _position(x, channels=(0,)):
+    return {
+        "x": float(x),
+        "y": 1.0,
+        "z_min": 0.0,
+        "z_max": 2.0,
+        "channels": list(channels),
+        "num_planes": 3,
+    }
+
+
+def _frame(value):
+    return np.full((8, 8), value, dtype=np.uint16), SimpleNamespace(frame_number=value)
+
+
+def _ingest(**kwargs):
+    worker = _FakeWorker()
+    ingest = TileFrameIngest(worker, downsample=lambda im: im[::2, ::2], **kwargs)
+    ingest.start()
+    return ingest, worker
+
+
+def test_frames_are_binned_per_tile_in_arrival_order():
+    ingest, worker = _ingest()
+    ingest.on_frame(*_frame(99))  # live view before the first workflow
+
+    def receiver():
+        for tile in range(3):
+            ingest.begin_tile(_position(tile))
+            for z in range(4):
+                ingest.on_frame(*_frame(10 * tile + z))
+
+    t = threading.Thread(target=receiver)
+    t.start()
+    t.join()
+    assert ingest.finish(timeout=10)
+
+    # The last tile is submitted by finish(), not lost
+    assert [b.tile_key for b in worker.buffers] == [(0.0, 1.0), (1.0, 1.0), (2.0, 1.0)]
+    for tile, buffer in enumerate(worker.buffers):
+        assert list(buffer.z_indices) == [0, 1, 2, 3]
+        assert list(buffer.stack[:, 0, 0]) == [10 * tile + z for z in range(4)]
+        assert buffer.stack.shape == (4, 4, 4)
+        assert buffer.source_frame_shape == (8, 8)
+        assert buffer.planes_per_channel == 3
+    assert ingest.frames_discarded == 1
+    assert ingest.frames_ingested == 12
+
+
+def test_reference_comes_from_first_tile():
+    storage = SimpleNamespace(refs=[])
+    storage.set_reference_position = storage.refs.append
+    ingest, worker = _ingest(voxel_storage=storage, default_r=45.0)
+    for tile in range(2):
+        ingest.begin_tile(_position(tile))
+        ingest.on_frame(*_frame(tile))
+    ingest.finish(timeout=10)
+
+    expected = {"x": 0.0, "y": 1.0, "z": 1.0, "r": 45.0}
+    assert storage.refs == [expected]
+    assert all(b.reference_position == expected for b in worker.buffers)
+
+
+def test_same_tile_key_continues_buffer_and_progress_is_throttled():
+    ingest, worker = _ingest(progress_interval_s=3600)
+    events = []
+    ingest.progress.connect(events.append, Qt.DirectConnection)
+    ingest.tile_started.connect(lambda p: events.append("started"), Qt.DirectConnection)
+
+    # Two workflows (e.g. one per illumination side) at the same XY
+    for _ in range(2):
+        ingest.begin_tile(_position(0))
+        for z in range(50):
+            ingest.on_frame(*_frame(z))
+    ingest.finish(timeout=10)
+
+    assert len(worker.buffers) == 1 and worker.buffers[0].frame_count == 100
+    assert events[0] == "started" and len(events) == 2
+    assert events[1]["frame_count"] == 1 and events[1]["tile_index"] == 1
+
+
+class _FakeCameraService:
+    def __init__(self):
+        self.listeners = []
+        self.tile_buffer = None
+
+    def set_image_callback(self, cb):
+        pass
+
+    def add_frame_listener(self, fn):
+        self.listeners.append(fn)
+
+    def remove_frame_listener(self, fn):
+        self.listeners.remove(fn)
+
+    def set_tile_mode_buffer(self, enabled):
+        self.tile_buffer = enabled
+
+    def ensure_data_receiver_running(self):
+        pass
+
+
+def test_controller_routes_tile_boundaries_to_attached_ingest():
+    service = _FakeCameraService()
+    controller = CameraController(service)
+    ingest, worker = _ingest()
+
+    controller.attach_tile_ingest(ingest)
+    assert service.listeners == [ingest.on_frame]
+
+    controller.begin_tile(_position(5))
+    service.listeners[0](*_frame(1))
+    assert not controller._tile_transition_pending
+
+    controller.detach_tile_ingest()
+    assert service.listeners == []
+    ingest.finish(timeout=10)
+    assert worker.buffers[0].tile_key == (5.0, 1.0)
+
+    # Without an ingest the GUI-timer transition flags are used as before
+    controller.begin_tile(_position(6))
+    assert controller._tile_transition_pending
+    assert controller._pending_tile_position["x"] == 6.0
@@ -6,17 +6,25 @@ Covers the two states offered after selecting tiles:
 * one Z range typed by the user and applied to every tile,
 
 plus the "acquired Z" summary shown next to the manual fields, the
-subfolder-layout reader that supplies it, and the LED 2D overview's
-skip-the-second-90°-view quick-test option.
+subfolder-layout reader that supplies it, the 90° intersection itself on
+dense tile sets, and the LED 2D overview's skip-the-second-90°-view
+quick-test option.
 """
 
+import math
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 from py2flamingo.models.mip_overview import read_tile_z_range
-from py2flamingo.utils.tile_z_range import summarize_acquired_z
+from py2flamingo.utils.tile_z_range import (
+    calculate_tile_z_ranges,
+    min_distance_in_tile_set,
+    summarize_acquired_z,
+)
 
 
 @dataclass
@@ -78,6 +86,70 @@ def test_reversed_range_is_normalised():
     )
 
 
+# --------------------------------------------------------------------------- #
+# calculate_tile_z_ranges / min_distance_in_tile_set on dense tile sets
+# --------------------------------------------------------------------------- #
+def _grid_tiles(nx, ny, fov, x0=0.0, y0=0.0, jitter=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        SimpleNamespace(
+            tile_x_idx=i,
+            tile_y_idx=j,
+            x=x0 + i * fov + rng.uniform(-jitter, jitter),
+            y=y0 + j * fov + rng.uniform(-jitter, jitter),
+            z=5.0 + i * 0.01,
+        )
+        for i in range(nx)
+        for j in range(ny)
+    ]
+
+
+def _scanned_z_ranges(primary, secondary, fov, offset):
+    """Per-tile scan over every secondary tile (the original matching rule)."""
+    out = {}
+    for p in primary:
+        xs = [s.x for s in secondary if abs(p.y - s.y) < fov]
+        key = (p.tile_x_idx, p.tile_y_idx)
+        out[key] = (
+            (min(xs) + offset - fov / 2, max(xs) + offset + fov / 2) if xs else None
+        )
+    return out
+
+
+@pytest.mark.parametrize("jitter", [0.0, 0.05])
+def test_z_ranges_match_a_full_scan(jitter):
+    fov = 0.4
+    primary = _grid_tiles(30, 40, fov, jitter=jitter)
+    # Secondary rows offset in Y and missing at the top, so some primary tiles
+    # match one row, some two, and some none (fallback)
+    secondary = _grid_tiles(25, 30, fov, x0=2.0, y0=0.2, jitter=jitter, seed=1)
+    fov_used = min_distance_in_tile_set(primary)
+
+    ranges = calculate_tile_z_ranges(primary, secondary, -1.0, 1.0, (3.0, 5.0))
+    expected = _scanned_z_ranges(primary, secondary, fov_used, 2.0)
+
+    assert ranges.keys() == expected.keys()
+    assert any(v is None for v in expected.values())
+    for key, want in expected.items():
+        assert ranges[key] == (want if want is not None else (-1.0, 1.0)), key
+
+
+def test_min_distance_skips_duplicates_and_near_duplicates():
+    tiles = _grid_tiles(20, 20, 0.4, jitter=0.01)
+    brute = min(
+        math.hypot(a.x - b.x, a.y - b.y)
+        for i, a in enumerate(tiles)
+        for b in tiles[i + 1 :]
+    )
+    # Duplicated tiles (selected in both sets) and a sub-micron copy
+    copies = [SimpleNamespace(x=t.x, y=t.y) for t in tiles[:50]]
+    nudged = SimpleNamespace(x=tiles[0].x + 1e-7, y=tiles[0].y)
+
+    assert min_distance_in_tile_set(tiles + copies + [nudged]) == pytest.approx(brute)
+    assert min_distance_in_tile_set([tiles[0], copies[0]]) == float("inf")
+    assert min_distance_in_tile_set(tiles[:1]) == float("inf")
+
+
 # --------------------------------------------------------------------------- #
 # read_tile_z_range (subfolder layout)
 # --------------------------------------------------------------------------- #
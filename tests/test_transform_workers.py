@@ -0,0 +1,183 @@
+"""
+Tests for TransformManager's byte-budgeted cache and reusable rotation maps.
+
+The rotation worker's CPU path now resamples each Y plane through a cached
+(Z, X) coordinate map instead of a full 3D affine_transform; it must give the
+same volume. The caches are bounded by bytes, and a newer rotation for a
+channel supersedes any still-pending one.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from PyQt5.QtCore import QRunnable, Qt
+from scipy import ndimage
+from scipy.spatial.transform import Rotation
+
+from py2flamingo.visualization import transform_workers
+from py2flamingo.visualization.transform_workers import (
+    ByteBudgetCache,
+    RotationMapCache,
+    RotationTransformWorker,
+    TransformManager,
+    TransformRequest,
+)
+
+
+@pytest.fixture(autouse=True)
+def _cpu_only(monkeypatch):
+    monkeypatch.setattr(transform_workers, "is_gpu_beneficial", lambda v: False)
+
+
+def _reference_rotation(volume, deg, center):
+    rot = Rotation.from_euler("y", deg, degrees=True).as_matrix()
+    center = np.array(center)
+    out = ndimage.affine_transform(
+        volume.astype(np.float32),
+        rot,
+        offset=center - rot @ center,
+        order=1,
+        mode="constant",
+        cval=0,
+    )
+    return out.astype(volume.dtype)
+
+
+def _run_worker(volume, deg, map_cache):
+    request = TransformRequest(
+        request_id="r",
+        transform_type="rotation",
+        channel_id=0,
+        volume=volume,
+        parameters={"rotation_deg": deg},
+    )
+    worker = RotationTransformWorker(request, map_cache=map_cache)
+    results = []
+    worker.signals.completed.connect(lambda rid, result: results.append(result))
+    worker.run()
+    return results[0]
+
+
+class _Blocker(QRunnable):
+    def __init__(self, event):
+        super().__init__()
+        self.event = event
+
+    def run(self):
+        self.event.wait(5)
+
+
+class TestByteBudgetCache:
+    def test_evicts_least_recent_to_fit_budget(self):
+        cache = ByteBudgetCache(max_bytes=3000)
+        for key in "abc":
+            cache.put(key, np.zeros(1000, dtype=np.uint8))
+        assert cache.get("a") is not None  # refresh "a"
+        cache.put("d", np.zeros(1000, dtype=np.uint8))
+
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert stats["bytes"] == 3000
+        assert stats["entries"] == 3
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_oversized_values_are_not_cached(self):
+        cache = ByteBudgetCache(max_bytes=100)
+        cache.put("big", np.zeros(101, dtype=np.uint8))
+        assert cache.get("big") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_replacing_a_key_updates_byte_count(self):
+        cache = ByteBudgetCache(max_bytes=1000)
+        cache.put("a", np.zeros(400, dtype=np.uint8))
+        cache.put("a", np.zeros(100, dtype=np.uint8))
+        assert cache.stats()["bytes"] == 100
+
+
+class TestRotationMaps:
+    @pytest.mark.parametrize("deg", [0.0, 17.0, -45.0, 90.0, 180.0])
+    def test_map_path_matches_affine_transform(self, deg):
+        rng = np.random.default_rng(1)
+        volume = rng.integers(0, 4000, size=(20, 7, 24), dtype=np.uint16)
+        result = _run_worker(volume, deg, RotationMapCache(max_bytes=10**8))
+        expected = _reference_rotation(volume, deg, np.array(volume.shape) / 2)
+        assert result.dtype == volume.dtype
+        np.testing.assert_array_equal(result, expected)
+
+    def test_map_is_shared_across_data_updates(self):
+        maps = RotationMapCache(max_bytes=10**8)
+        a = np.ones((10, 3, 12), dtype=np.uint16)
+        _run_worker(a, 30.0, maps)
+        _run_worker(a * 2, 30.0, maps)
+        stats = maps.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_cancel_mid_volume_emits_cancelled(self):
+        volume = np.ones((8, 4, 8), dtype=np.uint16)
+        request = TransformRequest("r", "rotation", 0, volume, {"rotation_deg": 5})
+        worker = RotationTransformWorker(request, map_cache=RotationMapCache(10**8))
+        worker._cancelled = True
+        assert worker._apply_plane_map(volume, np.zeros((2, 8, 8))) is None
+
+
+class TestTransformManager:
+    """Results are recorded with direct connections, so these run without
+    spinning an event loop: the pool is drained and state inspected."""
+
+    @staticmethod
+    def _collect(manager):
+        emitted = []
+        manager.transform_completed.connect(
+            lambda rid, ch, result: emitted.append((rid, ch, result)),
+            Qt.DirectConnection,
+        )
+        return emitted
+
+    def test_cached_result_is_emitted_without_recomputing(self, qapp):
+        manager = TransformManager(max_workers=1)
+        emitted = self._collect(manager)
+        volume = np.arange(6 * 3 * 6, dtype=np.uint16).reshape(6, 3, 6)
+
+        manager.submit_rotation(0, volume, 25.0)
+        manager.thread_pool.waitForDone()
+        manager.submit_rotation(1, volume.copy(), 25.0)
+        manager.thread_pool.waitForDone()
+
+        assert len(emitted) == 2
+        np.testing.assert_array_equal(emitted[0][2], emitted[1][2])
+        assert emitted[1][1] == 1
+        assert manager.cache_stats()["results"]["hits"] == 1
+
+    def test_late_older_result_does_not_replace_cached_newer_one(self, qapp):
+        manager = TransformManager(max_workers=1)
+        emitted = self._collect(manager)
+        volume = np.arange(6 * 3 * 6, dtype=np.uint16).reshape(6, 3, 6)
+        manager.submit_rotation(0, volume, 25.0)
+        manager.thread_pool.waitForDone()
+
+        older = manager.submit_rotation(0, volume, 40.0)
+        newer = manager.submit_rotation(0, volume, 25.0)  # served from the cache
+        manager.thread_pool.waitForDone()
+        # An older worker that was already running finishes afterwards
+        manager._on_worker_completed(older, 0, np.zeros_like(volume))
+
+        assert emitted[-1][0] == newer
+        assert older not in [rid for rid, _, _ in emitted]
+
+    def test_newer_request_supersedes_pending_one(self, qapp):
+        manager = TransformManager(max_workers=1)
+        emitted = self._collect(manager)
+        volume = np.ones((16, 8, 16), dtype=np.uint16)
+
+        # Occupy the only pool thread so every request is still queued
+        release = threading.Event()
+        manager.thread_pool.start(_Blocker(release))
+        ids = [manager.submit_rotation(0, volume, deg) for deg in (10, 20, 30, 40)]
+        release.set()
+        manager.thread_pool.waitForDone()
+
+        assert [rid for rid, _, _ in emitted] == [ids[-1]]
+        assert manager.active_workers == {}
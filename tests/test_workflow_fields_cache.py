@@ -0,0 +1,160 @@
+"""Cached workflow file parsing.
+
+Every ``read_*_from_workflow`` helper, the TIFF size check and
+``parse_workflow_file`` look up one parse per file, reused while the file's
+mtime and size are unchanged, so preflighting a tile queue reads each
+Workflow.txt once instead of once per field.
+
+Run: QT_QPA_PLATFORM=offscreen .venv/bin/python -m pytest tests/test_workflow_fields_cache.py -q
+"""
+
+import os
+
+import pytest
+
+from py2flamingo.services import tiff_size_validator
+from py2flamingo.utils import tile_workflow_parser as twp
+from py2flamingo.utils import workflow_parser
+from py2flamingo.utils.workflow_parser import WorkflowFields, read_workflow_fields
+
+_WORKFLOW_TXT = """<Workflow Settings>
+    <Experiment Settings>
+    Save image drive = G:\\
+    Save image directory = CTLSM1\\Test_X4.88_Y17.63
+    </Experiment Settings>
+    <Camera Settings>
+    AOI width = 1024
+    AOI height = 512
+    </Camera Settings>
+    <Stack Settings>
+    Number of planes = 250
+    Z stage velocity (mm/s) = 0.4
+    </Stack Settings>
+    <Start Position>
+    X (mm) = 5.400
+    Y (mm) = 18.660
+    Z (mm) = 16.000
+    </Start Position>
+    <End Position>
+    Z (mm) = 17.000
+    </End Position>
+    <Illumination Source>
+    Laser 1 1: 405 nm MLE = 0.00 0
+    Laser 2 2: 488 nm MLE = 10.00 1
+    Laser 4 4: 640 nm MLE = 5.00 1
+    </Illumination Source>
+    <Illumination Path>
+    Left path = OFF 0
+    Right path = ON 1
+    </Illumination Path>
+</Workflow Settings>
+"""
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count how often workflow text is actually parsed."""
+    calls = []
+    real = workflow_parser.parse_workflow_fields
+
+    def counting(content):
+        calls.append(1)
+        return real(content)
+
+    monkeypatch.setattr(workflow_parser, "parse_workflow_fields", counting)
+    return calls
+
+
+def test_one_parse_serves_every_helper(tmp_path, parses):
+    wf = tmp_path / "Workflow.txt"
+    wf.write_text(_WORKFLOW_TXT)
+
+    assert read_workflow_fields(wf) == WorkflowFields(
+        start_x=5.4,
+        start_y=18.66,
+        start_z=16.0,
+        end_z=17.0,
+        laser_channels=(1, 3),
+        illumination_path=(False, True),
+        num_planes=250,
+        z_velocity=0.4,
+        save_drive="G:\\",
+        save_directory="CTLSM1\\Test_X4.88_Y17.63",
+        aoi_width=1024,
+        aoi_height=512,
+    )
+    assert twp.read_xy_position_from_workflow(wf) == (5.4, 18.66)
+    assert twp.read_z_range_from_workflow(wf) == (16.0, 17.0)
+    assert twp.read_laser_channels_from_workflow(wf) == [1, 3]
+    assert twp.read_illumination_path_from_workflow(wf) == (False, True)
+    assert twp.read_num_planes_from_workflow(wf) == 250
+    assert twp.read_z_velocity_from_workflow(wf) == 0.4
+    assert twp.read_save_directory_from_workflow(wf)[1].startswith("CTLSM1")
+
+    estimate = tiff_size_validator.parse_workflow_file(wf)
+    assert (estimate.num_planes, estimate.image_width) == (250, 1024)
+
+    assert len(parses) == 1
+
+
+def test_defaults_for_missing_fields_are_unchanged(tmp_path, parses):
+    wf = tmp_path / "Workflow.txt"
+    wf.write_text("<Workflow Settings>\n</Workflow Settings>\n")
+
+    assert twp.read_xy_position_from_workflow(wf) is None
+    assert twp.read_z_range_from_workflow(wf) == (0.0, 0.0)
+    assert twp.read_laser_channels_from_workflow(wf) == [0]
+    assert twp.read_illumination_path_from_workflow(wf) == (True, False)
+    assert twp.read_num_planes_from_workflow(wf) is None
+    assert twp.read_z_velocity_from_workflow(wf) == 1.0
+    assert twp.read_save_directory_from_workflow(wf) == ("", "")
+    assert tiff_size_validator.parse_workflow_file(wf).num_planes == 1
+    assert len(parses) == 1
+
+    # Unreadable files keep their per-helper fallbacks and are not cached
+    missing = tmp_path / "missing.txt"
+    assert twp.read_z_range_from_workflow(missing) == (0.0, 10.0)
+    assert tiff_size_validator.parse_workflow_file(missing) is None
+
+
+def test_changed_file_is_parsed_again(tmp_path, parses):
+    wf = tmp_path / "Workflow.txt"
+    wf.write_text(_WORKFLOW_TXT)
+    assert twp.read_num_planes_from_workflow(wf) == 250
+
+    # Same size, new mtime
+    wf.write_text(_WORKFLOW_TXT.replace("= 250", "= 251"))
+    stat = wf.stat()
+    os.utime(wf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert twp.read_num_planes_from_workflow(wf) == 251
+
+    # New size
+    wf.write_text(_WORKFLOW_TXT.replace("= 250", "= 1250"))
+    assert twp.read_num_planes_from_workflow(wf) == 1250
+    assert len(parses) == 3
+
+
+def test_parsed_dict_is_cached_but_not_shared(tmp_path):
+    wf = tmp_path / "Workflow.txt"
+    wf.write_text(_WORKFLOW_TXT)
+
+    first = workflow_parser.parse_workflow_file(wf)
+    first["Start Position"]["X (mm)"] = "0.0"
+    second = workflow_parser.parse_workflow_file(wf)
+
+    assert second["Start Position"]["X (mm)"] == "5.400"
+    valid, errors = workflow_parser.validate_workflow(second)
+    assert not valid and any("Frame rate" in e for e in errors)
+
+
+def test_malformed_value_only_loses_that_field(tmp_path):
+    wf = tmp_path / "Workflow.txt"
+    wf.write_text(_WORKFLOW_TXT.replace("X (mm) = 5.400", "X (mm) = -"))
+
+    fields = read_workflow_fields(wf)
+    assert fields.start_x is None
+    assert (fields.start_y, fields.num_planes) == (18.66, 250)
+    assert twp.read_z_range_from_workflow(wf) == (16.0, 17.0)
+
+    estimate = tiff_size_validator.estimate_workflow_text(wf.read_text())
+    assert (estimate.num_planes, estimate.image_height) == (250, 512)
@@ -0,0 +1,72 @@
+"""
+Tests for the background 2D overview session writer.
+
+Images are written as chunk-row bands on a thread pool while the caller
+continues; ``session_metadata`` is only written once every band has landed,
+so an unfinished or failed save never loads as a valid session.
+"""
+
+import numpy as np
+import pytest
+
+from py2flamingo.visualization import zarr_2d_session
+from py2flamingo.visualization.zarr_2d_session import (
+    Zarr2DSessionWriter,
+    load_2d_zarr_session,
+    save_2d_zarr_session,
+)
+
+
+def _image(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 4000, size=shape, dtype=np.uint16)
+
+
+def test_multi_band_round_trip(tmp_path):
+    images = {
+        "rotation_0/stitched_best_focus": _image((1100, 700), 1),
+        "rotation_1/stitched_best_focus": _image((300, 1300), 2),
+        "flat": _image((5, 5), 3),
+        "missing": None,
+    }
+    path = save_2d_zarr_session(tmp_path / "s.zarr", {"a": 1}, images, "test")
+
+    metadata, loaded = load_2d_zarr_session(path)
+    assert metadata == {"a": 1}
+    assert sorted(loaded) == sorted(k for k, v in images.items() if v is not None)
+    for key, image in loaded.items():
+        np.testing.assert_array_equal(image, images[key])
+
+
+def test_metadata_is_committed_last(tmp_path):
+    writer = Zarr2DSessionWriter(tmp_path / "s.zarr", "led_2d_overview", max_workers=2)
+    first = _image((600, 600), 4)
+    writer.add("rotation_0/stitched_focus_stack", first)
+
+    # Data may already be on disk, but the session is not loadable yet
+    with pytest.raises(ValueError, match="session_metadata"):
+        load_2d_zarr_session(tmp_path / "s.zarr")
+
+    # A later rotation can be added while earlier bands are still writing
+    second = _image((600, 600), 5)
+    writer.add("rotation_1/stitched_focus_stack", second)
+    path = writer.finish_async({"rotations": 2}).result(timeout=30)
+
+    assert writer.progress == (4, 4)
+    metadata, loaded = load_2d_zarr_session(path)
+    assert metadata == {"rotations": 2}
+    np.testing.assert_array_equal(loaded["rotation_1/stitched_focus_stack"], second)
+
+
+def test_failed_band_never_commits_metadata(tmp_path, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(zarr_2d_session, "_write_band", fail)
+    writer = Zarr2DSessionWriter(tmp_path / "s.zarr", "mip_overview")
+    writer.add("stitched_overview", _image((10, 10)))
+
+    with pytest.raises(OSError, match="disk full"):
+        writer.finish({"x": 1})
+    with pytest.raises(ValueError, match="session_metadata"):
+        load_2d_zarr_session(tmp_path / "s.zarr")